@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark du filtre de spread et de la pondération de la watchlist.
+
+Compare, sur un lot généré, le pipeline ligne par ligne
+(SymbolFilter.filter_by_spread + WeightCalculator.calculate_weight, tri
+complet) et celui de WatchlistFilterApplier (ColumnarSymbolFilter :
+masque de spread NumPy, poids en lot, top N de IncrementalWatchlistRanker).
+La parité des résultats est vérifiée avant la mesure.
+
+Utilisation :
+    python scripts/bench_symbol_filter.py
+    python scripts/bench_symbol_filter.py --sizes 500 5000 20000 --repeat 10
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from filters.columnar_filter import ColumnarSymbolFilter, np
+from filters.symbol_filter import SymbolFilter
+from watchlist_helpers.incremental_ranker import IncrementalWatchlistRanker
+from watchlist_helpers.weight_calculator import WeightCalculator
+
+WEIGHTS = {"funding": 10.0, "volume": 0.5, "spread": 5.0, "volatility": 2.0, "top_symbols": 10}
+SPREAD_MAX = 0.005
+
+
+class _SilentLogger:
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def generate_rows(size: int, seed: int = 42):
+    """Génère les lignes (symbol, funding, volume, funding_time) et les spreads."""
+    rng = random.Random(seed)
+    rows = [
+        (f"SYM{i}USDT", rng.uniform(-0.01, 0.01), rng.uniform(0, 5e7), None)
+        for i in range(size)
+    ]
+    spreads = {row[0]: rng.uniform(0, 0.01) for row in rows}
+    return rows, spreads
+
+
+def run_pipeline(symbol_filter, calculator, rows, spreads):
+    """Spread → poids en lot → top N (ranker à froid : tous les poids calculés)."""
+    rows = symbol_filter.filter_by_spread(rows, spreads, SPREAD_MAX)
+    rows = [row + (0.0,) for row in rows]
+    ranked = IncrementalWatchlistRanker(calculator, logger=_SilentLogger()).rank(rows, WEIGHTS, {})
+    return [(row[0], row[6]) for row in ranked]
+
+
+def run_loop(rows, spreads):
+    """Pipeline de référence : boucles par symbole, tri complet des poids."""
+    symbol_filter = SymbolFilter(logger=_SilentLogger())
+    calculator = WeightCalculator(logger=_SilentLogger())
+    rows = SymbolFilter.filter_by_spread(symbol_filter, rows, spreads, SPREAD_MAX)
+    rows = [row + (0.0,) for row in rows]
+    weighted = [
+        (row[0], calculator.calculate_weight(calculator._to_dict(row, {}), WEIGHTS))
+        for row in rows
+    ]
+    return sorted(weighted, key=lambda item: item[1], reverse=True)[:WEIGHTS["top_symbols"]]
+
+
+def measure(func, repeat: int, *args) -> float:
+    """Meilleur temps (ms) sur `repeat` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du filtre de spread et des poids vectorisés")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000], help="Tailles d'univers")
+    parser.add_argument("--repeat", type=int, default=20, help="Nombre de passes (meilleure retenue)")
+    args = parser.parse_args()
+
+    if np is None:
+        print("❌ NumPy indisponible : le pipeline colonnaire retombe sur les boucles")
+        return
+
+    columnar_filter = ColumnarSymbolFilter(logger=_SilentLogger())
+    calculator = WeightCalculator(logger=_SilentLogger())
+    for size in args.sizes:
+        rows, spreads = generate_rows(size)
+        loop_result = run_loop(rows, spreads)
+        columnar_result = run_pipeline(columnar_filter, calculator, rows, spreads)
+        parity = "✅" if loop_result == columnar_result else "❌"
+
+        loop_ms = measure(run_loop, args.repeat, rows, spreads)
+        columnar_ms = measure(run_pipeline, args.repeat, columnar_filter, calculator, rows, spreads)
+        print(
+            f"📊 {size:>6} symboles  boucles {loop_ms:>8.2f} ms   colonnaire {columnar_ms:>8.2f} ms"
+            f"   x{loop_ms / columnar_ms:.2f}   parité {parity}"
+        )
+
+
+if __name__ == "__main__":
+    main()
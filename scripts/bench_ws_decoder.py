@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark du routage des trames WebSocket publiques.
+
+Mesure le débit (messages/seconde sur un cœur) de PublicMessageRouter.route
+pour chaque backend JSON disponible, avec et sans filtrage par préfixe de
+topic, par rapport à la référence json.loads sans filtrage.
+
+Utilisation :
+    python scripts/bench_ws_decoder.py
+    python scripts/bench_ws_decoder.py --frames trames.txt --repeat 5
+
+Le fichier --frames contient une trame brute par ligne (enregistrée depuis
+le WebSocket public). Sans fichier, un échantillon représentatif est généré
+(deltas tickers sur 500 symboles, orderbook.50, publicTrade).
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Ajouter le répertoire src au path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ws.decoder import BACKEND_PREFERENCE, FrameDecoder, resolve_backend
+from ws.public.parser_router import PublicMessageRouter
+
+
+def generate_frames(count: int, seed: int = 42) -> list:
+    """Génère des trames au format Bybit v5 (répartition proche du flux réel)."""
+    rng = random.Random(seed)
+    symbols = [f"SYM{i}USDT" for i in range(500)]
+    frames = []
+    for i in range(count):
+        symbol = rng.choice(symbols)
+        ts = 1712345678000 + i
+        kind = rng.random()
+        if kind < 0.70:
+            price = 100 + rng.random()
+            frames.append(json.dumps({
+                "topic": f"tickers.{symbol}",
+                "type": "delta",
+                "data": {
+                    "symbol": symbol,
+                    "lastPrice": f"{price:.4f}",
+                    "markPrice": f"{price + 0.01:.4f}",
+                    "bid1Price": f"{price - 0.01:.4f}",
+                    "ask1Price": f"{price + 0.02:.4f}",
+                    "fundingRate": "0.0001",
+                },
+                "cs": i,
+                "ts": ts,
+            }, separators=(",", ":")))
+        elif kind < 0.85:
+            frames.append(json.dumps({
+                "topic": f"orderbook.50.{symbol}",
+                "type": "delta",
+                "ts": ts,
+                "data": {
+                    "s": symbol,
+                    "b": [[f"{99 - j * 0.01:.2f}", f"{rng.random() * 10:.3f}"] for j in range(5)],
+                    "a": [[f"{101 + j * 0.01:.2f}", f"{rng.random() * 10:.3f}"] for j in range(5)],
+                    "u": i,
+                    "seq": i,
+                },
+                "cts": ts,
+            }, separators=(",", ":")))
+        else:
+            frames.append(json.dumps({
+                "topic": f"publicTrade.{symbol}",
+                "type": "snapshot",
+                "ts": ts,
+                "data": [{"T": ts, "s": symbol, "S": "Buy", "v": "0.01", "p": "100.0", "i": str(i)}],
+            }, separators=(",", ":")))
+    return frames
+
+
+def load_frames(path: str) -> list:
+    """Charge des trames enregistrées (une trame brute par ligne)."""
+    with open(path, "r", encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+class _SilentLogger:
+    def warning(self, *args, **kwargs):
+        pass
+
+
+def measure_once(frames: list, decoder: FrameDecoder) -> float:
+    """Retourne le débit (messages/s) d'une passe complète."""
+    logger = _SilentLogger()
+    router = PublicMessageRouter(on_ticker=lambda changes: None)
+    router.decoder = decoder
+    route = router.route
+    start = time.perf_counter()
+    for frame in frames:
+        route(frame, logger, "linear")
+    return len(frames) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark du décodage des trames WS publiques")
+    parser.add_argument("--frames", help="Fichier de trames enregistrées (une par ligne)")
+    parser.add_argument("--count", type=int, default=50000, help="Trames générées sans --frames")
+    parser.add_argument("--repeat", type=int, default=3, help="Nombre de passes (meilleure retenue)")
+    args = parser.parse_args()
+
+    frames = load_frames(args.frames) if args.frames else generate_frames(args.count)
+    print(f"📊 {len(frames)} trames ({'enregistrées' if args.frames else 'générées'})")
+
+    prefixes = ("tickers.", "orderbook.")
+    variants = [("json (référence, sans filtre)", "json", ())]
+    for name in BACKEND_PREFERENCE:
+        if resolve_backend(name)[0] != name:
+            continue
+        if name != "json":
+            variants.append((f"{name} (sans filtre)", name, ()))
+        variants.append((f"{name} (filtre topic)", name, prefixes))
+
+    # Passes entrelacées : la dérive de fréquence CPU pèse sur toutes les variantes
+    best = {label: 0.0 for label, _, _ in variants}
+    for _ in range(args.repeat):
+        for label, name, topic_prefixes in variants:
+            rate = measure_once(frames, FrameDecoder(name, topic_prefixes))
+            best[label] = max(best[label], rate)
+
+    baseline = best[variants[0][0]]
+    for label, _, _ in variants:
+        print(f"{label:<40} {best[label]:>12,.0f} msg/s   x{best[label] / baseline:.2f}")
+
+if __name__ == "__main__":
+    main()
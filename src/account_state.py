@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Cache de l'état du compte (soldes par coin) partagé par le hedge et le sizing.
+
+Ce module remplace les appels get_wallet_balance répétés sur le chemin
+critique (juste après l'exécution d'un perp) par un état en mémoire :
+- amorcé par un appel REST (UNIFIED, repli SPOT), le type de compte qui
+  répond est mémorisé pour les appels suivants
+- alimenté ensuite par le topic privé "wallet", reçu sur la WebSocket
+  privée du PositionMonitor (aucune connexion dédiée)
+- chaque coin porte un numéro de version : un appelant peut attendre la
+  mise à jour qui suit un ordre (wait_for_update) au lieu d'un sleep fixe
+
+Sans WebSocket authentifiée, les soldes restent valides
+ACCOUNT_STATE_MAX_AGE_SECONDS ; au-delà, la lecture mémoire renvoie None
+et l'appelant rafraîchit par REST (refresh / fetch_available).
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from config.constants import ACCOUNT_STATE_MAX_AGE_SECONDS
+from logging_setup import setup_logging
+
+
+@dataclass(frozen=True)
+class CoinBalance:
+    """
+    Solde d'un coin du compte.
+
+    Attributes:
+        coin: Nom du coin (ex: "USDT")
+        wallet_balance: Solde total du portefeuille
+        available: Solde disponible (hors fonds bloqués par des ordres)
+        locked: Solde bloqué par des ordres ouverts
+        version: Version du solde (incrémentée à chaque mise à jour)
+        updated_at: Horodatage local de la dernière mise à jour
+    """
+
+    coin: str
+    wallet_balance: float = 0.0
+    available: float = 0.0
+    locked: float = 0.0
+    version: int = 0
+    updated_at: float = field(default_factory=time.time)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_coin_balance(coin: Dict[str, Any], version: int = 0) -> Optional[CoinBalance]:
+    """
+    Convertit une entrée "coin" (REST ou WebSocket) en CoinBalance.
+
+    Args:
+        coin: Entrée coin de la réponse Bybit
+        version: Version à attribuer au solde
+
+    Returns:
+        CoinBalance ou None si l'entrée est invalide
+    """
+    name = coin.get("coin")
+    if not name:
+        return None
+    wallet_balance = _to_float(coin.get("walletBalance")) or 0.0
+    locked = _to_float(coin.get("locked")) or 0.0
+    # availableToWithdraw est vide sur les comptes unifiés récents : repli sur free,
+    # puis sur le solde total diminué des fonds bloqués
+    available = _to_float(coin.get("availableToWithdraw"))
+    if not available:
+        available = _to_float(coin.get("free"))
+    if not available:
+        available = max(wallet_balance - locked, 0.0)
+    return CoinBalance(
+        coin=name,
+        wallet_balance=wallet_balance,
+        available=available,
+        locked=locked,
+        version=version,
+    )
+
+
+class AccountStateCache:
+    """
+    Registre thread-safe des soldes du compte.
+
+    Écrit par le thread WebSocket du PositionMonitor (on_topic) et par les
+    rafraîchissements REST, lu par les gestionnaires (hedge spot, sizing).
+    """
+
+    # Types de compte essayés pour le REST (le premier qui répond est conservé)
+    ACCOUNT_TYPES = ("UNIFIED", "SPOT")
+
+    def __init__(self, bybit_client=None, testnet: bool = True, logger=None):
+        """
+        Initialise le cache.
+
+        Args:
+            bybit_client: Client Bybit synchrone (amorçage et rafraîchissements REST)
+            testnet: Utiliser le testnet (True) ou mainnet (False)
+            logger: Logger pour les messages (optionnel)
+        """
+        self.bybit_client = bybit_client
+        self.testnet = testnet
+        self.logger = logger or setup_logging()
+        self._balances: Dict[str, CoinBalance] = {}
+        self._version = 0
+        self._condition = threading.Condition()
+        self._account_type: Optional[str] = None
+        self._snapshot_at = 0.0
+        self._live = False
+
+    # ===== CONNEXION =====
+
+    def start(self) -> bool:
+        """
+        Amorce le cache par REST ; le topic wallet est ensuite transmis par
+        le PositionMonitor (on_topic / set_live).
+
+        Returns:
+            True si l'amorçage REST a réussi
+        """
+        return self.refresh()
+
+    def set_live(self, live: bool) -> None:
+        """
+        Indique si la WebSocket privée transmettant le topic wallet est authentifiée.
+
+        À la (re)connexion, les soldes sont rechargés par REST avant de passer
+        en direct : les mises à jour perdues pendant la coupure sont rattrapées.
+        Si le rechargement échoue, les lectures restent soumises à l'âge du
+        snapshot.
+
+        Args:
+            live: True si les soldes sont poussés, False après une coupure
+        """
+        if live and not self._live:
+            live = self.refresh()
+        self._live = live
+
+    def is_live(self) -> bool:
+        """True si la WebSocket privée est authentifiée (soldes poussés en continu)."""
+        return self._live
+
+    # ===== ALIMENTATION =====
+
+    def on_topic(self, topic: str, data: Dict[str, Any]) -> None:
+        """
+        Applique un message privé "wallet".
+
+        Args:
+            topic: Topic du message
+            data: Message décodé
+        """
+        if topic != "wallet":
+            return
+        try:
+            self.apply_wallet(data.get("data") or ())
+        except Exception as e:
+            self.logger.warning(f"[WALLET] ⚠️ Erreur traitement message wallet: {e}")
+
+    def apply_wallet(self, accounts, snapshot: bool = False) -> None:
+        """
+        Applique une liste de comptes (format Bybit : [{"coin": [...]}, ...]).
+
+        Args:
+            accounts: Comptes de la réponse REST ou du message WebSocket
+            snapshot: True pour un état complet (les coins absents passent à zéro)
+        """
+        with self._condition:
+            seen = set()
+            for account in accounts:
+                for coin in account.get("coin") or ():
+                    balance = parse_coin_balance(coin, self._version + 1)
+                    if balance is None:
+                        continue
+                    self._version += 1
+                    self._balances[balance.coin] = balance
+                    seen.add(balance.coin)
+            if snapshot:
+                for name in [c for c in self._balances if c not in seen]:
+                    self._version += 1
+                    self._balances[name] = CoinBalance(coin=name, version=self._version)
+                self._snapshot_at = time.monotonic()
+            self._condition.notify_all()
+
+    def refresh(self) -> bool:
+        """
+        Recharge tous les soldes par REST.
+
+        Returns:
+            True si les soldes ont été rechargés
+        """
+        if self.bybit_client is None:
+            return False
+        account_types = (self._account_type,) if self._account_type else self.ACCOUNT_TYPES
+        last_error: Optional[Exception] = None
+        for account_type in account_types:
+            try:
+                response = self.bybit_client.get_wallet_balance(account_type=account_type)
+            except RuntimeError as e:
+                # "accountType only support UNIFIED" (10001) : essayer le type suivant
+                last_error = e
+                continue
+            response = response or {}
+            accounts = (response.get("result") or response).get("list") or ()
+            self.apply_wallet(accounts, snapshot=True)
+            self._account_type = account_type
+            return True
+        self.logger.warning(f"[WALLET] ⚠️ Impossible de récupérer les soldes: {last_error}")
+        return False
+
+    # ===== LECTURE =====
+
+    def is_fresh(self) -> bool:
+        """True si les soldes en mémoire peuvent être utilisés sans appel REST."""
+        if not self._snapshot_at:
+            return False
+        return self._live or time.monotonic() - self._snapshot_at <= ACCOUNT_STATE_MAX_AGE_SECONDS
+
+    def get_balance(self, coin: str) -> Optional[CoinBalance]:
+        """
+        Dernier solde connu d'un coin (sans contrôle de fraîcheur).
+
+        Returns:
+            CoinBalance ou None si le coin n'a jamais été vu
+        """
+        with self._condition:
+            return self._balances.get(coin)
+
+    def get_available(self, coin: str) -> Optional[float]:
+        """
+        Solde disponible d'un coin lu en mémoire.
+
+        Args:
+            coin: Nom du coin (ex: "USDT")
+
+        Returns:
+            Solde disponible (0.0 si le coin est absent du compte),
+            ou None si les soldes en mémoire ne sont plus fiables
+        """
+        if not self.is_fresh():
+            return None
+        balance = self.get_balance(coin)
+        return balance.available if balance else 0.0
+
+    def fetch_available(self, coin: str) -> float:
+        """
+        Solde disponible d'un coin, rafraîchi par REST si la mémoire n'est plus fiable.
+
+        Args:
+            coin: Nom du coin (ex: "USDT")
+
+        Returns:
+            Solde disponible (0.0 si inconnu ou erreur)
+        """
+        available = self.get_available(coin)
+        if available is None:
+            self.refresh()
+            balance = self.get_balance(coin)
+            available = balance.available if balance else 0.0
+        return available
+
+    def version(self, coin: str) -> int:
+        """Version courante du solde d'un coin (0 si jamais vu)."""
+        balance = self.get_balance(coin)
+        return balance.version if balance else 0
+
+    def wait_for_update(self, coin: str, version: int, timeout: float) -> bool:
+        """
+        Attend une version du solde plus récente que celle donnée.
+
+        Args:
+            coin: Nom du coin
+            version: Version lue avant l'opération (ex: avant un achat)
+            timeout: Délai maximal en secondes
+
+        Returns:
+            True si le solde a été mis à jour dans le délai
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: coin in self._balances and self._balances[coin].version > version,
+                timeout,
+            )
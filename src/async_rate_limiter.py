@@ -41,26 +41,40 @@ class AsyncRateLimiter:
         garantir le respect des limites de taux.
         """
         while True:
-            now = time.time()
             async with self._lock:
-                # Retirer les timestamps hors fenêtre
-                while (
-                    self._timestamps
-                    and now - self._timestamps[0] > self.window_seconds
-                ):
-                    self._timestamps.popleft()
-
-                # Vérifier si on peut faire l'appel
-                if len(self._timestamps) < self.max_calls:
-                    self._timestamps.append(now)
+                wait_time = self.try_acquire()
+                if wait_time <= 0:
                     return
 
-                # Calculer le temps à attendre
-                wait_time = self.window_seconds - (now - self._timestamps[0])
+            # Attendre en dehors du lock, jusqu'à la libération du prochain créneau
+            await asyncio.sleep(wait_time)
 
-            # Attendre en dehors du lock
-            if wait_time > 0:
-                await asyncio.sleep(min(wait_time, 0.05))
+    def try_acquire(self) -> float:
+        """
+        Réserve un appel sans attendre.
+
+        Non bloquant : l'appelant attend lui-même (asyncio.sleep) le délai
+        retourné puis réessaie.
+
+        Returns:
+            0 si l'appel est réservé, sinon délai (secondes) avant le
+            prochain créneau libre
+        """
+        now = time.time()
+        # Retirer les timestamps hors fenêtre
+        while (
+            self._timestamps
+            and now - self._timestamps[0] > self.window_seconds
+        ):
+            self._timestamps.popleft()
+
+        # Vérifier si on peut faire l'appel
+        if len(self._timestamps) < self.max_calls:
+            self._timestamps.append(now)
+            return 0.0
+
+        # Calculer le temps à attendre
+        return max(self.window_seconds - (now - self._timestamps[0]), 0.001)
 
     def reset(self):
         """Réinitialise le rate limiter (vide l'historique)."""
@@ -87,6 +87,7 @@ from position_monitor import PositionMonitor
 from shutdown_manager import ShutdownManager
 from thread_manager import ThreadManager
 from scheduler_manager import SchedulerManager
+from funding_event_scheduler import FundingEventScheduler
 from funding_close_manager import FundingCloseManager
 
 # Gestion des exceptions
@@ -234,11 +235,20 @@ class BotOrchestrator:
 
         # Scheduler sera initialisé avec la configuration dans start()
         self.scheduler = None
+        self.funding_events = None
 
         # PositionMonitor pour surveiller les positions
         self.position_monitor = None
         self.funding_close_manager = None
+        # Carnet des positions / ordres ouverts alimenté par la WS du PositionMonitor
+        self.position_book = None
         self.spot_hedge_manager: Optional[SpotHedgeManagerInterface] = None
+        # Suivi des ordres par WebSocket privée (partagé par les SmartOrderPlacer)
+        self.order_tracker = None
+        # Client REST asynchrone partagé (scheduler, surveillance d'ordres, hedge)
+        self.async_bybit_client = None
+        # Soldes du compte alimentés par la WS privée wallet (hedge, sizing)
+        self.account_state = None
 
         # Initialiser les managers via l'initialiseur
         self._initialize_components()
@@ -821,16 +831,21 @@ class BotOrchestrator:
         # Validation des paramètres
         validate_dict_param('config', config)
 
-        # 7. Initialiser et démarrer le Scheduler pour la surveillance du funding
+        # 7. Démarrer le suivi des ordres par WebSocket privée et le client REST asynchrone
+        self._initialize_order_tracker()
+        self._initialize_async_client()
+        self._initialize_account_state()
+
+        # 8. Initialiser et démarrer le Scheduler pour la surveillance du funding
         self._initialize_scheduler(config)
 
-        # 8. Initialiser le PositionMonitor
+        # 9. Initialiser le PositionMonitor
         self._initialize_position_monitor()
 
-        # 9. Initialiser le FundingCloseManager
+        # 10. Initialiser le FundingCloseManager
         self._initialize_funding_close_manager()
 
-        # 10. Initialiser le SpotHedgeManager
+        # 11. Initialiser le SpotHedgeManager
         self._initialize_spot_hedge_manager(config)
 
     def _configure_specialized_callbacks(self) -> None:
@@ -907,8 +922,8 @@ class BotOrchestrator:
             config: Configuration du bot contenant les paramètres de funding
 
         Side effects:
-            - Crée self.scheduler
-            - Lance une tâche asyncio pour la surveillance
+            - Crée self.scheduler et self.funding_events
+            - Lance une tâche asyncio pilotée par les événements de funding
         """
         funding_threshold = config.get('funding_threshold_minutes', 60)
         auto_trading_config = config.get('auto_trading', {})
@@ -919,8 +934,89 @@ class BotOrchestrator:
             auto_trading_config=auto_trading_config,
             on_position_opened_callback=None  # Sera défini après
         )
-        # Passer une fonction callback pour récupérer les données à jour
-        asyncio.create_task(self.scheduler.run_with_callback(self._get_funding_data_for_scheduler))
+        # Carnets d'ordres lus depuis le flux WebSocket (aucun REST sur le chemin d'ordre)
+        self.scheduler.set_orderbook_source(self.ws_manager)
+        # États des ordres poussés par la WS privée (plus de polling REST des ordres ouverts)
+        if self.order_tracker:
+            self.scheduler.set_order_tracker(self.order_tracker)
+        # Appels REST du scheduler sur l'event loop (sans run_in_thread)
+        if self.async_bybit_client:
+            self.scheduler.set_async_client(self.async_bybit_client)
+        # Événements de funding indexés sur nextFundingTime (deltas WS + reconstructions de watchlist)
+        self.funding_events = FundingEventScheduler(self.scheduler.event_offsets(), logger=self.logger)
+        self.scheduler.set_funding_events(self.funding_events, self._fallback_data_manager.get_funding_rate)
+        self.watchlist_manager.set_on_watchlist_callback(self.funding_events.set_watchlist)
+        self.data_manager.storage.set_on_funding_time_callback(self.funding_events.on_funding_time)
+        self.funding_events.set_watchlist(self.watchlist_manager.get_watchlist_funding_times())
+        asyncio.create_task(self.scheduler.run_events())
+
+    def _initialize_order_tracker(self):
+        """
+        Initialise et démarre l'OrderLifecycleTracker (topics privés order/execution).
+
+        Side effects:
+            - Crée self.order_tracker (None si clés API absentes)
+        """
+        try:
+            from order_tracker import OrderLifecycleTracker
+
+            tracker = OrderLifecycleTracker(testnet=self.testnet, logger=self.logger)
+            self.order_tracker = tracker if tracker.start() else None
+        except Exception as e:
+            self.logger.error(
+                "Erreur initialisation OrderLifecycleTracker: {} "
+                "(composant: suivi des ordres)",
+                str(e)
+            )
+            self.order_tracker = None
+
+    def _initialize_account_state(self):
+        """
+        Initialise l'AccountStateCache (amorçage REST ; le topic privé wallet
+        est transmis par le PositionMonitor).
+
+        Side effects:
+            - Crée self.account_state (None sans client authentifié)
+        """
+        if not self.bybit_client:
+            return
+        try:
+            from account_state import AccountStateCache
+
+            self.account_state = AccountStateCache(
+                self.bybit_client, testnet=self.testnet, logger=self.logger
+            )
+            self.account_state.start()
+        except Exception as e:
+            self.logger.error(
+                "Erreur initialisation AccountStateCache: {} "
+                "(composant: soldes du compte)",
+                str(e)
+            )
+            self.account_state = None
+
+    def _initialize_async_client(self):
+        """
+        Crée l'AsyncBybitClient à partir de la configuration du client synchrone.
+
+        Side effects:
+            - Crée self.async_bybit_client (None sans client authentifié)
+        """
+        if not self.bybit_client:
+            return
+        try:
+            from bybit_client import AsyncBybitClient
+
+            self.async_bybit_client = AsyncBybitClient.from_client(
+                self.bybit_client, logger=self.logger
+            )
+        except Exception as e:
+            self.logger.error(
+                "Erreur initialisation AsyncBybitClient: {} "
+                "(composant: client REST asynchrone)",
+                str(e)
+            )
+            self.async_bybit_client = None
 
     def _initialize_position_monitor(self):
         """
@@ -933,15 +1029,25 @@ class BotOrchestrator:
             - Crée self.position_monitor
             - Démarre la surveillance des positions
             - Configure les callbacks d'ouverture/fermeture
+            - Crée self.position_book (alimenté par la WebSocket du moniteur)
         """
         try:
+            from position_book import PositionBook
+
+            self.position_book = PositionBook(logger=self.logger)
             self.position_monitor = PositionMonitor(
                 testnet=self.testnet,
                 logger=self.logger,
                 on_position_opened=self._on_position_opened,
-                on_position_closed=self._on_position_closed
+                on_position_closed=self._on_position_closed,
+                position_book=self.position_book,
+                account_state=self.account_state,
             )
 
+            # Confirmation des entrées lue dans le carnet (plus de polling REST)
+            if self.scheduler:
+                self.scheduler.set_position_book(self.position_book)
+
             # Démarrer le PositionMonitor
             self.position_monitor.start()
 
@@ -954,6 +1060,7 @@ class BotOrchestrator:
                 str(e)
             )
             self.position_monitor = None
+            self.position_book = None
 
     def _initialize_funding_close_manager(self):
         """
@@ -978,7 +1085,13 @@ class BotOrchestrator:
                 logger=self.logger,
                 bybit_client=self.bybit_client,
                 on_position_closed=self._on_position_closed,
-                auto_trading_config=auto_trading_config
+                auto_trading_config=auto_trading_config,
+                # Carnet partagé seulement si la WS du PositionMonitor l'alimente
+                position_book=(
+                    self.position_book
+                    if self.position_monitor and self.position_monitor.is_running()
+                    else None
+                ),
             )
             self.funding_close_manager.start()
             if self.funding_close_manager.is_enabled():
@@ -1035,6 +1148,16 @@ class BotOrchestrator:
                 auto_trading_config=auto_trading_config,
                 spot_checker=self.spot_checker
             )
+            spot_placer = getattr(self.spot_hedge_manager, "smart_placer", None)
+            if self.order_tracker and spot_placer:
+                spot_placer.set_order_tracker(self.order_tracker)
+            if self.async_bybit_client:
+                self.spot_hedge_manager.set_async_client(self.async_bybit_client)
+            if self.account_state:
+                self.spot_hedge_manager.set_account_state(self.account_state)
+            # Jambe spot préparée avant le funding et lancée dès le fill perp
+            if self.scheduler:
+                self.scheduler.set_hedge_manager(self.spot_hedge_manager)
             self.logger.info(
                 "SpotHedgeManager initialisé (testnet: {}, client: {})",
                 self.testnet,
@@ -1114,24 +1237,6 @@ class BotOrchestrator:
 
         self._position_event_handler.on_position_closed(symbol, position_data)
 
-    # ============================================================================
-    # MÉTHODES DE DONNÉES ET MONITORING
-    # ============================================================================
-
-    def _get_funding_data_for_scheduler(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Récupère les données de funding formatées pour le Scheduler.
-
-        Cette méthode délègue la récupération des données de funding
-        au FallbackDataManager qui gère le cache et les sources de données.
-
-        Returns:
-            Dict[str, Dict[str, Any]]: Données de funding formatées
-                - Clé: Symbole (ex: "BTCUSDT")
-                - Valeur: Dict avec funding_rate, funding_time, etc.
-        """
-        return self._fallback_data_manager.get_funding_data_for_scheduler()
-
     # ============================================================================
     # MÉTHODES DE STATUT ET ARRÊT
     # ============================================================================
@@ -1231,6 +1336,17 @@ class BotOrchestrator:
                     str(e)
                 )
 
+        # Arrêter le suivi des ordres par WebSocket
+        if self.order_tracker:
+            try:
+                self.order_tracker.stop()
+            except Exception as e:
+                self.logger.warning(
+                    "Erreur arrêt OrderLifecycleTracker: {} "
+                    "(composant: suivi des ordres)",
+                    str(e)
+                )
+
         # Arrêter le SpotHedgeManager si actif
         if self.spot_hedge_manager:
             try:
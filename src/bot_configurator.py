@@ -31,6 +31,7 @@ tout ce qui est nécessaire avant de construire la watchlist.
 📚 POUR EN SAVOIR PLUS : Consultez GUIDE_DEMARRAGE_BOT.md
 """
 
+import threading
 from typing import Dict, Tuple, Set
 from logging_setup import setup_logging
 from interfaces.bybit_client_interface import BybitClientInterface
@@ -41,6 +42,7 @@ from volatility_tracker import VolatilityTracker
 from watchlist_manager import WatchlistManager
 from display_manager import DisplayManager
 from config.timeouts import TimeoutConfig
+from warm_start_cache import configure_warm_start_cache, get_warm_start_cache
 
 
 class BotConfigurator:
@@ -103,11 +105,14 @@ class BotConfigurator:
             client: BybitClientInterface = BybitPublicClient(testnet=self.testnet, timeout=TimeoutConfig.HTTP_REQUEST)
             base_url = client.public_base_url()
 
-            # Récupérer l'univers perp
-            perp_data = get_perp_symbols(base_url, timeout=TimeoutConfig.HTTP_REQUEST)
-
-            # NEW: Récupérer les symboles spot
-            spot_symbols = get_spot_symbols(base_url, timeout=TimeoutConfig.HTTP_REQUEST)
+            warm_cache = configure_warm_start_cache(logger=self.logger)
+            if warm_cache is None:
+                universe = self._fetch_universe(base_url)
+                perp_data = universe["perp_data"]
+                spot_symbols = set(universe["spot_symbols"])
+            else:
+                # Démarrage à chaud : univers lu sur disque, revalidé en arrière-plan
+                perp_data, spot_symbols = self._load_warm_universe(warm_cache, base_url)
 
             self.logger.info(
                 f"📊 Symboles récupérés: {perp_data['total']} perp, "
@@ -120,6 +125,84 @@ class BotConfigurator:
             self.logger.error(f"❌ Erreur récupération données marché : {e}")
             raise
 
+    def _load_warm_universe(self, warm_cache, base_url: str) -> Tuple[Dict, Set[str]]:
+        """
+        Charge l'univers depuis le cache de démarrage à chaud.
+
+        Une revalidation terminée avant la distribution des structures
+        remplace l'univers servi ; après, elle est appliquée en place.
+
+        Returns:
+            Tuple (perp_data, spot_symbols)
+        """
+        current: Dict = {}
+        lock = threading.Lock()
+
+        def _on_refresh(fresh: Dict) -> None:
+            with lock:
+                if "perp_data" not in current:
+                    current["fresh"] = fresh
+                    return
+            self._apply_universe_refresh(current, fresh)
+
+        universe = warm_cache.get_or_fetch(
+            "instruments",
+            base_url,
+            lambda: self._fetch_universe(base_url),
+            on_refresh=_on_refresh,
+        )
+        with lock:
+            universe = current.pop("fresh", universe)
+            current.update(
+                perp_data=universe["perp_data"],
+                spot_symbols=set(universe["spot_symbols"]),
+            )
+        return current["perp_data"], current["spot_symbols"]
+
+    def _fetch_universe(self, base_url: str) -> Dict:
+        """
+        Récupère l'univers perp et spot depuis l'API.
+
+        Returns:
+            Dict {"perp_data": ..., "spot_symbols": [...]} (sérialisable)
+        """
+        # Récupérer l'univers perp
+        perp_data = get_perp_symbols(base_url, timeout=TimeoutConfig.HTTP_REQUEST)
+
+        # NEW: Récupérer les symboles spot
+        spot_symbols = get_spot_symbols(base_url, timeout=TimeoutConfig.HTTP_REQUEST)
+
+        return {"perp_data": perp_data, "spot_symbols": sorted(spot_symbols)}
+
+    def _apply_universe_refresh(self, current: Dict, fresh: Dict) -> None:
+        """
+        Applique en place l'univers revalidé aux structures déjà distribuées.
+
+        Args:
+            current: {"perp_data": dict, "spot_symbols": set} utilisés par le bot
+            fresh: Univers fraîchement récupéré (format de _fetch_universe)
+        """
+        perp_data = current.get("perp_data")
+        spot_symbols = current.get("spot_symbols")
+        if perp_data is None or spot_symbols is None:
+            return
+        fresh_perp = fresh["perp_data"]
+        added = set(fresh_perp["categories"]) - set(perp_data.get("categories", {}))
+        removed = set(perp_data.get("categories", {})) - set(fresh_perp["categories"])
+
+        # Le mapping des catégories est partagé par référence avec les managers
+        perp_data.setdefault("categories", {}).update(fresh_perp["categories"])
+        perp_data["linear"] = fresh_perp["linear"]
+        perp_data["inverse"] = fresh_perp["inverse"]
+        perp_data["total"] = fresh_perp["total"]
+        spot_symbols.update(fresh["spot_symbols"])
+
+        if added or removed:
+            self.logger.info(
+                f"🔄 Univers revalidé: {len(added)} symbole(s) ajouté(s), "
+                f"{len(removed)} retiré(s)"
+            )
+
     def configure_managers(
         self,
         config: Dict,
@@ -151,6 +234,15 @@ class BotConfigurator:
         # Configurer le tracker de volatilité
         volatility_ttl_sec = int(config.get("volatility_ttl_sec", 120) or 120)
         volatility_tracker.ttl_seconds = volatility_ttl_sec
+        volatility_tracker.set_volatility_measure(
+            config.get("volatility_measure") or "range_5",
+            config.get("volatility_windows"),
+        )
+
+        # Restaurer la dernière volatilité persistée (démarrage à chaud)
+        warm_cache = get_warm_start_cache()
+        if warm_cache is not None:
+            volatility_tracker.set_warm_cache(warm_cache)
 
         # Configurer l'intervalle d'affichage
         display_interval = int(
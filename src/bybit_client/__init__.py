@@ -2,8 +2,9 @@
 """
 Client Bybit pour les opérations synchrones avec authentification privée.
 
-Ce package fournit deux clients :
+Ce package fournit trois clients :
 - BybitClient : Client authentifié pour l'API privée
+- AsyncBybitClient : Équivalent asyncio de BybitClient (sans thread)
 - BybitPublicClient : Client non authentifié pour l'API publique
 
 Exemple d'utilisation :
@@ -25,7 +26,10 @@ Exemple d'utilisation :
 # Import de BybitClient depuis private_client.py (refactorisé)
 from .private_client import BybitClient
 
+# Client asynchrone natif (httpx.AsyncClient mutualisé)
+from .async_client import AsyncBybitClient
+
 # Importer BybitPublicClient depuis le nouveau module
 from .public_client import BybitPublicClient
 
-__all__ = ['BybitClient', 'BybitPublicClient']
+__all__ = ['BybitClient', 'AsyncBybitClient', 'BybitPublicClient']
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Client Bybit asynchrone (authentifié).
+
+Ce module contient AsyncBybitClient, la version native asyncio de
+BybitClient. Les appels REST ne passent plus par run_in_thread :
+- un seul httpx.AsyncClient mutualisé (HTTPClientManager, HTTP/2 si h2
+  est installé) pour toutes les coroutines de l'event loop principal
+- signature HMAC-SHA256 recalculée à chaque tentative (timestamp frais)
+- retry / backoff exponentiel via asyncio.sleep (Retry-After respecté)
+- Circuit Breaker partagé avec la logique du client synchrone
+- rate limiting réel : chaque requête réserve un créneau et attend sans
+  bloquer l'event loop
+
+Les mêmes helpers que BybitClient sont réutilisés (BybitAuthenticator,
+BybitErrorHandler, BybitRateLimiter).
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from circuit_breaker import CircuitBreaker, CircuitBreakerOpen
+from config.timeouts import TimeoutConfig
+from enhanced_metrics import record_api_call
+from http_client_manager import get_async_http_client
+from interfaces.bybit_client_interface import BybitClientInterface
+from bybit_client.auth import BybitAuthenticator
+from bybit_client.error_handler import BybitErrorHandler
+from bybit_client.private_client import parse_server_time_ms
+from bybit_client.rate_limiter import BybitRateLimiter
+
+# Codes retCode / HTTP signalant un dépassement de limite (retry après délai)
+_RATE_LIMIT_RET_CODE = 10016
+_RATE_LIMIT_STATUS = 429
+
+
+class _RetryableError(Exception):
+    """Erreur temporaire à retenter après un délai imposé (rate limit)."""
+
+    def __init__(self, message: str, delay: float):
+        super().__init__(message)
+        self.delay = delay
+
+
+class AsyncBybitClient(BybitClientInterface):
+    """
+    Client asynchrone pour l'API Bybit v5 (publique et privée).
+
+    Les méthodes d'API sont des coroutines avec les mêmes signatures et
+    les mêmes valeurs de retour (champ "result") que BybitClient.
+
+    Le httpx.AsyncClient mutualisé est lié à l'event loop qui l'utilise en
+    premier (event loop principal du bot). Un appel depuis un autre event
+    loop (asyncio.run dans un thread) utilise un client éphémère pour ne
+    jamais partager de connexion entre deux loops.
+
+    Example:
+        ```python
+        client = AsyncBybitClient.from_client(bybit_client)
+        orderbook, balance = await asyncio.gather(
+            client.get_orderbook(symbol="BTCUSDT", limit=1),
+            client.get_wallet_balance(),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        testnet: bool = True,
+        timeout: int = None,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        recv_window_ms: int = 7000,
+        time_sync_enabled: bool = True,
+        time_sync_interval_seconds: int = 60,
+        logger=None,
+    ):
+        """
+        Initialise le client asynchrone.
+
+        Args:
+            testnet (bool): Utiliser le testnet (True) ou le marché réel (False)
+            timeout (int): Timeout des requêtes HTTP en secondes
+                (utilise TimeoutConfig.HTTP_REQUEST par défaut)
+            api_key (str | None): Clé API Bybit
+            api_secret (str | None): Secret API Bybit
+            max_retries (int): Nombre maximum de tentatives par requête
+            backoff_base (float): Délai de base du backoff exponentiel (secondes)
+            recv_window_ms (int): Fenêtre de réception Bybit en millisecondes
+            time_sync_enabled (bool): Synchroniser l'horloge avec le serveur
+            time_sync_interval_seconds (int): Intervalle de resynchronisation
+            logger: Logger optionnel pour les messages
+
+        Raises:
+            RuntimeError: Si les clés API sont manquantes
+            ValueError: Si les clés API utilisent des valeurs placeholder
+        """
+        BybitAuthenticator.validate_credentials(api_key, api_secret)
+
+        self.testnet = testnet
+        self.timeout = timeout if timeout is not None else TimeoutConfig.HTTP_REQUEST
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.max_retries = max(1, max_retries)
+        self.backoff_base = backoff_base
+        self.recv_window_ms = recv_window_ms if recv_window_ms and recv_window_ms > 0 else 10000
+        self._time_sync_enabled = time_sync_enabled
+        self._time_sync_interval_seconds = max(10, time_sync_interval_seconds or 60)
+        self._last_time_sync = 0.0
+        self.logger = logger
+
+        from config.urls import URLConfig
+        self.base_url = URLConfig.get_api_url(testnet)
+
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=5,
+            timeout_seconds=60,
+            name=f"BybitAsyncAPI-{'testnet' if testnet else 'mainnet'}",
+        )
+
+        self._authenticator = BybitAuthenticator(api_key, api_secret, recv_window_ms=self.recv_window_ms)
+        self._error_handler = BybitErrorHandler(logger)
+        self._rate_limiter = BybitRateLimiter()
+        # Event loop propriétaire du client httpx mutualisé
+        self._home_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_client(cls, client, logger=None) -> "AsyncBybitClient":
+        """
+        Construit un client asynchrone avec la configuration d'un BybitClient.
+
+        L'offset d'horloge déjà mesuré par le client synchrone est repris.
+
+        Args:
+            client: BybitClient synchrone configuré
+            logger: Logger optionnel (celui du client par défaut)
+
+        Returns:
+            AsyncBybitClient équivalent
+        """
+        async_client = cls(
+            testnet=client.testnet,
+            timeout=client.timeout,
+            api_key=client.api_key,
+            api_secret=client.api_secret,
+            max_retries=client.max_retries,
+            backoff_base=client.backoff_base,
+            recv_window_ms=client.recv_window_ms,
+            time_sync_enabled=getattr(client, "_time_sync_enabled", True),
+            time_sync_interval_seconds=getattr(client, "_time_sync_interval_seconds", 60),
+            logger=logger or getattr(client, "logger", None),
+        )
+        authenticator = getattr(client, "_authenticator", None)
+        offset = getattr(authenticator, "_time_offset_ms", None)
+        if isinstance(offset, (int, float)):
+            async_client._authenticator.set_time_offset(offset)
+            async_client._last_time_sync = getattr(client, "_last_time_sync", 0.0)
+        return async_client
+
+    # ===== TRANSPORT =====
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        content: Optional[str] = None,
+    ) -> httpx.Response:
+        """Envoie une requête sur le client httpx adapté à l'event loop courant."""
+        loop = asyncio.get_running_loop()
+        if self._home_loop is None or self._home_loop.is_closed():
+            self._home_loop = loop
+
+        if loop is self._home_loop:
+            client = await get_async_http_client(timeout=self.timeout)
+            return await client.request(method, url, headers=headers, content=content)
+
+        # Autre event loop : les connexions du pool ne peuvent pas être partagées
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            return await client.request(method, url, headers=headers, content=content)
+
+    async def _maybe_sync_time(self) -> None:
+        """Synchronise l'horloge locale avec Bybit si l'intervalle est écoulé."""
+        if not self._time_sync_enabled:
+            return
+        if time.time() - self._last_time_sync < self._time_sync_interval_seconds:
+            return
+
+        # Marquer avant l'appel : une seule synchronisation pour des requêtes concurrentes
+        initial = self._last_time_sync == 0.0
+        self._last_time_sync = time.time()
+        try:
+            response = await self._send("GET", f"{self.base_url}/v5/market/time", {})
+            response.raise_for_status()
+            server_ms = parse_server_time_ms(response.json() if response.content else {})
+            if server_ms is None:
+                return
+
+            offset = server_ms - int(time.time() * 1000)
+            self._authenticator.set_time_offset(offset)
+
+            if self.logger:
+                msg = f"[TIME_SYNC] Offset horloge Bybit (async): {offset} ms"
+                if initial:
+                    self.logger.info(msg)
+                else:
+                    self.logger.debug(msg)
+        except Exception as exc:
+            if self.logger:
+                self.logger.debug(f"[TIME_SYNC] Impossible de synchroniser l'horloge: {exc}")
+
+    # ===== REQUÊTES =====
+
+    async def _get_private(self, path: str, params: dict = None) -> dict:
+        """
+        Effectue une requête GET privée authentifiée.
+
+        Args:
+            path (str): Chemin de l'endpoint
+            params (dict): Paramètres de la requête
+
+        Returns:
+            dict: Champ "result" de la réponse
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        params = params or {}
+        await self._maybe_sync_time()
+
+        def build() -> Tuple[str, Dict[str, str], Optional[str]]:
+            headers, query_string = self._authenticator.build_auth_headers(params)
+            url = f"{self.base_url}{path}"
+            if query_string:
+                url += f"?{query_string}"
+            return url, headers, None
+
+        return await self._execute_with_circuit_breaker("GET", path, build, is_private=True)
+
+    async def _post_private(self, path: str, data: dict = None) -> dict:
+        """
+        Effectue une requête POST privée authentifiée.
+
+        Le corps envoyé est exactement le JSON compact signé.
+
+        Args:
+            path (str): Chemin de l'endpoint
+            data (dict): Données JSON à envoyer dans le body
+
+        Returns:
+            dict: Champ "result" de la réponse
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        json_data = json.dumps(data or {}, separators=(',', ':'))
+        await self._maybe_sync_time()
+
+        def build() -> Tuple[str, Dict[str, str], Optional[str]]:
+            headers, _ = self._authenticator.build_auth_headers({}, json_data)
+            return f"{self.base_url}{path}", headers, json_data
+
+        return await self._execute_with_circuit_breaker("POST", path, build, is_private=True)
+
+    async def _get_public(self, path: str, params: dict = None) -> dict:
+        """
+        Effectue une requête GET publique sans authentification.
+
+        Comme BybitClient, une seule tentative et pas de Circuit Breaker.
+
+        Args:
+            path (str): Chemin de l'endpoint
+            params (dict): Paramètres de la requête
+
+        Returns:
+            dict: Champ "result" de la réponse
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        params = params or {}
+        query_string = "&".join([f"{k}={v}" for k, v in sorted(params.items())])
+        url = f"{self.public_base_url()}{path}"
+        if query_string:
+            url += f"?{query_string}"
+
+        def build() -> Tuple[str, Dict[str, str], Optional[str]]:
+            return url, {"Content-Type": "application/json"}, None
+
+        await self._rate_limiter.acquire_async(is_private=False, url=url)
+        try:
+            return await self._request_with_retry("GET", build, max_attempts=1, is_private=False)
+        except Exception as e:
+            raise RuntimeError(f"Erreur requête publique Bybit: {e}") from e
+
+    async def _execute_with_circuit_breaker(
+        self, method: str, path: str, build, is_private: bool
+    ) -> dict:
+        """
+        Exécute une requête avec rate limiting, retry et Circuit Breaker.
+
+        Args:
+            method: Méthode HTTP
+            path: Chemin de l'endpoint (groupe de rate limiting)
+            build: Fonction retournant (url, headers, body) signés
+            is_private: Si c'est une requête privée (pour rate limiting)
+
+        Returns:
+            Champ "result" de la réponse
+
+        Raises:
+            RuntimeError: En cas d'erreur ou si le Circuit Breaker est ouvert
+        """
+        await self._rate_limiter.acquire_async(is_private, path)
+        try:
+            return await self.circuit_breaker.call_async(
+                self._request_with_retry, method, build, self.max_retries
+            )
+        except CircuitBreakerOpen as e:
+            raise RuntimeError(
+                f"⚠️ API Bybit temporairement indisponible - "
+                f"Circuit Breaker ouvert (trop d'erreurs récentes). "
+                f"Réessayez dans quelques instants."
+            ) from e
+
+    async def _request_with_retry(
+        self, method: str, build, max_attempts: int, is_private: bool = True
+    ) -> dict:
+        """
+        Boucle de retry asynchrone.
+
+        Timeouts, erreurs réseau, 5xx et rate limits (429, retCode=10016)
+        sont retentés avec backoff ; les autres erreurs sont levées
+        immédiatement.
+
+        Args:
+            method: Méthode HTTP
+            build: Fonction retournant (url, headers, body) signés
+            max_attempts: Nombre maximum de tentatives
+            is_private: Requête privée (groupe de rate limiting des headers)
+
+        Returns:
+            Champ "result" de la réponse
+
+        Raises:
+            RuntimeError: En cas d'erreur non retentable ou après tous les retries
+        """
+        start_time = time.time()
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, max_attempts + 1):
+            try:
+                url, headers, content = build()
+                result = await self._attempt(
+                    method, url, headers, content, attempt, max_attempts, is_private
+                )
+                record_api_call((time.time() - start_time) * 1000, success=True)
+                return result
+            except _RetryableError as e:
+                last_error, delay = e, e.delay
+            except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPStatusError) as e:
+                last_error = e
+                delay = self._error_handler.calculate_retry_delay(attempt, self.backoff_base)
+            except Exception:
+                record_api_call((time.time() - start_time) * 1000, success=False)
+                raise
+
+            if attempt < max_attempts:
+                await asyncio.sleep(delay)
+
+        record_api_call((time.time() - start_time) * 1000, success=False)
+        if isinstance(last_error, _RetryableError):
+            raise RuntimeError("Limite de requêtes atteinte : ralentis ou réessaie plus tard")
+        raise RuntimeError(f"Erreur réseau/HTTP Bybit : {last_error}")
+
+    async def _attempt(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        content: Optional[str],
+        attempt: int,
+        max_attempts: int,
+        is_private: bool = True,
+    ) -> dict:
+        """Effectue une tentative et valide la réponse HTTP puis API."""
+        response = await self._send(method, url, headers, content)
+        self._rate_limiter.record_response(url, response.headers, is_private)
+
+        # Rate limit : délai Retry-After attendu par la boucle (pas de time.sleep)
+        if response.status_code == _RATE_LIMIT_STATUS:
+            raise _RetryableError(
+                "Rate limited",
+                self._error_handler.get_retry_after_delay(response, attempt, self.backoff_base),
+            )
+        self._error_handler.handle_http_response(
+            response, attempt, max_attempts, self.backoff_base
+        )
+
+        data = response.json()
+        if data.get("retCode") == _RATE_LIMIT_RET_CODE:
+            raise _RetryableError(
+                "API Rate limited",
+                self._error_handler.get_retry_after_delay(response, attempt, self.backoff_base),
+            )
+        self._error_handler.handle_api_response(
+            data, response, attempt, max_attempts, self.backoff_base
+        )
+        return data.get("result", {})
+
+    # ===== API =====
+
+    def public_base_url(self) -> str:
+        """Retourne l'URL de base publique (testnet ou mainnet)."""
+        if self.testnet:
+            return "https://api-testnet.bybit.com"
+        return "https://api.bybit.com"
+
+    async def get_wallet_balance(self, account_type: str = "UNIFIED") -> Dict[str, Any]:
+        """Récupère le solde du portefeuille."""
+        return await self._get_private(
+            "/v5/account/wallet-balance", {"accountType": account_type}
+        )
+
+    async def get_tickers(self, category: str = "linear", symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Récupère les données de tickers."""
+        params = {"category": category}
+        if symbol:
+            params["symbol"] = symbol
+        return await self._get_public("/v5/market/tickers", params)
+
+    async def get_funding_rate_history(
+        self,
+        category: str = "linear",
+        symbol: Optional[str] = None,
+        limit: int = 200
+    ) -> Dict[str, Any]:
+        """Récupère l'historique des taux de funding."""
+        params = {"category": category, "limit": limit}
+        if symbol:
+            params["symbol"] = symbol
+        return await self._get_public("/v5/market/funding/history", params)
+
+    async def get_funding_rate(self, symbol: str, category: str = "linear") -> Dict[str, Any]:
+        """Récupère le taux de funding actuel pour un symbole."""
+        params = {"category": category, "symbol": symbol, "limit": 1}
+        return await self._get_public("/v5/market/funding/history", params)
+
+    async def get_instruments_info(
+        self,
+        category: str = "linear",
+        symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Récupère les informations sur les instruments."""
+        params = {"category": category}
+        if symbol:
+            params["symbol"] = symbol
+        return await self._get_public("/v5/market/instruments-info", params)
+
+    async def get_orderbook(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+        limit: int = 25
+    ) -> Dict[str, Any]:
+        """Récupère le carnet d'ordres."""
+        params = {"category": category, "symbol": symbol, "limit": limit}
+        return await self._get_public("/v5/market/orderbook", params)
+
+    async def get_kline(
+        self,
+        category: str = "linear",
+        symbol: str = "BTCUSDT",
+        interval: str = "1",
+        limit: int = 200
+    ) -> Dict[str, Any]:
+        """Récupère les données de chandeliers (kline)."""
+        params = {
+            "category": category,
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit
+        }
+        return await self._get_public("/v5/market/kline", params)
+
+    async def get_positions(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Récupère les positions ouvertes (une page, cursor = nextPageCursor)."""
+        params = {"category": category}
+        if settleCoin:
+            params["settleCoin"] = settleCoin
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+        return await self._get_private("/v5/position/list", params)
+
+    async def get_open_orders(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Récupère les ordres ouverts (une page, cursor = nextPageCursor)."""
+        params = {"category": category}
+        if settleCoin:
+            params["settleCoin"] = settleCoin
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+        return await self._get_private("/v5/order/realtime", params)
+
+    def is_testnet(self) -> bool:
+        """Indique si le client utilise le testnet."""
+        return self.testnet
+
+    def get_timeout(self) -> int:
+        """Retourne le timeout configuré."""
+        return self.timeout
+
+    def set_timeout(self, timeout: int) -> None:
+        """Définit le timeout."""
+        self.timeout = timeout
+
+    def is_authenticated(self) -> bool:
+        """Indique si le client est authentifié."""
+        return bool(self.api_key and self.api_secret)
+
+    def get_rate_limit_status(self) -> Dict[str, Any]:
+        """Retourne le statut du rate limiting."""
+        return {
+            "circuit_breaker_state": self.circuit_breaker.state,
+            "failure_count": self.circuit_breaker.failure_count,
+            "last_failure_time": self.circuit_breaker.last_failure_time,
+            "buckets": self._rate_limiter.get_status(),
+        }
+
+    def reset_rate_limit(self) -> None:
+        """Remet à zéro le compteur de rate limiting."""
+        self.circuit_breaker.reset()
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str = "Limit",
+        qty: str = None,
+        price: str = None,
+        category: str = "linear",
+        time_in_force: str = "PostOnly"
+    ) -> Dict[str, Any]:
+        """
+        Place un ordre sur Bybit.
+
+        Args:
+            symbol: Symbole de la paire (ex: "BTCUSDT")
+            side: "Buy" ou "Sell"
+            order_type: Type d'ordre ("Limit", "Market", etc.)
+            qty: Quantité à trader
+            price: Prix limite (requis pour les ordres Limit)
+            category: Catégorie ("linear", "inverse", "spot")
+            time_in_force: Type d'exécution ("PostOnly", "GTC", "IOC", "FOK")
+
+        Returns:
+            Dict contenant la réponse de l'API avec l'ID de l'ordre
+
+        Raises:
+            RuntimeError: En cas d'erreur API
+        """
+        order_data = {
+            "category": category,
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "qty": qty
+        }
+
+        if order_type == "Limit" and price:
+            order_data["price"] = price
+
+        if order_type == "Limit":
+            order_data["timeInForce"] = time_in_force
+
+        return await self._post_private("/v5/order/create", order_data)
+
+    async def cancel_order(
+        self,
+        symbol: str,
+        order_id: str = None,
+        order_link_id: str = None,
+        category: str = "linear"
+    ) -> Dict[str, Any]:
+        """
+        Annule un ordre sur Bybit.
+
+        Args:
+            symbol: Symbole de la paire (ex: "BTCUSDT")
+            order_id: ID de l'ordre à annuler
+            order_link_id: ID de lien de l'ordre (alternative à order_id)
+            category: Catégorie ("linear", "inverse", "spot")
+
+        Returns:
+            Dict contenant la réponse de l'API
+
+        Raises:
+            RuntimeError: En cas d'erreur API
+        """
+        if not order_id and not order_link_id:
+            raise ValueError("order_id ou order_link_id doit être fourni")
+
+        cancel_data = {
+            "category": category,
+            "symbol": symbol
+        }
+
+        if order_id:
+            cancel_data["orderId"] = order_id
+        if order_link_id:
+            cancel_data["orderLinkId"] = order_link_id
+
+        return await self._post_private("/v5/order/cancel", cancel_data)
+
+
+__all__ = ['AsyncBybitClient']
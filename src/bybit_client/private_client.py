@@ -24,6 +24,32 @@ from bybit_client.error_handler import BybitErrorHandler
 from bybit_client.rate_limiter import BybitRateLimiter
 
 
+def parse_server_time_ms(data: dict) -> Optional[int]:
+    """
+    Extrait l'heure serveur (ms) d'une réponse /v5/market/time.
+
+    Args:
+        data: Réponse JSON décodée
+
+    Returns:
+        Timestamp serveur en millisecondes ou None si absent
+    """
+    result = data.get("result") or {}
+
+    if isinstance(result, dict):
+        time_nano = result.get("timeNano")
+        if time_nano:
+            return int(str(time_nano)[:13])
+        time_second = result.get("timeSecond")
+        if time_second is not None:
+            return int(float(time_second) * 1000)
+
+    time_value = data.get("time") or data.get("ts")
+    if time_value is not None:
+        return int(float(time_value))
+    return None
+
+
 class BybitClient(BybitClientInterface):
     """
     Client pour interagir avec l'API privée Bybit v5.
@@ -225,6 +251,29 @@ class BybitClient(BybitClientInterface):
         # Exécuter la requête POST avec retry
         return self._execute_post_request_with_retry(url, headers, data, is_private=True)
 
+    def _post_private_body(self, path: str, body: str) -> dict:
+        """
+        Effectue une requête POST privée avec un corps JSON déjà sérialisé.
+
+        Seuls l'horodatage et la signature sont calculés ici ; le corps est
+        envoyé tel quel (le texte signé est exactement le texte envoyé).
+
+        Args:
+            path (str): Chemin de l'endpoint
+            body (str): Corps JSON compact
+
+        Returns:
+            dict: Réponse JSON de l'API
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        self._maybe_sync_time()
+        headers, query_string = self._build_auth_headers({}, body)
+        url = self._build_request_url(path, query_string)
+        headers["Content-Type"] = "application/json"
+        return self._execute_post_request_with_retry(url, headers, body, is_private=True)
+
     def _get_public(self, path: str, params: dict = None) -> dict:
         """
         Effectue une requête GET publique sans authentification.
@@ -253,7 +302,7 @@ class BybitClient(BybitClientInterface):
         headers = {"Content-Type": "application/json"}
 
         # Appliquer rate limiting pour requêtes publiques
-        self._apply_rate_limiting(is_private=False)
+        self._apply_rate_limiting(is_private=False, url=url)
 
         # Exécuter la requête avec retry (mais sans circuit breaker pour les publiques)
         start_time = time.time()
@@ -261,6 +310,7 @@ class BybitClient(BybitClientInterface):
         try:
             client = get_http_client(timeout=self.timeout)
             response = client.get(url, headers=headers)
+            self._rate_limiter.record_response(url, response.headers, is_private=False)
 
             # Gérer la réponse HTTP
             self._handle_http_response(response, 1, 1, self.backoff_base)
@@ -327,24 +377,7 @@ class BybitClient(BybitClientInterface):
             response = client.get(f"{self.base_url}/v5/market/time")
             response.raise_for_status()
             data = response.json() if response.content else {}
-            result = data.get("result") or {}
-
-            server_ms = None
-
-            if isinstance(result, dict):
-                time_nano = result.get("timeNano")
-                if time_nano:
-                    server_ms = int(str(time_nano)[:13])
-                else:
-                    time_second = result.get("timeSecond")
-                    if time_second is not None:
-                        server_ms = int(float(time_second) * 1000)
-
-            if server_ms is None:
-                time_value = data.get("time") or data.get("ts")
-                if time_value is not None:
-                    server_ms = int(float(time_value))
-
+            server_ms = parse_server_time_ms(data)
             if server_ms is None:
                 return
 
@@ -379,7 +412,7 @@ class BybitClient(BybitClientInterface):
             CircuitBreakerOpen: Si le circuit breaker est ouvert
         """
         # Appliquer rate limiting avant requête
-        self._apply_rate_limiting(is_private)
+        self._apply_rate_limiting(is_private, url)
 
         # Wrapper avec Circuit Breaker pour protection contre erreurs répétées
         try:
@@ -396,7 +429,7 @@ class BybitClient(BybitClientInterface):
                 f"Réessayez dans quelques instants."
             ) from e
 
-    def _apply_rate_limiting(self, is_private: bool):
+    def _apply_rate_limiting(self, is_private: bool, url: Optional[str] = None):
         """
         Applique le rate limiting avant d'exécuter une requête.
 
@@ -404,8 +437,9 @@ class BybitClient(BybitClientInterface):
 
         Args:
             is_private: True pour API privée, False pour API publique
+            url: URL de la requête (groupe d'endpoints)
         """
-        self._rate_limiter.apply_rate_limiting(is_private)
+        self._rate_limiter.apply_rate_limiting(is_private, url)
 
     def _execute_request_internal(self, url: str, headers: dict) -> dict:
         """
@@ -444,7 +478,7 @@ class BybitClient(BybitClientInterface):
         Args:
             url: URL de la requête
             headers: Headers HTTP
-            data: Données JSON à envoyer
+            data: Données JSON à envoyer (ou corps JSON déjà sérialisé)
             is_private: Si c'est une requête privée (pour rate limiting)
 
         Returns:
@@ -455,7 +489,7 @@ class BybitClient(BybitClientInterface):
             CircuitBreakerOpen: Si le circuit breaker est ouvert
         """
         # Appliquer rate limiting avant requête
-        self._apply_rate_limiting(is_private)
+        self._apply_rate_limiting(is_private, url)
 
         # Wrapper avec Circuit Breaker pour protection contre erreurs répétées
         try:
@@ -605,7 +639,12 @@ class BybitClient(BybitClientInterface):
         """Traite une requête POST HTTP réussie."""
         # Effectuer la requête POST
         client = get_http_client(timeout=self.timeout)
-        response = client.post(url, headers=headers, json=data)
+        if isinstance(data, str):
+            # Corps pré-sérialisé (signé tel quel)
+            response = client.post(url, headers=headers, content=data)
+        else:
+            response = client.post(url, headers=headers, json=data)
+        self._rate_limiter.record_response(url, response.headers)
 
         # Gérer la réponse HTTP
         self._handle_http_response(
@@ -723,6 +762,7 @@ class BybitClient(BybitClientInterface):
         # Effectuer la requête
         client = get_http_client(timeout=self.timeout)
         response = client.get(url, headers=headers)
+        self._rate_limiter.record_response(url, response.headers)
 
         # Gérer la réponse HTTP
         self._handle_http_response(
@@ -934,18 +974,32 @@ class BybitClient(BybitClientInterface):
         }
         return self._get_public("/v5/market/kline", params)
 
-    def get_positions(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
-        """Récupère les positions ouvertes."""
+    def get_positions(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Récupère les positions ouvertes (une page, cursor = nextPageCursor)."""
         params = {"category": category}
         if settleCoin:
             params["settleCoin"] = settleCoin
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
         return self._get_private("/v5/position/list", params)
 
-    def get_open_orders(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
-        """Récupère les ordres ouverts."""
+    def get_open_orders(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Récupère les ordres ouverts (une page, cursor = nextPageCursor)."""
         params = {"category": category}
         if settleCoin:
             params["settleCoin"] = settleCoin
+        if limit:
+            params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
         return self._get_private("/v5/order/realtime", params)
 
     def is_testnet(self) -> bool:
@@ -970,7 +1024,8 @@ class BybitClient(BybitClientInterface):
             "circuit_breaker_state": self.circuit_breaker.state,
             "failure_count": self.circuit_breaker.failure_count,
             "last_failure_time": self.circuit_breaker.last_failure_time,
-            "next_attempt_time": self.circuit_breaker.next_attempt_time
+            "next_attempt_time": self.circuit_breaker.next_attempt_time,
+            "buckets": self._rate_limiter.get_status(),
         }
 
     def reset_rate_limit(self) -> None:
@@ -1033,6 +1088,21 @@ class BybitClient(BybitClientInterface):
 
         return self._post_private("/v5/order/create", order_data)
 
+    def place_order_prepared(self, body: str) -> Dict[str, Any]:
+        """
+        Place un ordre à partir d'un corps JSON pré-sérialisé (OrderTemplate).
+
+        Args:
+            body: Corps JSON compact de /v5/order/create (prix inclus)
+
+        Returns:
+            Dict contenant la réponse de l'API avec l'ID de l'ordre
+
+        Raises:
+            RuntimeError: En cas d'erreur API
+        """
+        return self._post_private_body("/v5/order/create", body)
+
     def cancel_order(
         self,
         symbol: str,
@@ -92,11 +92,17 @@ class BybitPublicClient(BybitClientInterface):
         """Non implémenté - nécessite authentification."""
         raise NotImplementedError("Méthode privée - nécessite authentification")
 
-    def get_positions(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
+    def get_positions(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Non implémenté - nécessite authentification."""
         raise NotImplementedError("Méthode privée - nécessite authentification")
 
-    def get_open_orders(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
+    def get_open_orders(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Non implémenté - nécessite authentification."""
         raise NotImplementedError("Méthode privée - nécessite authentification")
 
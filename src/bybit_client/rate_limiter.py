@@ -3,84 +3,92 @@
 Rate limiting pour le client Bybit.
 
 Ce module gère :
-- Rate limiting pour les API publiques et privées
+- Rate limiting par groupe d'endpoints via le service partagé
+  (rate_limit_service) : ordres, positions, portefeuille, données de marché
+- Recalage des buckets sur les headers X-Bapi-Limit-* des réponses
 - Détection de contexte async pour éviter les blocages
-- Gestion du sleep avec détection d'event loop
+- Attente non bloquante (asyncio) pour le client asynchrone
 """
 
-import time
+import asyncio
+from typing import Any, Dict, Mapping, Optional
+
+from rate_limit_service import RateLimitService, classify_endpoint, get_rate_limit_service
 
 
 class BybitRateLimiter:
     """
     Gestionnaire de rate limiting pour le client Bybit.
 
-    Cette classe gère le rate limiting selon les limites Bybit :
-    - API publique : 120 requêtes / minute
-    - API privée : 50 requêtes / minute
+    Adaptateur entre les clients Bybit et le RateLimitService partagé :
+    le groupe d'endpoints est déduit de l'URL, la priorité du groupe
+    (ordres avant données de marché) s'applique automatiquement.
     """
 
-    def __init__(self):
+    def __init__(self, service: Optional[RateLimitService] = None):
         """
         Initialise le rate limiter.
+
+        Args:
+            service: Service de rate limiting (service partagé du processus par défaut)
         """
-        try:
-            from async_rate_limiter import AsyncRateLimiter
-            # Rate limiters selon documentation Bybit API v5
-            self._public_limiter = AsyncRateLimiter(
-                max_calls=120,  # 120 requêtes
-                window_seconds=60  # par minute pour API publique
-            )
-            self._private_limiter = AsyncRateLimiter(
-                max_calls=50,   # 50 requêtes
-                window_seconds=60  # par minute pour API privée
-            )
-        except ImportError:
-            # Fallback si le rate limiter n'est pas disponible
-            self._public_limiter = None
-            self._private_limiter = None
-
-    def apply_rate_limiting(self, is_private: bool):
+        self._service = service or get_rate_limit_service()
+
+    def apply_rate_limiting(self, is_private: bool, url: Optional[str] = None):
         """
         Applique le rate limiting avant d'exécuter une requête.
 
-        Version synchrone uniquement - ce client ne doit être utilisé que dans des threads dédiés.
+        Version synchrone - bloque le thread appelant jusqu'au prochain jeton.
+
+        Args:
+            is_private: True pour API privée, False pour API publique
+            url: URL ou chemin de la requête (détermine le groupe d'endpoints)
+        """
+        group = classify_endpoint(url, is_private)
+
+        try:
+            # Éviter de bloquer un event loop (PERF-002)
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Pas d'event loop actif = contexte synchrone, c'est OK
+            self._service.acquire(group)
+            return
+
+        # Contexte async : compter la requête sans attendre (la dette retarde les suivantes)
+        import logging
+        logging.getLogger(__name__).warning(
+            "PERF-002: BybitClient synchrone utilisé depuis un contexte async. "
+            "Utilisez AsyncBybitClient ou un thread dédié pour éviter de bloquer l'event loop."
+        )
+        self._service.consume(group)
+
+    async def acquire_async(self, is_private: bool, url: Optional[str] = None):
+        """
+        Attend un jeton sans bloquer l'event loop.
 
         Args:
             is_private: True pour API privée, False pour API publique
+            url: URL ou chemin de la requête (détermine le groupe d'endpoints)
         """
-        limiter = self._private_limiter if is_private else self._public_limiter
+        await self._service.acquire_async(classify_endpoint(url, is_private))
 
-        if limiter is None:
-            return  # Pas de rate limiting si les limiters ne sont pas disponibles
+    def record_response(
+        self, url: Optional[str], headers: Optional[Mapping[str, Any]], is_private: bool = True
+    ) -> None:
+        """
+        Recale le bucket du groupe sur les headers de limite d'une réponse.
 
+        Args:
+            url: URL de la requête
+            headers: Headers HTTP de la réponse
+            is_private: True pour API privée, False pour API publique
+        """
         try:
-            # Éviter time.sleep() si on détecte un contexte async (PERF-002)
-            import asyncio
-            try:
-                # Vérifier si on est dans un event loop
-                loop = asyncio.get_running_loop()
-                # Si on arrive ici, on EST dans un event loop async
-                # Log warning mais ne pas bloquer avec time.sleep
-                import logging
-                logging.getLogger(__name__).warning(
-                    "PERF-002: BybitClient synchrone utilisé depuis un contexte async. "
-                    "Utilisez un thread dédié pour éviter de bloquer l'event loop."
-                )
-                return  # Skip le rate limiting pour éviter de bloquer
-            except RuntimeError:
-                # Pas d'event loop actif = contexte synchrone, c'est OK
-                pass
-
-            # Version simplifiée - vérifier le compteur actuel (ARCH-001)
-            current_count = limiter.get_current_count()
-            max_calls = limiter.max_calls
-
-            if current_count >= max_calls:
-                # Si on est proche de la limite, faire une pause
-                time.sleep(0.05)  # Attendre 50ms pour respecter les limites
+            self._service.update_from_headers(classify_endpoint(url, is_private), headers)
         except Exception as e:
-            # En cas d'erreur, logger un warning mais continuer
             import logging
-            logging.getLogger(__name__).warning(f"Erreur rate limiting: {e}")
+            logging.getLogger(__name__).debug(f"Headers de rate limit ignorés: {e}")
 
+    def get_status(self) -> Dict[str, Any]:
+        """Retourne l'état des buckets du service partagé."""
+        return self._service.get_status()
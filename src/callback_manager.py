@@ -77,6 +77,9 @@ class CallbackManager(CallbackManagerInterface):
         monitoring_manager.set_volatility_tracker(volatility_tracker)
         monitoring_manager.set_ws_manager(ws_manager)
 
+        # Volatilité calculée sur les bougies reçues par le WebSocket public
+        volatility_tracker.set_kline_store(ws_manager.kline_store)
+
         # Callbacks d'opportunités (si opportunity_manager fourni)
         if opportunity_manager and watchlist_manager:
             monitoring_manager.set_on_new_opportunity_callback(
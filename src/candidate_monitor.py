@@ -17,6 +17,7 @@ from config.timeouts import TimeoutConfig
 if TYPE_CHECKING:
     from data_manager import DataManager
     from watchlist_manager import WatchlistManager
+    from ws.manager import WebSocketManager
 
 
 class CandidateMonitor:
@@ -55,8 +56,14 @@ class CandidateMonitor:
         self.candidate_ws_client = None
         self._candidate_ws_thread: Optional[threading.Thread] = None
 
+        # WebSocket principal partagé (souscriptions dynamiques, pas de connexion dédiée)
+        self.ws_manager: Optional["WebSocketManager"] = None
+        # Symboles souscrits par ce moniteur sur le WebSocket principal, par catégorie
+        self._shared_subscriptions: Dict[str, List[str]] = {}
+
         # Liste des symboles candidats surveillés
         self.candidate_symbols: List[str] = []
+        self._candidate_set = frozenset()
 
         # Callback pour les tickers candidats
         self._on_candidate_ticker_callback: Optional[Callable] = None
@@ -70,6 +77,15 @@ class CandidateMonitor:
         """
         self._on_candidate_ticker_callback = callback
 
+    def set_ws_manager(self, ws_manager: Optional["WebSocketManager"]):
+        """
+        Définit le WebSocket principal à réutiliser pour les candidats.
+
+        Args:
+            ws_manager: Gestionnaire WebSocket principal
+        """
+        self.ws_manager = ws_manager
+
     def setup_monitoring(self, base_url: str, perp_data: Dict):
         """
         Configure la surveillance des symboles candidats.
@@ -85,6 +101,7 @@ class CandidateMonitor:
 
         # Stocker les candidats
         self.candidate_symbols = linear_candidates + inverse_candidates
+        self._candidate_set = frozenset(self.candidate_symbols)
 
         # Démarrer la surveillance WebSocket si des candidats existent
         if linear_candidates or inverse_candidates:
@@ -97,6 +114,9 @@ class CandidateMonitor:
 
         self._candidate_running = False
 
+        if self._shared_subscriptions:
+            self._release_shared_subscriptions()
+
         if self.candidate_ws_client:
             try:
                 self.candidate_ws_client.close()
@@ -174,6 +194,9 @@ class CandidateMonitor:
             inverse_candidates: Liste des candidats inverse
         """
         try:
+            if self._start_shared_monitoring(linear_candidates, inverse_candidates):
+                return
+
             # Déterminer les symboles à surveiller
             if linear_candidates and inverse_candidates:
                 # Si on a les deux catégories, utiliser linear (plus courant)
@@ -217,6 +240,60 @@ class CandidateMonitor:
                 f"❌ Erreur démarrage surveillance candidats: {e}"
             )
 
+    def _start_shared_monitoring(
+        self, linear_candidates: List[str], inverse_candidates: List[str]
+    ) -> bool:
+        """
+        Souscrit les candidats sur les connexions du WebSocket principal.
+
+        Returns:
+            True si les connexions principales sont utilisées, False si une
+            connexion dédiée doit être ouverte
+        """
+        ws_manager = self.ws_manager
+        if not ws_manager or not ws_manager.is_running():
+            return False
+
+        connected = ws_manager.get_connected_symbols()
+        for category, candidates in (
+            ("linear", linear_candidates),
+            ("inverse", inverse_candidates),
+        ):
+            # Ne désouscrire plus tard que ce que ce moniteur a ajouté
+            added = [s for s in candidates if s not in connected.get(category, [])]
+            if added:
+                ws_manager.add_symbols(category, added)
+                self._shared_subscriptions[category] = added
+
+        ws_manager.add_ticker_listener(self._on_ticker_received)
+        self._candidate_running = True
+
+        self.logger.info(
+            f"👀 Surveillance des candidats démarrée: "
+            f"{len(linear_candidates) + len(inverse_candidates)} symboles "
+            f"(WebSocket principal)"
+        )
+        return True
+
+    def _release_shared_subscriptions(self):
+        """Retire les souscriptions candidates non promues dans la watchlist."""
+        ws_manager = self.ws_manager
+        subscriptions, self._shared_subscriptions = self._shared_subscriptions, {}
+        if not ws_manager:
+            return
+
+        ws_manager.remove_ticker_listener(self._on_ticker_received)
+        watchlist = set(self.data_manager.get_linear_symbols()) | set(
+            self.data_manager.get_inverse_symbols()
+        )
+        for category, symbols in subscriptions.items():
+            stale = [s for s in symbols if s not in watchlist]
+            if stale:
+                try:
+                    ws_manager.remove_symbols(category, stale)
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Erreur désouscription candidats: {e}")
+
     def _ws_runner(self):
         """Runner pour la WebSocket des candidats."""
         if self.candidate_ws_client:
@@ -234,9 +311,14 @@ class CandidateMonitor:
         """
         try:
             symbol = ticker_data.get("symbol", "")
-            if not symbol:
+            if not symbol or symbol not in self._candidate_set:
                 return
 
+            # Les deltas ne portent que les champs modifiés : filtrer sur l'état consolidé
+            source = self.candidate_ws_client or self.ws_manager
+            if source:
+                ticker_data = source.get_ticker_state(symbol) or ticker_data
+
             # Vérifier si le candidat passe maintenant les filtres
             if self.watchlist_manager.check_if_symbol_now_passes_filters(
                 symbol, ticker_data
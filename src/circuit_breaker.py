@@ -111,7 +111,7 @@ except CircuitBreakerOpen as e:
 import time
 import threading
 from enum import Enum
-from typing import Callable, Any, Optional
+from typing import Awaitable, Callable, Any, Optional
 from logging_setup import setup_logging
 
 
@@ -311,6 +311,43 @@ class CircuitBreaker:
             self._on_failure(e)
             raise
 
+    async def call_async(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Équivalent de call() pour une coroutine.
+
+        Les transitions d'état sont identiques ; seul l'appel est attendu
+        (await) au lieu d'être exécuté de manière bloquante.
+
+        Args:
+            func: Fonction coroutine à appeler
+            *args: Arguments positionnels de la fonction
+            **kwargs: Arguments nommés de la fonction
+
+        Returns:
+            Résultat de la coroutine si succès
+
+        Raises:
+            CircuitBreakerOpen: Si le circuit est ouvert
+            Exception: Toute exception levée par func
+        """
+        with self._lock:
+            self._check_state()
+
+            if self.state == CircuitState.OPEN:
+                raise CircuitBreakerOpen(
+                    f"Circuit Breaker '{self.name}' est ouvert - "
+                    f"Service temporairement indisponible"
+                )
+
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+
+        except Exception as e:
+            self._on_failure(e)
+            raise
+
     def _check_state(self):
         """
         Vérifie et met à jour l'état du circuit si nécessaire.
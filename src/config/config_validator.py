@@ -27,6 +27,8 @@ from .constants import (
     CATEGORY_INVERSE,
     CATEGORY_BOTH,
 )
+from volatility_kernels import VOLATILITY_MEASURES, parse_measure_key
+from score_expression import ScoreExpressionError, compile_score_expression
 
 
 class ConfigValidator:
@@ -96,6 +98,7 @@ class ConfigValidator:
         errors.extend(self._validate_category(config))
         errors.extend(self._validate_limit(config))
         errors.extend(self._validate_volatility_ttl(config))
+        errors.extend(self._validate_volatility_measure(config))
         errors.extend(self._validate_display_interval(config))
         errors.extend(self._validate_weights(config))
         errors.extend(self._validate_top_symbols(config))
@@ -267,6 +270,28 @@ class ConfigValidator:
 
         return errors
 
+    def _validate_volatility_measure(self, config: Dict) -> List[str]:
+        """Valide la mesure et les fenêtres de volatilité."""
+        errors = []
+        measure = config.get("volatility_measure")
+        windows = config.get("volatility_windows")
+
+        if measure is not None and parse_measure_key(measure) is None:
+            errors.append(
+                f"volatility_measure invalide ({measure}), format attendu "
+                f"'<mesure>_<fenêtre>' avec mesure parmi {', '.join(VOLATILITY_MEASURES)}"
+            )
+        if windows is not None:
+            if not isinstance(windows, (list, tuple)) or not all(
+                isinstance(w, int) and w >= 2 for w in windows
+            ):
+                errors.append(
+                    f"volatility_windows invalide ({windows}), "
+                    f"liste d'entiers >= 2 attendue (ex: [5, 15])"
+                )
+
+        return errors
+
     def _validate_display_interval(self, config: Dict) -> List[str]:
         """Valide l'intervalle d'affichage."""
         errors = []
@@ -324,6 +349,13 @@ class ConfigValidator:
                         f"maximum: {self.MAX_WEIGHT_VALUE}"
                     )
 
+        formula = weights.get("formula")
+        if formula is not None:
+            try:
+                compile_score_expression(formula, weights)
+            except ScoreExpressionError as e:
+                errors.append(f"weights.formula invalide: {e}")
+
         return errors
 
     def _validate_top_symbols(self, config: Dict) -> List[str]:
@@ -33,6 +33,8 @@ MAX_DISPLAY_INTERVAL_SECONDS = 300  # Maximum 5 minutes entre les rafraîchissem
 # LIMITES DE THREADING
 # ============================================================================
 MAX_WORKERS_THREADPOOL = 2  # Nombre maximum de workers dans le thread pool
+WS_SHARD_SPARE_WORKERS = 1  # Workers WebSocket de réserve par catégorie (nouveaux shards)
+SPREAD_FALLBACK_CONCURRENCY = 8  # Requêtes ticker unitaires simultanées (dernier recours des spreads)
 
 # ============================================================================
 # INTERVALLES ET TIMEOUTS PAR DÉFAUT
@@ -43,11 +45,27 @@ DEFAULT_HTTP_TIMEOUT = 30  # secondes - Timeout par défaut pour les requêtes H
 DEFAULT_WEBSOCKET_TIMEOUT = 10  # secondes - Timeout pour les connexions WebSocket
 DEFAULT_THREAD_SHUTDOWN_TIMEOUT = 5  # secondes - Timeout pour l'arrêt des threads
 DEFAULT_MAX_RETRIES = 3  # Nombre maximum de tentatives pour les opérations
+STORAGE_SNAPSHOT_INTERVAL = 0.25  # secondes - Publication max des snapshots DataStorage par les writers
+MARKET_SNAPSHOT_TTL_SECONDS = 30  # secondes - Validité des tickers d'une catégorie dans l'instantané marché
+LIVE_QUOTE_MAX_AGE_SECONDS = 10  # secondes - Âge max d'un bid/ask WebSocket utilisé pour un spread
+POSITION_RECONCILE_INTERVAL_SECONDS = 60  # secondes - Réconciliation REST du carnet de positions (compte entier)
+POSITION_CONFIRM_GRACE_SECONDS = 30  # secondes - Délai d'apparition d'une position surveillée dans le carnet
+POSITION_OPEN_CONFIRM_SECONDS = 6  # secondes - Attente max de la position perp dans le carnet après l'ordre d'entrée
+ACCOUNT_STATE_MAX_AGE_SECONDS = 5  # secondes - Validité des soldes en mémoire sans WebSocket wallet
+BALANCE_UPDATE_WAIT_SECONDS = 1.0  # secondes - Attente max de la mise à jour du solde après un achat spot
+HEDGE_PLAN_MAX_AGE_SECONDS = 15  # secondes - Validité du prix / de la disponibilité spot préparés avant le funding
+HEDGE_PREP_LEAD_SECONDS = 5  # secondes - Préparation de la jambe spot avant l'entrée perp (< HEDGE_PLAN_MAX_AGE_SECONDS)
+HEDGE_ABORT_WAIT_SECONDS = 30  # secondes - Attente max de la jambe spot avant son annulation (perp non confirmé)
+ORDER_PREARM_MINUTES = 5  # minutes - Pré-armement de l'ordre d'entrée avant la fenêtre de trading du funding
+ORDER_TEMPLATE_MAX_AGE_SECONDS = 900  # secondes - Validité d'un gabarit d'ordre pré-armé (côté, règles, quantité)
 
 # ============================================================================
 # LIMITES DE DONNÉES
 # ============================================================================
 MAX_SYMBOLS_PER_CONNECTION = 200  # Nombre maximum de symboles par connexion WebSocket
+WS_SHARD_TARGET_SYMBOLS = 100  # Symboles par shard WebSocket public avant d'en ouvrir un autre
+WS_ORDERBOOK_DEPTH = 50  # Profondeur du flux orderbook WebSocket (carnet local)
+WS_ORDERBOOK_MAX_SYMBOLS = 10  # Carnets locaux souscrits simultanément (les plus anciens sont libérés)
 DEFAULT_PAGINATION_LIMIT = 1000  # Limite par défaut pour la pagination API
 MAX_FUNDING_RATE_DEVIATION = 0.1  # 10% - Déviation maximale du funding rate
 
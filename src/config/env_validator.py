@@ -33,6 +33,7 @@ VALID_ENV_VARS = {
     "DISPLAY_INTERVAL_SECONDS",
     "PUBLIC_HTTP_MAX_CALLS_PER_SEC",
     "PUBLIC_HTTP_WINDOW_SECONDS",
+    "WARM_CACHE_PATH",
 }
 
 # Variables à ignorer complètement (faux positifs système)
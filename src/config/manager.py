@@ -124,6 +124,8 @@ class ConfigManager:
             "volatility_max": None,
             "limite": 10,
             "volatility_ttl_sec": 120,
+            "volatility_measure": "range_5",
+            "volatility_windows": [5, 15],
             "funding_time_min_minutes": None,
             "funding_time_max_minutes": None,
             "display_interval_seconds": 10,
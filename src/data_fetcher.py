@@ -106,7 +106,7 @@ class DataFetcher:
         category: str = "linear",
     ) -> Dict[str, float]:
         """
-        Récupère les spreads via /v5/market/tickers paginé, puis filtre localement.
+        Récupère les spreads depuis l'instantané marché, puis complète les manquants.
 
         Args:
             base_url: URL de base de l'API Bybit
@@ -119,6 +119,15 @@ class DataFetcher:
         """
         return self._spread_fetcher.fetch_spread_data(base_url, symbols, timeout, category)
 
+    def set_live_quote_source(self, data_storage) -> None:
+        """
+        Définit la source des bid/ask temps réel utilisée pour compléter les spreads.
+
+        Args:
+            data_storage: DataStorage alimenté par la WebSocket publique
+        """
+        self._spread_fetcher.set_live_quote_source(data_storage)
+
     # ===== MÉTHODES DE PAGINATION (DÉLÉGATION VERS PAGINATION_HANDLER) =====
 
     def fetch_paginated_data(
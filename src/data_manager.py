@@ -100,6 +100,9 @@ class DataManager(DataManagerInterface):
         self._storage = storage or DataStorage(logger=self.logger)
         self._validator = validator or DataValidator(logger=self.logger)
 
+        # Spreads manquants complétés par les bid/ask WebSocket du stockage
+        self._fetcher.set_live_quote_source(self._storage)
+
     # ===== PROPRIÉTÉS D'ACCÈS DIRECT AUX COMPOSANTS =====
 
     @property
@@ -167,6 +170,20 @@ class DataManager(DataManagerInterface):
         """
         return self._storage.get_all_funding_data_objects()
 
+    def get_data_snapshot(self):
+        """
+        Récupère le snapshot immuable et versionné des données (sans verrou).
+
+        Returns:
+            StorageSnapshot : comparer .version (ou funding_version /
+            realtime_version) au dernier traité pour sauter le travail inutile
+        """
+        return self._storage.get_snapshot()
+
+    def get_data_version(self) -> int:
+        """Retourne la version du snapshot de données publié."""
+        return self._storage.get_snapshot_version()
+
     def get_funding_data_object(self, symbol: str) -> Optional["FundingData"]:
         """
         Récupère un FundingData Value Object pour un symbole.
@@ -192,7 +209,7 @@ class DataManager(DataManagerInterface):
         """
         self._storage.set_funding_data_object(funding_data)
 
-    def update_original_funding_data(self, symbol: str, next_funding_time: str) -> None:
+    def update_original_funding_data(self, symbol: str, next_funding_time: Any) -> None:
         """
         Met à jour les données de funding originales pour un symbole.
 
@@ -6,15 +6,61 @@ Cette classe gère uniquement :
 - Le stockage thread-safe des données
 - La gestion des verrous et synchronisation
 - L'accès aux données stockées
+
+Lectures sans verrou : les writers publient un StorageSnapshot immuable et
+versionné (au plus une fois par STORAGE_SNAPSHOT_INTERVAL) ; les lecteurs
+récupèrent la référence courante sans verrou ni copie. Un lecteur qui
+trouve des données non publiées tente une publication non bloquante et
+se contente du snapshot précédent si un writer tient le verrou.
 """
 
 import time
 import threading
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Any
+from funding_time import funding_epoch_ms
 from logging_setup import setup_logging
 from models.funding_data import FundingData
 from models.ticker_data import TickerData
 from interfaces.data_storage_interface import DataStorageInterface
+from realtime_columns import RealtimeColumnStore, RealtimeSnapshot
+from config.constants import STORAGE_SNAPSHOT_INTERVAL
+
+
+# Clés ticker Bybit → colonnes du stockage temps réel
+TICKER_TO_COLUMN: Tuple[Tuple[str, str], ...] = (
+    ("fundingRate", "funding_rate"),
+    ("volume24h", "volume24h"),
+    ("turnover24h", "turnover24h"),
+    ("bid1Price", "bid1_price"),
+    ("ask1Price", "ask1_price"),
+    ("nextFundingTime", "next_funding_time"),
+    ("markPrice", "mark_price"),
+    ("lastPrice", "last_price"),
+)
+
+
+@dataclass(frozen=True)
+class StorageSnapshot:
+    """
+    Vue immuable et versionnée des données stockées.
+
+    Attributes:
+        version: Incrémenté à chaque publication
+        funding_version: Version de la partie funding (change seulement si le funding change)
+        realtime_version: Version de la partie temps réel
+        funding: {symbol: FundingData} en lecture seule
+        realtime: RealtimeSnapshot (dict {symbol: ligne} + colonnes float64)
+        published_at: Timestamp de publication
+    """
+
+    version: int = 0
+    funding_version: int = 0
+    realtime_version: int = 0
+    funding: Mapping[str, FundingData] = field(default_factory=lambda: MappingProxyType({}))
+    realtime: RealtimeSnapshot = field(default_factory=RealtimeSnapshot)
+    published_at: float = 0.0
 
 
 class DataStorage(DataStorageInterface):
@@ -41,16 +87,25 @@ class DataStorage(DataStorageInterface):
         self._funding_data_objects: Dict[str, FundingData] = {}
 
         # Données de funding originales avec next_funding_time
-        self.original_funding_data: Dict[str, str] = {}
+        self.original_funding_data: Dict[str, int] = {}
 
-        # Données en temps réel via WebSocket
-        # Format: {symbol: {funding_rate, volume24h, bid1, ask1, next_funding_time, ...}}
-        self.realtime_data: Dict[str, Dict[str, Any]] = {}
+        # Données en temps réel via WebSocket, stockées en colonnes float64
+        # Lecture par symbole: {funding_rate, volume24h, bid1_price, ask1_price, next_funding_time, ...}
+        self.realtime_data: RealtimeColumnStore = RealtimeColumnStore()
 
         # Verrous pour la synchronisation thread-safe
         self._funding_lock = threading.Lock()
         self._realtime_lock = threading.Lock()
 
+        # Snapshot publié (remplacé atomiquement, jamais modifié) et état des publications
+        self._snapshot = StorageSnapshot()
+        self._publish_lock = threading.Lock()
+        self.snapshot_interval = STORAGE_SNAPSHOT_INTERVAL
+        self._funding_dirty = False
+        self._realtime_dirty = False
+        self._funding_published_at = 0.0
+        self._realtime_published_at = 0.0
+
         # Catégories des symboles
         self.symbol_categories: Dict[str, str] = {}
 
@@ -58,6 +113,9 @@ class DataStorage(DataStorageInterface):
         self.linear_symbols: List[str] = []
         self.inverse_symbols: List[str] = []
 
+        # Callback appelé à chaque nextFundingTime reçu (planificateur d'événements)
+        self._on_funding_time_callback: Optional[Callable[[str, Any], None]] = None
+
     def set_symbol_categories(self, symbol_categories: Dict[str, str]):
         """
         Définit le mapping des catégories de symboles.
@@ -68,6 +126,15 @@ class DataStorage(DataStorageInterface):
         self.symbol_categories = symbol_categories
 
 
+    def set_on_funding_time_callback(self, callback: Optional[Callable[[str, Any], None]]):
+        """
+        Définit le callback appelé quand un delta ticker porte un nextFundingTime.
+
+        Args:
+            callback: Fonction (symbol, next_funding_time) ou None
+        """
+        self._on_funding_time_callback = callback
+
     def update_realtime_data(self, symbol: str, ticker_data: Dict[str, Any]):
         """
         Met à jour les données en temps réel pour un symbole.
@@ -80,38 +147,25 @@ class DataStorage(DataStorageInterface):
             return
 
         try:
-            # Construire un diff et fusionner avec l'état précédent
+            # Diff écrit en place dans la ligne du symbole (aucune allocation)
             now_ts = time.time()
             incoming = {
-                "funding_rate": ticker_data.get("fundingRate"),
-                "volume24h": ticker_data.get("volume24h"),
-                "bid1_price": ticker_data.get("bid1Price"),
-                "ask1_price": ticker_data.get("ask1Price"),
-                "next_funding_time": ticker_data.get("nextFundingTime"),
-                "mark_price": ticker_data.get("markPrice"),
-                "last_price": ticker_data.get("lastPrice"),
+                column: ticker_data[key]
+                for key, column in TICKER_TO_COLUMN
+                if ticker_data.get(key) is not None
             }
 
-            # Vérifier si des données importantes sont présentes
-            important_keys = [
-                "funding_rate",
-                "volume24h",
-                "bid1_price",
-                "ask1_price",
-                "next_funding_time",
-                "mark_price",
-                "last_price",
-            ]
-
-            if any(incoming[key] is not None for key in important_keys):
+            if incoming:
+                incoming["timestamp"] = now_ts
                 with self._realtime_lock:
-                    current = self.realtime_data.get(symbol, {})
-                    merged = dict(current) if current else {}
-                    for k, v in incoming.items():
-                        if v is not None:
-                            merged[k] = v
-                    merged["timestamp"] = now_ts
-                    self.realtime_data[symbol] = merged
+                    self.realtime_data.write(symbol, incoming)
+                    self._realtime_dirty = True
+                    if now_ts - self._realtime_published_at >= self.snapshot_interval:
+                        self._publish(realtime=self._capture_realtime())
+
+                callback = self._on_funding_time_callback
+                if callback is not None and "next_funding_time" in incoming:
+                    callback(symbol, incoming["next_funding_time"])
 
         except Exception as e:
             self.logger.warning(
@@ -186,26 +240,113 @@ class DataStorage(DataStorageInterface):
 
     def get_all_realtime_data(self) -> Dict[str, Dict[str, Any]]:
         """
-        Récupère toutes les données en temps réel.
+        Récupère toutes les données en temps réel (snapshot publié, sans copie).
 
         Returns:
-            Dictionnaire des données temps réel
+            Mapping en lecture seule {symbol: données temps réel}
         """
-        with self._realtime_lock:
-            return self.realtime_data.copy()
+        return self.get_snapshot(max_age=0).realtime
 
-    def update_original_funding_data(self, symbol: str, next_funding_time: str):
+    def get_realtime_snapshot(self) -> RealtimeSnapshot:
+        """
+        Récupère toutes les colonnes temps réel pour un traitement vectorisé.
+
+        Returns:
+            RealtimeSnapshot (symboles, colonnes float64 avec NaN pour les
+            valeurs absentes, index symbole → ligne)
+        """
+        return self.get_snapshot(max_age=0).realtime
+
+    # ===== SNAPSHOTS VERSIONNÉS (LECTURE SANS VERROU) =====
+
+    def get_snapshot(self, max_age: Optional[float] = None) -> StorageSnapshot:
+        """
+        Retourne le snapshot publié courant, sans verrou ni copie.
+
+        Si des écritures ne sont pas encore publiées et que le snapshot est
+        plus ancien que max_age, une publication non bloquante est tentée.
+
+        Args:
+            max_age: Âge maximal toléré en secondes (snapshot_interval si None,
+                0 pour exiger les dernières écritures publiables)
+
+        Returns:
+            StorageSnapshot immuable (comparer .version pour sauter le travail)
+        """
+        snapshot = self._snapshot
+        if self._funding_dirty or self._realtime_dirty:
+            limit = self.snapshot_interval if max_age is None else max_age
+            if time.time() - snapshot.published_at >= limit:
+                self._refresh_snapshot()
+                snapshot = self._snapshot
+        return snapshot
+
+    def get_snapshot_version(self) -> int:
+        """Retourne la version du snapshot publié courant."""
+        return self._snapshot.version
+
+    def _capture_funding(self) -> Mapping[str, FundingData]:
+        """Fige les données de funding (appelé sous _funding_lock)."""
+        self._funding_dirty = False
+        self._funding_published_at = time.time()
+        return MappingProxyType(dict(self._funding_data_objects))
+
+    def _capture_realtime(self) -> RealtimeSnapshot:
+        """Fige les colonnes temps réel (appelé sous _realtime_lock)."""
+        self._realtime_dirty = False
+        self._realtime_published_at = time.time()
+        return self.realtime_data.snapshot()
+
+    def _refresh_snapshot(self) -> None:
+        """Publie les parties modifiées sans jamais attendre un writer."""
+        if self._funding_dirty and self._funding_lock.acquire(blocking=False):
+            try:
+                self._publish(funding=self._capture_funding())
+            finally:
+                self._funding_lock.release()
+        if self._realtime_dirty and self._realtime_lock.acquire(blocking=False):
+            try:
+                self._publish(realtime=self._capture_realtime())
+            finally:
+                self._realtime_lock.release()
+
+    def _publish(
+        self,
+        funding: Optional[Mapping[str, FundingData]] = None,
+        realtime: Optional[RealtimeSnapshot] = None,
+    ) -> None:
+        """
+        Remplace le snapshot courant (affectation atomique de la référence).
+
+        Appelé sous le verrou de la partie publiée : deux captures d'une même
+        partie ne peuvent donc pas être publiées dans le désordre.
+        """
+        with self._publish_lock:
+            current = self._snapshot
+            self._snapshot = StorageSnapshot(
+                version=current.version + 1,
+                funding_version=current.funding_version + (funding is not None),
+                realtime_version=current.realtime_version + (realtime is not None),
+                funding=funding if funding is not None else current.funding,
+                realtime=realtime if realtime is not None else current.realtime,
+                published_at=time.time(),
+            )
+
+    def update_original_funding_data(self, symbol: str, next_funding_time: Any):
         """
         Met à jour les données de funding originales.
 
         Args:
             symbol: Symbole à mettre à jour
-            next_funding_time: Timestamp du prochain funding
+            next_funding_time: Timestamp du prochain funding (stocké en epoch ms)
         """
+        funding_ms = funding_epoch_ms(next_funding_time)
+        if funding_ms is None:
+            return
         with self._funding_lock:
-            self.original_funding_data[symbol] = next_funding_time
+            self.original_funding_data[symbol] = funding_ms
 
-    def get_original_funding_data(self, symbol: str) -> Optional[str]:
+    def get_original_funding_data(self, symbol: str) -> Optional[int]:
         """
         Récupère les données de funding originales pour un symbole.
 
@@ -213,12 +354,12 @@ class DataStorage(DataStorageInterface):
             symbol: Symbole à récupérer
 
         Returns:
-            Timestamp du prochain funding ou None si absent
+            Epoch ms du prochain funding ou None si absent
         """
         with self._funding_lock:
             return self.original_funding_data.get(symbol)
 
-    def get_all_original_funding_data(self) -> Dict[str, str]:
+    def get_all_original_funding_data(self) -> Dict[str, int]:
         """
         Récupère toutes les données de funding originales.
 
@@ -299,9 +440,11 @@ class DataStorage(DataStorageInterface):
         with self._funding_lock:
             self._funding_data_objects.clear()
             self.original_funding_data.clear()
+            self._publish(funding=self._capture_funding())
 
         with self._realtime_lock:
             self.realtime_data.clear()
+            self._publish(realtime=self._capture_realtime())
 
         self.linear_symbols.clear()
         self.inverse_symbols.clear()
@@ -339,6 +482,9 @@ class DataStorage(DataStorageInterface):
         """
         with self._funding_lock:
             self._funding_data_objects[funding_data.symbol] = funding_data
+            self._funding_dirty = True
+            if time.time() - self._funding_published_at >= self.snapshot_interval:
+                self._publish(funding=self._capture_funding())
 
     def get_funding_data_object(self, symbol: str) -> Optional[FundingData]:
         """
@@ -358,7 +504,7 @@ class DataStorage(DataStorageInterface):
         Récupère toutes les données de funding en tant que Value Objects.
 
         Returns:
-            Dictionnaire {symbol: FundingData}
+            Mapping en lecture seule {symbol: FundingData} (snapshot publié,
+            sans copie)
         """
-        with self._funding_lock:
-            return self._funding_data_objects.copy()
+        return self.get_snapshot(max_age=0).funding
@@ -117,7 +117,7 @@ Le tableau affiché contient les colonnes suivantes :
 """
 
 import asyncio
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from logging_setup import setup_logging
 from interfaces.data_manager_interface import DataManagerInterface
 from table_formatter import TableFormatter
@@ -214,6 +214,10 @@ class DisplayManager:
         # Filtrage des symboles à afficher (pour mode position unique)
         self._filtered_symbols: Optional[set] = None
 
+        # Ordre d'affichage calculé pour le dernier snapshot de funding publié
+        self._order_cache_key = None
+        self._order_cache: List[str] = []
+
     def set_volatility_callback(self, callback: callable):
         """
         Définit le callback pour récupérer la volatilité.
@@ -332,7 +336,16 @@ class DisplayManager:
         """
         # Si aucune opportunité n'est trouvée, retourner
         # Utiliser la méthode déléguée de DataManagerInterface au lieu d'accéder à .storage
-        funding_data_objects = self.data_manager.get_all_funding_data_objects()
+        # Snapshot publié (sans verrou) : funding_version change à chaque
+        # publication d'un nouveau funding
+        get_snapshot = getattr(self.data_manager, "get_data_snapshot", None)
+        if get_snapshot is not None:
+            snapshot = get_snapshot()
+            funding_data_objects = snapshot.funding
+            funding_version = snapshot.funding_version
+        else:
+            funding_data_objects = self.data_manager.get_all_funding_data_objects()
+            funding_version = None
         self.logger.debug(f"_print_price_table: {len(funding_data_objects) if funding_data_objects else 0} symboles")
 
         if not funding_data_objects:
@@ -373,7 +386,41 @@ class DisplayManager:
         print("\n" + header)
         print(separator)
 
-        # Trier les symboles par poids (si disponible) avant affichage
+        # Trier les symboles par poids (si disponible) avant affichage.
+        # Tant que la version du funding publié ne change pas, l'ordre
+        # calculé reste valable.
+        cache_key = None
+        if funding_version is not None:
+            cache_key = (funding_version, frozenset(self._filtered_symbols or ()))
+        if cache_key is not None and cache_key == self._order_cache_key:
+            symbols_to_display = self._order_cache
+        else:
+            symbols_to_display = self._sort_symbols_by_weight(funding_data_objects)
+            self._order_cache_key = cache_key
+            self._order_cache = symbols_to_display
+
+        # Afficher les données dans l'ordre trié
+        for symbol in symbols_to_display:
+            row_data = self._formatter.prepare_row_data(
+                symbol, self.data_manager
+            )
+            line = self._formatter.format_table_row(
+                symbol, row_data, col_widths
+            )
+            print(line)
+
+        print()  # Ligne vide après le tableau
+
+    def _sort_symbols_by_weight(self, funding_data_objects) -> List[str]:
+        """
+        Trie les symboles par poids décroissant (|funding| à défaut).
+
+        Args:
+            funding_data_objects: {symbol: FundingData} à afficher
+
+        Returns:
+            Liste des symboles dans l'ordre d'affichage
+        """
         symbols_to_display = list(funding_data_objects.keys())
 
         # Essayer de récupérer les poids depuis les données de funding
@@ -397,19 +444,8 @@ class DisplayManager:
         except Exception as e:
             # En cas d'erreur, utiliser l'ordre original
             self.logger.debug(f"Impossible de trier par poids: {e}")
-            pass
-
-        # Afficher les données dans l'ordre trié
-        for symbol in symbols_to_display:
-            row_data = self._formatter.prepare_row_data(
-                symbol, self.data_manager
-            )
-            line = self._formatter.format_table_row(
-                symbol, row_data, col_widths
-            )
-            print(line)
 
-        print()  # Ligne vide après le tableau
+        return symbols_to_display
 
     def is_running(self) -> bool:
         """
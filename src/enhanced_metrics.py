@@ -108,6 +108,8 @@ class EnhancedMetricsCollector:
             MetricConfig("cpu_usage_percent", "Utilisation CPU", "%"),
             MetricConfig("task_execution_time_ms", "Temps d'exécution des tâches", "ms"),
             MetricConfig("error_rate_percent", "Taux d'erreur", "%"),
+            MetricConfig("hedge_leg_latency_ms", "Latence par étape du hedge spot", "ms"),
+            MetricConfig("hedge_unhedged_window_ms", "Exposition non couverte (fill perp → hedge spot)", "ms"),
         ]
 
         for metric in default_metrics:
@@ -175,6 +177,19 @@ class EnhancedMetricsCollector:
         self.record_metric("pairs_kept", kept, {"filter": filter_name})
         self.record_metric("pairs_rejected", rejected, {"filter": filter_name})
 
+    def record_hedge_latency(self, symbol: str, legs_ms: Dict[str, float], unhedged_ms: float):
+        """
+        Enregistre les latences d'un hedge perp + spot.
+
+        Args:
+            symbol: Symbole hedgé
+            legs_ms: Durée de chaque étape {nom: ms} (préparation, jambe spot, ...)
+            unhedged_ms: Durée entre le fill perp et le placement du hedge spot
+        """
+        for leg, latency_ms in legs_ms.items():
+            self.record_metric("hedge_leg_latency_ms", latency_ms, {"symbol": symbol, "leg": leg})
+        self.record_metric("hedge_unhedged_window_ms", unhedged_ms, {"symbol": symbol})
+
     def record_task_execution(self, task_name: str, execution_time_ms: float, threshold_ms: float = 1000.0):
         """
         Enregistre l'exécution d'une tâche avec détection des tâches lentes.
@@ -528,6 +543,11 @@ def record_filter_result(filter_name: str, kept: int, rejected: int):
     get_metrics_collector().record_filter_result(filter_name, kept, rejected)
 
 
+def record_hedge_latency(symbol: str, legs_ms: Dict[str, float], unhedged_ms: float):
+    """Enregistre les latences d'un hedge perp + spot."""
+    get_metrics_collector().record_hedge_latency(symbol, legs_ms, unhedged_ms)
+
+
 def record_task_execution(task_name: str, execution_time_ms: float, threshold_ms: float = 1000.0):
     """Enregistre l'exécution d'une tâche."""
     get_metrics_collector().record_task_execution(task_name, execution_time_ms, threshold_ms)
@@ -7,6 +7,7 @@ la duplication de code entre opportunity_manager.py et data_manager.py.
 """
 
 from typing import Dict, Any, Optional, Tuple, List, Union
+from funding_time import funding_epoch_ms
 from models.funding_data import FundingData
 
 
@@ -17,7 +18,6 @@ class FundingDataFactory:
     def from_ticker_data(
         symbol: str,
         ticker_data: dict,
-        watchlist_manager=None
     ) -> Optional[FundingData]:
         """
         Crée FundingData depuis données ticker WebSocket.
@@ -25,7 +25,6 @@ class FundingDataFactory:
         Args:
             symbol: Symbole du contrat
             ticker_data: Données ticker reçues via WebSocket
-            watchlist_manager: Manager pour calculer funding_time_remaining (optionnel)
 
         Returns:
             FundingData ou None si données invalides
@@ -42,12 +41,6 @@ class FundingDataFactory:
             funding = float(funding_rate)
             volume = float(volume24h) if volume24h is not None else 0.0
 
-            # Calculer le temps de funding restant
-            if watchlist_manager and next_funding_time:
-                funding_time_remaining = watchlist_manager.calculate_funding_time_remaining(next_funding_time)
-            else:
-                funding_time_remaining = "-"
-
             # Calculer le spread si disponible
             spread_pct = FundingDataFactory._calculate_spread_from_ticker(ticker_data)
 
@@ -55,7 +48,7 @@ class FundingDataFactory:
                 symbol=symbol,
                 funding_rate=funding,
                 volume_24h=volume,
-                next_funding_time=funding_time_remaining,
+                next_funding_time=funding_epoch_ms(next_funding_time),
                 spread_pct=spread_pct,
                 volatility_pct=None  # Sera calculé séparément
             )
@@ -86,7 +79,7 @@ class FundingDataFactory:
                 symbol=symbol,
                 funding_rate=funding,
                 volume_24h=volume,
-                next_funding_time=funding_time,
+                next_funding_time=funding_epoch_ms(funding_time),
                 spread_pct=spread,
                 volatility_pct=volatility
             )
@@ -101,7 +94,7 @@ class FundingDataFactory:
 
         Args:
             symbol: Symbole du contrat
-            data: Dict avec clés funding, volume, funding_time_remaining, etc.
+            data: Dict avec clés funding, volume, next_funding_time, etc.
 
         Returns:
             FundingData ou None si données invalides
@@ -111,9 +104,8 @@ class FundingDataFactory:
             funding = data.get("funding", 0.0)
             volume = data.get("volume", 0.0)
 
-            # Gérer les différents formats de temps de funding
-            funding_time = data.get("funding_time_remaining",
-                                  data.get("next_funding_time", "-"))
+            # Heure de funding absolue (epoch ms)
+            funding_time = funding_epoch_ms(data.get("next_funding_time"))
 
             spread = data.get("spread_pct", 0.0)
             volatility = data.get("volatility_pct", None)
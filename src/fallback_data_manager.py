@@ -107,8 +107,8 @@ class FallbackDataManager(FallbackDataManagerInterface):
 
     def get_funding_data_for_scheduler(self) -> Dict[str, Dict[str, Any]]:
         """
-        Récupère les données de funding formatées pour le Scheduler.
-        Calcule dynamiquement le temps restant à partir des timestamps temps réel.
+        Récupère les données de funding pour le Scheduler.
+        L'heure de funding est transmise en epoch ms (temps restant dérivé à la lecture).
 
         Returns:
             Dict avec les données de funding formatées pour chaque symbole
@@ -128,22 +128,36 @@ class FallbackDataManager(FallbackDataManagerInterface):
         self.logger.debug(f"[SCHEDULER] Données récupérées: {len(funding_data)} symboles")
         return funding_data
 
+    def get_funding_rate(self, symbol: str) -> Optional[float]:
+        """
+        Retourne le funding rate courant d'un symbole (temps réel, sinon REST).
+
+        Args:
+            symbol: Symbole à lire
+
+        Returns:
+            Funding rate ou None si inconnu
+        """
+        if not self.data_manager:
+            return None
+        realtime_info = self.data_manager.storage.get_realtime_data(symbol)
+        if realtime_info and realtime_info.get("funding_rate") is not None:
+            return realtime_info["funding_rate"]
+        funding_obj = self.data_manager.storage.get_funding_data_object(symbol)
+        return funding_obj.funding_rate if funding_obj else None
+
     def _get_symbol_funding_data(self, symbol: str) -> Dict[str, Any]:
         """Récupère les données de funding pour un symbole spécifique."""
         # Récupérer les données temps réel (mises à jour via WebSocket)
         realtime_info = self.data_manager.storage.get_realtime_data(symbol)
 
         if realtime_info and realtime_info.get("next_funding_time"):
-            # Calculer le temps restant à partir du timestamp temps réel
-            next_funding_timestamp = realtime_info["next_funding_time"]
-            funding_time_str = self.watchlist_manager.calculate_funding_time_remaining(next_funding_timestamp)
-
             funding_data = {
-                'next_funding_time': funding_time_str,  # Recalculé dynamiquement
+                'next_funding_time': int(realtime_info["next_funding_time"]),  # Epoch ms
                 'funding_rate': realtime_info.get('funding_rate'),
                 'volume_24h': realtime_info.get('volume24h')
             }
-            self.logger.debug(f"[SCHEDULER] {symbol}: {funding_time_str} (temps réel)")
+            self.logger.debug(f"[SCHEDULER] {symbol}: {funding_data['next_funding_time']} (temps réel)")
             return funding_data
         else:
             # Fallback sur les données originales si pas de données temps réel
@@ -153,18 +167,17 @@ class FallbackDataManager(FallbackDataManagerInterface):
         """Récupère les données de funding en fallback depuis les données originales."""
         funding_obj = self.data_manager.storage.get_funding_data_object(symbol)
         if funding_obj:
-            original_timestamp = self.data_manager.storage.get_original_funding_data(symbol)
-            if original_timestamp:
-                funding_time_str = self.watchlist_manager.calculate_funding_time_remaining(original_timestamp)
-            else:
-                funding_time_str = funding_obj.next_funding_time
+            next_funding_time = (
+                self.data_manager.storage.get_original_funding_data(symbol)
+                or funding_obj.next_funding_time
+            )
 
             funding_data = {
-                'next_funding_time': funding_time_str,
+                'next_funding_time': next_funding_time,
                 'funding_rate': funding_obj.funding_rate,
                 'volume_24h': funding_obj.volume_24h
             }
-            self.logger.debug(f"[SCHEDULER] {symbol}: {funding_time_str} (fallback)")
+            self.logger.debug(f"[SCHEDULER] {symbol}: {next_funding_time} (fallback)")
             return funding_data
         else:
             self.logger.debug(f"[SCHEDULER] Aucune donnée pour {symbol}")
@@ -5,9 +5,15 @@ Package des filtres pour le bot Bybit.
 Ce package contient :
 - BaseFilter : Interface abstraite pour tous les filtres
 - Implémentations concrètes des différents types de filtres
+- ColumnarSymbolFilter : variante vectorisée (NumPy) de SymbolFilter
 """
 
 from .base_filter import BaseFilter
 from .symbol_filter import SymbolFilter
+from .columnar_filter import ColumnarSymbolFilter
 
-__all__ = ["BaseFilter", "SymbolFilter"]
+__all__ = [
+    "BaseFilter",
+    "SymbolFilter",
+    "ColumnarSymbolFilter",
+]
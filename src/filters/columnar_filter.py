@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Filtre de spread et pondération vectorisés (NumPy).
+
+Les valeurs d'un lot sont chargées en colonnes float64 (NaN = valeur
+absente) : le filtre de spread devient un masque booléen et le score
+pondéré est calculé pour toutes les lignes en une passe.
+
+Les règles reproduisent celles des versions ligne par ligne :
+- SymbolFilter.filter_by_spread (spread inconnu rejeté si spread_max)
+- WeightCalculator.calculate_weight (valeurs négatives ramenées à 0,
+  score arrondi à 2 décimales)
+
+Le filtre funding/volume/temps et le top N de la watchlist sont tenus
+par IncrementalWatchlistRanker (verdicts et poids incrémentaux).
+
+Sans NumPy, ColumnarSymbolFilter se comporte comme SymbolFilter.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .symbol_filter import SymbolFilter
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy optionnel
+    np = None
+
+# Poids par défaut (identiques à WeightCalculator.calculate_weight)
+DEFAULT_WEIGHTS = {"funding": 10.0, "volume": 0.5, "spread": 5.0, "volatility": 2.0}
+
+
+def _column(values: Sequence[Optional[float]]):
+    """Colonne float64 (None → NaN)."""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def compute_weights(funding, volume, spread, volatility, weights_config: Mapping[str, Any]):
+    """
+    Score pondéré vectorisé (formule de WeightCalculator.calculate_weight).
+
+    Args:
+        funding, volume, spread, volatility: Colonnes (NaN traité comme 0)
+        weights_config: Configuration des poids
+
+    Returns:
+        ndarray des scores arrondis à 2 décimales
+    """
+    weights = {**DEFAULT_WEIGHTS, **{k: v for k, v in weights_config.items() if k in DEFAULT_WEIGHTS}}
+    funding = np.nan_to_num(np.asarray(funding, dtype=np.float64))
+    volume = np.maximum(np.nan_to_num(np.asarray(volume, dtype=np.float64)), 0.0)
+    spread = np.maximum(np.nan_to_num(np.asarray(spread, dtype=np.float64)), 0.0)
+    volatility = np.maximum(np.nan_to_num(np.asarray(volatility, dtype=np.float64)), 0.0)
+    score = (
+        np.abs(funding) * weights["funding"]
+        + np.log(volume + 1) * weights["volume"]
+        - spread * weights["spread"]
+        - volatility * weights["volatility"]
+    )
+    return np.round(score, 2)
+
+
+class ColumnarSymbolFilter(SymbolFilter):
+    """
+    SymbolFilter dont le filtre de spread est vectorisé : même signature
+    et mêmes résultats, un masque NumPy au lieu d'une boucle par symbole.
+    """
+
+    def get_name(self) -> str:
+        """Retourne le nom du filtre."""
+        return "columnar_symbol_filter"
+
+    def filter_by_spread(
+        self,
+        symbols_data: List[Tuple],
+        spread_data: Dict[str, float],
+        spread_max: Optional[float],
+    ) -> List[Tuple[str, float, float, Optional[int], float]]:
+        """Voir SymbolFilter.filter_by_spread."""
+        if np is None or spread_max is None or not symbols_data:
+            return super().filter_by_spread(symbols_data, spread_data, spread_max)
+
+        spreads = _column([spread_data.get(row[0]) for row in symbols_data])
+        keep = np.flatnonzero(spreads <= spread_max)
+        return [
+            (*symbols_data[i][:4], spread_data[symbols_data[i][0]])
+            for i in keep.tolist()
+        ]
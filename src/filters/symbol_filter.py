@@ -6,8 +6,8 @@ Cette classe implémente l'interface BaseFilter pour le filtrage par funding,
 volume et temps avant funding.
 """
 
-import time
 from typing import List, Tuple, Dict, Optional, Any
+from funding_time import funding_epoch_ms, remaining_minutes
 from .base_filter import BaseFilter
 
 
@@ -18,7 +18,6 @@ class SymbolFilter(BaseFilter):
     Responsabilités :
     - Filtrage par funding, volume et fenêtre temporelle
     - Filtrage par spread
-    - Calculs de temps de funding
     - Tri et sélection des symboles
     """
 
@@ -95,7 +94,7 @@ class SymbolFilter(BaseFilter):
         limite: Optional[int],
         funding_time_min_minutes: Optional[int] = None,
         funding_time_max_minutes: Optional[int] = None,
-    ) -> List[Tuple[str, float, float, str]]:
+    ) -> List[Tuple[str, float, float, Optional[int]]]:
         """
         Filtre les symboles par funding, volume et fenêtre temporelle
         avant funding.
@@ -114,7 +113,8 @@ class SymbolFilter(BaseFilter):
             prochain funding
 
         Returns:
-            Liste des (symbol, funding, volume, funding_time_remaining) triés
+            Liste des (symbol, funding, volume, next_funding_time epoch ms)
+            triés
         """
         # Récupérer tous les symboles perpétuels
         all_symbols = list(set(perp_data["linear"] + perp_data["inverse"]))
@@ -133,7 +133,9 @@ class SymbolFilter(BaseFilter):
                 data = funding_map[symbol]
                 funding = data["funding"]
                 volume = data["volume"]
-                next_funding_time = data.get("next_funding_time")
+                next_funding_time = funding_epoch_ms(
+                    data.get("next_funding_time")
+                )
 
                 # Appliquer les bornes funding/volume (utiliser valeur absolue
                 # pour funding)
@@ -152,13 +154,7 @@ class SymbolFilter(BaseFilter):
                     funding_time_min_minutes is not None
                     or funding_time_max_minutes is not None
                 ):
-                    # Utiliser la fonction centralisée pour calculer
-                    # les minutes restantes
-                    minutes_remaining = (
-                        self.calculate_funding_minutes_remaining(
-                            next_funding_time
-                        )
-                    )
+                    minutes_remaining = remaining_minutes(next_funding_time)
 
                     # Si pas de temps valide alors qu'on filtre, rejeter
                     if minutes_remaining is None:
@@ -174,13 +170,10 @@ class SymbolFilter(BaseFilter):
                     ):
                         continue
 
-                # Calculer le temps restant avant le prochain funding (formaté)
-                funding_time_remaining = self.calculate_funding_time_remaining(
-                    next_funding_time
-                )
-
+                # L'heure absolue est conservée : le temps restant est
+                # dérivé à la lecture
                 filtered_symbols.append(
-                    (symbol, funding, volume, funding_time_remaining)
+                    (symbol, funding, volume, next_funding_time)
                 )
 
         # Trier par |funding| décroissant
@@ -197,31 +190,31 @@ class SymbolFilter(BaseFilter):
         symbols_data: List[Tuple],
         spread_data: Dict[str, float],
         spread_max: Optional[float],
-    ) -> List[Tuple[str, float, float, str, float]]:
+    ) -> List[Tuple[str, float, float, Optional[int], float]]:
         """
         Filtre les symboles par spread maximum.
 
         Args:
             symbols_data: Liste des (symbol, funding, volume,
-            funding_time_remaining)
+            next_funding_time)
             spread_data: Dictionnaire des spreads {symbol: spread_pct}
             spread_max: Spread maximum autorisé
 
         Returns:
-            Liste des (symbol, funding, volume, funding_time_remaining,
+            Liste des (symbol, funding, volume, next_funding_time,
             spread_pct) filtrés
         """
         if spread_max is None:
             # Pas de filtre de spread, ajouter 0.0 comme spread par défaut
             return [
-                (symbol, funding, volume, funding_time_remaining, 0.0)
-                for symbol, funding, volume, funding_time_remaining in (
+                (symbol, funding, volume, next_funding_time, 0.0)
+                for symbol, funding, volume, next_funding_time in (
                     symbols_data
                 )
             ]
 
         filtered_symbols = []
-        for symbol, funding, volume, funding_time_remaining in symbols_data:
+        for symbol, funding, volume, next_funding_time in symbols_data:
             if symbol in spread_data:
                 spread_pct = spread_data[symbol]
                 if spread_pct <= spread_max:
@@ -230,115 +223,13 @@ class SymbolFilter(BaseFilter):
                             symbol,
                             funding,
                             volume,
-                            funding_time_remaining,
+                            next_funding_time,
                             spread_pct,
                         )
                     )
 
         return filtered_symbols
 
-    def calculate_funding_time_remaining(self, next_funding_time) -> str:
-        """
-        Retourne "Xh Ym Zs" à partir d'un timestamp Bybit (ms) ou ISO.
-
-        Args:
-            next_funding_time: Timestamp du prochain funding (ms ou ISO string)
-
-        Returns:
-            str: Temps restant formaté ou "-" si invalide
-        """
-        if not next_funding_time:
-            return "-"
-
-        try:
-            # Gérer les deux formats : timestamp ms ou ISO string
-            if isinstance(next_funding_time, str):
-                if next_funding_time.isdigit():
-                    # Timestamp en ms
-                    target_timestamp = int(next_funding_time) / 1000
-                else:
-                    # ISO string
-                    from datetime import datetime
-
-                    dt = datetime.fromisoformat(
-                        next_funding_time.replace("Z", "+00:00")
-                    )
-                    target_timestamp = dt.timestamp()
-            else:
-                # Déjà un timestamp
-                target_timestamp = (
-                    float(next_funding_time) / 1000
-                    if next_funding_time > 1e10
-                    else float(next_funding_time)
-                )
-
-            current_timestamp = time.time()
-            remaining_seconds = target_timestamp - current_timestamp
-
-            if remaining_seconds <= 0:
-                return "0s"
-
-            hours = int(remaining_seconds // 3600)
-            minutes = int((remaining_seconds % 3600) // 60)
-            seconds = int(remaining_seconds % 60)
-
-            if hours > 0:
-                return f"{hours}h {minutes}m {seconds}s"
-            elif minutes > 0:
-                return f"{minutes}m {seconds}s"
-            else:
-                return f"{seconds}s"
-
-        except (ValueError, TypeError, OverflowError) as e:
-            self.logger.warning(f"⚠️ Erreur calcul temps funding: {e}")
-            return "-"
-
-    def calculate_funding_minutes_remaining(
-        self, next_funding_time
-    ) -> Optional[float]:
-        """
-        Calcule les minutes restantes avant le prochain funding.
-
-        Args:
-            next_funding_time: Timestamp du prochain funding
-
-        Returns:
-            float: Minutes restantes ou None si erreur
-        """
-        if not next_funding_time:
-            return None
-
-        try:
-            # Gérer les deux formats : timestamp ms ou ISO string
-            if isinstance(next_funding_time, str):
-                if next_funding_time.isdigit():
-                    # Timestamp en ms
-                    target_timestamp = int(next_funding_time) / 1000
-                else:
-                    # ISO string
-                    from datetime import datetime
-
-                    dt = datetime.fromisoformat(
-                        next_funding_time.replace("Z", "+00:00")
-                    )
-                    target_timestamp = dt.timestamp()
-            else:
-                # Déjà un timestamp
-                target_timestamp = (
-                    float(next_funding_time) / 1000
-                    if next_funding_time > 1e10
-                    else float(next_funding_time)
-                )
-
-            current_timestamp = time.time()
-            remaining_seconds = target_timestamp - current_timestamp
-            remaining_minutes = remaining_seconds / 60
-
-            return remaining_minutes if remaining_minutes > 0 else 0
-
-        except (ValueError, TypeError, OverflowError):
-            return None
-
     def separate_symbols_by_category(
         self, symbols_data: List[Tuple], symbol_categories: Dict[str, str]
     ) -> Tuple[List[str], List[str]]:
@@ -359,7 +250,7 @@ class SymbolFilter(BaseFilter):
 
         # Déterminer la structure des données selon la longueur des tuples
         if symbols_data and len(symbols_data[0]) >= 4:
-            # Format: (symbol, funding, volume, funding_time_remaining, ...)
+            # Format: (symbol, funding, volume, next_funding_time, ...)
             symbols = [item[0] for item in symbols_data]
         else:
             # Format simple: [symbol, ...]
@@ -403,12 +294,11 @@ class SymbolFilter(BaseFilter):
         """
         try:
             data = funding_map.get(symbol)
-            if not data or len(data) < 3:
+            if not data:
                 return False
 
-            funding = data[0]
-            volume = data[1]
-            funding_time_remaining = data[2]
+            funding = data.get("funding")
+            volume = data.get("volume")
 
             # Vérifier que les données sont valides
             if funding is None or volume is None:
@@ -423,33 +313,20 @@ class SymbolFilter(BaseFilter):
             # Vérifier le volume
             if (
                 volume_min_millions is not None
-                and volume < volume_min_millions
+                and volume < volume_min_millions * 1_000_000
             ):
                 return False
 
-            # Vérifier le temps avant funding
+            # Vérifier le temps avant funding (dérivé de l'epoch ms)
             if funding_time_max_minutes is not None:
-                try:
-                    # Convertir le temps restant en minutes
-                    if (
-                        isinstance(funding_time_remaining, str)
-                        and funding_time_remaining != "-"
-                    ):
-                        # Format "Xh Ym Zs" -> minutes
-                        time_parts = funding_time_remaining.split()
-                        total_minutes = 0
-                        for part in time_parts:
-                            if part.endswith("h"):
-                                total_minutes += int(part[:-1]) * 60
-                            elif part.endswith("m"):
-                                total_minutes += int(part[:-1])
-                            elif part.endswith("s"):
-                                total_minutes += int(part[:-1]) / 60
-
-                        if total_minutes > funding_time_max_minutes:
-                            return False
-                except (ValueError, AttributeError):
-                    pass
+                minutes_remaining = remaining_minutes(
+                    funding_epoch_ms(data.get("next_funding_time"))
+                )
+                if (
+                    minutes_remaining is not None
+                    and minutes_remaining > funding_time_max_minutes
+                ):
+                    return False
 
             return True
 
@@ -519,10 +396,10 @@ class SymbolFilter(BaseFilter):
 
         Args:
             symbols_data: Liste des tuples (symbol, funding, volume,
-            funding_time_remaining, ...)
+            next_funding_time, ...)
 
         Returns:
-            Dictionnaire {symbol: {funding, volume, funding_time_remaining,
+            Dictionnaire {symbol: {funding, volume, next_funding_time,
             spread_pct, volatility_pct}}
         """
         funding_data = {}
@@ -532,7 +409,7 @@ class SymbolFilter(BaseFilter):
                 symbol = symbol_data[0]
                 funding = symbol_data[1]
                 volume = symbol_data[2]
-                funding_time_remaining = symbol_data[3]
+                next_funding_time = symbol_data[3]
 
                 # Ajouter les données optionnelles selon la longueur du tuple
                 spread_pct = symbol_data[4] if len(symbol_data) > 4 else 0.0
@@ -544,7 +421,7 @@ class SymbolFilter(BaseFilter):
                 funding_data[symbol] = {
                     "funding": funding,
                     "volume": volume,
-                    "funding_time_remaining": funding_time_remaining,
+                    "next_funding_time": next_funding_time,
                     "spread_pct": spread_pct,
                     "volatility_pct": volatility_pct,
                     "weight": weight,  # Ajouter le poids calculé
@@ -8,6 +8,9 @@ les positions correspondantes.
 
 Fonctionnalités :
 - Surveillance des événements de funding en temps réel
+- Positions lues en mémoire dans le PositionBook partagé (topics privés
+  "position" et "order"), avec une seule réconciliation REST périodique
+  pour tout le compte au lieu d'appels par symbole
 - Fermeture automatique des positions après funding
 - Gestion des erreurs et retry
 - Logs informatifs pour le suivi
@@ -20,7 +23,9 @@ from typing import Callable, Dict, Any, Optional, Set
 from logging_setup import setup_logging
 from ws_private import PrivateWSClient
 from config import get_settings
+from config.constants import POSITION_CONFIRM_GRACE_SECONDS, POSITION_RECONCILE_INTERVAL_SECONDS
 from order_monitor import OrderMonitor
+from position_book import PositionBook
 from utils.async_wrappers import run_in_thread
 
 
@@ -39,6 +44,7 @@ class FundingCloseManager:
         bybit_client,
         on_position_closed: Optional[Callable[[str, Dict[str, Any]], None]] = None,
         auto_trading_config: Optional[Dict[str, Any]] = None,
+        position_book: Optional[PositionBook] = None,
     ):
         """
         Initialise le gestionnaire de fermeture après funding.
@@ -49,6 +55,8 @@ class FundingCloseManager:
             bybit_client: Client Bybit pour fermer les positions
             on_position_closed: Callback appelé lors de la fermeture d'une position
             auto_trading_config: Configuration du trading automatique
+            position_book: Carnet de positions partagé (alimenté par PositionMonitor).
+                           Sans carnet fourni, le manager alimente le sien par sa propre WebSocket.
         """
         self.testnet = testnet
         self.logger = logger
@@ -64,6 +72,9 @@ class FundingCloseManager:
             self.logger.info("[FUNDING] 💤 Aucun thread démarré pour la fermeture automatique")
             # Gardes simples : ne pas initialiser les composants coûteux
             self._monitored_positions: Set[str] = set()
+            self._monitored_since: Dict[str, float] = {}
+            self._position_book = None
+            self._owns_position_book = False
             self._ws_client = None
             self._monitor_thread = None
             self._running = False
@@ -78,6 +89,11 @@ class FundingCloseManager:
 
         # Positions surveillées pour fermeture après funding
         self._monitored_positions: Set[str] = set()
+        self._monitored_since: Dict[str, float] = {}  # symbol -> début de surveillance (monotone)
+
+        # Carnet des positions / ordres ouverts (lecture O(1) en mémoire)
+        self._owns_position_book = position_book is None
+        self._position_book = position_book or PositionBook(logger=logger)
 
         # WebSocket client pour surveiller les événements de funding
         self._ws_client: Optional[PrivateWSClient] = None
@@ -123,27 +139,20 @@ class FundingCloseManager:
                 return
             self.logger.debug("🔍 Vérification des positions existantes pour surveillance funding...")
 
-            # Récupérer les positions existantes
-            positions = self.bybit_client.get_positions(category="linear", settleCoin="USDT")
-
-            if positions and positions.get("list"):
-                existing_positions = positions["list"]
-                active_positions = [pos for pos in existing_positions if float(pos.get("size", 0)) > 0]
+            # Réconciliation initiale du carnet (un appel REST pour tout le compte)
+            if not self._position_book.reconcile(self.bybit_client):
+                return
 
-                if active_positions:
-                    self.logger.debug(f"📈 {len(active_positions)} position(s) existante(s) détectée(s) pour surveillance funding:")
-                    for pos in active_positions:
-                        symbol = pos.get("symbol", "N/A")
-                        size = pos.get("size", "0")
-                        side = pos.get("side", "N/A")
-                        self.logger.debug(f"   - {symbol}: {side} {size}")
+            active_positions = self._position_book.get_open_positions()
+            if active_positions:
+                self.logger.debug(f"📈 {len(active_positions)} position(s) existante(s) détectée(s) pour surveillance funding:")
+                for symbol, pos in active_positions.items():
+                    self.logger.debug(f"   - {symbol}: {pos.get('side', 'N/A')} {pos.get('size', '0')}")
 
-                        # Ajouter à la surveillance
-                        self.add_position_to_monitor(symbol)
-                else:
-                    self.logger.debug("ℹ️ Aucune position active détectée pour surveillance funding")
+                    # Ajouter à la surveillance
+                    self.add_position_to_monitor(symbol)
             else:
-                self.logger.debug("ℹ️ Aucune position trouvée pour surveillance funding")
+                self.logger.debug("ℹ️ Aucune position active détectée pour surveillance funding")
 
         except Exception as e:
             self.logger.error(f"❌ Erreur vérification positions existantes: {e}")
@@ -159,6 +168,7 @@ class FundingCloseManager:
             return
 
         self._monitored_positions.add(symbol)
+        self._monitored_since.setdefault(symbol, time.monotonic())
         self.logger.debug(f"💰 Position ajoutée à la surveillance funding: {symbol}")
         self.logger.debug(f"💰 Positions surveillées: {list(self._monitored_positions)}")
         self.logger.debug(f"💰 FundingCloseManager running: {self._running}")
@@ -175,6 +185,7 @@ class FundingCloseManager:
 
         if symbol in self._monitored_positions:
             self._monitored_positions.remove(symbol)
+            self._monitored_since.pop(symbol, None)
             self.logger.debug(f"💰 Position retirée de la surveillance funding: {symbol}")
 
             # Nettoyer l'ordre de fermeture en cours s'il existe
@@ -198,13 +209,9 @@ class FundingCloseManager:
 
         self.logger.debug(f"🔍 Événement WebSocket reçu: topic='{topic}'")
 
-        # Le topic "funding" n'existe pas dans l'API WebSocket privée de Bybit
-        # On utilise la surveillance périodique via l'API REST à la place
-        if topic == "position":
-            self.logger.debug("💰 Mise à jour de position reçue")
-            # Les positions sont surveillées via la méthode périodique _check_positions_periodically
-        else:
-            self.logger.debug(f"ℹ️ Topic '{topic}' reçu (surveillance via API REST)")
+        # Le topic "funding" n'existe pas dans l'API WebSocket privée de Bybit :
+        # positions et ordres alimentent le carnet, lu par _check_positions_periodically
+        self._position_book.on_topic(topic, data)
 
     def _close_position_after_funding(self, symbol: str):
         """
@@ -300,7 +307,7 @@ class FundingCloseManager:
             self.logger.error(f"[FUNDING] ❌ [FALLBACK] Erreur fermeture fallback {symbol}: {e}")
 
     def _run_ws_client(self):
-        """Lance le client WebSocket privé pour surveiller les événements de funding."""
+        """Lance le client WebSocket privé alimentant le carnet de positions du manager."""
         if not self.is_enabled():
             return
         try:
@@ -308,10 +315,13 @@ class FundingCloseManager:
                 testnet=self.testnet,
                 api_key=self.api_key,
                 api_secret=self.api_secret,
-                channels=["position"],  # Surveiller les positions (pas de topic "funding" disponible)
+                channels=["position", "order"],  # Pas de topic "funding" disponible
                 logger=self.logger,
             )
             self._ws_client.on_topic = self._on_funding_event
+            self._ws_client.on_auth_success = lambda: self._position_book.set_live(True)
+            self._ws_client.on_error_cb = lambda *args: self._position_book.set_live(False)
+            self._ws_client.on_close_cb = lambda *args: self._position_book.set_live(False)
             self._ws_client.run()
         except Exception as e:
             self.logger.error(f"❌ Erreur FundingCloseManager WebSocket: {e}")
@@ -334,11 +344,13 @@ class FundingCloseManager:
                     if self._monitored_positions:
                         self.logger.debug(f"🔍 [FUNDING_MONITOR] Vérification périodique des positions: {list(self._monitored_positions)}")
 
-                        for symbol in list(self._monitored_positions):
-                            self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : _verify_position_exists()")
-                            position_found = await run_in_thread(self._verify_position_exists, symbol)
+                        # Une seule réconciliation REST pour tout le compte (jamais par symbole)
+                        if self._reconcile_due():
+                            await run_in_thread(self._position_book.reconcile, self.bybit_client)
 
-                            if position_found:
+                        for symbol in list(self._monitored_positions):
+                            # Lecture en mémoire : aucun appel REST ni attente
+                            if self._verify_position_exists(symbol):
                                 self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : _check_funding_and_monitor()")
                                 await run_in_thread(self._check_funding_and_monitor, symbol)
                             else:
@@ -378,106 +390,46 @@ class FundingCloseManager:
             f"[FUNDING] Summary positions={len(self._monitored_positions)} ordres_en_attente={len(self._pending_close_orders)} auto_close={self.is_enabled()}"
         )
 
+    def _reconcile_due(self) -> bool:
+        """
+        Indique si le carnet doit être réconcilié par REST.
+
+        WebSocket authentifiée : toutes les POSITION_RECONCILE_INTERVAL_SECONDS.
+        Sans WebSocket : à chaque passage de la boucle (un appel pour tout le compte).
+        """
+        interval = POSITION_RECONCILE_INTERVAL_SECONDS if self._position_book.is_live() else 0
+        return self._position_book.seconds_since_reconcile() >= interval
+
     def _verify_position_exists(self, symbol: str) -> bool:
         """
-        Vérifie si une position existe encore avec retry logic adaptatif.
+        Vérifie si une position surveillée existe encore (lecture en mémoire).
 
         Args:
             symbol: Symbole à vérifier
 
         Returns:
-            bool: True si la position existe et est active, False sinon
+            bool: True si la position est ouverte, ou sur le point de l'être
+                  (ordre récent encore actif, ou délai de confirmation non écoulé)
         """
         if not self.is_enabled():
             return False
-        import time
-
-        max_attempts = 8  # Plus de tentatives pour plus de robustesse
-        base_delay = 3  # Délai de base plus court
-        max_delay = 30  # Délai maximum pour éviter l'attente excessive
 
-        # Vérifier d'abord si l'ordre a été exécuté (sans délai initial)
-        if not self._check_order_execution(symbol):
-            self.logger.warning(f"[FUNDING] ⚠️ Ordre {symbol} non exécuté - position probablement non ouverte")
-            return False
-
-        for attempt in range(max_attempts):
-            try:
-                positions = self.bybit_client.get_positions(category="linear", settleCoin="USDT")
-
-                # Debug: Afficher la réponse de l'API
-                self.logger.debug(f"🔍 Tentative {attempt + 1}/{max_attempts} - API Response pour {symbol}: {positions}")
-
-                if positions and positions.get("list"):
-                    all_positions = positions.get("list", [])
-                    self.logger.debug(f"🔍 Toutes les positions: {[p.get('symbol') for p in all_positions]}")
-
-                    matching = [p for p in all_positions if p.get("symbol") == symbol]
-                    if matching:
-                        position_data = matching[0]
-                        size = position_data.get("size", "0")
-
-                        self.logger.debug(f"🔍 Position {symbol}: size={size}")
-
-                        if size and float(size) > 0:
-                            self.logger.debug(f"✅ Position {symbol} confirmée (size={size}) - surveillance continue")
-                            return True
-                        else:
-                            self.logger.debug(f"ℹ️ Position {symbol} fermée (size=0) - retirer de la surveillance")
-                            return False
-
-                # Délai adaptatif : plus court au début, plus long si nécessaire
-                if attempt < max_attempts - 1:  # Pas d'attente après la dernière tentative
-                    delay = min(base_delay * (2 ** attempt), max_delay)  # Délai exponentiel avec plafond
-                    self.logger.debug(f"⏳ Position {symbol} non trouvée, tentative {attempt + 2} dans {delay}s...")
-                    time.sleep(delay)
-
-            except Exception as e:
-                self.logger.error(f"❌ Erreur tentative {attempt + 1} pour {symbol}: {e}")
-                if attempt < max_attempts - 1:
-                    delay = 5 + (attempt * 2)
-                    time.sleep(delay)
-
-        # Si la position n'a pas été trouvée après toutes les tentatives
-        self.logger.warning(f"[FUNDING] ⚠️ Position {symbol} non trouvée après {max_attempts} tentatives")
-        return False
-
-    def _check_order_execution(self, symbol: str) -> bool:
-        """
-        Vérifie si un ordre récent a été exécuté en vérifiant les ordres ouverts.
-
-        Args:
-            symbol: Symbole à vérifier
+        if self._position_book.has_position(symbol):
+            return True
 
-        Returns:
-            bool: True si un ordre a été exécuté récemment (pas d'ordre ouvert trouvé)
-        """
-        try:
-            if not self.is_enabled():
-                return True
-            # Récupérer les ordres ouverts
-            open_orders = self.bybit_client.get_open_orders(category="linear", settleCoin="USDT")
-
-            current_time = time.time()
-
-            # Vérifier les ordres ouverts récents pour ce symbole
-            if open_orders and open_orders.get("list"):
-                for order in open_orders["list"]:
-                    if order.get("symbol") == symbol:
-                        order_time = int(order.get("createdTime", 0)) / 1000
-                        if current_time - order_time < 300:  # 5 minutes
-                            self.logger.debug(f"🔍 Ordre ouvert récent trouvé pour {symbol}: {order.get('orderId')}")
-                            return False  # Ordre encore ouvert
-
-            # Aucun ordre ouvert trouvé pour ce symbole - probablement exécuté
-            self.logger.debug(f"✅ Aucun ordre ouvert trouvé pour {symbol} - probablement exécuté")
+        # Ordre d'ouverture récent (5 minutes) encore actif : la position va apparaître
+        if self._position_book.has_open_order(symbol, max_age_seconds=300):
+            self.logger.debug(f"🔍 Ordre ouvert récent pour {symbol} - surveillance maintenue")
             return True
 
-        except Exception as e:
-            self.logger.error(f"❌ Erreur vérification exécution ordre {symbol}: {e}")
-            # En cas d'erreur, assumer qu'un ordre a pu être exécuté pour ne pas bloquer
+        # L'événement de position peut arriver après l'ajout à la surveillance
+        monitored_since = self._monitored_since.get(symbol)
+        if monitored_since is not None and time.monotonic() - monitored_since < POSITION_CONFIRM_GRACE_SECONDS:
+            self.logger.debug(f"⏳ Position {symbol} pas encore confirmée - surveillance maintenue")
             return True
 
+        return False
+
     def _check_funding_and_monitor(self, symbol: str):
         """
         Vérifie le funding et continue la surveillance.
@@ -556,8 +508,10 @@ class FundingCloseManager:
             # Vérifier les positions existantes au démarrage
             self.check_existing_positions()
 
-            self._monitor_thread = threading.Thread(target=self._run_ws_client, daemon=True)
-            self._monitor_thread.start()
+            # Carnet partagé : déjà alimenté par la WebSocket du PositionMonitor
+            if self._owns_position_book:
+                self._monitor_thread = threading.Thread(target=self._run_ws_client, daemon=True)
+                self._monitor_thread.start()
 
             # Démarrer aussi la vérification périodique comme fallback
             self._check_positions_periodically()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Planificateur d'événements de funding (tas de minuteries).
+
+Remplace le scan périodique de la watchlist par le SchedulerManager :
+- chaque symbole surveillé est indexé sur son nextFundingTime absolu
+  (epoch en millisecondes)
+- un événement par décalage configuré (ex: "prearm" 65 min avant,
+  "entry" 60 min avant) est poussé dans un tas (fire_at, symbole)
+- les mises à jour arrivent des deltas ticker WebSocket (nextFundingTime)
+  et des reconstructions de la watchlist ; seul un changement d'heure de
+  funding réarme un symbole (génération incrémentée, entrées périmées
+  ignorées au dépilage)
+
+La boucle consommatrice attend l'échéance la plus proche (wait_next),
+réveillée par une mise à jour plus proche, puis dépile les événements
+échus (pop_due) : aucune reconstruction de la watchlist par cycle.
+"""
+
+import asyncio
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from funding_time import funding_epoch_ms
+from logging_setup import setup_logging
+
+
+@dataclass(frozen=True)
+class FundingEvent:
+    """
+    Événement de funding échu.
+
+    Attributes:
+        symbol: Symbole concerné
+        kind: Nom du décalage (ex: "prearm", "entry")
+        funding_time_ms: Heure du funding (epoch ms)
+        fire_at_ms: Échéance prévue (epoch ms)
+        fired_at_ms: Heure effective du dépilage (epoch ms)
+    """
+
+    symbol: str
+    kind: str
+    funding_time_ms: int
+    fire_at_ms: int
+    fired_at_ms: int
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Secondes restantes avant le funding au moment du déclenchement."""
+        return (self.funding_time_ms - self.fired_at_ms) / 1000
+
+    @property
+    def jitter_ms(self) -> int:
+        """Retard du déclenchement sur l'échéance (0 pour un événement en retard à l'armement)."""
+        return max(self.fired_at_ms - self.fire_at_ms, 0)
+
+
+class FundingEventScheduler:
+    """
+    Tas thread-safe d'événements (fire_at, symbole) indexés sur l'heure de funding.
+
+    Alimenté depuis le thread WebSocket (on_funding_time) et depuis les
+    reconstructions de la watchlist (set_watchlist) ; consommé par une
+    boucle asyncio (wait_next / pop_due).
+    """
+
+    def __init__(self, offsets: Mapping[str, float], logger=None):
+        """
+        Initialise le planificateur.
+
+        Args:
+            offsets: {nom d'événement: secondes avant le funding}
+            logger: Logger pour les messages (optionnel)
+        """
+        self.logger = logger or setup_logging()
+        self._offsets: Dict[str, float] = dict(offsets)
+        self._lock = threading.Lock()
+        # (fire_at_ms, seq, symbole, événement, génération)
+        self._heap: List[Tuple[int, int, str, str, int]] = []
+        self._seq = 0
+        self._funding_ms: Dict[str, int] = {}
+        self._generation: Dict[str, int] = {}
+        self._watched: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._fired = 0
+        self._late = 0
+        self._max_jitter_ms = 0
+
+    # ===== ALIMENTATION =====
+
+    def set_offsets(self, offsets: Mapping[str, float]) -> None:
+        """
+        Remplace les décalages et réarme tous les symboles surveillés.
+
+        Les échéances déjà passées ne sont pas réarmées : leurs événements
+        ont été émis avec les anciens décalages.
+
+        Args:
+            offsets: {nom d'événement: secondes avant le funding}
+        """
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            self._offsets = dict(offsets)
+            for symbol, funding_ms in self._funding_ms.items():
+                self._arm(symbol, funding_ms, after_ms=now_ms)
+        self._notify()
+
+    def set_watchlist(self, funding_times: Mapping[str, Any]) -> None:
+        """
+        Remplace l'ensemble des symboles surveillés.
+
+        Args:
+            funding_times: {symbole: nextFundingTime brut ou None si inconnu}
+        """
+        with self._lock:
+            self._watched = set(funding_times)
+            for symbol in [s for s in self._funding_ms if s not in self._watched]:
+                del self._funding_ms[symbol]
+                self._generation[symbol] = self._generation.get(symbol, 0) + 1
+        for symbol, next_funding_time in funding_times.items():
+            self.on_funding_time(symbol, next_funding_time)
+
+    def on_funding_time(self, symbol: str, next_funding_time: Any) -> bool:
+        """
+        Applique une heure de funding (delta ticker WebSocket ou watchlist).
+
+        Args:
+            symbol: Symbole concerné
+            next_funding_time: nextFundingTime brut (ms, secondes ou ISO)
+
+        Returns:
+            True si le symbole a été (ré)armé
+        """
+        funding_ms = funding_epoch_ms(next_funding_time)
+        if funding_ms is None:
+            return False
+        with self._lock:
+            if symbol not in self._watched or self._funding_ms.get(symbol) == funding_ms:
+                return False
+            head = self._heap[0][0] if self._heap else None
+            self._funding_ms[symbol] = funding_ms
+            earliest = self._arm(symbol, funding_ms)
+        # Réveiller la boucle seulement si l'échéance la plus proche avance
+        if head is None or (earliest is not None and earliest < head):
+            self._notify()
+        return True
+
+    def _arm(self, symbol: str, funding_ms: int, after_ms: Optional[int] = None) -> Optional[int]:
+        """
+        Pousse les événements d'un symbole (verrou tenu).
+
+        Args:
+            symbol: Symbole à armer
+            funding_ms: Heure de funding (epoch ms)
+            after_ms: Si fourni, les échéances <= after_ms sont ignorées
+
+        Returns:
+            Échéance la plus proche (None si aucun événement poussé)
+        """
+        generation = self._generation.get(symbol, 0) + 1
+        self._generation[symbol] = generation
+        earliest = None
+        for kind, offset in self._offsets.items():
+            fire_at = funding_ms - int(offset * 1000)
+            if after_ms is not None and fire_at <= after_ms:
+                continue
+            self._seq += 1
+            heapq.heappush(self._heap, (fire_at, self._seq, symbol, kind, generation))
+            earliest = fire_at if earliest is None else min(earliest, fire_at)
+        return earliest
+
+    # ===== CONSOMMATION =====
+
+    def seconds_until_next(self) -> Optional[float]:
+        """Secondes avant la prochaine échéance (None si le tas est vide)."""
+        with self._lock:
+            if not self._heap:
+                return None
+            return max((self._heap[0][0] - time.time() * 1000) / 1000, 0.0)
+
+    def pop_due(self) -> List[FundingEvent]:
+        """
+        Dépile les événements échus dont le funding n'est pas encore passé.
+
+        Returns:
+            Événements dans l'ordre des échéances
+        """
+        events: List[FundingEvent] = []
+        now_ms = int(time.time() * 1000)
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now_ms:
+                fire_at, _, symbol, kind, generation = heapq.heappop(self._heap)
+                funding_ms = self._funding_ms.get(symbol)
+                if generation != self._generation.get(symbol) or funding_ms is None:
+                    continue  # Entrée périmée (heure de funding changée ou symbole retiré)
+                if funding_ms <= now_ms:
+                    continue  # Funding déjà passé : attendre la prochaine heure
+                event = FundingEvent(symbol, kind, funding_ms, fire_at, now_ms)
+                self._fired += 1
+                if event.jitter_ms > 1000:
+                    # Armé après l'échéance (symbole ajouté dans la fenêtre)
+                    self._late += 1
+                else:
+                    self._max_jitter_ms = max(self._max_jitter_ms, event.jitter_ms)
+                events.append(event)
+        return events
+
+    async def wait_next(self, max_wait: Optional[float] = None) -> None:
+        """
+        Attend la prochaine échéance, une mise à jour plus proche ou max_wait.
+
+        Args:
+            max_wait: Attente maximale en secondes (None = illimitée)
+        """
+        if self._wakeup is None or self._loop is not asyncio.get_running_loop():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+        self._wakeup.clear()
+        delay = self.seconds_until_next()
+        if max_wait is not None:
+            delay = max_wait if delay is None else min(delay, max_wait)
+        if delay is not None and delay <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def _notify(self) -> None:
+        """Réveille la boucle consommatrice (appelable depuis n'importe quel thread)."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass
+
+    # ===== LECTURE =====
+
+    def get_funding_time_ms(self, symbol: str) -> Optional[int]:
+        """Heure de funding connue d'un symbole surveillé (epoch ms)."""
+        with self._lock:
+            return self._funding_ms.get(symbol)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques : symboles armés, entrées du tas, déclenchements et gigue max."""
+        with self._lock:
+            return {
+                "watched": len(self._watched),
+                "armed": len(self._funding_ms),
+                "pending": len(self._heap),
+                "fired": self._fired,
+                "late": self._late,
+                "max_jitter_ms": self._max_jitter_ms,
+            }
@@ -4,17 +4,19 @@ Gestionnaire de récupération des données de funding pour le bot Bybit - Versi
 
 Cette classe gère uniquement :
 - La récupération des données de funding
-- Le traitement des données de funding
+- Le traitement des données de funding page par page (pendant que la
+  page suivante est en vol)
 - La gestion des erreurs spécifiques au funding
+
+Les tickers sont lus dans l'instantané marché du cycle (MarketSnapshot) :
+une catégorie déjà récupérée par un autre composant ne coûte aucune requête.
 """
 
 from typing import Dict, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor
+from funding_time import funding_epoch_ms
 from logging_setup import setup_logging
-from pagination_handler import PaginationHandler
 from error_handler import ErrorHandler
-from config import MAX_WORKERS_THREADPOOL
-from parallel_api_manager import get_parallel_manager, ParallelConfig, ExecutionMode
+from market_snapshot import MarketSnapshot, get_market_snapshot
 
 
 class FundingFetcher:
@@ -27,17 +29,17 @@ class FundingFetcher:
     - Gestion des erreurs spécifiques au funding
     """
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, market_snapshot: Optional[MarketSnapshot] = None):
         """
         Initialise le gestionnaire de funding.
 
         Args:
             logger: Logger pour les messages (optionnel)
+            market_snapshot: Instantané marché (instance partagée par défaut)
         """
         self.logger = logger or setup_logging()
-        self._pagination_handler = PaginationHandler(logger)
         self._error_handler = ErrorHandler(logger)
-        self._parallel_manager = get_parallel_manager()
+        self._market_snapshot = market_snapshot or get_market_snapshot()
 
     def fetch_funding_map(
         self, base_url: str, category: str, timeout: int = 10
@@ -59,20 +61,13 @@ class FundingFetcher:
         try:
             self.logger.debug(f"📊 Récupération funding pour {category}...")
 
-            # Paramètres de base pour la pagination
-            params = {
-                "category": category,
-                "limit": 1000,  # Limite maximum supportée par l'API Bybit
-            }
-
-            # Récupérer toutes les données via pagination
-            all_tickers = self._pagination_handler.fetch_paginated_data(
-                base_url, "/v5/market/tickers", params, timeout
+            # Traiter chaque page dès son arrivée (la suivante est déjà en vol)
+            funding_map: Dict[str, Dict] = {}
+            self._market_snapshot.get_tickers(
+                base_url, category, timeout,
+                on_page=lambda tickers: self._process_funding_data(tickers, funding_map),
             )
 
-            # Traiter les données de funding
-            funding_map = self._process_funding_data(all_tickers)
-
             self.logger.info(f"✅ Funding récupéré: {len(funding_map)} symboles pour {category}")
             return funding_map
 
@@ -98,29 +93,16 @@ class FundingFetcher:
             return self.fetch_funding_map(base_url, categories[0], timeout)
 
         try:
-            # Créer les tâches synchrones optimisées
-            tasks = [
-                self._parallel_manager.create_sync_task(
-                    self.fetch_funding_map, base_url, category, timeout
-                )
-                for category in categories
-            ]
-
-            # Exécuter avec le gestionnaire de parallélisation optimisé
-            results = self._parallel_manager.execute_sync_batch(tasks)
-
-            # Combiner les résultats
-            funding_map = {}
-            for i, category_data in enumerate(results):
-                if isinstance(category_data, Exception):
-                    self._error_handler.log_error(
-                        category_data, f"fetch_funding_data_parallel category={categories[i]}"
-                    )
-                    raise category_data
-
-                funding_map.update(category_data)
-                self.logger.debug(f"✅ Funding {categories[i]}: {len(category_data)} symboles")
+            # Catégories récupérées en parallèle, pages traitées dans l'ordre d'arrivée
+            funding_map: Dict[str, Dict] = {}
+            counts = {category: 0 for category in categories}
+            self._market_snapshot.get_tickers_many(
+                base_url, categories, timeout,
+                on_page=self._page_processor(funding_map, counts),
+            )
 
+            for category, count in counts.items():
+                self.logger.debug(f"✅ Funding {category}: {count} symboles")
             self.logger.info(f"✅ Funding parallèle terminé: {len(funding_map)} symboles total")
             return funding_map
 
@@ -153,20 +135,13 @@ class FundingFetcher:
         try:
             self.logger.debug(f"📊 Récupération funding async pour {category}...")
 
-            # Paramètres de base pour la pagination
-            params = {
-                "category": category,
-                "limit": 1000,  # Limite maximum supportée par l'API Bybit
-            }
-
-            # Utiliser la version async de la pagination
-            all_tickers = await self._pagination_handler.fetch_paginated_data_async(
-                base_url, "/v5/market/tickers", params, timeout
+            # Traiter chaque page dès son arrivée (méthode synchrone légère)
+            funding_map: Dict[str, Dict] = {}
+            await self._market_snapshot.get_tickers_async(
+                base_url, category, timeout,
+                on_page=lambda tickers: self._process_funding_data(tickers, funding_map),
             )
 
-            # Traiter les données (méthode synchrone légère)
-            funding_map = self._process_funding_data(all_tickers)
-
             self.logger.info(f"✅ Funding async récupéré: {len(funding_map)} symboles pour {category}")
             return funding_map
 
@@ -193,26 +168,16 @@ class FundingFetcher:
             return await self.fetch_funding_map_async(base_url, categories[0], timeout)
 
         try:
-            # Créer les tâches asynchrones optimisées
-            tasks = [
-                self._parallel_manager.create_async_task(
-                    self.fetch_funding_map_async, base_url, category, timeout
-                )
-                for category in categories
-            ]
-
-            # Exécuter avec le gestionnaire de parallélisation optimisé
-            results = await self._parallel_manager.execute_async_batch(tasks)
-
-            # Combiner les résultats
-            funding_map = {}
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    self._error_handler.log_error(result, f"async parallel {categories[i]}")
-                    raise result
-                funding_map.update(result)
-                self.logger.debug(f"✅ Funding async {categories[i]}: {len(result)} symboles")
+            # Catégories en parallèle (session partagée), pages traitées dès leur arrivée
+            funding_map: Dict[str, Dict] = {}
+            counts = {category: 0 for category in categories}
+            await self._market_snapshot.get_tickers_many_async(
+                base_url, categories, timeout,
+                on_page=self._page_processor(funding_map, counts),
+            )
 
+            for category, count in counts.items():
+                self.logger.debug(f"✅ Funding async {category}: {count} symboles")
             self.logger.info(f"✅ Funding async parallèle terminé: {len(funding_map)} symboles total")
             return funding_map
 
@@ -220,17 +185,33 @@ class FundingFetcher:
             self._error_handler.log_error(e, "fetch_funding_data_parallel_async")
             raise
 
-    def _process_funding_data(self, tickers: List[Dict[str, Any]]) -> Dict[str, Dict]:
+    def _page_processor(self, funding_map: Dict[str, Dict], counts: Dict[str, int]):
+        """Retourne le callback on_page qui alimente funding_map et compte par catégorie."""
+
+        def _on_page(category: str, tickers: List[Dict[str, Any]]) -> None:
+            before = len(funding_map)
+            self._process_funding_data(tickers, funding_map)
+            counts[category] += len(funding_map) - before
+
+        return _on_page
+
+    def _process_funding_data(
+        self,
+        tickers: List[Dict[str, Any]],
+        funding_map: Optional[Dict[str, Dict]] = None,
+    ) -> Dict[str, Dict]:
         """
         Traite les données de tickers pour extraire les informations de funding.
 
         Args:
-            tickers: Liste des tickers reçus de l'API
+            tickers: Liste des tickers reçus de l'API (une page ou l'ensemble)
+            funding_map: Dictionnaire à compléter (nouveau dictionnaire si None)
 
         Returns:
             Dict[str, Dict]: Dictionnaire des données de funding
         """
-        funding_map = {}
+        if funding_map is None:
+            funding_map = {}
 
         for ticker in tickers:
             try:
@@ -289,7 +270,7 @@ class FundingFetcher:
             return {
                 "funding": funding,
                 "volume": volume if volume is not None else 0.0,
-                "next_funding_time": next_funding_time,
+                "next_funding_time": funding_epoch_ms(next_funding_time),
             }
 
         except Exception as e:
@@ -370,7 +351,7 @@ class FundingFetcher:
                 return False
             if not isinstance(data["volume"], (int, float)):
                 return False
-            if not isinstance(data["next_funding_time"], (str, type(None))):
+            if not isinstance(data["next_funding_time"], (int, type(None))):
                 return False
 
             return True
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Représentation numérique de l'heure de funding.
+
+Le nextFundingTime Bybit circule dans le bot sous forme d'epoch absolu en
+millisecondes (int) : le temps restant est dérivé au moment de la lecture
+(remaining_seconds / remaining_minutes), jamais stocké. Le formatage
+"Xh Ym Zs" est réservé à la couche d'affichage (format_remaining), mémoïsé
+par seconde entière.
+"""
+
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+
+def funding_epoch_ms(next_funding_time: Any) -> Optional[int]:
+    """
+    Convertit un nextFundingTime Bybit (ms, secondes ou ISO) en epoch ms.
+
+    Args:
+        next_funding_time: Valeur brute (int, float, chaîne numérique ou ISO)
+
+    Returns:
+        Epoch en millisecondes ou None si la valeur est invalide
+    """
+    if next_funding_time in (None, "", "-"):
+        return None
+    try:
+        if isinstance(next_funding_time, str) and not next_funding_time.replace(".", "", 1).isdigit():
+            dt = datetime.fromisoformat(next_funding_time.replace("Z", "+00:00"))
+            return int(dt.timestamp() * 1000)
+        value = float(next_funding_time)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if value <= 0:
+        return None
+    return int(value if value > 1e10 else value * 1000)
+
+
+def now_ms() -> int:
+    """Heure courante en epoch ms."""
+    return int(time.time() * 1000)
+
+
+def remaining_seconds(funding_ms: Optional[int], now: Optional[int] = None) -> Optional[float]:
+    """
+    Secondes restantes avant le funding (0 si déjà passé).
+
+    Args:
+        funding_ms: Heure du funding (epoch ms) ou None
+        now: Heure de référence (epoch ms, défaut: maintenant)
+
+    Returns:
+        Secondes restantes ou None si l'heure est inconnue
+    """
+    if funding_ms is None:
+        return None
+    if now is None:
+        now = now_ms()
+    return max((funding_ms - now) / 1000, 0.0)
+
+
+def remaining_minutes(funding_ms: Optional[int], now: Optional[int] = None) -> Optional[float]:
+    """Minutes restantes avant le funding (None si l'heure est inconnue)."""
+    seconds = remaining_seconds(funding_ms, now)
+    return None if seconds is None else seconds / 60
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Formate un nombre entier de secondes (mémoïsé)."""
+    if seconds <= 0:
+        return "0s"
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours > 0:
+        return f"{hours}h {minutes}m {secs}s"
+    if minutes > 0:
+        return f"{minutes}m {secs}s"
+    return f"{secs}s"
+
+
+def format_remaining(next_funding_time: Any, now: Optional[int] = None) -> str:
+    """
+    Temps restant formaté pour l'affichage ("Xh Ym Zs").
+
+    Tous les symboles partageant la même seconde restante réutilisent la
+    même chaîne (cache par seconde entière).
+
+    Args:
+        next_funding_time: Heure du funding (epoch ms, ou valeur brute Bybit)
+        now: Heure de référence (epoch ms, défaut: maintenant)
+
+    Returns:
+        Temps restant formaté ou "-" si l'heure est inconnue
+    """
+    funding_ms = (
+        next_funding_time if isinstance(next_funding_time, int) and next_funding_time > 1e10
+        else funding_epoch_ms(next_funding_time)
+    )
+    seconds = remaining_seconds(funding_ms, now)
+    if seconds is None:
+        return "-"
+    return _format_seconds(int(seconds))
@@ -108,6 +108,13 @@ import threading
 from typing import Optional
 from logging_setup import setup_logging
 
+# HTTP/2 (multiplexage sur une seule connexion TLS) si le paquet h2 est installé
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 optionnel
+    HTTP2_AVAILABLE = False
+
 
 class HTTPClientManager:
     """
@@ -172,6 +179,7 @@ class HTTPClientManager:
         self.logger = setup_logging()
         self._sync_client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         self._aiohttp_session: Optional[aiohttp.ClientSession] = None
 
         # Enregistrer la fermeture automatique à l'arrêt du programme
@@ -205,27 +213,36 @@ class HTTPClientManager:
 
         return self._sync_client
 
-    async def get_async_client(self, timeout: int = 10) -> httpx.AsyncClient:
+    async def get_async_client(
+        self, timeout: int = 10, http2: bool = True
+    ) -> httpx.AsyncClient:
         """
         Retourne le client HTTP asynchrone persistant.
 
         Args:
             timeout (int): Timeout en secondes
+            http2 (bool): Activer HTTP/2 à la création (ignoré sans h2)
 
         Returns:
             httpx.AsyncClient: Client HTTP asynchrone réutilisable
         """
-        if self._async_client is None or self._async_client.is_closed:
+        # Un client créé dans un event loop fermé ne peut plus être réutilisé
+        loop_closed = self._async_client_loop is not None and self._async_client_loop.is_closed()
+        if self._async_client is None or self._async_client.is_closed or loop_closed:
+            use_http2 = http2 and HTTP2_AVAILABLE
             self._async_client = httpx.AsyncClient(
                 timeout=timeout,
+                http2=use_http2,
                 limits=httpx.Limits(
                     max_keepalive_connections=20,
                     max_connections=100,
                     keepalive_expiry=30.0,
                 ),
             )
+            self._async_client_loop = asyncio.get_running_loop()
             self.logger.debug(
-                f"🔗 Client HTTP asynchrone créé (timeout={timeout}s)"
+                f"🔗 Client HTTP asynchrone créé (timeout={timeout}s, "
+                f"http2={'oui' if use_http2 else 'non'})"
             )
 
         return self._async_client
@@ -349,6 +366,19 @@ def get_http_client(timeout: int = 10) -> httpx.Client:
     return _get_manager().get_sync_client(timeout)
 
 
+async def get_async_http_client(timeout: int = 10) -> httpx.AsyncClient:
+    """
+    Fonction de convenance pour obtenir le client HTTP asynchrone persistant.
+
+    Args:
+        timeout (int): Timeout en secondes
+
+    Returns:
+        httpx.AsyncClient: Client HTTP asynchrone réutilisable (HTTP/2 si disponible)
+    """
+    return await _get_manager().get_async_client(timeout)
+
+
 def close_all_http_clients():
     """
     Fonction de convenance pour fermer tous les clients HTTP.
@@ -31,6 +31,10 @@ Avantages :
 - ✅ Lissage du trafic : distribution uniforme des requêtes
 - ✅ Respect strict des limites API
 
+Note : le trafic Bybit du bot passe par rate_limit_service (token buckets
+par groupe d'endpoints partagés par tout le processus) ; ce limiteur reste
+disponible pour les usages ponctuels.
+
 📚 EXEMPLE D'UTILISATION :
 
 ```python
@@ -168,7 +172,7 @@ class RateLimiter:
            - Retourner immédiatement
         3. Sinon :
            - Calculer le temps d'attente jusqu'à expiration du plus ancien
-           - Attendre par petits incréments (0.05s) pour rester réactif
+           - Attendre exactement ce délai
            - Recommencer à l'étape 1
 
         Example:
@@ -192,7 +196,7 @@ class RateLimiter:
 
         Note:
             - Cette méthode bloque le thread appelant
-            - L'attente est active (sleep par petits incréments)
+            - L'attente dure jusqu'à la libération du prochain slot
             - Pour un comportement non-bloquant, utilisez AsyncRateLimiter
             - Le verrou est relâché pendant les sleep pour permettre d'autres threads
 
@@ -227,13 +231,10 @@ class RateLimiter:
                 # wait_time = window_seconds - (now - oldest_timestamp)
                 wait_time = self.window_seconds - (now - self._timestamps[0])
 
-            # Attendre hors du verrou pour ne pas bloquer d'autres threads
-            # Utiliser min(wait_time, 0.05) pour rester réactif :
-            # - Si wait_time < 0.05s, attendre exactement wait_time
-            # - Sinon, attendre 0.05s et recalculer (au cas où d'autres threads libèrent des slots)
+            # Attendre hors du verrou pour ne pas bloquer d'autres threads,
+            # exactement jusqu'à l'expiration du plus ancien timestamp
             if wait_time > 0:
-                from config.timeouts import TimeoutConfig
-                time.sleep(min(wait_time, TimeoutConfig.RATE_LIMIT_SLEEP))
+                time.sleep(wait_time)
 
 
 def get_rate_limiter() -> RateLimiter:
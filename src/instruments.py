@@ -83,18 +83,26 @@ print(f"BTCUSDT est {cat}")  # "linear"
 - API Bybit instruments-info: https://bybit-exchange.github.io/docs/v5/market/instrument
 """
 
-import httpx
 import logging
-from http_client_manager import get_http_client
-from http_utils import get_rate_limiter
-from typing import Dict, List, Set
+from pagination_handler import PaginationHandler
+from typing import Dict, Iterator, List, Set, Tuple
 
-# Rate limiter global pour toutes les requêtes
-_rate_limiter = get_rate_limiter()
+INSTRUMENTS_ENDPOINT = "/v5/market/instruments-info"
+# Pas de borne fonctionnelle sur le nombre de pages d'instruments
+_MAX_INSTRUMENT_PAGES = 1000
 
 # Logger pour les exclusions de symboles (utilisé uniquement si nécessaire)
 _logger = logging.getLogger(__name__)
 
+# Pagination partagée (rate limiter "market" du service partagé)
+_pagination = PaginationHandler(_logger)
+
+
+def _wrap_network_error(e: Exception) -> RuntimeError:
+    if isinstance(e, RuntimeError) and "Erreur" in str(e):
+        return e
+    return RuntimeError(f"Erreur réseau/HTTP Bybit: {e}")
+
 
 def fetch_instruments_info(
     base_url: str, category: str, timeout: int = 10
@@ -114,58 +122,48 @@ def fetch_instruments_info(
         RuntimeError: En cas d'erreur HTTP ou API
     """
     all_instruments = []
-    cursor = ""
-
-    while True:
-        # Construire l'URL avec pagination
-        url = f"{base_url}/v5/market/instruments-info"
-        params = {"category": category, "limit": 1000}
-        if cursor:
-            params["cursor"] = cursor
-
-        try:
-            _rate_limiter.acquire()
-            client = get_http_client(timeout=timeout)
-            response = client.get(url, params=params)
-
-            # Vérifier le statut HTTP
-            if response.status_code >= 400:
-                raise RuntimeError(
-                    f'Erreur HTTP Bybit: status={response.status_code} '
-                    f'detail="{response.text[:100]}"'
-                )
-
-            data = response.json()
-
-            # Vérifier le retCode
-            if data.get("retCode") != 0:
-                ret_code = data.get("retCode")
-                ret_msg = data.get("retMsg", "")
-                raise RuntimeError(
-                    f'Erreur API Bybit: retCode={ret_code} retMsg="{ret_msg}"'
-                )
-
-            result = data.get("result", {})
-            instruments = result.get("list", [])
-            all_instruments.extend(instruments)
-
-            # Vérifier s'il y a une page suivante
-            next_page_cursor = result.get("nextPageCursor")
-            if not next_page_cursor:
-                break
-            cursor = next_page_cursor
-
-        except httpx.RequestError as e:
-            raise RuntimeError(f"Erreur réseau/HTTP Bybit: {e}")
-        except Exception as e:
-            if "Erreur" in str(e):
-                raise
-            else:
-                raise RuntimeError(f"Erreur réseau/HTTP Bybit: {e}")
-
+    for _, instruments in stream_instruments(base_url, [category], timeout):
+        all_instruments.extend(instruments)
     return all_instruments
 
 
+def stream_instruments(
+    base_url: str, categories: List[str], timeout: int = 10
+) -> Iterator[Tuple[str, List[Dict]]]:
+    """
+    Récupère les instruments de plusieurs catégories en parallèle, page par page.
+
+    Chaque page est rendue dès son arrivée (la suivante est déjà en vol),
+    ce qui permet de parser pendant le téléchargement.
+
+    Args:
+        base_url (str): URL de base de l'API Bybit
+        categories (List[str]): Catégories à récupérer (linear, inverse, spot)
+        timeout (int): Timeout pour les requêtes HTTP en secondes
+
+    Yields:
+        Tuple[str, List[Dict]]: (catégorie, instruments de la page)
+
+    Raises:
+        RuntimeError: En cas d'erreur HTTP ou API
+    """
+    params = {"limit": 1000}
+    try:
+        if len(categories) == 1:
+            category = categories[0]
+            for page in _pagination.iter_pages(
+                base_url, INSTRUMENTS_ENDPOINT, {**params, "category": category},
+                timeout, _MAX_INSTRUMENT_PAGES,
+            ):
+                yield category, page
+            return
+        yield from _pagination.stream_categories(
+            base_url, INSTRUMENTS_ENDPOINT, params, categories, timeout, _MAX_INSTRUMENT_PAGES
+        )
+    except Exception as e:
+        raise _wrap_network_error(e)
+
+
 def is_perpetual_active(item: Dict) -> bool:
     """
     Vérifie si un instrument est un perpétuel actif.
@@ -230,27 +228,19 @@ def get_perp_symbols(base_url: str, timeout: int = 10) -> Dict:
     Returns:
         Dict: Dictionnaire avec les symboles linear, inverse et le total
     """
-    linear_symbols = []
-    inverse_symbols = []
+    symbols: Dict[str, List[str]] = {"linear": [], "inverse": []}
     categories: Dict[str, str] = {}
 
-    # Récupérer les instruments linear
-    linear_instruments = fetch_instruments_info(base_url, "linear", timeout)
-    for item in linear_instruments:
-        if is_perpetual_active(item):
-            symbol = extract_symbol(item)
-            if symbol:
-                linear_symbols.append(symbol)
-                categories[symbol] = "linear"
-
-    # Récupérer les instruments inverse
-    inverse_instruments = fetch_instruments_info(base_url, "inverse", timeout)
-    for item in inverse_instruments:
-        if is_perpetual_active(item):
-            symbol = extract_symbol(item)
-            if symbol:
-                inverse_symbols.append(symbol)
-                categories[symbol] = "inverse"
+    # Récupérer linear et inverse en parallèle, en parsant chaque page dès son arrivée
+    for category, instruments in stream_instruments(base_url, ["linear", "inverse"], timeout):
+        for item in instruments:
+            if is_perpetual_active(item):
+                symbol = extract_symbol(item)
+                if symbol:
+                    symbols[category].append(symbol)
+                    categories[symbol] = category
+    linear_symbols = symbols["linear"]
+    inverse_symbols = symbols["inverse"]
 
     return {
         "linear": linear_symbols,
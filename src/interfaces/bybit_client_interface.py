@@ -161,13 +161,18 @@ class BybitClientInterface(ABC):
         pass
 
     @abstractmethod
-    def get_positions(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
+    def get_positions(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Récupère les positions ouvertes (API privée).
 
         Args:
             category: Catégorie des symboles ("linear", "inverse", "spot")
             settleCoin: Monnaie de règlement (USDT, BTC, etc.)
+            limit: Taille de page (1-200, défaut Bybit: 20)
+            cursor: nextPageCursor de la page précédente
 
         Returns:
             Dict contenant les positions ouvertes
@@ -178,13 +183,18 @@ class BybitClientInterface(ABC):
         pass
 
     @abstractmethod
-    def get_open_orders(self, category: str = "linear", settleCoin: str = None) -> Dict[str, Any]:
+    def get_open_orders(
+        self, category: str = "linear", settleCoin: str = None,
+        limit: Optional[int] = None, cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Récupère les ordres ouverts (API privée).
 
         Args:
             category: Catégorie des symboles ("linear", "inverse", "spot")
             settleCoin: Monnaie de règlement (USDT, BTC, etc.) - requis pour l'API v5
+            limit: Taille de page (1-50, défaut Bybit: 20)
+            cursor: nextPageCursor de la page précédente
 
         Returns:
             Dict contenant les ordres ouverts
@@ -7,7 +7,7 @@ permettant de découpler l'accès aux données internes.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from models.funding_data import FundingData
@@ -82,7 +82,7 @@ class DataManagerInterface(ABC):
         pass
 
     @abstractmethod
-    def update_original_funding_data(self, symbol: str, next_funding_time: str) -> None:
+    def update_original_funding_data(self, symbol: str, next_funding_time: Any) -> None:
         """
         Met à jour les données de funding originales pour un symbole.
 
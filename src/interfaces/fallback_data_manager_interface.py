@@ -35,7 +35,7 @@ class FallbackDataManagerInterface(ABC):
         Returns:
             Dict[str, Dict[str, Any]]: Données de funding formatées
                 - Clé: Symbole (ex: "BTCUSDT")
-                - Valeur: Dict avec funding_rate, funding_time, etc.
+                - Valeur: Dict avec funding_rate, next_funding_time (epoch ms), etc.
         """
         pass
 
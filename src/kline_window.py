@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Fenêtres glissantes de bougies 1 minute pour le calcul de volatilité.
+
+La volatilité du bot est (max(high) - min(low)) / prix_médian sur les 5
+bougies les plus récentes (bougie en cours comprise). Au lieu de recharger
+6 bougies par REST à chaque cycle, chaque symbole conserve :
+- un ring buffer des dernières bougies [start, high, low, close] (assez
+  pour la plus longue fenêtre des mesures de volatility_kernels)
+- deux deques monotones (high décroissants, low croissants) dont la tête
+  donne le max / min des N dernières bougies en O(1)
+
+Les bougies arrivent par le topic WebSocket ``kline.1.{symbol}`` (bougie
+en cours poussée à chaque trade) ou par des appels REST incrémentaux qui
+ne chargent que les bougies manquantes. Mise à jour et lecture sont en
+O(1) amorti ; une correction d'une bougie plus ancienne (rare) reconstruit
+les deques en O(N).
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+from volatility_kernels import (
+    DEFAULT_VOLATILITY_WINDOWS,
+    MIN_WINDOW_CANDLES,
+    compute_volatility_measures,
+    stack_candles,
+)
+
+# Bougies par fenêtre de volatilité (5 minutes en bougies de 1 minute)
+VOLATILITY_WINDOW_CANDLES = 5
+# Intervalle des bougies suivies (1 minute, en ms)
+KLINE_INTERVAL_MS = 60_000
+# Au-delà de ce délai sans message WS, la fenêtre n'est plus considérée comme temps réel
+KLINE_STALE_SECONDS = 90
+
+
+class KlineWindow:
+    """Historique de bougies d'un symbole avec max/min des N dernières en O(1)."""
+
+    __slots__ = ("size", "_candles", "_max", "_min", "updated_at", "ws_updated_at")
+
+    def __init__(self, size: int = VOLATILITY_WINDOW_CANDLES, history: Optional[int] = None):
+        self.size = size
+        # Bougies [start, high, low, close] par start croissant (la plus ancienne sort en tête)
+        self._candles: deque = deque(maxlen=max(size, history or size))
+        # Deques monotones [start, valeur] : high décroissants, low croissants
+        self._max: deque = deque()
+        self._min: deque = deque()
+        self.updated_at = 0.0
+        self.ws_updated_at = 0.0
+
+    @property
+    def history(self) -> int:
+        return self._candles.maxlen
+
+    def resize(self, history: int) -> None:
+        """Change le nombre de bougies conservées (au moins size)."""
+        self._candles = deque(self._candles, maxlen=max(self.size, history))
+        self._rebuild()
+
+    def update(self, start: int, high: float, low: float, close: float = math.nan) -> None:
+        """
+        Ajoute une bougie ou met à jour la bougie de même start.
+
+        Args:
+            start: Timestamp d'ouverture de la bougie (ms)
+            high: Plus haut de la bougie
+            low: Plus bas de la bougie
+            close: Clôture (dernier prix pour la bougie en cours)
+        """
+        candles = self._candles
+        newest = candles[-1][0] if candles else None
+
+        if newest is None or start > newest:
+            if len(candles) >= self.size:
+                # Bougie qui sort de la fenêtre de N bougies
+                expired = candles[-self.size][0]
+                if self._max[0][0] == expired:
+                    self._max.popleft()
+                if self._min[0][0] == expired:
+                    self._min.popleft()
+            candles.append([start, high, low, close])
+            self._push(start, high, low)
+        elif start == newest:
+            candle = candles[-1]
+            # Bougie en cours : le high ne peut que monter et le low que baisser
+            rebuild = high < candle[1] or low > candle[2]
+            candle[1], candle[2], candle[3] = high, low, close
+            if rebuild:
+                self._rebuild()
+            else:
+                self._push(start, high, low)
+        else:
+            # Correction d'une bougie plus ancienne (rattrapage REST)
+            for candle in candles:
+                if candle[0] == start:
+                    candle[1], candle[2], candle[3] = high, low, close
+                    self._rebuild()
+                    break
+
+    def _push(self, start: int, high: float, low: float) -> None:
+        maxq, minq = self._max, self._min
+        while maxq and maxq[-1][1] <= high:
+            maxq.pop()
+        maxq.append((start, high))
+        while minq and minq[-1][1] >= low:
+            minq.pop()
+        minq.append((start, low))
+
+    def _rebuild(self) -> None:
+        self._max.clear()
+        self._min.clear()
+        for start, high, low, _ in list(self._candles)[-self.size:]:
+            self._push(start, high, low)
+
+    @property
+    def newest_start(self) -> Optional[int]:
+        return self._candles[-1][0] if self._candles else None
+
+    def is_complete(self, count: Optional[int] = None) -> bool:
+        """
+        Indique si les dernières bougies sont présentes et consécutives.
+
+        Args:
+            count: Nombre de bougies requises (size si None)
+        """
+        count = count or self.size
+        candles = self._candles
+        return (
+            len(candles) >= count
+            and candles[-1][0] - candles[-count][0] == (count - 1) * KLINE_INTERVAL_MS
+        )
+
+    def candles(self) -> List[tuple]:
+        """Bougies (high, low, close) de la plus ancienne à la plus récente."""
+        return [(high, low, close) for _, high, low, close in self._candles]
+
+    def volatility(self) -> Optional[float]:
+        """
+        Calcule la volatilité de la fenêtre en O(1).
+
+        Returns:
+            (max - min) / prix_médian, ou None si moins de MIN_WINDOW_CANDLES bougies
+        """
+        if min(len(self._candles), self.size) < MIN_WINDOW_CANDLES:
+            return None
+        pmax = self._max[0][1]
+        pmin = self._min[0][1]
+        pmid = (pmax + pmin) / 2
+        if pmid <= 0:
+            return None
+        return (pmax - pmin) / pmid
+
+    def __len__(self) -> int:
+        return len(self._candles)
+
+
+class KlineStore:
+    """
+    Registre thread-safe des fenêtres de bougies par symbole.
+
+    Écrit par les threads WebSocket publics et par le calculateur de
+    volatilité (REST) ; lu par le calculateur et le tracker de volatilité.
+    """
+
+    def __init__(
+        self,
+        window_size: int = VOLATILITY_WINDOW_CANDLES,
+        history: int = max(DEFAULT_VOLATILITY_WINDOWS),
+    ):
+        self.window_size = window_size
+        self.history = max(window_size, history)
+        self._windows: Dict[str, KlineWindow] = {}
+        self._lock = threading.Lock()
+
+    def _window(self, symbol: str) -> KlineWindow:
+        window = self._windows.get(symbol)
+        if window is None:
+            window = self._windows[symbol] = KlineWindow(self.window_size, self.history)
+        return window
+
+    def set_history(self, history: int) -> None:
+        """
+        Ajuste le nombre de bougies conservées par symbole.
+
+        Args:
+            history: Bougies nécessaires à la plus longue fenêtre de mesure
+        """
+        with self._lock:
+            self.history = max(self.window_size, int(history))
+            for window in self._windows.values():
+                if window.history != self.history:
+                    window.resize(self.history)
+
+    def apply_ws(self, payload: dict) -> Optional[str]:
+        """
+        Applique un message ``kline.{interval}.{symbol}``.
+
+        Args:
+            payload: Message WebSocket décodé (topic, data)
+
+        Returns:
+            Symbole mis à jour ou None si le message est ignoré
+        """
+        topic = payload.get("topic") or ""
+        symbol = topic.rsplit(".", 1)[-1]
+        candles = payload.get("data") or ()
+        if not symbol or not candles:
+            return None
+        now = time.time()
+        try:
+            parsed = [
+                (int(c["start"]), float(c["high"]), float(c["low"]), float(c.get("close", math.nan)))
+                for c in candles
+            ]
+        except (KeyError, TypeError, ValueError):
+            return None
+        with self._lock:
+            window = self._window(symbol)
+            for start, high, low, close in sorted(parsed):
+                window.update(start, high, low, close)
+            window.updated_at = now
+            window.ws_updated_at = now
+        return symbol
+
+    def apply_rest(self, symbol: str, klines: Iterable[List[Any]]) -> None:
+        """
+        Applique des bougies REST ``/v5/market/kline`` (plus récente en tête).
+
+        Args:
+            symbol: Symbole concerné
+            klines: Bougies [start, open, high, low, close, ...] (chaînes)
+        """
+        parsed = []
+        for kline in klines:
+            try:
+                parsed.append(
+                    (int(kline[0]), float(kline[2]), float(kline[3]), float(kline[4]))
+                )
+            except (ValueError, TypeError, IndexError):
+                continue
+        if not parsed:
+            return
+        with self._lock:
+            window = self._window(symbol)
+            for start, high, low, close in sorted(parsed):
+                window.update(start, high, low, close)
+            window.updated_at = time.time()
+
+    def get_volatility(self, symbol: str) -> Optional[float]:
+        """Volatilité courante de la fenêtre d'un symbole (None si insuffisante)."""
+        with self._lock:
+            window = self._windows.get(symbol)
+            return window.volatility() if window is not None else None
+
+    def is_live(
+        self, symbol: str, count: Optional[int] = None, max_age: float = KLINE_STALE_SECONDS
+    ) -> bool:
+        """
+        Indique si les dernières bougies d'un symbole suivent le WebSocket.
+
+        Args:
+            symbol: Symbole recherché
+            count: Bougies consécutives requises (window_size si None)
+            max_age: Âge maximal du dernier message WS (secondes)
+        """
+        now = time.time()
+        with self._lock:
+            window = self._windows.get(symbol)
+            return (
+                window is not None
+                and now - window.ws_updated_at <= max_age
+                and window.is_complete(count)
+            )
+
+    def get_live_volatility(
+        self, symbol: str, max_age: float = KLINE_STALE_SECONDS
+    ) -> Optional[float]:
+        """
+        Volatilité d'une fenêtre complète alimentée par le WebSocket.
+
+        Args:
+            symbol: Symbole recherché
+            max_age: Âge maximal du dernier message WS (secondes)
+
+        Returns:
+            Volatilité ou None si la fenêtre n'est pas temps réel / complète
+        """
+        if not self.is_live(symbol, max_age=max_age):
+            return None
+        return self.get_volatility(symbol)
+
+    def get_measures(
+        self, symbols: List[str], windows: Iterable[int] = DEFAULT_VOLATILITY_WINDOWS
+    ) -> Dict[str, Optional[Dict[str, Optional[float]]]]:
+        """
+        Calcule toutes les mesures de volatilité des symboles en une passe.
+
+        Args:
+            symbols: Symboles à évaluer
+            windows: Fenêtres (en bougies) à calculer
+
+        Returns:
+            {symbol: {clé de mesure: valeur}} ; None pour un symbole sans bougies
+        """
+        windows = tuple(windows)
+        with self._lock:
+            rows = [
+                self._windows[s].candles() if s in self._windows else []
+                for s in symbols
+            ]
+        length = max(max(windows), 1)
+        highs, lows, closes = stack_candles(rows, length)
+        columns = compute_volatility_measures(highs, lows, closes, windows)
+        return {
+            symbol: ({key: values[i] for key, values in columns.items()} if rows[i] else None)
+            for i, symbol in enumerate(symbols)
+        }
+
+    def missing_candles(self, symbol: str, now_ms: Optional[int] = None) -> int:
+        """
+        Nombre de bougies à charger par REST pour compléter l'historique.
+
+        La bougie la plus récente connue est toujours rechargée (elle
+        était peut-être encore en cours).
+
+        Returns:
+            Entre 1 et history + 1
+        """
+        now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+        full = self.history + 1
+        with self._lock:
+            window = self._windows.get(symbol)
+            if window is None or window.newest_start is None:
+                return full
+            elapsed = max(0, now_ms - window.newest_start) // KLINE_INTERVAL_MS
+            if len(window) < self.history:
+                return full
+        return int(min(full, elapsed + 1))
+
+    def discard(self, symbol: str) -> None:
+        """Oublie la fenêtre d'un symbole."""
+        with self._lock:
+            self._windows.pop(symbol, None)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._windows
+
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Instantané marché partagé par un cycle de scan.
+
+Pendant un cycle (WatchlistManager.build_watchlist, qu'il soit lancé au
+démarrage ou par OpportunityScanner), le funding, les spreads et la
+détection des candidats lisent tous /v5/market/tickers. Ce module
+récupère chaque catégorie une seule fois :
+- TTL : un instantané reste valide MARKET_SNAPSHOT_TTL_SECONDS, et
+  start_cycle() force des données fraîches au début de chaque scan
+- coalescence : les demandeurs concurrents (threads ou coroutines)
+  attendent la même requête en vol au lieu d'en lancer une autre
+- streaming : le demandeur qui lance la récupération reçoit chaque page
+  dès son arrivée (on_page) ; les autres reçoivent la liste complète
+- vues dérivées : les meilleurs bid/ask par symbole (spreads) sont
+  calculés une fois par instantané
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import aclosing, closing
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config.constants import MARKET_SNAPSHOT_TTL_SECONDS
+from logging_setup import setup_logging
+from pagination_handler import PaginationHandler
+
+TICKERS_ENDPOINT = "/v5/market/tickers"
+
+# (bid1Price, ask1Price)
+Quote = Tuple[float, float]
+# on_page(catégorie, tickers de la page)
+PageCallback = Callable[[str, List[Dict[str, Any]]], None]
+
+
+def quotes_from_tickers(
+    tickers: Iterable[Dict[str, Any]], into: Optional[Dict[str, Quote]] = None
+) -> Dict[str, Quote]:
+    """
+    Extrait les meilleurs bid/ask valides d'une liste de tickers.
+
+    Args:
+        tickers: Tickers bruts de l'API (bid1Price, ask1Price)
+        into: Dictionnaire à compléter (nouveau dictionnaire si None)
+
+    Returns:
+        Dict {symbol: (bid, ask)}
+    """
+    quotes = {} if into is None else into
+    for ticker in tickers:
+        symbol = ticker.get("symbol")
+        try:
+            bid = float(ticker.get("bid1Price") or 0)
+            ask = float(ticker.get("ask1Price") or 0)
+        except (TypeError, ValueError):
+            continue
+        if symbol and bid > 0 and ask > 0:
+            quotes[symbol] = (bid, ask)
+    return quotes
+
+
+class _Entry:
+    __slots__ = ("tickers", "fetched_at", "quotes")
+
+    def __init__(self, tickers: List[Dict[str, Any]], fetched_at: float):
+        self.tickers = tickers
+        self.fetched_at = fetched_at
+        self.quotes: Optional[Dict[str, Quote]] = None
+
+
+class MarketSnapshot:
+    """
+    Tickers par (base_url, catégorie), récupérés une fois et partagés.
+
+    Thread-safe ; utilisable depuis des threads (get_tickers*) comme depuis
+    n'importe quel event loop (get_tickers*_async). Une récupération en vol
+    est une concurrent.futures.Future attendue par tous les demandeurs.
+    """
+
+    def __init__(self, ttl_seconds: float = MARKET_SNAPSHOT_TTL_SECONDS, logger=None):
+        """
+        Initialise l'instantané.
+
+        Args:
+            ttl_seconds: Durée de validité d'une catégorie récupérée (secondes)
+            logger: Logger pour les messages (optionnel)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.logger = logger or setup_logging()
+        self._pagination = PaginationHandler(self.logger)
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "fetches": 0, "coalesced": 0}
+
+    # ===== CYCLE =====
+
+    def start_cycle(self) -> None:
+        """Début d'un cycle de scan : les prochaines lectures repartent de données fraîches."""
+        with self._lock:
+            self._entries.clear()
+
+    # ===== RÉSERVATION =====
+
+    def _claim(self, base_url: str, categories: Sequence[str]):
+        """Classe les catégories : en cache, en vol (à attendre) ou à récupérer par l'appelant."""
+        ready: Dict[str, List[Dict[str, Any]]] = {}
+        waiting: Dict[str, Future] = {}
+        owned: Dict[str, Future] = {}
+        now = time.monotonic()
+        with self._lock:
+            for category in dict.fromkeys(categories):
+                key = (base_url, category)
+                entry = self._entries.get(key)
+                if entry is not None and now - entry.fetched_at <= self.ttl_seconds:
+                    ready[category] = entry.tickers
+                    self._stats["hits"] += 1
+                elif key in self._inflight:
+                    waiting[category] = self._inflight[key]
+                    self._stats["coalesced"] += 1
+                else:
+                    owned[category] = self._inflight[key] = Future()
+                    self._stats["fetches"] += 1
+        return ready, waiting, owned
+
+    def _complete(
+        self,
+        base_url: str,
+        owned: Dict[str, Future],
+        pages: Dict[str, List[Dict[str, Any]]],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Publie (ou fait échouer) les récupérations de l'appelant et réveille les autres."""
+        now = time.monotonic()
+        with self._lock:
+            for category in owned:
+                self._inflight.pop((base_url, category), None)
+                if error is None:
+                    self._entries[(base_url, category)] = _Entry(pages[category], now)
+        for category, future in owned.items():
+            if error is None:
+                future.set_result(pages[category])
+            else:
+                future.set_exception(error)
+
+    # ===== LECTURE SYNCHRONE =====
+
+    def get_tickers(
+        self,
+        base_url: str,
+        category: str,
+        timeout: int = 10,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retourne les tickers d'une catégorie (récupérés au plus une fois par TTL).
+
+        Args:
+            base_url: URL de base de l'API Bybit
+            category: Catégorie (linear, inverse)
+            timeout: Timeout HTTP
+            on_page: Appelé pour chaque page (ou une fois avec la liste en cache)
+
+        Returns:
+            Liste complète des tickers de la catégorie
+        """
+        callback = (lambda _category, page: on_page(page)) if on_page else None
+        return self.get_tickers_many(base_url, [category], timeout, callback)[category]
+
+    def get_tickers_many(
+        self,
+        base_url: str,
+        categories: Sequence[str],
+        timeout: int = 10,
+        on_page: Optional[PageCallback] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Retourne les tickers de plusieurs catégories, récupérées en parallèle si besoin.
+
+        Args:
+            base_url: URL de base de l'API Bybit
+            categories: Catégories (ex: ["linear", "inverse"])
+            timeout: Timeout HTTP
+            on_page: Appelé avec (catégorie, page) dès l'arrivée de chaque page
+                     (une fois avec la liste complète si elle vient du cache)
+
+        Returns:
+            Dict {catégorie: liste complète des tickers}
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        ready, waiting, owned = self._claim(base_url, categories)
+        results = dict(ready)
+
+        if owned:
+            pages: Dict[str, List[Dict[str, Any]]] = {category: [] for category in owned}
+            try:
+                with closing(self._stream(base_url, list(owned), timeout)) as stream:
+                    for category, page in stream:
+                        pages[category].extend(page)
+                        if on_page:
+                            on_page(category, page)
+            except BaseException as e:
+                self._complete(base_url, owned, pages, e)
+                raise
+            self._complete(base_url, owned, pages)
+            results.update(pages)
+
+        # Catégories déjà en cache (après nos propres récupérations : les attentes
+        # des autres demandeurs ne dépendent jamais d'un callback de l'appelant)
+        for category, tickers in ready.items():
+            if on_page:
+                on_page(category, tickers)
+
+        for category, future in waiting.items():
+            tickers = future.result()
+            results[category] = tickers
+            if on_page:
+                on_page(category, tickers)
+        return results
+
+    def _stream(self, base_url: str, categories: List[str], timeout: int):
+        params = {"limit": 1000}
+        if len(categories) == 1:
+            category = categories[0]
+            with closing(self._pagination.iter_pages(
+                base_url, TICKERS_ENDPOINT, {**params, "category": category}, timeout
+            )) as pages:
+                for page in pages:
+                    yield category, page
+            return
+        yield from self._pagination.stream_categories(
+            base_url, TICKERS_ENDPOINT, params, categories, timeout
+        )
+
+    # ===== LECTURE ASYNCHRONE =====
+
+    async def get_tickers_async(
+        self,
+        base_url: str,
+        category: str,
+        timeout: int = 10,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Version async de get_tickers()."""
+        callback = (lambda _category, page: on_page(page)) if on_page else None
+        results = await self.get_tickers_many_async(base_url, [category], timeout, callback)
+        return results[category]
+
+    async def get_tickers_many_async(
+        self,
+        base_url: str,
+        categories: Sequence[str],
+        timeout: int = 10,
+        on_page: Optional[PageCallback] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Version async de get_tickers_many() : attend sans bloquer l'event loop.
+
+        Args:
+            base_url: URL de base de l'API Bybit
+            categories: Catégories (ex: ["linear", "inverse"])
+            timeout: Timeout HTTP
+            on_page: Appelé avec (catégorie, page) dès l'arrivée de chaque page
+
+        Returns:
+            Dict {catégorie: liste complète des tickers}
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        ready, waiting, owned = self._claim(base_url, categories)
+        results = dict(ready)
+
+        if owned:
+            pages: Dict[str, List[Dict[str, Any]]] = {category: [] for category in owned}
+            try:
+                async with aclosing(self._stream_async(base_url, list(owned), timeout)) as stream:
+                    async for category, page in stream:
+                        pages[category].extend(page)
+                        if on_page:
+                            on_page(category, page)
+            except BaseException as e:
+                self._complete(base_url, owned, pages, e)
+                raise
+            self._complete(base_url, owned, pages)
+            results.update(pages)
+
+        # Catégories déjà en cache (après nos propres récupérations : les attentes
+        # des autres demandeurs ne dépendent jamais d'un callback de l'appelant)
+        for category, tickers in ready.items():
+            if on_page:
+                on_page(category, tickers)
+
+        for category, future in waiting.items():
+            tickers = await asyncio.wrap_future(future)
+            results[category] = tickers
+            if on_page:
+                on_page(category, tickers)
+        return results
+
+    async def _stream_async(self, base_url: str, categories: List[str], timeout: int):
+        params = {"limit": 1000}
+        if len(categories) == 1:
+            category = categories[0]
+            async with aclosing(self._pagination.iter_pages_async(
+                base_url, TICKERS_ENDPOINT, {**params, "category": category}, timeout
+            )) as pages:
+                async for page in pages:
+                    yield category, page
+            return
+        async with aclosing(self._pagination.stream_categories_async(
+            base_url, TICKERS_ENDPOINT, params, categories, timeout
+        )) as pages:
+            async for category, page in pages:
+                yield category, page
+
+    # ===== VUES DÉRIVÉES =====
+
+    def get_quotes(self, base_url: str, category: str, timeout: int = 10) -> Dict[str, Quote]:
+        """
+        Meilleurs bid/ask par symbole de la catégorie (calculés une fois par instantané).
+
+        Args:
+            base_url: URL de base de l'API Bybit
+            category: Catégorie (linear, inverse)
+            timeout: Timeout HTTP (si la catégorie doit être récupérée)
+
+        Returns:
+            Dict {symbol: (bid, ask)}
+        """
+        tickers = self.get_tickers(base_url, category, timeout)
+        with self._lock:
+            entry = self._entries.get((base_url, category))
+            if entry is not None and entry.tickers is tickers:
+                if entry.quotes is None:
+                    entry.quotes = quotes_from_tickers(tickers)
+                return entry.quotes
+        return quotes_from_tickers(tickers)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les compteurs {hits, fetches, coalesced}."""
+        with self._lock:
+            return dict(self._stats)
+
+
+_snapshot: Optional[MarketSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_market_snapshot() -> MarketSnapshot:
+    """
+    Retourne l'instantané marché partagé par le processus.
+
+    Returns:
+        Instance unique de MarketSnapshot
+    """
+    global _snapshot
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = MarketSnapshot()
+    return _snapshot
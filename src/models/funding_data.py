@@ -9,6 +9,8 @@ les données de funding d'un symbole avec validation automatique.
 from dataclasses import dataclass, field
 from typing import Optional
 
+from funding_time import remaining_seconds
+
 
 @dataclass(frozen=True)
 class FundingData:
@@ -22,7 +24,8 @@ class FundingData:
         symbol: Symbole du contrat (ex: BTCUSDT)
         funding_rate: Taux de funding (entre -1 et 1, typiquement -0.01 à 0.01)
         volume_24h: Volume sur 24h en USDT
-        next_funding_time: Temps restant avant le prochain funding (format: "1h 30m")
+        next_funding_time: Heure absolue du prochain funding (epoch ms, None si inconnue) ;
+            le temps restant est dérivé à la lecture (remaining_seconds)
         spread_pct: Spread bid/ask en pourcentage (0.0 à 1.0)
         volatility_pct: Volatilité 5 minutes en pourcentage (optionnel)
 
@@ -33,7 +36,7 @@ class FundingData:
     symbol: str
     funding_rate: float
     volume_24h: float
-    next_funding_time: str
+    next_funding_time: Optional[int]
     spread_pct: float
     volatility_pct: Optional[float] = None
     weight: Optional[float] = None
@@ -77,11 +80,17 @@ class FundingData:
                 f"Volume négatif pour {self.symbol}: {self.volume_24h}"
             )
 
-        # Validation du temps de funding
-        if not isinstance(self.next_funding_time, str):
-            raise ValueError(
-                f"Next funding time doit être une chaîne: {self.next_funding_time}"
-            )
+        # Validation de l'heure de funding (epoch ms)
+        if self.next_funding_time is not None:
+            if not isinstance(self.next_funding_time, int) or isinstance(self.next_funding_time, bool):
+                raise ValueError(
+                    f"Next funding time doit être un epoch ms entier: {self.next_funding_time}"
+                )
+
+            if self.next_funding_time < 0:
+                raise ValueError(
+                    f"Next funding time négatif pour {self.symbol}: {self.next_funding_time}"
+                )
 
         # Validation du spread
         if not isinstance(self.spread_pct, (int, float)):
@@ -129,6 +138,18 @@ class FundingData:
         """Vérifie si les données de volatilité sont disponibles."""
         return self.volatility_pct is not None
 
+    def remaining_seconds(self, now_ms: Optional[int] = None) -> Optional[float]:
+        """
+        Secondes restantes avant le funding, calculées au moment de la lecture.
+
+        Args:
+            now_ms: Heure de référence (epoch ms, défaut: maintenant)
+
+        Returns:
+            Secondes restantes (0 si passé) ou None si l'heure est inconnue
+        """
+        return remaining_seconds(self.next_funding_time, now_ms)
+
     def to_tuple(self) -> tuple:
         """
         Convertit en tuple pour compatibilité avec l'ancien code.
@@ -162,6 +162,9 @@ class MonitoringManager(MonitoringManagerInterface):
             ws_manager: Gestionnaire WebSocket principal
         """
         self.ws_manager = ws_manager
+        # Les candidats réutilisent les connexions principales
+        if self.candidate_monitor:
+            self.candidate_monitor.set_ws_manager(ws_manager)
 
     def set_bybit_client(self, bybit_client: "BybitClientInterface") -> None:
         """
@@ -484,6 +487,7 @@ class MonitoringManager(MonitoringManagerInterface):
         self.candidate_monitor.set_on_candidate_ticker_callback(
             self._on_candidate_ticker_callback
         )
+        self.candidate_monitor.set_ws_manager(self.ws_manager)
         self.logger.debug("→ CandidateMonitor créé et configuré")
 
     async def _start_market_scanning(self, base_url: str, perp_data: Dict):
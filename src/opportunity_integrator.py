@@ -51,9 +51,21 @@ class OpportunityIntegrator:
         self.watchlist_manager = watchlist_manager
         self.logger = logger or setup_logging()
 
+        # WebSocket principal (souscription des symboles ajoutés)
+        self.ws_manager = None
+
         # Callback pour les nouvelles opportunités
         self._on_new_opportunity_callback: Optional[Callable] = None
 
+    def set_ws_manager(self, ws_manager):
+        """
+        Définit le gestionnaire WebSocket principal.
+
+        Args:
+            ws_manager: Gestionnaire WebSocket principal
+        """
+        self.ws_manager = ws_manager
+
     def set_on_new_opportunity_callback(self, callback: Callable):
         """
         Définit le callback pour les nouvelles opportunités.
@@ -122,7 +134,7 @@ class OpportunityIntegrator:
             if funding_rate is not None:
                 # Utiliser la factory centralisée pour créer FundingData
                 funding_obj = FundingDataFactory.from_ticker_data(
-                    symbol, ticker_data, watchlist_manager
+                    symbol, ticker_data
                 )
 
                 if funding_obj is None:
@@ -136,6 +148,7 @@ class OpportunityIntegrator:
                     symbol, self.data_manager.get_symbol_categories()
                 )
                 self.data_manager.add_symbol_to_category(symbol, category)
+                self._subscribe_symbols(category, [symbol])
 
                 # Mettre à jour les données originales (utiliser méthode déléguée)
                 if next_funding_time:
@@ -155,6 +168,15 @@ class OpportunityIntegrator:
 
         return False
 
+    def _subscribe_symbols(self, category: str, symbols: List[str]):
+        """Souscrit les symboles sur la connexion principale ouverte (sans reconnexion)."""
+        if not self.ws_manager or not self.ws_manager.is_running():
+            return
+        try:
+            self.ws_manager.add_symbols(category, symbols)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erreur souscription {symbols}: {e}")
+
     def _update_symbol_lists(self, linear_symbols: List[str], inverse_symbols: List[str]):
         """Met à jour les listes de symboles avec les nouvelles opportunités."""
         # Utiliser la méthode publique de DataManager pour éviter le couplage
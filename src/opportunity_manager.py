@@ -102,6 +102,7 @@ class OpportunityManager:
         self.ws_manager = ws_manager
         # Transférer au scanner pour optimisation
         self.scanner.set_ws_manager(ws_manager)
+        self.integrator.set_ws_manager(ws_manager)
 
     def set_on_new_opportunity_callback(self, callback: Callable):
         """
@@ -179,8 +180,8 @@ class OpportunityManager:
         try:
             # Vérifier si le WebSocketManager est déjà en cours d'exécution
             if ws_manager.running:
-                # Le WebSocket est déjà actif et gère automatiquement
-                # tous les symboles via ses souscriptions existantes
+                # Le WebSocket est déjà actif : souscription dynamique des nouveaux symboles
+                self._subscribe_live(ws_manager, linear_symbols, inverse_symbols)
                 self.logger.info(
                     f"🎯 Nouvelles opportunités détectées: "
                     f"{len(linear_symbols)} linear, {len(inverse_symbols)} inverse "
@@ -235,6 +236,7 @@ class OpportunityManager:
         """
         try:
             if ws_manager.running:
+                self._subscribe_live(ws_manager, linear_symbols, inverse_symbols)
                 self.logger.info(
                     f"🎯 Nouvelles opportunités détectées: "
                     f"{len(linear_symbols)} linear, {len(inverse_symbols)} inverse "
@@ -252,6 +254,15 @@ class OpportunityManager:
         except Exception as e:
             self.logger.warning(f"⚠️ Erreur intégration opportunités: {e}")
 
+    def _subscribe_live(
+        self, ws_manager, linear_symbols: List[str], inverse_symbols: List[str]
+    ):
+        """Ajoute les symboles aux connexions ouvertes via subscribe (sans reconnexion)."""
+        if linear_symbols:
+            ws_manager.add_symbols("linear", linear_symbols)
+        if inverse_symbols:
+            ws_manager.add_symbols("inverse", inverse_symbols)
+
     def _handle_task_exception(self, task):
         """
         Gère les exceptions des tâches asyncio.
@@ -78,6 +78,8 @@ class OrderMonitor:
         self.bybit_client = bybit_client
         self.logger = logger or logging.getLogger(__name__)
         self.on_order_timeout = on_order_timeout
+        # Client REST asynchrone (annulations sans passer par un thread)
+        self.async_client = None
 
         # Dictionnaire des ordres en attente : order_id -> PendingOrder
         self.pending_orders: Dict[str, PendingOrder] = {}
@@ -89,6 +91,15 @@ class OrderMonitor:
         self._summary_interval = 60
         self._last_summary_ts = 0.0
 
+    def set_async_client(self, async_client) -> None:
+        """
+        Branche le client REST asynchrone utilisé pour les annulations.
+
+        Args:
+            async_client: AsyncBybitClient partagé (None pour revenir au thread)
+        """
+        self.async_client = async_client
+
     def add_order(self, order_id: str, symbol: str, side: str, qty: str,
                   price: float, timeout_minutes: int) -> None:
         """
@@ -197,13 +208,20 @@ class OrderMonitor:
 
         try:
             # Appeler l'API Bybit pour annuler l'ordre
-            self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : cancel_order()")
-            response = await run_in_thread(
-                self.bybit_client.cancel_order,
-                symbol=order.symbol,
-                order_id=order_id,
-                category="linear"
-            )
+            if self.async_client:
+                response = await self.async_client.cancel_order(
+                    symbol=order.symbol,
+                    order_id=order_id,
+                    category="linear"
+                )
+            else:
+                self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : cancel_order()")
+                response = await run_in_thread(
+                    self.bybit_client.cancel_order,
+                    symbol=order.symbol,
+                    order_id=order_id,
+                    category="linear"
+                )
 
             # Vérifier si l'annulation a réussi
             if response and response.get('orderId') == order_id:
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Gabarits d'ordres pré-armés pour les entrées de fenêtre de funding.
+
+Un OrderTemplate est construit quelques minutes avant le funding (règles
+de tick / quantité déjà en cache, quantité dimensionnée, corps JSON
+pré-sérialisé). Au déclenchement il ne reste qu'à insérer le prix dans
+le corps ; l'horodatage et la signature sont ajoutés par le client
+(place_order_prepared), soit un seul POST sans appel REST préalable.
+"""
+
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Marqueur remplacé par le prix dans le corps JSON pré-sérialisé
+_PRICE_MARKER = "__PRICE__"
+
+
+def step_decimals(step: float) -> int:
+    """
+    Nombre de décimales d'un pas (qtyStep ou tickSize).
+
+    Args:
+        step: Pas de quantité ou de prix
+
+    Returns:
+        Nombre de décimales (0 pour un pas entier ou invalide)
+    """
+    if step <= 0:
+        return 0
+    step_str = f"{step:.10f}".rstrip('0').rstrip('.')
+    return len(step_str.split('.')[1]) if '.' in step_str else 0
+
+
+def format_quantity(qty: float, decimals: int) -> str:
+    """Formate une quantité sans zéros superflus."""
+    if decimals > 0:
+        return f"{qty:.{decimals}f}".rstrip('0').rstrip('.')
+    return f"{qty:.0f}"
+
+
+def size_quantity(
+    target_notional: float,
+    price: float,
+    qty_step: float,
+    min_qty: float,
+    quantity_precision: Optional[int] = None,
+) -> str:
+    """
+    Dimensionne une quantité couvrant au moins target_notional au prix donné.
+
+    La quantité est arrondie au pas supérieur et jamais inférieure à min_qty.
+
+    Args:
+        target_notional: Valeur minimale de l'ordre (USDT)
+        price: Prix de référence
+        qty_step: Pas de quantité du symbole
+        min_qty: Quantité minimale du symbole
+        quantity_precision: Précision de quantité exposée par Bybit (optionnel)
+
+    Returns:
+        Quantité formatée (chaîne)
+    """
+    decimals = max(quantity_precision or 0, step_decimals(qty_step))
+    if qty_step > 0:
+        steps = max(1, math.ceil(target_notional / (price * qty_step)))
+        qty = steps * qty_step
+        if qty < min_qty:
+            qty = math.ceil(min_qty / qty_step) * qty_step
+        # Sécurité : l'arrondi flottant ne doit pas faire passer sous la cible
+        if float(format_quantity(qty, decimals)) * price < target_notional:
+            qty += qty_step
+    else:
+        qty = max(target_notional / price, min_qty)
+
+    formatted = format_quantity(qty, decimals)
+    if not formatted or formatted == '0':
+        safe_decimals = decimals if decimals > 0 else 2
+        formatted = format_quantity(max(min_qty, qty), safe_decimals) or str(min_qty)
+    return formatted
+
+
+@dataclass(frozen=True)
+class OrderTemplate:
+    """
+    Ordre limite PostOnly préparé avant le funding.
+
+    Attributes:
+        symbol: Symbole de la paire
+        side: "Buy" ou "Sell"
+        qty: Quantité dimensionnée au prix de référence
+        reference_price: Prix utilisé pour le dimensionnement
+        target_notional: Valeur visée de l'ordre (USDT)
+        qty_step: Pas de quantité du symbole
+        min_qty: Quantité minimale du symbole
+        quantity_precision: Précision de quantité (optionnel)
+        tick_size: Pas de prix du symbole
+        body_prefix: Corps JSON jusqu'à la valeur du prix (exclue)
+        body_suffix: Corps JSON après la valeur du prix
+        category: Catégorie de l'ordre
+        prepared_at: Horodatage (monotone) de la préparation
+    """
+
+    symbol: str
+    side: str
+    qty: str
+    reference_price: float
+    target_notional: float
+    qty_step: float
+    min_qty: float
+    quantity_precision: Optional[int]
+    tick_size: float
+    body_prefix: str
+    body_suffix: str
+    category: str = "linear"
+    prepared_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(
+        cls,
+        symbol: str,
+        side: str,
+        reference_price: float,
+        target_notional: float,
+        rules: dict,
+        tick_size: float,
+        category: str = "linear",
+    ) -> "OrderTemplate":
+        """
+        Dimensionne la quantité et pré-sérialise le corps de l'ordre.
+
+        Args:
+            symbol: Symbole de la paire
+            side: "Buy" ou "Sell"
+            reference_price: Prix de référence pour le dimensionnement
+            target_notional: Valeur visée de l'ordre (USDT)
+            rules: Règles de quantité (SymbolRulesCache.get_quantity_rules)
+            tick_size: Pas de prix du symbole
+            category: Catégorie de l'ordre
+
+        Returns:
+            OrderTemplate prêt à être rendu avec un prix
+        """
+        qty_step = float(rules.get('qty_step') or 0)
+        min_qty = float(rules.get('min_qty') or 0)
+        quantity_precision = rules.get('quantity_precision')
+        qty = size_quantity(target_notional, reference_price, qty_step, min_qty, quantity_precision)
+        # Même format compact que BybitClient._post_private (la signature porte sur ce texte)
+        body = json.dumps(
+            {
+                "category": category,
+                "symbol": symbol,
+                "side": side,
+                "orderType": "Limit",
+                "qty": qty,
+                "price": _PRICE_MARKER,
+                "timeInForce": "PostOnly",
+            },
+            separators=(',', ':'),
+        )
+        prefix, suffix = body.split(_PRICE_MARKER)
+        return cls(
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            reference_price=reference_price,
+            target_notional=target_notional,
+            qty_step=qty_step,
+            min_qty=min_qty,
+            quantity_precision=quantity_precision,
+            tick_size=tick_size,
+            body_prefix=prefix,
+            body_suffix=suffix,
+            category=category,
+        )
+
+    def for_price(self, price: float) -> "OrderTemplate":
+        """
+        Gabarit à utiliser au prix de déclenchement.
+
+        Le gabarit pré-armé est conservé tant que sa quantité couvre la valeur
+        visée ; sinon il est redimensionné localement (règles en mémoire).
+
+        Args:
+            price: Prix de déclenchement
+
+        Returns:
+            Ce gabarit ou un gabarit redimensionné
+        """
+        if price <= 0 or float(self.qty) * price >= self.target_notional:
+            return self
+        return OrderTemplate.build(
+            self.symbol,
+            self.side,
+            price,
+            self.target_notional,
+            {
+                'qty_step': self.qty_step,
+                'min_qty': self.min_qty,
+                'quantity_precision': self.quantity_precision,
+            },
+            self.tick_size,
+            self.category,
+        )
+
+    def format_price(self, price: float) -> str:
+        """Arrondit le prix au tick du symbole."""
+        if self.tick_size <= 0:
+            return f"{price:.5f}"
+        return f"{round(price / self.tick_size) * self.tick_size:.{step_decimals(self.tick_size)}f}"
+
+    def render(self, price: float) -> str:
+        """
+        Corps JSON de l'ordre au prix donné.
+
+        Args:
+            price: Prix limite
+
+        Returns:
+            Corps JSON compact prêt à être signé
+        """
+        return f"{self.body_prefix}{self.format_price(price)}{self.body_suffix}"
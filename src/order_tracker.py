@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Suivi du cycle de vie des ordres via WebSocket privé.
+
+Ce module remplace le polling REST (get_open_orders) du placement maker
+par les topics privés "order" et "execution" :
+- chaque orderId a un état (New, PartiallyFilled, Filled, Cancelled,
+  Rejected, ...) mis à jour dès réception d'un message
+- un Event par ordre est levé à l'état terminal : le thread de placement
+  attend l'exécution sans sleep et la voit en quelques millisecondes
+- les messages reçus avant l'enregistrement de l'ordre (la WS est souvent
+  plus rapide que la réponse REST de place_order) sont conservés
+
+Le REST ne sert plus qu'en réconciliation : WebSocket non authentifié ou
+aucun message reçu pour l'ordre dans le délai d'attente.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional
+
+from config import get_settings
+from logging_setup import setup_logging
+from ws_private import PrivateWSClient
+
+# Statuts Bybit v5 d'un ordre encore actif / terminé
+ACTIVE_ORDER_STATUSES = frozenset({"Created", "New", "PartiallyFilled", "Untriggered", "Triggered"})
+TERMINAL_ORDER_STATUSES = frozenset(
+    {"Filled", "Cancelled", "Rejected", "PartiallyFilledCanceled", "Deactivated"}
+)
+
+# Durée de conservation des ordres terminés (ou sans message) non consultés (secondes)
+TERMINAL_RETENTION_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class OrderState:
+    """
+    Dernier état connu d'un ordre.
+
+    Attributes:
+        order_id: Identifiant Bybit de l'ordre
+        symbol: Symbole de l'ordre
+        status: Statut Bybit (orderStatus)
+        cum_exec_qty: Quantité exécutée cumulée
+        avg_price: Prix moyen d'exécution (None si aucune exécution)
+        updated_at: Horodatage local de la dernière mise à jour
+    """
+
+    order_id: str
+    symbol: str = ""
+    status: str = "New"
+    cum_exec_qty: float = 0.0
+    avg_price: Optional[float] = None
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_ORDER_STATUSES
+
+    @property
+    def is_filled(self) -> bool:
+        return self.status == "Filled"
+
+    @property
+    def has_fills(self) -> bool:
+        return self.cum_exec_qty > 0
+
+
+class _OrderEntry:
+    __slots__ = ("state", "done", "future", "exec_ids", "exec_qty", "exec_notional")
+
+    def __init__(self, state: OrderState):
+        self.state = state
+        self.done = threading.Event()
+        self.future: Optional[Future] = None
+        # Exécutions déjà comptées (execId) et leur cumul quantité / notionnel
+        self.exec_ids: set = set()
+        self.exec_qty = 0.0
+        self.exec_notional = 0.0
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class OrderLifecycleTracker:
+    """
+    Registre thread-safe des états d'ordres alimenté par la WebSocket privée.
+
+    Écrit par le thread WebSocket (on_topic), lu par les threads de
+    placement (wait_for_terminal / future).
+    """
+
+    def __init__(self, testnet: bool = True, logger=None):
+        """
+        Initialise le tracker.
+
+        Args:
+            testnet: Utiliser le testnet (True) ou mainnet (False)
+            logger: Logger pour les messages (optionnel)
+        """
+        self.testnet = testnet
+        self.logger = logger or setup_logging()
+        self._orders: Dict[str, _OrderEntry] = {}
+        self._lock = threading.Lock()
+        self._live = False
+        self._running = False
+        self._ws_client: Optional[PrivateWSClient] = None
+        self._ws_thread: Optional[threading.Thread] = None
+
+        settings = get_settings()
+        self.api_key = settings.get("api_key")
+        self.api_secret = settings.get("api_secret")
+
+    # ===== CONNEXION =====
+
+    def start(self) -> bool:
+        """
+        Démarre la WebSocket privée (topics order + execution) dans un thread.
+
+        Returns:
+            True si le suivi a démarré
+        """
+        if self._running:
+            return True
+        if not self.api_key or not self.api_secret:
+            self.logger.warning("[ORDER] ⚠️ Clés API manquantes - suivi WS des ordres désactivé (REST)")
+            return False
+        try:
+            self._ws_client = PrivateWSClient(
+                testnet=self.testnet,
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+                channels=["order", "execution"],
+                logger=self.logger,
+            )
+            self._ws_client.on_topic = self.on_topic
+            self._ws_client.on_auth_success = self._on_auth_success
+            self._ws_client.on_error_cb = self._on_disconnect
+            self._ws_client.on_close_cb = self._on_disconnect
+            self._running = True
+            self._ws_thread = threading.Thread(
+                target=self._ws_runner, daemon=True, name="order_tracker_ws"
+            )
+            self._ws_thread.start()
+            self.logger.info("[ORDER] 🔍 Suivi des ordres par WebSocket démarré")
+            return True
+        except Exception as e:
+            self.logger.error(f"❌ Erreur démarrage suivi des ordres: {e}")
+            self._running = False
+            return False
+
+    def stop(self) -> None:
+        """Arrête la WebSocket privée."""
+        if not self._running:
+            return
+        self._running = False
+        self._live = False
+        if self._ws_client:
+            try:
+                self._ws_client.close()
+            except Exception as e:
+                self.logger.warning(f"[ORDER] ⚠️ Erreur fermeture WebSocket ordres: {e}")
+        if self._ws_thread and self._ws_thread.is_alive():
+            self._ws_thread.join(timeout=5)
+
+    def _ws_runner(self) -> None:
+        try:
+            self._ws_client.run()
+        except Exception as e:
+            if self._running:
+                self.logger.warning(f"[ORDER] ⚠️ Erreur WebSocket ordres: {e}")
+
+    def _on_auth_success(self) -> None:
+        self._live = True
+
+    def _on_disconnect(self, *args) -> None:
+        # Des messages peuvent être perdus : les attentes en cours basculent sur le REST
+        self._live = False
+
+    def is_live(self) -> bool:
+        """True si la WebSocket privée est authentifiée (événements fiables)."""
+        return self._live
+
+    # ===== ALIMENTATION =====
+
+    def on_topic(self, topic: str, data: Dict[str, Any]) -> None:
+        """
+        Applique un message privé "order" ou "execution".
+
+        Args:
+            topic: Topic du message
+            data: Message décodé
+        """
+        try:
+            if topic == "order":
+                for order in data.get("data") or ():
+                    self._apply_order(order)
+            elif topic == "execution":
+                for execution in data.get("data") or ():
+                    self._apply_execution(execution)
+        except Exception as e:
+            self.logger.warning(f"[ORDER] ⚠️ Erreur traitement message {topic}: {e}")
+
+    def _apply_order(self, order: Dict[str, Any]) -> None:
+        order_id = order.get("orderId")
+        status = order.get("orderStatus")
+        if not order_id or not status:
+            return
+        cum_exec_qty = _to_float(order.get("cumExecQty")) or 0.0
+        avg_price = _to_float(order.get("avgPrice")) or None
+        with self._lock:
+            entry = self._orders.get(order_id)
+            previous = entry.state if entry else OrderState(order_id)
+        # cumExecQty est absolu : il fait foi, sauf s'il retarde sur les
+        # exécutions déjà reçues (message "order" plus ancien)
+        if cum_exec_qty < previous.cum_exec_qty:
+            cum_exec_qty, avg_price = previous.cum_exec_qty, previous.avg_price
+        self._update(
+            order_id,
+            symbol=order.get("symbol", ""),
+            status=status,
+            cum_exec_qty=cum_exec_qty,
+            avg_price=avg_price,
+        )
+
+    def _apply_execution(self, execution: Dict[str, Any]) -> None:
+        order_id = execution.get("orderId")
+        # Les exécutions de funding / liquidation ne concernent pas les ordres suivis
+        if not order_id or execution.get("execType", "Trade") != "Trade":
+            return
+        exec_qty = _to_float(execution.get("execQty")) or 0.0
+        exec_price = _to_float(execution.get("execPrice")) or 0.0
+        leaves_qty = _to_float(execution.get("leavesQty"))
+        exec_id = execution.get("execId")
+        with self._lock:
+            entry = self._orders.get(order_id)
+            if entry is None:
+                entry = self._orders[order_id] = _OrderEntry(OrderState(order_id, status=""))
+            previous = entry.state
+            if previous.is_terminal or (exec_id and exec_id in entry.exec_ids):
+                return
+            if exec_id:
+                entry.exec_ids.add(exec_id)
+            entry.exec_qty += exec_qty
+            entry.exec_notional += exec_qty * exec_price
+            exec_total, exec_notional = entry.exec_qty, entry.exec_notional
+        # Le topic "order" porte le cumul absolu (cumExecQty / avgPrice) ; les
+        # exécutions ne l'avancent que s'il retarde, et suffisent à détecter
+        # le fill complet
+        cum_exec_qty, avg_price = previous.cum_exec_qty, previous.avg_price
+        if exec_total > cum_exec_qty:
+            cum_exec_qty = exec_total
+            avg_price = exec_notional / exec_total if exec_notional > 0 else avg_price
+        self._update(
+            order_id,
+            symbol=execution.get("symbol", "") or previous.symbol,
+            status="Filled" if leaves_qty == 0 else "PartiallyFilled",
+            cum_exec_qty=cum_exec_qty,
+            avg_price=avg_price,
+        )
+
+    def _update(self, order_id: str, **changes: Any) -> None:
+        now = time.time()
+        with self._lock:
+            entry = self._orders.get(order_id)
+            if entry is None:
+                entry = self._orders[order_id] = _OrderEntry(OrderState(order_id))
+            elif entry.state.is_terminal:
+                # Un état terminal est définitif (messages hors ordre ignorés)
+                return
+            if not changes.get("symbol"):
+                changes["symbol"] = entry.state.symbol
+            entry.state = replace(entry.state, updated_at=now, **changes)
+            if entry.state.is_terminal:
+                entry.done.set()
+                if entry.future is not None and not entry.future.done():
+                    entry.future.set_result(entry.state)
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            order_id
+            for order_id, entry in self._orders.items()
+            if (entry.state.is_terminal or not entry.state.status)
+            and now - entry.state.updated_at > TERMINAL_RETENTION_SECONDS
+        ]
+        for order_id in expired:
+            del self._orders[order_id]
+
+    # ===== LECTURE =====
+
+    def _entry(self, order_id: str) -> _OrderEntry:
+        with self._lock:
+            entry = self._orders.get(order_id)
+            if entry is None:
+                entry = self._orders[order_id] = _OrderEntry(OrderState(order_id, status=""))
+            return entry
+
+    def get_state(self, order_id: str) -> Optional[OrderState]:
+        """
+        Dernier état reçu pour un ordre.
+
+        Returns:
+            OrderState ou None si aucun message n'a été reçu
+        """
+        with self._lock:
+            entry = self._orders.get(order_id)
+        if entry is None or not entry.state.status:
+            return None
+        return entry.state
+
+    def wait_for_terminal(self, order_id: str, timeout: float) -> Optional[OrderState]:
+        """
+        Bloque jusqu'à l'état terminal de l'ordre ou l'expiration du délai.
+
+        Args:
+            order_id: Identifiant de l'ordre
+            timeout: Délai maximal en secondes
+
+        Returns:
+            Dernier état connu (terminal ou non), None si aucun message reçu
+        """
+        self._entry(order_id).done.wait(timeout)
+        return self.get_state(order_id)
+
+    def future(self, order_id: str) -> Future:
+        """
+        Future résolue avec l'OrderState terminal de l'ordre.
+
+        Args:
+            order_id: Identifiant de l'ordre
+
+        Returns:
+            concurrent.futures.Future (déjà résolue si l'ordre est terminé)
+        """
+        with self._lock:
+            entry = self._orders.get(order_id)
+            if entry is None:
+                entry = self._orders[order_id] = _OrderEntry(OrderState(order_id, status=""))
+            if entry.future is None:
+                entry.future = Future()
+                if entry.state.is_terminal:
+                    entry.future.set_result(entry.state)
+            return entry.future
+
+    def forget(self, order_id: str) -> None:
+        """Oublie un ordre dont le suivi est terminé."""
+        with self._lock:
+            self._orders.pop(order_id, None)
+
+    def __len__(self) -> int:
+        return len(self._orders)
@@ -6,15 +6,25 @@ Cette classe gère uniquement :
 - La logique de pagination des requêtes API
 - La gestion des curseurs et paramètres
 - La détection de fin de pagination
+- Le streaming page par page avec préchargement de la page suivante :
+  la requête de la page N+1 part dès que le curseur de la page N est
+  connu, pendant que l'appelant traite la page N
+- Le streaming concurrent de plusieurs catégories (linear, inverse, ...)
+  sous le rate limiter partagé
 """
 
 import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import aclosing, closing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
 import aiohttp
-from typing import Dict, List, Any
 from logging_setup import setup_logging
-from http_utils import get_rate_limiter
 from http_client_manager import get_http_client
-from async_rate_limiter import get_async_rate_limiter
+from rate_limit_service import GROUP_MARKET, get_rate_limit_service
+from utils.executors import PREFETCH_EXECUTOR
 
 
 class PaginationHandler:
@@ -25,6 +35,7 @@ class PaginationHandler:
     - Gestion de la pagination des requêtes API
     - Gestion des curseurs et paramètres
     - Détection de fin de pagination
+    - Streaming des pages (synchrone et asynchrone)
     """
 
     def __init__(self, logger=None):
@@ -61,43 +72,163 @@ class PaginationHandler:
             RuntimeError: En cas d'erreur HTTP ou API
         """
         all_data = []
-        cursor = ""
-        page_index = 0
-        rate_limiter = get_rate_limiter()
+        for page_items in self.iter_pages(base_url, endpoint, params, timeout, max_pages):
+            all_data.extend(page_items)
+        return all_data
 
-        while page_index < max_pages:
-            try:
-                # Préparer les paramètres de la page
-                page_params = self._prepare_page_params(params, cursor)
+    def iter_pages(
+        self,
+        base_url: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        timeout: int = 10,
+        max_pages: int = 100,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Itère sur les pages dès leur arrivée.
+
+        La page suivante est demandée (dans PREFETCH_EXECUTOR) avant que la
+        page courante soit rendue à l'appelant : son traitement se fait
+        pendant que la requête suivante est en vol.
+
+        Args:
+            base_url: URL de base de l'API
+            endpoint: Endpoint à appeler (ex: "/v5/market/tickers")
+            params: Paramètres de la requête
+            timeout: Timeout HTTP
+            max_pages: Nombre maximum de pages à récupérer
+
+        Yields:
+            Liste des éléments de chaque page
+
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        rate_limiter = get_rate_limit_service().limiter(GROUP_MARKET)
+        page_index = 0
+        total = 0
+        pending = self._submit_page(base_url, endpoint, params, "", timeout, 1, rate_limiter)
 
-                # Effectuer la requête
-                page_data = self._make_paginated_request(
-                    base_url, endpoint, page_params, timeout, page_index + 1, rate_limiter
-                )
+        try:
+            while pending is not None:
+                try:
+                    page_data = pending.result()
+                except Exception as e:
+                    self.logger.error(f"❌ Erreur pagination page {page_index + 1}: {e}")
+                    raise
+                pending = None
+                page_index += 1
 
                 # Extraire les données de la page
                 page_items = page_data.get("list", [])
                 if not page_items:
                     break
 
-                all_data.extend(page_items)
-
-                # Vérifier s'il y a une page suivante
+                # Précharger la page suivante avant de rendre la main
                 next_cursor = page_data.get("nextPageCursor")
-                if not next_cursor:
-                    break
+                if next_cursor and page_index < max_pages:
+                    pending = self._submit_page(
+                        base_url, endpoint, params, next_cursor, timeout,
+                        page_index + 1, rate_limiter
+                    )
 
-                cursor = next_cursor
-                page_index += 1
+                total += len(page_items)
+                yield page_items
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        self.logger.debug(f"📄 Pagination terminée: {page_index} pages, {total} éléments")
 
+    def _submit_page(
+        self,
+        base_url: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        cursor: str,
+        timeout: int,
+        page_index: int,
+        rate_limiter,
+    ) -> Future:
+        """Lance la requête d'une page dans le pool de préchargement (en ligne s'il est arrêté)."""
+        page_params = self._prepare_page_params(params, cursor)
+        try:
+            return PREFETCH_EXECUTOR.submit(
+                self._make_paginated_request,
+                base_url, endpoint, page_params, timeout, page_index, rate_limiter,
+            )
+        except RuntimeError:
+            # Pool arrêté (shutdown en cours) : requête exécutée dans le thread appelant
+            future: Future = Future()
+            try:
+                future.set_result(self._make_paginated_request(
+                    base_url, endpoint, page_params, timeout, page_index, rate_limiter
+                ))
             except Exception as e:
-                self.logger.error(f"❌ Erreur pagination page {page_index + 1}: {e}")
-                raise
+                future.set_exception(e)
+            return future
 
-        self.logger.debug(
-            f"📄 Pagination terminée: {page_index + 1} pages, {len(all_data)} éléments"
-        )
-        return all_data
+    def stream_categories(
+        self,
+        base_url: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        categories: Sequence[str],
+        timeout: int = 10,
+        max_pages: int = 100,
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Récupère plusieurs catégories en parallèle et rend chaque page dès son arrivée.
+
+        Args:
+            base_url: URL de base de l'API
+            endpoint: Endpoint à appeler
+            params: Paramètres communs (la catégorie est ajoutée)
+            categories: Catégories à récupérer (ex: ["linear", "inverse"])
+            timeout: Timeout HTTP
+            max_pages: Nombre maximum de pages par catégorie
+
+        Yields:
+            Tuples (catégorie, éléments de la page)
+
+        Raises:
+            RuntimeError: Première erreur rencontrée par une catégorie
+        """
+        pages: "queue.Queue" = queue.Queue()
+        stop = threading.Event()
+
+        def _produce(category: str) -> None:
+            category_params = {**params, "category": category}
+            try:
+                with closing(
+                    self.iter_pages(base_url, endpoint, category_params, timeout, max_pages)
+                ) as category_pages:
+                    for page_items in category_pages:
+                        if stop.is_set():
+                            return
+                        pages.put((category, page_items, None))
+            except Exception as e:
+                pages.put((category, None, e))
+                return
+            pages.put((category, None, None))
+
+        for category in categories:
+            threading.Thread(
+                target=_produce, args=(category,), daemon=True, name=f"pages_{category}"
+            ).start()
+
+        try:
+            remaining = len(categories)
+            while remaining:
+                category, page_items, error = pages.get()
+                if error is not None:
+                    raise error
+                if page_items is None:
+                    remaining -= 1
+                    continue
+                yield category, page_items
+        finally:
+            stop.set()
 
     async def fetch_paginated_data_async(
         self,
@@ -110,7 +241,7 @@ class PaginationHandler:
         """
         Récupère toutes les données via pagination de manière asynchrone.
 
-        OPTIMISATION: Version async qui utilise aiohttp et async_rate_limiter
+        OPTIMISATION: Version async qui utilise aiohttp et le rate limiter partagé
         pour éviter de bloquer l'event loop pendant les requêtes HTTP.
 
         Args:
@@ -127,47 +258,147 @@ class PaginationHandler:
             RuntimeError: En cas d'erreur HTTP ou API
         """
         all_data = []
-        cursor = ""
-        page_index = 0
-        async_rate_limiter = get_async_rate_limiter()
+        async with aclosing(
+            self.iter_pages_async(base_url, endpoint, params, timeout, max_pages)
+        ) as pages:
+            async for page_items in pages:
+                all_data.extend(page_items)
+        return all_data
 
-        # Utiliser une session aiohttp réutilisable
-        timeout_config = aiohttp.ClientTimeout(total=timeout)
-        async with aiohttp.ClientSession(timeout=timeout_config) as session:
-            while page_index < max_pages:
-                try:
-                    # Préparer les paramètres de la page
-                    page_params = self._prepare_page_params(params, cursor)
+    async def iter_pages_async(
+        self,
+        base_url: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        timeout: int = 10,
+        max_pages: int = 100,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Itère de manière asynchrone sur les pages dès leur arrivée.
 
-                    # Effectuer la requête de manière asynchrone
-                    page_data = await self._make_paginated_request_async(
-                        session, base_url, endpoint, page_params, timeout,
-                        page_index + 1, async_rate_limiter
-                    )
+        La requête de la page suivante est lancée (tâche asyncio) avant que
+        la page courante soit rendue à l'appelant.
 
-                    # Extraire les données de la page
-                    page_items = page_data.get("list", [])
-                    if not page_items:
-                        break
+        Args:
+            base_url: URL de base de l'API
+            endpoint: Endpoint à appeler (ex: "/v5/market/tickers")
+            params: Paramètres de la requête
+            timeout: Timeout HTTP
+            max_pages: Nombre maximum de pages à récupérer
+            session: Session aiohttp partagée (une session dédiée sinon)
 
-                    all_data.extend(page_items)
+        Yields:
+            Liste des éléments de chaque page
 
-                    # Vérifier s'il y a une page suivante
-                    next_cursor = page_data.get("nextPageCursor")
-                    if not next_cursor:
-                        break
+        Raises:
+            RuntimeError: En cas d'erreur HTTP ou API
+        """
+        rate_limiter = get_rate_limit_service().limiter(GROUP_MARKET)
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout))
 
-                    cursor = next_cursor
-                    page_index += 1
+        def _request(cursor: str, page_index: int) -> "asyncio.Task":
+            return asyncio.ensure_future(self._make_paginated_request_async(
+                session, base_url, endpoint, self._prepare_page_params(params, cursor),
+                timeout, page_index, rate_limiter
+            ))
 
+        page_index = 0
+        total = 0
+        pending = _request("", 1)
+        try:
+            while pending is not None:
+                try:
+                    page_data = await pending
                 except Exception as e:
                     self.logger.error(f"❌ Erreur pagination async page {page_index + 1}: {e}")
                     raise
+                pending = None
+                page_index += 1
+
+                page_items = page_data.get("list", [])
+                if not page_items:
+                    break
+
+                next_cursor = page_data.get("nextPageCursor")
+                if next_cursor and page_index < max_pages:
+                    pending = _request(next_cursor, page_index + 1)
+
+                total += len(page_items)
+                yield page_items
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            if owns_session:
+                await session.close()
 
         self.logger.debug(
-            f"📄 Pagination async terminée: {page_index + 1} pages, {len(all_data)} éléments"
+            f"📄 Pagination async terminée: {page_index} pages, {total} éléments"
         )
-        return all_data
+
+    async def stream_categories_async(
+        self,
+        base_url: str,
+        endpoint: str,
+        params: Dict[str, Any],
+        categories: Sequence[str],
+        timeout: int = 10,
+        max_pages: int = 100,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Version async de stream_categories() (une session aiohttp partagée).
+
+        Args:
+            base_url: URL de base de l'API
+            endpoint: Endpoint à appeler
+            params: Paramètres communs (la catégorie est ajoutée)
+            categories: Catégories à récupérer (ex: ["linear", "inverse"])
+            timeout: Timeout HTTP
+            max_pages: Nombre maximum de pages par catégorie
+
+        Yields:
+            Tuples (catégorie, éléments de la page)
+
+        Raises:
+            RuntimeError: Première erreur rencontrée par une catégorie
+        """
+        pages: asyncio.Queue = asyncio.Queue()
+
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as session:
+
+            async def _produce(category: str) -> None:
+                category_params = {**params, "category": category}
+                try:
+                    async with aclosing(self.iter_pages_async(
+                        base_url, endpoint, category_params, timeout, max_pages, session
+                    )) as category_pages:
+                        async for page_items in category_pages:
+                            pages.put_nowait((category, page_items, None))
+                except Exception as e:
+                    pages.put_nowait((category, None, e))
+                    return
+                pages.put_nowait((category, None, None))
+
+            producers = [asyncio.create_task(_produce(category)) for category in categories]
+            try:
+                remaining = len(producers)
+                while remaining:
+                    category, page_items, error = await pages.get()
+                    if error is not None:
+                        raise error
+                    if page_items is None:
+                        remaining -= 1
+                        continue
+                    yield category, page_items
+            finally:
+                for producer in producers:
+                    producer.cancel()
+                await asyncio.gather(*producers, return_exceptions=True)
 
     def _prepare_page_params(self, base_params: Dict[str, Any], cursor: str) -> Dict[str, Any]:
         """
@@ -266,7 +497,7 @@ class PaginationHandler:
         url = f"{base_url}{endpoint}"
 
         # Respecter le rate limit de manière asynchrone
-        await async_rate_limiter.acquire()
+        await async_rate_limiter.acquire_async()
 
         # Effectuer la requête async
         async with session.get(url, params=params) as response:
@@ -14,8 +14,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from config.timeouts import ConcurrencyConfig
-from async_rate_limiter import get_async_rate_limiter
-from http_utils import get_rate_limiter
+from rate_limit_service import GROUP_MARKET, get_rate_limit_service
 
 # Type générique pour les résultats
 T = TypeVar('T')
@@ -56,8 +55,8 @@ class ParallelAPIManager:
             config: Configuration personnalisée (utilise les valeurs par défaut si None)
         """
         self.config = config or ParallelConfig()
-        self._async_rate_limiter = get_async_rate_limiter()
-        self._sync_rate_limiter = get_rate_limiter()
+        # Bucket "market" partagé : les ordres restent prioritaires sur ces lots
+        self._rate_limiter = get_rate_limit_service().limiter(GROUP_MARKET)
         self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
 
     async def execute_async_batch(
@@ -103,7 +102,7 @@ class ParallelAPIManager:
         async def limited_task(task: Callable[[], Any]) -> Any:
             """Tâche avec rate limiting et semaphore."""
             if self.config.rate_limit_enabled:
-                await self._async_rate_limiter.acquire()
+                await self._rate_limiter.acquire_async()
 
             async with self._semaphore:
                 return await task()
@@ -157,7 +156,7 @@ class ParallelAPIManager:
         def limited_task(task: Callable[[], Any]) -> Any:
             """Tâche avec rate limiting."""
             if self.config.rate_limit_enabled:
-                self._sync_rate_limiter.acquire()
+                self._rate_limiter.acquire()
             return task()
 
         # Exécuter avec ThreadPoolExecutor pour la parallélisation
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Carnet partagé des positions et ordres ouverts du compte.
+
+Ce module remplace les appels REST par symbole (get_positions /
+get_open_orders à chaque vérification) par un état en mémoire :
+- alimenté par les topics privés "position" et "order" (PositionMonitor
+  transmet ses messages au carnet)
+- interrogé en O(1) par les gestionnaires (FundingCloseManager, ...)
+- réconcilié périodiquement par get_positions et get_open_orders pour
+  tout le compte, pages suivies par nextPageCursor (WebSocket coupée,
+  messages perdus) ; l'état n'est remplacé qu'une fois toutes les pages lues
+
+Une mise à jour WebSocket reçue pendant une réconciliation est plus récente
+que la réponse REST : elle est conservée.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from logging_setup import setup_logging
+from order_tracker import ACTIVE_ORDER_STATUSES
+
+# Tailles de page maximales Bybit v5 (position/list, order/realtime)
+POSITIONS_PAGE_LIMIT = 200
+OPEN_ORDERS_PAGE_LIMIT = 50
+# Garde-fou contre un curseur qui ne progresse pas
+MAX_RECONCILE_PAGES = 50
+
+
+def _fetch_all_pages(fetch: Callable[..., Dict[str, Any]], limit: int, **params: Any) -> List[Dict[str, Any]]:
+    """
+    Lit toutes les pages d'un endpoint paginé par nextPageCursor.
+
+    Raises:
+        RuntimeError: Si le nombre de pages dépasse MAX_RECONCILE_PAGES
+    """
+    rows: List[Dict[str, Any]] = []
+    cursor = None
+    for _ in range(MAX_RECONCILE_PAGES):
+        page_params = dict(params, limit=limit)
+        if cursor:
+            page_params["cursor"] = cursor
+        page = fetch(**page_params) or {}
+        rows.extend(page.get("list") or ())
+        next_cursor = page.get("nextPageCursor")
+        if not next_cursor or next_cursor == cursor:
+            return rows
+        cursor = next_cursor
+    raise RuntimeError(f"pagination interrompue après {MAX_RECONCILE_PAGES} pages")
+
+
+def _size(position: Dict[str, Any]) -> float:
+    try:
+        return float(position.get("size") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class PositionBook:
+    """
+    Registre thread-safe des positions ouvertes et des ordres actifs.
+
+    Écrit par le thread WebSocket (on_topic) et par la réconciliation REST,
+    lu par les threads des gestionnaires.
+    """
+
+    def __init__(self, logger=None):
+        """
+        Initialise le carnet.
+
+        Args:
+            logger: Logger pour les messages (optionnel)
+        """
+        self.logger = logger or setup_logging()
+        self._lock = threading.Lock()
+        # Réveille les attentes de position (wait_for_position)
+        self._changed = threading.Condition(self._lock)
+        # {symbol: données de position} (positions ouvertes uniquement)
+        self._positions: Dict[str, Dict[str, Any]] = {}
+        # {symbol: {orderId: données d'ordre}} (ordres actifs uniquement)
+        self._orders: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Dernière mise à jour WebSocket par symbole (horloge monotone)
+        self._ws_updated: Dict[str, float] = {}
+        self._live = False
+        self._last_reconcile = 0.0
+
+    # ===== ALIMENTATION WEBSOCKET =====
+
+    def set_live(self, live: bool) -> None:
+        """
+        Indique si la WebSocket privée alimentant le carnet est authentifiée.
+
+        Args:
+            live: True si les événements sont reçus, False après une coupure
+        """
+        if live and not self._live:
+            # Événements perdus pendant la coupure : réconciliation REST au
+            # prochain passage de la boucle de surveillance
+            self._last_reconcile = 0.0
+        self._live = live
+
+    def is_live(self) -> bool:
+        """True si la WebSocket privée alimente le carnet."""
+        return self._live
+
+    def on_topic(self, topic: str, data: Dict[str, Any]) -> None:
+        """
+        Applique un message privé "position" ou "order".
+
+        Args:
+            topic: Topic du message
+            data: Message décodé
+        """
+        try:
+            if topic == "position":
+                for position in data.get("data") or ():
+                    self._apply_position(position)
+            elif topic == "order":
+                for order in data.get("data") or ():
+                    self._apply_order(order)
+        except Exception as e:
+            self.logger.warning(f"[POSITION] ⚠️ Erreur carnet de positions ({topic}): {e}")
+
+    def _apply_position(self, position: Dict[str, Any]) -> None:
+        symbol = position.get("symbol")
+        if not symbol:
+            return
+        with self._lock:
+            if _size(position) > 0:
+                self._positions[symbol] = position
+            else:
+                self._positions.pop(symbol, None)
+            self._ws_updated[symbol] = time.monotonic()
+            self._changed.notify_all()
+
+    def _apply_order(self, order: Dict[str, Any]) -> None:
+        symbol = order.get("symbol")
+        order_id = order.get("orderId")
+        if not symbol or not order_id:
+            return
+        with self._lock:
+            if order.get("orderStatus") in ACTIVE_ORDER_STATUSES:
+                self._orders.setdefault(symbol, {})[order_id] = order
+            else:
+                orders = self._orders.get(symbol)
+                if orders is not None:
+                    orders.pop(order_id, None)
+                    if not orders:
+                        del self._orders[symbol]
+            self._ws_updated[symbol] = time.monotonic()
+
+    # ===== RÉCONCILIATION REST =====
+
+    def reconcile(self, bybit_client, category: str = "linear", settle_coin: str = "USDT") -> bool:
+        """
+        Recale le carnet sur l'état REST du compte (toutes les pages).
+
+        Args:
+            bybit_client: Client Bybit synchrone
+            category: Catégorie des positions
+            settle_coin: Devise de règlement
+
+        Returns:
+            True si la réconciliation a réussi
+        """
+        started = time.monotonic()
+        try:
+            positions = _fetch_all_pages(
+                bybit_client.get_positions, POSITIONS_PAGE_LIMIT,
+                category=category, settleCoin=settle_coin,
+            )
+            open_orders = _fetch_all_pages(
+                bybit_client.get_open_orders, OPEN_ORDERS_PAGE_LIMIT,
+                category=category, settleCoin=settle_coin,
+            )
+        except Exception as e:
+            self.logger.warning(f"[POSITION] ⚠️ Réconciliation des positions échouée: {e}")
+            return False
+
+        rest_positions = {
+            p["symbol"]: p
+            for p in positions
+            if p.get("symbol") and _size(p) > 0
+        }
+        rest_orders: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for order in open_orders:
+            if order.get("symbol") and order.get("orderId"):
+                rest_orders.setdefault(order["symbol"], {})[order["orderId"]] = order
+
+        with self._lock:
+            # Les symboles mis à jour par la WS depuis le début de l'appel REST gardent l'état WS
+            fresh = {s for s, ts in self._ws_updated.items() if ts >= started}
+            for symbol in fresh:
+                if symbol in self._positions:
+                    rest_positions[symbol] = self._positions[symbol]
+                else:
+                    rest_positions.pop(symbol, None)
+                if symbol in self._orders:
+                    rest_orders[symbol] = self._orders[symbol]
+                else:
+                    rest_orders.pop(symbol, None)
+            self._positions = rest_positions
+            self._orders = rest_orders
+            self._ws_updated = {s: self._ws_updated[s] for s in fresh}
+            self._last_reconcile = time.monotonic()
+            self._changed.notify_all()
+
+        self.logger.debug(
+            f"🔄 [POSITION] Carnet réconcilié: {len(rest_positions)} position(s), "
+            f"{sum(len(o) for o in rest_orders.values())} ordre(s) actif(s)"
+        )
+        return True
+
+    def seconds_since_reconcile(self) -> float:
+        """Secondes écoulées depuis la dernière réconciliation (inf si jamais)."""
+        if not self._last_reconcile:
+            return float("inf")
+        return time.monotonic() - self._last_reconcile
+
+    # ===== LECTURE =====
+
+    def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Position ouverte sur un symbole.
+
+        Returns:
+            Données de position ou None si aucune position ouverte
+        """
+        with self._lock:
+            return self._positions.get(symbol)
+
+    def wait_for_position(self, symbol: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Attend l'ouverture d'une position (événement WS ou réconciliation).
+
+        Args:
+            symbol: Symbole attendu
+            timeout: Attente maximale en secondes
+
+        Returns:
+            Données de position, ou None si aucune position après le délai
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: symbol in self._positions, timeout=timeout)
+            return self._positions.get(symbol)
+
+    def has_position(self, symbol: str) -> bool:
+        """True si une position est ouverte sur le symbole."""
+        with self._lock:
+            return symbol in self._positions
+
+    def get_open_positions(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne une copie des positions ouvertes {symbol: position}."""
+        with self._lock:
+            return dict(self._positions)
+
+    def has_open_order(self, symbol: str, max_age_seconds: Optional[float] = None) -> bool:
+        """
+        Vérifie si un ordre actif existe sur le symbole.
+
+        Args:
+            symbol: Symbole à vérifier
+            max_age_seconds: Ne considérer que les ordres créés depuis moins de ce délai
+
+        Returns:
+            True si un ordre actif (et assez récent) existe
+        """
+        with self._lock:
+            orders = list(self._orders.get(symbol, {}).values())
+        if max_age_seconds is None:
+            return bool(orders)
+        now_ms = time.time() * 1000
+        for order in orders:
+            try:
+                created_ms = int(order.get("createdTime") or 0)
+            except (TypeError, ValueError):
+                created_ms = 0
+            if now_ms - created_ms < max_age_seconds * 1000:
+                return True
+        return False
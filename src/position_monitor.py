@@ -7,6 +7,8 @@ et notifie les autres composants via des callbacks.
 
 Responsabilités :
 - Surveillance des positions via WebSocket privé (topic "position")
+- Alimentation du PositionBook partagé (topics "position" et "order")
+- Alimentation de l'AccountStateCache (topic "wallet") sur la même connexion
 - Détection d'ouverture/fermeture de positions
 - Callbacks pour notifier les changements d'état
 - Thread-safe avec gestion des erreurs
@@ -36,6 +38,8 @@ class PositionMonitor:
         logger=None,
         on_position_opened: Optional[Callable[[str, Dict], None]] = None,
         on_position_closed: Optional[Callable[[str, Dict], None]] = None,
+        position_book=None,
+        account_state=None,
     ):
         """
         Initialise le moniteur de positions.
@@ -45,6 +49,8 @@ class PositionMonitor:
             logger: Logger pour les messages (optionnel)
             on_position_opened: Callback appelé lors de l'ouverture d'une position
             on_position_closed: Callback appelé lors de la fermeture d'une position
+            position_book: PositionBook alimenté par les messages privés (optionnel)
+            account_state: AccountStateCache alimenté par le topic wallet (optionnel)
         """
         self.testnet = testnet
         self.logger = logger or setup_logging()
@@ -52,6 +58,8 @@ class PositionMonitor:
         # Callbacks
         self.on_position_opened = on_position_opened
         self.on_position_closed = on_position_closed
+        self.position_book = position_book
+        self.account_state = account_state
 
         # État du moniteur
         self._running = False
@@ -95,15 +103,15 @@ class PositionMonitor:
                 testnet=self.testnet,
                 api_key=self.api_key,
                 api_secret=self.api_secret,
-                channels=["position"],
+                channels=self._channels(),
                 logger=self.logger,
             )
 
             # Configurer les callbacks
             self._ws_client.on_topic = self._handle_position_message
             self._ws_client.on_auth_success = self._on_auth_success
-            self._ws_client.on_error = self._on_error
-            self._ws_client.on_close = self._on_close
+            self._ws_client.on_error_cb = self._on_error
+            self._ws_client.on_close_cb = self._on_close
 
             # Démarrer dans un thread séparé
             self._ws_thread = threading.Thread(
@@ -120,6 +128,22 @@ class PositionMonitor:
             self.logger.error(f"❌ Erreur démarrage PositionMonitor: {e}")
             self._running = False
 
+    def _channels(self) -> list:
+        """Topics privés souscrits selon les consommateurs branchés."""
+        channels = ["position"]
+        if self.position_book is not None:
+            channels.append("order")
+        if self.account_state is not None:
+            channels.append("wallet")
+        return channels
+
+    def _set_consumers_live(self, live: bool) -> None:
+        """Propage l'état de la connexion au carnet et au cache de soldes."""
+        if self.position_book is not None:
+            self.position_book.set_live(live)
+        if self.account_state is not None:
+            self.account_state.set_live(live)
+
     def stop(self):
         """
         Arrête la surveillance des positions.
@@ -193,6 +217,14 @@ class PositionMonitor:
             data: Données de position
         """
         try:
+            if topic == "wallet":
+                if self.account_state is not None:
+                    self.account_state.on_topic(topic, data)
+                return
+
+            if self.position_book is not None:
+                self.position_book.on_topic(topic, data)
+
             if topic != "position":
                 return
 
@@ -289,14 +321,17 @@ class PositionMonitor:
 
     def _on_auth_success(self):
         """Callback d'authentification réussie."""
+        self._set_consumers_live(True)
         self.logger.info("[POSITION] ✅ PositionMonitor authentifié")
 
     def _on_error(self, error):
         """Callback d'erreur WebSocket."""
+        self._set_consumers_live(False)
         if self._running:
             self.logger.warning(f"[POSITION] ⚠️ Erreur WebSocket PositionMonitor: {error}")
 
     def _on_close(self, close_status_code, close_msg):
         """Callback de fermeture WebSocket."""
+        self._set_consumers_live(False)
         if self._running:
             self.logger.info("[POSITION] 🔌 WebSocket PositionMonitor fermé")
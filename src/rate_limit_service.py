@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Service partagé de rate limiting par groupe d'endpoints Bybit.
+
+Un seul service pour tout le trafic HTTP du bot (clients Bybit synchrone
+et asynchrone, pagination, instruments, spreads) :
+- un token bucket pondéré par groupe d'endpoints (données de marché,
+  création/annulation d'ordres, positions, portefeuille) plus un bucket
+  global pour la limite IP Bybit (600 requêtes / 5 s)
+- synchronisation sur les headers X-Bapi-Limit, X-Bapi-Limit-Status et
+  X-Bapi-Limit-Reset-Timestamp : le serveur fait foi sur le nombre de
+  requêtes restantes et l'instant de remise à zéro
+- files d'attente ordonnées par priorité : un ordre passe avant les
+  requêtes de données de marché en attente sur le bucket global
+- chaque attente dure exactement le temps nécessaire au prochain jeton
+  (plus de sommeil par pas de 50 ms) et les attentes sont réveillées dès
+  que l'état des buckets change (headers, abandon d'une attente)
+
+Utilisable depuis des threads (acquire) comme depuis n'importe quel
+event loop (acquire_async).
+"""
+
+import asyncio
+import itertools
+import os
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
+
+# Groupes d'endpoints
+GROUP_MARKET = "market"
+GROUP_ORDER = "order"
+GROUP_POSITION = "position"
+GROUP_WALLET = "wallet"
+
+# Priorités (plus petit = servi en premier)
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_MARKET_DATA = 2
+
+GROUP_PRIORITIES: Dict[str, int] = {
+    GROUP_ORDER: PRIORITY_ORDER,
+    GROUP_POSITION: PRIORITY_ACCOUNT,
+    GROUP_WALLET: PRIORITY_ACCOUNT,
+    GROUP_MARKET: PRIORITY_MARKET_DATA,
+}
+
+# Limites par défaut (requêtes, fenêtre en secondes) ; les groupes privés
+# sont ensuite recalés sur X-Bapi-Limit renvoyé par Bybit
+DEFAULT_GROUP_LIMITS: Dict[str, Tuple[int, float]] = {
+    GROUP_MARKET: (20, 1.0),
+    GROUP_ORDER: (10, 1.0),
+    GROUP_POSITION: (10, 1.0),
+    GROUP_WALLET: (10, 1.0),
+}
+# Limite IP Bybit sur l'ensemble du trafic HTTP
+IP_LIMIT: Tuple[int, float] = (600, 5.0)
+# Fenêtre des limites par UID annoncées dans X-Bapi-Limit (secondes)
+HEADER_LIMIT_WINDOW_SECONDS = 1.0
+# Borne d'un X-Bapi-Limit-Reset-Timestamp crédible (secondes)
+MAX_RESET_DELAY_SECONDS = 60.0
+
+# Préfixes de chemins → groupe (le premier préfixe correspondant l'emporte)
+_ENDPOINT_GROUPS: Tuple[Tuple[str, str], ...] = (
+    ("/v5/order/create", GROUP_ORDER),
+    ("/v5/order/cancel", GROUP_ORDER),
+    ("/v5/order/amend", GROUP_ORDER),
+    ("/v5/order/", GROUP_POSITION),
+    ("/v5/position/", GROUP_POSITION),
+    ("/v5/execution/", GROUP_POSITION),
+    ("/v5/account/", GROUP_WALLET),
+    ("/v5/asset/", GROUP_WALLET),
+    ("/v5/market/", GROUP_MARKET),
+)
+
+
+def classify_endpoint(url_or_path: Optional[str], is_private: bool = False) -> str:
+    """
+    Détermine le groupe de rate limiting d'un endpoint.
+
+    Args:
+        url_or_path: URL complète ou chemin (ex: "/v5/order/create")
+        is_private: Requête authentifiée (groupe position si chemin inconnu)
+
+    Returns:
+        Nom du groupe d'endpoints
+    """
+    path = urlparse(url_or_path).path if url_or_path else ""
+    for prefix, group in _ENDPOINT_GROUPS:
+        if path.startswith(prefix):
+            return group
+    return GROUP_POSITION if is_private else GROUP_MARKET
+
+
+class TokenBucket:
+    """
+    Token bucket pondéré recalable sur les headers Bybit.
+
+    Les jetons se rechargent continûment (capacity / window par seconde).
+    Après un header X-Bapi-Limit-Status, le nombre de jetons est plafonné
+    à la valeur serveur et ne se recharge plus jusqu'au reset annoncé, où
+    il repasse à la capacité complète.
+    """
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at", "reset_at")
+
+    def __init__(self, capacity: int, window_seconds: float, now: Optional[float] = None):
+        self.capacity = float(max(1, capacity))
+        self.refill_rate = self.capacity / max(window_seconds, 1e-3)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic() if now is None else now
+        self.reset_at = 0.0
+
+    def refill(self, now: float) -> None:
+        """Ajoute les jetons accumulés depuis la dernière mise à jour."""
+        if self.reset_at:
+            if now < self.reset_at:
+                return
+            self.tokens = self.capacity
+            self.updated_at = self.reset_at
+            self.reset_at = 0.0
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+            self.updated_at = now
+
+    def delay_for(self, amount: float, now: float) -> float:
+        """
+        Délai avant que ``amount`` jetons soient disponibles (après refill).
+
+        Args:
+            amount: Jetons nécessaires (réservations prioritaires comprises)
+            now: Instant courant (time.monotonic)
+
+        Returns:
+            0 si disponible, sinon délai en secondes
+        """
+        if self.tokens >= amount:
+            return 0.0
+        wait, tokens = 0.0, self.tokens
+        if self.reset_at:
+            wait, tokens = max(self.reset_at - now, 0.0), self.capacity
+            if tokens >= amount:
+                return wait
+        return wait + (amount - tokens) / self.refill_rate
+
+    def sync(self, limit: Optional[int], remaining: Optional[int], reset_at: Optional[float]) -> None:
+        """
+        Recale le bucket sur l'état annoncé par le serveur.
+
+        Args:
+            limit: Requêtes autorisées par fenêtre (X-Bapi-Limit)
+            remaining: Requêtes restantes (X-Bapi-Limit-Status)
+            reset_at: Instant (monotonic) de remise à zéro de la fenêtre
+        """
+        if limit and limit > 0 and float(limit) != self.capacity:
+            self.capacity = float(limit)
+            self.refill_rate = self.capacity / HEADER_LIMIT_WINDOW_SECONDS
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(max(remaining, 0)))
+            if reset_at:
+                self.reset_at = reset_at
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "weight", "buckets", "event", "loop")
+
+    def __init__(self, priority, seq, weight, buckets, loop=None):
+        self.priority = priority
+        self.seq = seq
+        self.weight = weight
+        self.buckets = buckets
+        self.loop = loop
+        self.event = asyncio.Event() if loop is not None else threading.Event()
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return self.priority, self.seq
+
+    def wake(self) -> None:
+        if self.loop is None:
+            self.event.set()
+            return
+        try:
+            self.loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            # Event loop fermé : l'attente a disparu avec lui
+            pass
+
+
+def _header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value)) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitService:
+    """
+    Registre thread-safe des token buckets par groupe d'endpoints.
+
+    Une requête consomme ``weight`` jetons dans le bucket de son groupe et
+    dans le bucket IP global. Une requête en attente réserve ses jetons :
+    une requête moins prioritaire ne peut consommer que ce qui reste après
+    les réservations des attentes placées devant elle.
+    """
+
+    def __init__(
+        self,
+        group_limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        ip_limit: Optional[Tuple[int, float]] = IP_LIMIT,
+    ):
+        """
+        Initialise le service.
+
+        Args:
+            group_limits: {groupe: (requêtes, fenêtre s)} (DEFAULT_GROUP_LIMITS si None)
+            ip_limit: Limite globale (requêtes, fenêtre s) ; None pour la désactiver
+        """
+        limits = dict(DEFAULT_GROUP_LIMITS)
+        limits.update(group_limits or {})
+        now = time.monotonic()
+        self._buckets: Dict[str, TokenBucket] = {
+            group: TokenBucket(calls, window, now) for group, (calls, window) in limits.items()
+        }
+        self._ip_bucket = TokenBucket(*ip_limit, now) if ip_limit else None
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0, "header_syncs": 0}
+
+    # ===== RÉSERVATION =====
+
+    def _bucket(self, group: str) -> TokenBucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            calls, window = DEFAULT_GROUP_LIMITS[GROUP_MARKET]
+            bucket = self._buckets[group] = TokenBucket(calls, window)
+        return bucket
+
+    def _buckets_for(self, group: str) -> Tuple[TokenBucket, ...]:
+        bucket = self._bucket(group)
+        return (bucket, self._ip_bucket) if self._ip_bucket else (bucket,)
+
+    def _reserve(self, buckets, weight: float, now: float, waiter: Optional[_Waiter] = None) -> float:
+        """Consomme les jetons si possible ; sinon retourne le délai d'attente (sous lock)."""
+        delay = 0.0
+        for bucket in buckets:
+            bucket.refill(now)
+            ahead = 0.0
+            for other in self._waiters:
+                if other is waiter:
+                    break
+                if bucket in other.buckets:
+                    ahead += other.weight
+            delay = max(delay, bucket.delay_for(ahead + weight, now))
+        if delay <= 0:
+            for bucket in buckets:
+                bucket.tokens -= weight
+            self._stats["acquired"] += 1
+        return delay
+
+    def _enqueue(self, group: str, weight: float, priority: Optional[int], loop=None) -> _Waiter:
+        priority = GROUP_PRIORITIES.get(group, PRIORITY_MARKET_DATA) if priority is None else priority
+        waiter = _Waiter(priority, next(self._seq), weight, self._buckets_for(group), loop)
+        waiters = self._waiters
+        index = len(waiters)
+        while index > 0 and waiters[index - 1].key > waiter.key:
+            index -= 1
+        waiters.insert(index, waiter)
+        return waiter
+
+    def _leave(self, waiter: _Waiter, consumed: bool) -> None:
+        """Retire une attente (sous lock) ; ses réservations libérées réveillent les autres."""
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        if not consumed:
+            self._wake_all()
+
+    def _wake_all(self) -> None:
+        for waiter in self._waiters:
+            waiter.wake()
+
+    def _clamp_weight(self, group: str, weight: float) -> float:
+        # Un poids supérieur à la capacité ne serait jamais servi
+        return max(0.0, min(float(weight), self._bucket(group).capacity))
+
+    def acquire(
+        self,
+        group: str,
+        weight: float = 1,
+        priority: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Attend (thread bloqué) que ``weight`` jetons soient disponibles.
+
+        Args:
+            group: Groupe d'endpoints (GROUP_*)
+            weight: Coût de la requête en jetons
+            priority: Priorité (PRIORITY_*), celle du groupe par défaut
+            timeout: Délai maximal d'attente en secondes (None = illimité)
+
+        Returns:
+            True si les jetons ont été obtenus, False si le délai a expiré
+        """
+        with self._lock:
+            weight = self._clamp_weight(group, weight)
+            buckets = self._buckets_for(group)
+            if not self._waiters and self._reserve(buckets, weight, time.monotonic()) <= 0:
+                return True
+            waiter = self._enqueue(group, weight, priority)
+
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        consumed = False
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    delay = self._reserve(buckets, weight, now, waiter)
+                    if delay <= 0:
+                        consumed = True
+                        self._record_wait(now - start)
+                        return True
+                    waiter.event.clear()
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    delay = min(delay, deadline - now)
+                waiter.event.wait(delay)
+        finally:
+            with self._lock:
+                self._leave(waiter, consumed)
+
+    async def acquire_async(
+        self,
+        group: str,
+        weight: float = 1,
+        priority: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Attend sans bloquer l'event loop que ``weight`` jetons soient disponibles.
+
+        Args:
+            group: Groupe d'endpoints (GROUP_*)
+            weight: Coût de la requête en jetons
+            priority: Priorité (PRIORITY_*), celle du groupe par défaut
+            timeout: Délai maximal d'attente en secondes (None = illimité)
+
+        Returns:
+            True si les jetons ont été obtenus, False si le délai a expiré
+        """
+        with self._lock:
+            weight = self._clamp_weight(group, weight)
+            buckets = self._buckets_for(group)
+            if not self._waiters and self._reserve(buckets, weight, time.monotonic()) <= 0:
+                return True
+            waiter = self._enqueue(group, weight, priority, loop=asyncio.get_running_loop())
+
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        consumed = False
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    delay = self._reserve(buckets, weight, now, waiter)
+                    if delay <= 0:
+                        consumed = True
+                        self._record_wait(now - start)
+                        return True
+                    waiter.event.clear()
+                if deadline is not None:
+                    if now >= deadline:
+                        return False
+                    delay = min(delay, deadline - now)
+                try:
+                    await asyncio.wait_for(waiter.event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                self._leave(waiter, consumed)
+
+    def consume(self, group: str, weight: float = 1) -> bool:
+        """
+        Consomme des jetons sans attendre (appel synchrone depuis un event loop).
+
+        Le bucket peut devenir négatif : la dette est comptée et retardera
+        les requêtes suivantes au lieu d'être ignorée.
+
+        Returns:
+            True si des jetons étaient disponibles, False si une dette est créée
+        """
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._buckets_for(group)
+            if self._reserve(buckets, weight, now) <= 0:
+                return True
+            for bucket in buckets:
+                bucket.tokens -= weight
+            return False
+
+    def _record_wait(self, waited: float) -> None:
+        self._stats["waited"] += 1
+        self._stats["wait_seconds"] += waited
+
+    # ===== SYNCHRONISATION SERVEUR =====
+
+    def update_from_headers(self, group: str, headers: Optional[Mapping[str, Any]]) -> bool:
+        """
+        Recale le bucket d'un groupe sur les headers X-Bapi-Limit-* d'une réponse.
+
+        Args:
+            group: Groupe d'endpoints de la requête
+            headers: Headers HTTP de la réponse (httpx, aiohttp ou dict)
+
+        Returns:
+            True si des headers de limite étaient présents
+        """
+        if not headers:
+            return False
+        remaining = _to_int(_header(headers, "X-Bapi-Limit-Status"))
+        if remaining is None:
+            return False
+        limit = _to_int(_header(headers, "X-Bapi-Limit"))
+        reset_ms = _to_int(_header(headers, "X-Bapi-Limit-Reset-Timestamp"))
+
+        now = time.monotonic()
+        reset_at = None
+        if reset_ms:
+            reset_in = reset_ms / 1000.0 - time.time()
+            if 0 < reset_in <= MAX_RESET_DELAY_SECONDS:
+                reset_at = now + reset_in
+
+        with self._lock:
+            bucket = self._bucket(group)
+            bucket.refill(now)
+            bucket.sync(limit, remaining, reset_at)
+            self._stats["header_syncs"] += 1
+            self._wake_all()
+        return True
+
+    # ===== LECTURE =====
+
+    def limiter(self, group: str, priority: Optional[int] = None, weight: float = 1) -> "EndpointLimiter":
+        """Retourne un limiteur lié à un groupe (acquire / acquire_async)."""
+        return EndpointLimiter(self, group, priority, weight)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Retourne l'état des buckets et des attentes.
+
+        Returns:
+            Dict {groups: {groupe: {tokens, capacity}}, waiting, ...statistiques}
+        """
+        now = time.monotonic()
+        with self._lock:
+            groups = {}
+            for group, bucket in self._buckets.items():
+                bucket.refill(now)
+                groups[group] = {"tokens": round(bucket.tokens, 3), "capacity": bucket.capacity}
+            status = {"groups": groups, "waiting": len(self._waiters), **self._stats}
+            if self._ip_bucket:
+                self._ip_bucket.refill(now)
+                status["ip_tokens"] = round(self._ip_bucket.tokens, 3)
+        return status
+
+
+class EndpointLimiter:
+    """Limiteur lié à un groupe d'endpoints du service partagé."""
+
+    __slots__ = ("service", "group", "priority", "weight")
+
+    def __init__(self, service: RateLimitService, group: str, priority: Optional[int] = None, weight: float = 1):
+        self.service = service
+        self.group = group
+        self.priority = priority
+        self.weight = weight
+
+    def acquire(self) -> bool:
+        """Attend un créneau (thread bloqué)."""
+        return self.service.acquire(self.group, self.weight, self.priority)
+
+    async def acquire_async(self) -> bool:
+        """Attend un créneau sans bloquer l'event loop."""
+        return await self.service.acquire_async(self.group, self.weight, self.priority)
+
+
+_service: Optional[RateLimitService] = None
+_service_lock = threading.Lock()
+
+
+def _market_limit_from_env() -> Tuple[int, float]:
+    default_calls, default_window = DEFAULT_GROUP_LIMITS[GROUP_MARKET]
+    try:
+        calls = int(os.getenv("PUBLIC_HTTP_MAX_CALLS_PER_SEC", str(default_calls)))
+        window = float(os.getenv("PUBLIC_HTTP_WINDOW_SECONDS", str(default_window)))
+    except (TypeError, ValueError):
+        return default_calls, default_window
+    if calls <= 0 or window <= 0:
+        return default_calls, default_window
+    return calls, window
+
+
+def get_rate_limit_service() -> RateLimitService:
+    """
+    Retourne le service de rate limiting partagé par tout le processus.
+
+    Le groupe "market" suit PUBLIC_HTTP_MAX_CALLS_PER_SEC /
+    PUBLIC_HTTP_WINDOW_SECONDS lorsqu'elles sont définies.
+
+    Returns:
+        Instance unique de RateLimitService
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = RateLimitService({GROUP_MARKET: _market_limit_from_env()})
+    return _service
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Stockage colonnaire des données temps réel (tickers WebSocket).
+
+Remplace le dict de dicts {symbol: {...}} de DataStorage par :
+- un index symbole → ligne
+- une colonne float64 par champ (NumPy si disponible, sinon array('d'))
+
+Une mise à jour écrit en place dans la ligne du symbole : aucune
+allocation, hormis l'agrandissement géométrique des colonnes lorsqu'un
+nouveau symbole dépasse la capacité. Une valeur absente est stockée en NaN.
+
+Les lecteurs disposent de deux accès :
+- ligne par ligne (interface Mapping, compatible avec l'ancien dict)
+- colonnes entières via snapshot(), pour traiter tout l'univers en une
+  seule passe vectorisée (affichage, filtres, scheduler)
+"""
+
+import math
+from array import array
+from collections.abc import Mapping as MappingABC, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy optionnel
+    np = None
+
+# Colonnes stockées (clé interne) et conversion à la lecture ligne par ligne
+REALTIME_COLUMNS: Tuple[str, ...] = (
+    "funding_rate",
+    "volume24h",
+    "turnover24h",
+    "bid1_price",
+    "ask1_price",
+    "next_funding_time",
+    "mark_price",
+    "last_price",
+    "timestamp",
+)
+# Colonnes entières par nature (timestamps ms) : restituées en int
+INTEGER_COLUMNS = frozenset({"next_funding_time"})
+
+INITIAL_CAPACITY = 64
+NAN = float("nan")
+
+
+def _new_column(capacity: int):
+    if np is not None:
+        return np.full(capacity, np.nan, dtype=np.float64)
+    return array("d", [NAN]) * capacity
+
+
+def _read_row(columns: Dict[str, Any], row: int) -> Dict[str, Any]:
+    """Construit le dict d'une ligne (None pour une valeur absente)."""
+    result: Dict[str, Any] = {}
+    for name, column in columns.items():
+        value = column[row]
+        if math.isnan(value):
+            result[name] = None
+        elif name in INTEGER_COLUMNS:
+            result[name] = int(value)
+        else:
+            result[name] = float(value)
+    return result
+
+
+@dataclass(frozen=True, eq=False)
+class RealtimeSnapshot(MappingABC):
+    """
+    Copie cohérente et immuable de toutes les colonnes à un instant donné.
+
+    Se lit aussi comme un dict {symbol: ligne} (lignes construites à la
+    demande), ce qui permet de la partager entre lecteurs sans copie.
+
+    Attributes:
+        symbols: Symboles dans l'ordre des lignes
+        columns: {colonne: valeurs float64} (NaN = valeur absente)
+        index: {symbole: ligne}
+    """
+
+    symbols: Tuple[str, ...] = ()
+    columns: Dict[str, Any] = field(default_factory=dict)
+    index: Dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        return _read_row(self.columns, self.index[symbol])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self.index
+
+    def column(self, name: str):
+        """Retourne la colonne demandée (ndarray ou array('d'))."""
+        return self.columns[name]
+
+
+class RealtimeColumnStore(MutableMapping):
+    """
+    Table colonnaire symbole × champ temps réel.
+
+    Non thread-safe : la synchronisation reste à la charge de DataStorage
+    (verrou _realtime_lock), comme pour l'ancien dict.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self._capacity = max(1, capacity)
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._columns: Dict[str, Any] = {
+            name: _new_column(self._capacity) for name in REALTIME_COLUMNS
+        }
+
+    # ===== ÉCRITURE =====
+
+    def write(self, symbol: str, values: Mapping[str, Any]) -> int:
+        """
+        Écrit en place les valeurs fournies dans la ligne du symbole.
+
+        Args:
+            symbol: Symbole à mettre à jour (ligne créée si absente)
+            values: {colonne: valeur} ; valeurs None ou non numériques ignorées
+
+        Returns:
+            Index de la ligne du symbole
+        """
+        row = self._index.get(symbol)
+        if row is None:
+            row = self._append(symbol)
+        columns = self._columns
+        for name, value in values.items():
+            column = columns.get(name)
+            if column is None or value is None:
+                continue
+            try:
+                column[row] = float(value)
+            except (TypeError, ValueError):
+                continue
+        return row
+
+    def _append(self, symbol: str) -> int:
+        row = len(self._symbols)
+        if row >= self._capacity:
+            self._grow(self._capacity * 2)
+        self._index[symbol] = row
+        self._symbols.append(symbol)
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        for name, column in self._columns.items():
+            grown = _new_column(capacity)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+        self._capacity = capacity
+
+    def _clear_row(self, row: int) -> None:
+        for column in self._columns.values():
+            column[row] = NAN
+
+    # ===== LECTURE =====
+
+    def row(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne la ligne d'un symbole au format de l'ancien dict.
+
+        Returns:
+            {colonne: valeur} (None pour une valeur absente) ou None si le
+            symbole est inconnu
+        """
+        row = self._index.get(symbol)
+        if row is None:
+            return None
+        return _read_row(self._columns, row)
+
+    def snapshot(self) -> RealtimeSnapshot:
+        """
+        Copie les colonnes utiles (une copie mémoire par colonne).
+
+        Returns:
+            RealtimeSnapshot indépendant des écritures ultérieures
+        """
+        size = len(self._symbols)
+        return RealtimeSnapshot(
+            symbols=tuple(self._symbols),
+            columns={name: column[:size].copy() if np is not None else column[:size]
+                     for name, column in self._columns.items()},
+            index=dict(self._index),
+        )
+
+    def column_view(self, name: str):
+        """
+        Retourne une vue sans copie d'une colonne (lignes occupées).
+
+        La vue reflète les écritures suivantes : à n'utiliser que sous le
+        verrou du propriétaire ou pour une lecture approximative.
+        """
+        size = len(self._symbols)
+        column = self._columns[name]
+        return column[:size] if np is not None else memoryview(column)[:size]
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    # ===== INTERFACE MAPPING (compatibilité dict) =====
+
+    def __getitem__(self, symbol: str) -> Dict[str, Any]:
+        result = self.row(symbol)
+        if result is None:
+            raise KeyError(symbol)
+        return result
+
+    def __setitem__(self, symbol: str, values: Mapping[str, Any]) -> None:
+        row = self._index.get(symbol)
+        if row is not None:
+            self._clear_row(row)
+        self.write(symbol, values)
+
+    def __delitem__(self, symbol: str) -> None:
+        row = self._index.pop(symbol)
+        last = len(self._symbols) - 1
+        if row != last:
+            # Déplacer la dernière ligne dans le trou (suppression O(colonnes))
+            moved = self._symbols[last]
+            for column in self._columns.values():
+                column[row] = column[last]
+            self._symbols[row] = moved
+            self._index[moved] = row
+        self._symbols.pop()
+        self._clear_row(last)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._symbols))
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._index
+
+    def clear(self) -> None:
+        for row in range(len(self._symbols)):
+            self._clear_row(row)
+        self._index.clear()
+        self._symbols.clear()
+
+    def copy(self) -> Dict[str, Dict[str, Any]]:
+        """Retourne un dict {symbol: ligne} (compatibilité dict.copy())."""
+        return {symbol: self.row(symbol) for symbol in self._symbols}
+
+    def __repr__(self) -> str:
+        return f"RealtimeColumnStore({len(self)} symboles, capacité={self._capacity})"
@@ -13,7 +13,7 @@ funding sniping et autres opérations programmées.
 
 1. SchedulerManager : Classe principale pour la gestion du timing
    ├─> __init__() : Initialise le logger
-   └─> run() : Méthode principale (sera implémentée plus tard)
+   └─> run_events() : Boucle principale sur les événements de funding (epoch ms)
 
 📚 FLUX DÉTAILLÉ : Ce module sera étendu pour gérer :
 - Timing des opérations de funding
@@ -22,16 +22,22 @@ funding sniping et autres opérations programmées.
 
 🎯 COMPOSANTS UTILISÉS :
 - Logger : Pour les messages de debug et d'information
-- Watchlist data : Données de surveillance pour le timing
+- FundingEventScheduler : Heures de funding absolues (epoch ms), sans chaîne formatée
 """
 
 import asyncio
 import inspect
-import math
-import re
 import time
-from typing import Dict, Any
+from typing import Callable, Dict, Optional
+from config.constants import (
+    HEDGE_PREP_LEAD_SECONDS,
+    ORDER_PREARM_MINUTES,
+    ORDER_TEMPLATE_MAX_AGE_SECONDS,
+    POSITION_OPEN_CONFIRM_SECONDS,
+)
+from funding_event_scheduler import FundingEvent, FundingEventScheduler
 from order_monitor import OrderMonitor
+from order_template import OrderTemplate
 from smart_order_placer import SmartOrderPlacer
 from utils.executors import GLOBAL_EXECUTOR
 from utils.async_wrappers import run_in_thread
@@ -60,8 +66,27 @@ class SchedulerManager:
         self.scan_interval = 5  # secondes
         self.funding_threshold_minutes = funding_threshold_minutes
         self.bybit_client = bybit_client
+        # Client REST asynchrone optionnel (appels sans run_in_thread)
+        self.async_client = None
         self.auto_trading_config = auto_trading_config or {}
         self.on_position_opened_callback = on_position_opened_callback
+        # Hedge spot lancé dès le fill perp (SpotHedgeManager optionnel)
+        self.hedge_manager = None
+        # Carnet de positions alimenté par la WS privée (PositionBook optionnel)
+        self.position_book = None
+        self._hedge_prep_tasks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Gabarits d'ordres pré-armés avant le funding {symbol: OrderTemplate}
+        self._order_templates: Dict[str, OrderTemplate] = {}
+        self._prearm_tasks: Dict[str, asyncio.Task] = {}
+
+        # Événements de funding (FundingEventScheduler optionnel, remplace le scan périodique)
+        self.funding_events: Optional[FundingEventScheduler] = None
+        self._funding_rate_lookup: Optional[Callable[[str], Optional[float]]] = None
+        self._event_tasks: set = set()
+        # Entrées en cours (comptées dans la limite de positions pendant le placement)
+        self._entries_in_flight: set = set()
 
         # Tracking des ordres passés pour éviter les doublons
         self.orders_placed = set()
@@ -122,6 +147,154 @@ class SchedulerManager:
                 f"[SCHEDULER] Position retirée: {symbol} - Positions restantes: {len(self.current_positions)}/{self.max_positions}"
             )
 
+    def set_orderbook_source(self, orderbook_source) -> None:
+        """
+        Branche la source de carnets locaux WebSocket du placement d'ordres.
+
+        Args:
+            orderbook_source: WebSocketManager (get_orderbook / subscribe_orderbook)
+        """
+        if self.smart_placer:
+            self.smart_placer.set_orderbook_source(orderbook_source)
+
+    def set_order_tracker(self, order_tracker) -> None:
+        """
+        Branche le suivi des ordres par WebSocket privée du placement d'ordres.
+
+        Args:
+            order_tracker: OrderLifecycleTracker partagé
+        """
+        if self.smart_placer:
+            self.smart_placer.set_order_tracker(order_tracker)
+
+    def set_async_client(self, async_client) -> None:
+        """
+        Branche le client REST asynchrone (carnet de repli, annulations).
+
+        Args:
+            async_client: AsyncBybitClient partagé
+        """
+        self.async_client = async_client
+        if self.order_monitor:
+            self.order_monitor.set_async_client(async_client)
+
+    def set_position_book(self, position_book) -> None:
+        """
+        Branche le carnet de positions : la confirmation d'entrée lit les
+        positions poussées par la WebSocket privée au lieu d'interroger le REST.
+
+        Args:
+            position_book: PositionBook partagé avec le PositionMonitor
+        """
+        self.position_book = position_book
+
+    def set_hedge_manager(self, hedge_manager) -> None:
+        """
+        Branche le SpotHedgeManager : jambe spot préparée avant le funding
+        et lancée dès le fill perp, en parallèle de la confirmation.
+
+        Args:
+            hedge_manager: SpotHedgeManager (prepare_hedge / fire_hedge / abort_hedge)
+        """
+        self.hedge_manager = hedge_manager
+
+    def _prepare_hedge(self, symbol: str) -> None:
+        """Prépare la jambe spot en tâche de fond (une à la fois par symbole)."""
+        if self.hedge_manager is None:
+            return
+        task = self._hedge_prep_tasks.get(symbol)
+        if task is not None and not task.done():
+            return
+        self._hedge_prep_tasks[symbol] = asyncio.create_task(self.hedge_manager.prepare_hedge(symbol))
+
+    def _target_notional(self) -> float:
+        """Valeur visée des ordres automatiques (au moins 5 USDT, minimum Bybit)."""
+        order_size_usdt = self.auto_trading_config.get('order_size_usdt', 10)
+        min_order_value_usdt = 5.0
+        if order_size_usdt < min_order_value_usdt:
+            self.logger.warning(f"[TRADING] ⚠️ order_size_usdt ({order_size_usdt}) < minimum requis ({min_order_value_usdt}), ajustement automatique")
+            order_size_usdt = min_order_value_usdt
+        return float(order_size_usdt)
+
+    def _build_order_template(self, symbol: str, side: str, current_price: float) -> Optional[OrderTemplate]:
+        """
+        Construit le gabarit d'ordre d'un symbole (règles via SymbolRulesCache).
+
+        Args:
+            symbol: Symbole de la paire
+            side: "Buy" ou "Sell"
+            current_price: Prix de référence pour le dimensionnement
+
+        Returns:
+            OrderTemplate ou None si les règles du symbole sont indisponibles
+        """
+        if not self.smart_placer or current_price <= 0:
+            return None
+        try:
+            rules_cache = self.smart_placer.rules_cache
+            return OrderTemplate.build(
+                symbol,
+                side,
+                current_price,
+                self._target_notional(),
+                rules_cache.get_quantity_rules(symbol, "linear"),
+                rules_cache.get_tick_size(symbol, "linear"),
+            )
+        except Exception as e:
+            self.logger.warning(f"[TRADING] ⚠️ Impossible de récupérer les infos du symbole {symbol}: {e}")
+            return None
+
+    def prearm_order(self, symbol: str, funding_rate: float, current_price: float) -> Optional[OrderTemplate]:
+        """
+        Pré-arme l'ordre d'entrée d'un symbole avant la fenêtre de funding.
+
+        Les règles de tick / quantité sont chargées (REST hors chemin critique),
+        la quantité est dimensionnée et le corps JSON pré-sérialisé.
+
+        Args:
+            symbol: Symbole de la paire
+            funding_rate: Taux de funding actuel (détermine le côté)
+            current_price: Prix actuel de la paire
+
+        Returns:
+            OrderTemplate pré-armé ou None
+        """
+        side = "Buy" if float(funding_rate or 0.0) > 0 else "Sell"
+        template = self._build_order_template(symbol, side, current_price)
+        if template is not None:
+            self._order_templates[symbol] = template
+            self.logger.debug(
+                f"🎯 [SCHEDULER] Ordre pré-armé {symbol}: {side} {template.qty} (tick={template.tick_size})"
+            )
+        return template
+
+    def _get_order_template(self, symbol: str, side: str, current_price: float) -> Optional[OrderTemplate]:
+        """Gabarit pré-armé encore valide (redimensionné au prix courant), sinon construit maintenant."""
+        template = self._order_templates.pop(symbol, None)
+        if (
+            template is None
+            or template.side != side
+            or time.monotonic() - template.prepared_at > ORDER_TEMPLATE_MAX_AGE_SECONDS
+        ):
+            return self._build_order_template(symbol, side, current_price)
+        return template.for_price(current_price)
+
+    async def _prearm(self, symbol: str, funding_rate: float) -> None:
+        """Pré-arme l'ordre d'un symbole (prix du carnet, règles chargées dans un thread)."""
+        try:
+            current_price = await self._get_mid_price(symbol)
+            if current_price:
+                await run_in_thread(self.prearm_order, symbol, funding_rate, current_price)
+        except Exception as e:
+            self.logger.warning(f"[SCHEDULER] ⚠️ Erreur pré-armement {symbol}: {e}")
+
+    def _schedule_prearm(self, symbol: str, funding_rate: float) -> None:
+        """Lance le pré-armement en tâche de fond (un à la fois par symbole)."""
+        task = self._prearm_tasks.get(symbol)
+        if task is not None and not task.done():
+            return
+        self._prearm_tasks[symbol] = asyncio.create_task(self._prearm(symbol, funding_rate))
+
     def reset_orders(self):
         """
         Réinitialise la liste des ordres tentés.
@@ -138,30 +311,10 @@ class SchedulerManager:
             minutes: Seuil en minutes pour détecter le funding imminent
         """
         self.funding_threshold_minutes = minutes
+        if self.funding_events is not None:
+            self.funding_events.set_offsets(self.event_offsets())
         self.logger.debug(f"🛠️ [SCHEDULER] Seuil Funding T défini à {minutes} min")
 
-    def parse_funding_time(self, funding_t_str: str) -> int:
-        """
-        Convertit un texte '2h 15m 30s' ou '22m 59s' en secondes.
-
-        Args:
-            funding_t_str: Chaîne de temps au format "Xh Ym Zs" ou "Ym Zs"
-
-        Returns:
-            int: Nombre de secondes total
-        """
-        if not funding_t_str or funding_t_str == "-":
-            return 0
-
-        h = m = s = 0
-        if match := re.search(r"(\d+)h", funding_t_str):
-            h = int(match.group(1))
-        if match := re.search(r"(\d+)m", funding_t_str):
-            m = int(match.group(1))
-        if match := re.search(r"(\d+)s", funding_t_str):
-            s = int(match.group(1))
-        return h * 3600 + m * 60 + s
-
     def _should_place_order(self, symbol: str, remaining_seconds: int) -> bool:
         """
         Détermine si un ordre doit être placé pour cette paire.
@@ -177,8 +330,8 @@ class SchedulerManager:
         if not self.auto_trading_config.get('enabled', False):
             return False
 
-        # Vérifier la limite de positions simultanées
-        if len(self.current_positions) >= self.max_positions:
+        # Vérifier la limite de positions simultanées (entrées en cours incluses)
+        if len(self.current_positions) + len(self._entries_in_flight) >= self.max_positions:
             self.logger.debug(f"🚫 Limite de positions atteinte ({self.max_positions}) - Ignorer {symbol}")
             return False
 
@@ -192,39 +345,43 @@ class SchedulerManager:
         return True
 
     def _confirm_position_opened(self, symbol: str, expected_side: str) -> bool:
-        """Confirme via l'API Bybit qu'une position perp est bien ouverte."""
-        try:
-            import time
-
-            normalized_side = expected_side.lower() if expected_side else ""
-            for attempt in range(6):  # ~6 secondes maximum
-                positions = self.bybit_client.get_positions(category="linear", settleCoin="USDT")
-                if positions and positions.get("list"):
-                    for position in positions["list"]:
-                        if position.get("symbol") != symbol:
-                            continue
-
-                        size_raw = position.get("size", "0")
-                        try:
-                            size_val = float(size_raw)
-                        except (TypeError, ValueError):
-                            size_val = 0.0
-
-                        side_val = (position.get("side") or "").lower()
-
-                        if size_val > 0:
-                            if normalized_side and side_val and normalized_side != side_val:
-                                    self.logger.warning(
-                                        f"[TRADING] ⚠️ Position détectée sur {symbol} mais côté {side_val} ≠ {normalized_side}"
-                                    )
-                            return True
-
-                time.sleep(1)
+        """
+        Confirme qu'une position perp est bien ouverte.
 
+        Carnet de positions en direct : attente de l'événement WebSocket
+        (POSITION_OPEN_CONFIRM_SECONDS au plus). Sinon : une lecture REST.
+        """
+        try:
+            if self.position_book is not None and self.position_book.is_live():
+                position = self.position_book.wait_for_position(symbol, POSITION_OPEN_CONFIRM_SECONDS)
+            else:
+                position = self._fetch_position(symbol)
         except Exception as e:
             self.logger.warning(f"[TRADING] ⚠️ Erreur lors de la confirmation position {symbol}: {e}")
+            return False
+        if position is None:
+            return False
 
-        return False
+        normalized_side = expected_side.lower() if expected_side else ""
+        side_val = (position.get("side") or "").lower()
+        if normalized_side and side_val and normalized_side != side_val:
+            self.logger.warning(
+                f"[TRADING] ⚠️ Position détectée sur {symbol} mais côté {side_val} ≠ {normalized_side}"
+            )
+        return True
+
+    def _fetch_position(self, symbol: str) -> Optional[Dict]:
+        """Position ouverte d'un symbole lue par REST (sans WebSocket privée)."""
+        positions = self.bybit_client.get_positions(category="linear", settleCoin="USDT")
+        for position in (positions or {}).get("list") or ():
+            if position.get("symbol") != symbol:
+                continue
+            try:
+                if float(position.get("size") or 0) > 0:
+                    return position
+            except (TypeError, ValueError):
+                continue
+        return None
 
     def _place_automatic_order(self, symbol: str, funding_rate: float, current_price: float) -> bool:
         """
@@ -238,6 +395,7 @@ class SchedulerManager:
         Returns:
             bool: True si l'ordre a été placé avec succès
         """
+        hedge_started = False
         try:
             # Vérifier le mode dry-run
             if self.auto_trading_config.get('dry_run', False):
@@ -250,110 +408,19 @@ class SchedulerManager:
             funding_rate_float = float(funding_rate) if funding_rate is not None else 0.0
             side = "Buy" if funding_rate_float > 0 else "Sell"
 
-            # Calculer la quantité en USDT
-            order_size_usdt = self.auto_trading_config.get('order_size_usdt', 10)
-
-            # S'assurer que l'ordre respecte le minimum de 5 USDT requis par Bybit
-            min_order_value_usdt = 5.0
-            if order_size_usdt < min_order_value_usdt:
-                self.logger.warning(f"[TRADING] ⚠️ order_size_usdt ({order_size_usdt}) < minimum requis ({min_order_value_usdt}), ajustement automatique")
-                order_size_usdt = min_order_value_usdt
-
-            # Calculer la quantité de base
-            base_qty = order_size_usdt / current_price
-
-            # Récupérer les informations du symbole pour connaître les règles
-            try:
-                # Utiliser un thread dédié pour éviter PERF-002
-
-                def _get_instruments_info_sync():
-                    return self.bybit_client.get_instruments_info(category="linear", symbol=symbol)
-
-                self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : get_instruments_info()")
-                instruments_info = _get_instruments_info_sync()
-
-                if instruments_info and 'list' in instruments_info and instruments_info['list']:
-                    symbol_info = instruments_info['list'][0]
-                    lot_size_filter = symbol_info.get('lotSizeFilter', {})
-                    min_qty = float(lot_size_filter.get('minOrderQty', '0.001'))
-                    qty_step = float(lot_size_filter.get('qtyStep', '0.001'))
-
-                    precision_candidates = [lot_size_filter.get('quantityPrecision'), lot_size_filter.get('basePrecision')]
-                    quantity_precision = None
-                    for candidate in precision_candidates:
-                        if candidate is None:
-                            continue
-                        try:
-                            quantity_precision = int(float(candidate))
-                            break
-                        except (TypeError, ValueError):
-                            continue
-
-                    step_decimals = 0
-                    if qty_step > 0:
-                        step_str = f"{qty_step:.10f}".rstrip('0').rstrip('.')
-                        if '.' in step_str:
-                            step_decimals = len(step_str.split('.')[1])
-
-                    decimals = quantity_precision if quantity_precision is not None else step_decimals
-                    decimals = max(decimals, step_decimals)
-
-                    target_notional = max(order_size_usdt, min_order_value_usdt)
-                    required_qty = target_notional / current_price
-
-                    qty_steps = max(1, math.ceil(required_qty / qty_step)) if qty_step > 0 else 1
-                    adjusted_qty = qty_steps * qty_step if qty_step > 0 else required_qty
-
-                    if adjusted_qty < min_qty:
-                        min_steps = math.ceil(min_qty / qty_step) if qty_step > 0 else 1
-                        adjusted_qty = max(min_qty, min_steps * qty_step if qty_step > 0 else min_qty)
-
-                    qty_float = adjusted_qty if adjusted_qty > 0 else min_qty
-
-                    if decimals > 0:
-                        qty = f"{qty_float:.{decimals}f}".rstrip('0').rstrip('.')
-                    else:
-                        qty = f"{qty_float:.0f}"
-
-                    if not qty or qty == '0':
-                        # Utiliser decimals calculé au lieu de 6 décimales en dur
-                        safe_decimals = decimals if decimals > 0 else 2
-                        qty = f"{max(min_qty, qty_float):.{safe_decimals}f}".rstrip('0').rstrip('.') or str(min_qty)
-
-                    final_order_value = float(qty) * current_price
-                    if final_order_value < target_notional:
-                        # Sécurité : recalculer via arrondi supérieur explicite
-                        adjusted_steps = max(1, math.ceil(target_notional / (current_price * qty_step))) if qty_step > 0 else 1
-                        qty_float = adjusted_steps * qty_step if qty_step > 0 else target_notional / current_price
-                        if qty_step > 0 and qty_float < min_qty:
-                            min_steps = math.ceil(min_qty / qty_step)
-                            qty_float = max(min_qty, min_steps * qty_step)
-                        if decimals > 0:
-                            qty = f"{qty_float:.{decimals}f}".rstrip('0').rstrip('.')
-                        else:
-                            qty = f"{qty_float:.0f}"
-                        if not qty or qty == '0':
-                            # Utiliser decimals calculé au lieu de 6 décimales en dur
-                            safe_decimals = decimals if decimals > 0 else 2
-                            qty = f"{max(min_qty, qty_float):.{safe_decimals}f}".rstrip('0').rstrip('.') or str(min_qty)
-                        final_order_value = float(qty) * current_price
-
-                    self.logger.debug(
-                        f"📊 [TRADING] Quantité finale pour {symbol}: {qty} (valeur ≈ {final_order_value:.2f} USDT)"
-                    )
-                else:
-                    # Fallback si pas d'infos du symbole
-                    target_notional = max(order_size_usdt, min_order_value_usdt)
-                    qty_float = max(target_notional / current_price, 0.001)
-                    # Utiliser 2 décimales au lieu de 6 (plus sûr, évite "too many decimals")
-                    qty = f"{qty_float:.2f}".rstrip('0').rstrip('.') or "0.001"
-            except Exception as e:
-                self.logger.warning(f"[TRADING] ⚠️ Impossible de récupérer les infos du symbole {symbol}: {e}")
-                # Fallback simple
-                target_notional = max(order_size_usdt, min_order_value_usdt)
-                qty_float = max(target_notional / current_price, 0.001)
+            # Gabarit pré-armé (règles et quantité en mémoire) ou construit maintenant
+            template = self._get_order_template(symbol, side, current_price)
+            if template is not None:
+                qty = template.qty
+            else:
+                # Fallback simple sans règles du symbole
+                qty_float = max(self._target_notional() / current_price, 0.001)
                 # Utiliser 2 décimales au lieu de 6 (plus sûr, évite "too many decimals")
                 qty = f"{qty_float:.2f}".rstrip('0').rstrip('.') or "0.001"
+            self.logger.debug(
+                f"📊 [TRADING] Quantité finale pour {symbol}: {qty} "
+                f"(valeur ≈ {float(qty) * current_price:.2f} USDT)"
+            )
 
             # Stratégie PostOnly conservatrice : offset fixe pour garder les ordres en attente
             offset_percent = self.auto_trading_config.get('order_offset_percent', 0.01) / 100
@@ -391,7 +458,8 @@ class SchedulerManager:
                     symbol=symbol,
                     side=side,
                     qty=qty,
-                    category="linear"
+                    category="linear",
+                    template=template,
                 )
 
                 if not result.success:
@@ -399,6 +467,21 @@ class SchedulerManager:
                     return False
 
                 order_id = result.order_id
+                # Ordre exécuté : la jambe spot part immédiatement, la confirmation se fait en parallèle
+                if self.hedge_manager is not None:
+                    hedge_started = True
+                    self.hedge_manager.fire_hedge(
+                        symbol,
+                        {
+                            "symbol": symbol,
+                            "side": side,
+                            "size": qty,
+                            "price": limit_price,
+                            "funding_rate": funding_rate_float,
+                            "filled_at": time.monotonic(),
+                        },
+                        loop=self._loop,
+                    )
                 self.logger.debug(f"✅ [SMART_ORDER] Ordre intelligent placé {symbol}: ID={order_id}, "
                                f"price={result.price:.6f}, offset={result.offset_percent*100:.3f}%, "
                                f"liquidity={result.liquidity_level}, retry={result.retry_count}")
@@ -487,59 +570,14 @@ class SchedulerManager:
             env_info = "TESTNET" if self.bybit_client.is_testnet() else "MAINNET"
             self.logger.debug(f"✅ [MAKER_CONFIRMED] Ordre accepté comme MAKER pour {symbol} (ID: {order_id}) - Environnement: {env_info}")
 
-            # Vérification immédiate de l'existence de l'ordre
-            try:
-                import time
-                time.sleep(1)  # Attendre 1 seconde
-
-                # Vérifier immédiatement si l'ordre existe
-                immediate_check = self.bybit_client.get_open_orders(category="linear", settleCoin="USDT")
-                if immediate_check and immediate_check.get("list"):
-                    matching_immediate = [o for o in immediate_check.get("list", []) if o.get("orderId") == order_id]
-                    if matching_immediate:
-                        self.logger.debug(f"✅ [IMMEDIATE_CHECK] Ordre {symbol} confirmé immédiatement sur Bybit")
-                    else:
-                        self.logger.warning(
-                            f"[ORDER] ⚠️ Ordre {symbol} non trouvé immédiatement - possible problème"
-                        )
-                else:
-                    self.logger.warning(f"[ORDER] ⚠️ Aucun ordre trouvé pour {symbol} - possible problème")
-            except Exception as e:
-                self.logger.warning(f"[ORDER] ⚠️ Erreur vérification immédiate {symbol}: {e}")
-
-            # Vérifier le statut de l'ordre après un délai
-            try:
-                import time
-                time.sleep(5)  # Attendre 5 secondes pour laisser l'ordre s'afficher
-
-                # Vérifier le statut de l'ordre
-                order_status = self.bybit_client.get_open_orders(category="linear", settleCoin="USDT")
-                if order_status and order_status.get("list"):
-                    matching_orders = [o for o in order_status.get("list", []) if o.get("orderId") == order_id]
-                    if matching_orders:
-                        order_info = matching_orders[0]
-                        self.logger.debug(
-                            f"🔍 [ORDER_STATUS] Ordre {symbol} trouvé: Status={order_info.get('orderStatus')}, Qty={order_info.get('qty')}, Price={order_info.get('price')}"
-                        )
-                        self.logger.debug(f"✅ [ORDER_VISIBLE] Ordre perp {symbol} visible sur Bybit - ID: {order_id}")
-                    else:
-                        self.logger.debug(
-                            f"🔍 [ORDER_STATUS] Ordre {symbol} non trouvé dans les ordres ouverts - probablement exécuté"
-                        )
-                        self.logger.warning(
-                            f"[ORDER] ⚠️ Ordre perp {symbol} non visible sur Bybit - vérifiez manuellement l'ID: {order_id}"
-                        )
-                else:
-                    self.logger.debug(f"🔍 [ORDER_STATUS] Aucun ordre ouvert trouvé")
-            except Exception as e:
-                self.logger.warning(f"[ORDER] ⚠️ Erreur vérification statut ordre {symbol}: {e}")
-
             # Confirmer que la position est bien ouverte côté Bybit avant de continuer
             if not self._confirm_position_opened(symbol, side):
                 self.logger.error(
                     f"[TRADING] ❌ Position {symbol} introuvable après placement de l'ordre {order_id}. "
                     "Annulation et nouveau scan requis."
                 )
+                if hedge_started:
+                    self.hedge_manager.abort_hedge(symbol)
                 try:
                     self.bybit_client.cancel_order(
                         symbol=symbol,
@@ -611,6 +649,37 @@ class SchedulerManager:
             # Ne pas marquer l'ordre comme passé en cas d'erreur
             return False
 
+    async def _get_mid_price(self, symbol: str) -> Optional[float]:
+        """
+        Prix médian du meilleur bid/ask d'un symbole.
+
+        Args:
+            symbol: Symbole de la paire
+
+        Returns:
+            Prix médian ou None si le carnet est indisponible
+        """
+        # Carnet local WebSocket en priorité (aucun appel REST)
+        orderbook = (
+            self.smart_placer.orderbook_manager.get_local_orderbook(symbol)
+            if self.smart_placer else None
+        )
+        if not orderbook and self.async_client:
+            orderbook = await self.async_client.get_orderbook(symbol=symbol, limit=1)
+        elif not orderbook:
+            self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : get_orderbook()")
+            orderbook = await run_in_thread(
+                self.bybit_client.get_orderbook,
+                symbol=symbol,
+                limit=1,
+            )
+
+        if orderbook and 'b' in orderbook and 'a' in orderbook:
+            bid_price = float(orderbook['b'][0][0]) if orderbook['b'] else 0
+            ask_price = float(orderbook['a'][0][0]) if orderbook['a'] else 0
+            return (bid_price + ask_price) / 2
+        return None
+
     async def _handle_automatic_trading(self, symbol: str, remaining_seconds: int, first_data: dict):
         """
         Gère le trading automatique pour une paire donnée.
@@ -623,24 +692,17 @@ class SchedulerManager:
         # Vérifier si un ordre automatique doit être placé
         if not self._should_place_order(symbol, remaining_seconds):
             return
+        # Event loop sur lequel le hedge spot sera lancé depuis le thread de placement
+        self._loop = asyncio.get_running_loop()
+        self._entries_in_flight.add(symbol)
 
         try:
             if not self.bybit_client:
                 self.logger.warning(f"[TRADING] ⚠️ Client Bybit non disponible pour {symbol}")
                 return
 
-            self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : get_orderbook()")
-            orderbook = await run_in_thread(
-                self.bybit_client.get_orderbook,
-                symbol=symbol,
-                limit=1,
-            )
-
-            if orderbook and 'b' in orderbook and 'a' in orderbook:
-                bid_price = float(orderbook['b'][0][0]) if orderbook['b'] else 0
-                ask_price = float(orderbook['a'][0][0]) if orderbook['a'] else 0
-                current_price = (bid_price + ask_price) / 2
-
+            current_price = await self._get_mid_price(symbol)
+            if current_price is not None:
                 funding_rate = first_data.get('funding_rate', 0)
 
                 self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : _place_automatic_order()")
@@ -655,160 +717,100 @@ class SchedulerManager:
 
         except Exception as e:
             self.logger.error(f"❌ [TRADING] Erreur lors de la récupération des données pour {symbol}: {e}")
-
-    async def run_with_callback(self, data_callback):
+        finally:
+            self._entries_in_flight.discard(symbol)
+
+    def event_offsets(self) -> Dict[str, float]:
+        """Décalages des événements de funding (secondes avant le funding)."""
+        return {
+            "prearm": (self.funding_threshold_minutes + ORDER_PREARM_MINUTES) * 60,
+            "hedge_prep": self.funding_threshold_minutes * 60 + HEDGE_PREP_LEAD_SECONDS,
+            "entry": self.funding_threshold_minutes * 60,
+        }
+
+    def set_funding_events(
+        self,
+        funding_events: FundingEventScheduler,
+        funding_rate_lookup: Callable[[str], Optional[float]],
+    ) -> None:
         """
-        Méthode principale du scheduler avec callback pour récupérer les données à jour.
+        Branche le planificateur d'événements de funding (utilisé par run_events).
 
         Args:
-            data_callback: Fonction qui retourne les données de funding formatées
+            funding_events: FundingEventScheduler alimenté par la WS et la watchlist
+            funding_rate_lookup: Fonction symbole -> funding rate courant
+        """
+        funding_events.set_offsets(self.event_offsets())
+        self.funding_events = funding_events
+        self._funding_rate_lookup = funding_rate_lookup
+
+    async def run_events(self):
         """
+        Boucle principale pilotée par les événements de funding.
+
+        Attend l'échéance la plus proche du FundingEventScheduler (pré-armement,
+        préparation du hedge puis entrée, pour chaque symbole surveillé) au lieu de scanner la
+        watchlist ; la surveillance des ordres en attente garde son intervalle.
+        """
+        if self.funding_events is None:
+            raise RuntimeError("FundingEventScheduler non configuré (set_funding_events)")
         self.logger.info(
-            f"[SCHEDULER] Scheduler démarré (seuil Funding T = {self.funding_threshold_minutes} min)"
+            f"[SCHEDULER] Scheduler événementiel démarré (seuil Funding T = {self.funding_threshold_minutes} min)"
         )
+        next_housekeeping = time.monotonic()
 
         while True:
             try:
-                # Récupérer les données à jour via le callback
-                watchlist_data = data_callback()
-
-                # Vérifier si les données sont disponibles
-                if not watchlist_data:
-                    self.logger.debug(f"🕒 [SCHEDULER] Aucune donnée disponible (prochain scan dans {self.scan_interval}s)")
-                    await asyncio.sleep(self.scan_interval)
-                    continue
-
-                imminent_pairs = []
-
-                # Sélectionner UNIQUEMENT la première paire de la watchlist
-                first_symbol = None
-                first_data = None
-
-                # Récupérer la première paire de la watchlist
-                for symbol, data in watchlist_data.items():
-                    if isinstance(data, dict):
-                        first_symbol = symbol
-                        first_data = data
-                        break
-
-                if first_symbol and first_data:
-                    # Récupérer le funding time formaté (ex: "22m 59s")
-                    funding_t_str = first_data.get('next_funding_time', None)
-
-                    if funding_t_str and funding_t_str != "-":
-                        # Convertir la chaîne en secondes
-                        remaining_seconds = self.parse_funding_time(funding_t_str)
-
-                        # Log debug pour le suivi (avec plus de détails)
-                        self.logger.debug(f"[SCHEDULER] {first_symbol}: funding={funding_t_str} ({remaining_seconds}s) - Seuil: {self.funding_threshold_minutes}min")
-
-                        # Vérifier si le funding est imminent selon le seuil
-                        if remaining_seconds > 0 and remaining_seconds <= self.funding_threshold_minutes * 60:
-                            imminent_pairs.append({
-                                'symbol': first_symbol,
-                                'remaining_seconds': remaining_seconds,
-                                'remaining_minutes': remaining_seconds / 60
-                            })
-
-                # Afficher les paires avec funding imminent et gérer le trading automatique
-                if imminent_pairs:
-                    for pair in imminent_pairs:
-                        symbol = pair['symbol']
-                        remaining_seconds = pair['remaining_seconds']
-
-                        self.logger.debug(
-                            f"⚡ [SCHEDULER] {symbol} funding imminent → "
-                            f"{remaining_seconds:.0f}s (seuil={self.funding_threshold_minutes}min)"
-                        )
-
-                        # Récupérer les données spécifiques à cette paire
-                        pair_data = watchlist_data.get(symbol, {})
-
-                        # Gérer le trading automatique
-                        await self._handle_automatic_trading(symbol, remaining_seconds, pair_data)
-                else:
-                    self.logger.debug(
-                        f"🕒 [SCHEDULER] Aucune paire proche du funding "
-                        f"(prochain scan dans {self.scan_interval}s)"
-                    )
+                await self.funding_events.wait_next(max(next_housekeeping - time.monotonic(), 0.0))
 
-                # Vérifier les ordres en attente et annuler ceux qui ont expiré
-                await self.check_pending_orders()
+                for event in self.funding_events.pop_due():
+                    task = asyncio.create_task(self._on_funding_event(event))
+                    self._event_tasks.add(task)
+                    task.add_done_callback(self._event_tasks.discard)
 
-                # Attendre avant le prochain scan
-                self._log_periodic_summary()
-                await asyncio.sleep(self.scan_interval)
+                if time.monotonic() >= next_housekeeping:
+                    next_housekeeping = time.monotonic() + self.scan_interval
+                    # Vérifier les ordres en attente et annuler ceux qui ont expiré
+                    await self.check_pending_orders()
+                    self._log_periodic_summary()
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                self.logger.error(f"❌ [SCHEDULER] Erreur dans la boucle de scan: {e}")
+                self.logger.error(f"❌ [SCHEDULER] Erreur dans la boucle d'événements: {e}")
                 await asyncio.sleep(self.scan_interval)
 
-    async def run(self, watchlist_data: Dict[str, Any]):
+    async def _on_funding_event(self, event: FundingEvent) -> None:
         """
-        Méthode principale du scheduler - analyse régulièrement la watchlist
-        pour détecter les paires dont le Funding T est proche du seuil.
+        Traite un événement de funding échu.
 
         Args:
-            watchlist_data: Données de la watchlist pour le timing
+            event: Événement dépilé par le FundingEventScheduler
         """
-        self.logger.info(
-            f"[SCHEDULER] Scheduler démarré (seuil Funding T = {self.funding_threshold_minutes} min)"
+        symbol = event.symbol
+        self.logger.debug(
+            f"⚡ [SCHEDULER] {symbol} événement {event.kind} → funding dans "
+            f"{event.remaining_seconds:.0f}s (gigue={event.jitter_ms}ms)"
         )
-
-        while True:
-            try:
-                imminent_pairs = []
-
-                # Analyser seulement la première paire de la watchlist
-                first_symbol = None
-                first_data = None
-
-                # Récupérer la première paire
-                for symbol, data in watchlist_data.items():
-                    if isinstance(data, dict):
-                        first_symbol = symbol
-                        first_data = data
-                        break
-
-                if first_symbol and first_data:
-                    # Récupérer le funding time formaté (ex: "22m 59s")
-                    funding_t_str = first_data.get('next_funding_time', None)
-
-                    if funding_t_str and funding_t_str != "-":
-                        # Convertir la chaîne en secondes
-                        remaining_seconds = self.parse_funding_time(funding_t_str)
-
-                        # Log debug pour le suivi
-                        self.logger.debug(f"[SCHEDULER] {first_symbol}: funding={funding_t_str} ({remaining_seconds}s)")
-
-                        # Vérifier si le funding est imminent selon le seuil
-                        if remaining_seconds > 0 and remaining_seconds <= self.funding_threshold_minutes * 60:
-                            imminent_pairs.append({
-                                'symbol': first_symbol,
-                                'remaining_seconds': remaining_seconds,
-                                'remaining_minutes': remaining_seconds / 60
-                            })
-
-                # Afficher les paires avec funding imminent
-                if imminent_pairs:
-                    for pair in imminent_pairs:
-                        self.logger.debug(
-                            f"⚡ [SCHEDULER] {pair['symbol']} funding imminent → "
-                            f"{pair['remaining_seconds']:.0f}s (seuil={self.funding_threshold_minutes}min)"
-                        )
-                else:
-                    self.logger.debug(
-                        f"🕒 [SCHEDULER] Aucune paire proche du funding "
-                        f"(prochain scan dans {self.scan_interval}s)"
-                    )
-
-                # Vérifier les ordres en attente et annuler ceux qui ont expiré
-                await self.check_pending_orders()
-
-                # Attendre avant le prochain scan
-                self._log_periodic_summary()
-                await asyncio.sleep(self.scan_interval)
-
-            except Exception as e:
-                self.logger.error(f"❌ [SCHEDULER] Erreur dans la boucle de scan: {e}")
-                await asyncio.sleep(self.scan_interval)
+        try:
+            funding_rate = self._funding_rate_lookup(symbol) if self._funding_rate_lookup else None
+            if event.kind == "prearm":
+                # Carnet local et ordre prêts avant la fenêtre de trading
+                if self.smart_placer:
+                    self.smart_placer.orderbook_manager.prepare(symbol, "linear")
+                if self.bybit_client and self._should_place_order(symbol, int(event.remaining_seconds)):
+                    self._schedule_prearm(symbol, funding_rate or 0)
+            elif event.kind == "hedge_prep":
+                # Jambe spot prête avant l'entrée perp (prix, règles, soldes)
+                if self._should_place_order(symbol, int(event.remaining_seconds)):
+                    self._prepare_hedge(symbol)
+            elif event.kind == "entry":
+                if not self._should_place_order(symbol, int(event.remaining_seconds)):
+                    return
+                if self.smart_placer:
+                    self.smart_placer.orderbook_manager.prepare(symbol, "linear")
+                await self._handle_automatic_trading(
+                    symbol, int(event.remaining_seconds), {"funding_rate": funding_rate or 0}
+                )
+        except Exception as e:
+            self.logger.error(f"❌ [SCHEDULER] Erreur événement {event.kind} {symbol}: {e}")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Expressions de score configurables (weights.formula dans parameters.yaml).
+
+Une formule est une expression arithmétique sur les colonnes des
+candidats, compilée une seule fois :
+- en arbre de fonctions NumPy, évalué sur tout le lot en un appel
+- en bytecode Python (compile), évalué ligne par ligne sans NumPy
+
+Grammaire (sous-ensemble d'expressions Python, tout le reste est refusé) :
+- nombres, variables de colonne (ex: funding, volume, spread, volatility,
+  minutes), opérateurs + - * / ** et moins unaire
+- weights.<clé> : coefficient numérique de la section weights, figé à la
+  compilation
+- fonctions : abs, log, log1p, sqrt, exp (1 argument), min, max
+  (2 arguments, élément par élément), clip(x, bas, haut)
+
+Exemple (formule historique de WeightCalculator) :
+    abs(funding) * weights.funding + log(volume + 1) * weights.volume
+    - spread * weights.spread - volatility * weights.volatility
+
+Un score non fini (log d'une valeur négative, division par zéro) vaut 0,
+comme un poids en erreur. Les scores sont arrondis à 2 décimales.
+"""
+
+import ast
+import math
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy optionnel
+    np = None
+
+# Colonnes fournies par WeightCalculator pour chaque candidat
+SCORE_VARIABLES: Tuple[str, ...] = ("funding", "volume", "spread", "volatility", "minutes")
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+# {nom: (arité, version Python, nom de la version NumPy)}
+_FUNCTIONS = {
+    "abs": (1, abs, "abs"),
+    "log": (1, math.log, "log"),
+    "log1p": (1, math.log1p, "log1p"),
+    "sqrt": (1, math.sqrt, "sqrt"),
+    "exp": (1, math.exp, "exp"),
+    "min": (2, min, "minimum"),
+    "max": (2, max, "maximum"),
+    "clip": (3, lambda x, low, high: min(max(x, low), high), "clip"),
+}
+
+
+class ScoreExpressionError(ValueError):
+    """Formule de score invalide (syntaxe ou élément non autorisé)."""
+
+
+class ScoreExpression:
+    """
+    Formule de score compilée.
+
+    Attributes:
+        source: Texte de la formule
+        variables: Colonnes utilisées par la formule
+    """
+
+    def __init__(self, source: str, tree: ast.Expression, variables: Tuple[str, ...]):
+        self.source = source
+        self.variables = variables
+        self._code = compile(tree, "<weights.formula>", "eval")
+        self._vectorized = _build_numpy(tree.body) if np is not None else None
+
+    def evaluate_row(self, values: Mapping[str, float]) -> float:
+        """
+        Évalue la formule pour une ligne (bytecode compilé).
+
+        Args:
+            values: {variable: valeur}
+
+        Returns:
+            Score arrondi à 2 décimales (0 si non fini)
+        """
+        namespace = {name: float(values.get(name) or 0.0) for name in self.variables}
+        try:
+            score = float(eval(self._code, _PYTHON_GLOBALS, namespace))
+        except (ArithmeticError, TypeError, ValueError):
+            return 0.0
+        return round(score, 2) if math.isfinite(score) else 0.0
+
+    def evaluate(
+        self, columns: Mapping[str, Sequence[float]], size: Optional[int] = None
+    ) -> List[float]:
+        """
+        Évalue la formule sur tout le lot en un appel.
+
+        Args:
+            columns: {variable: valeurs par candidat}, colonnes de même longueur
+            size: Nombre de candidats (défaut: longueur des colonnes) ; requis
+                pour une formule sans variable (ex: weights.funding * 2)
+
+        Returns:
+            Scores arrondis à 2 décimales, dans l'ordre des candidats
+        """
+        if size is None:
+            size = len(next(iter(columns.values()), ()))
+        if self._vectorized is None:
+            return [
+                self.evaluate_row({name: columns[name][i] for name in self.variables})
+                for i in range(size)
+            ]
+        arrays = {name: np.asarray(columns[name], dtype=np.float64) for name in self.variables}
+        with np.errstate(all="ignore"):
+            scores = np.broadcast_to(self._vectorized(arrays), (size,)).astype(np.float64)
+        scores[~np.isfinite(scores)] = 0.0
+        return np.round(scores, 2).tolist()
+
+
+_PYTHON_GLOBALS: Dict[str, Any] = {
+    "__builtins__": {},
+    **{name: python_func for name, (_, python_func, _) in _FUNCTIONS.items()},
+}
+
+
+def compile_score_expression(
+    source: str,
+    weights: Mapping[str, Any],
+    variables: Sequence[str] = SCORE_VARIABLES,
+) -> ScoreExpression:
+    """
+    Compile une formule de score (mise en cache par formule et coefficients).
+
+    Args:
+        source: Texte de la formule
+        weights: Section weights (les coefficients numériques sont utilisables
+            via weights.<clé>)
+        variables: Colonnes autorisées
+
+    Returns:
+        ScoreExpression
+
+    Raises:
+        ScoreExpressionError: Si la formule est invalide
+    """
+    if not isinstance(source, str) or not source.strip():
+        raise ScoreExpressionError("formule vide")
+    coefficients = tuple(sorted(
+        (key, float(value)) for key, value in weights.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ))
+    return _compile(source.strip(), coefficients, tuple(variables))
+
+
+@lru_cache(maxsize=32)
+def _compile(
+    source: str, coefficients: Tuple[Tuple[str, float], ...], variables: Tuple[str, ...]
+) -> ScoreExpression:
+    """Analyse, valide et compile la formule."""
+    try:
+        tree = ast.parse(source, mode="eval")
+    except SyntaxError as e:
+        raise ScoreExpressionError(f"syntaxe invalide: {e.msg}") from None
+    validator = _Validator(dict(coefficients), variables)
+    tree = ast.fix_missing_locations(validator.visit(tree))
+    used = tuple(name for name in variables if name in validator.used)
+    return ScoreExpression(source, tree, used)
+
+
+class _Validator(ast.NodeTransformer):
+    """Refuse tout nœud hors grammaire et remplace weights.<clé> par sa valeur."""
+
+    def __init__(self, coefficients: Dict[str, float], variables: Tuple[str, ...]):
+        self.coefficients = coefficients
+        self.variables = variables
+        self.used = set()
+
+    def generic_visit(self, node):
+        raise ScoreExpressionError(f"élément non autorisé: {type(node).__name__}")
+
+    def visit_Expression(self, node):
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            raise ScoreExpressionError(f"constante non numérique: {node.value!r}")
+        # Flottant : pas d'arithmétique entière illimitée (ex: 10 ** 10 ** 10)
+        return ast.copy_location(ast.Constant(float(node.value)), node)
+
+    def visit_Name(self, node):
+        if node.id not in self.variables:
+            raise ScoreExpressionError(
+                f"variable inconnue: {node.id} (disponibles: {', '.join(self.variables)})"
+            )
+        self.used.add(node.id)
+        return node
+
+    def visit_Attribute(self, node):
+        if not (isinstance(node.value, ast.Name) and node.value.id == "weights"):
+            raise ScoreExpressionError("seuls les attributs weights.<clé> sont autorisés")
+        if node.attr not in self.coefficients:
+            raise ScoreExpressionError(f"coefficient absent de weights: {node.attr}")
+        return ast.copy_location(ast.Constant(self.coefficients[node.attr]), node)
+
+    def visit_BinOp(self, node):
+        if type(node.op) not in _BINARY_OPS:
+            raise ScoreExpressionError(f"opérateur non autorisé: {type(node.op).__name__}")
+        node.left = self.visit(node.left)
+        node.right = self.visit(node.right)
+        return node
+
+    def visit_UnaryOp(self, node):
+        if type(node.op) not in _UNARY_OPS:
+            raise ScoreExpressionError(f"opérateur non autorisé: {type(node.op).__name__}")
+        node.operand = self.visit(node.operand)
+        return node
+
+    def visit_Call(self, node):
+        name = node.func.id if isinstance(node.func, ast.Name) else None
+        if name not in _FUNCTIONS or node.keywords:
+            raise ScoreExpressionError(
+                f"fonction non autorisée (disponibles: {', '.join(_FUNCTIONS)})"
+            )
+        arity = _FUNCTIONS[name][0]
+        if len(node.args) != arity:
+            raise ScoreExpressionError(f"{name} attend {arity} argument(s)")
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+def _build_numpy(node: ast.AST) -> Callable[[Mapping[str, Any]], Any]:
+    """Construit l'arbre de fonctions NumPy d'une expression validée."""
+    if isinstance(node, ast.Constant):
+        value = float(node.value)
+        return lambda columns: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda columns: columns[name]
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPS[type(node.op)]
+        left, right = _build_numpy(node.left), _build_numpy(node.right)
+        return lambda columns: op(left(columns), right(columns))
+    if isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPS[type(node.op)]
+        operand = _build_numpy(node.operand)
+        return lambda columns: op(operand(columns))
+    func = getattr(np, _FUNCTIONS[node.func.id][2])
+    args = [_build_numpy(arg) for arg in node.args]
+    return lambda columns: func(*(arg(columns) for arg in args))
+
@@ -22,7 +22,7 @@ from logging_setup import (
     disable_logging,
     safe_log_info,
 )
-from utils.executors import GLOBAL_EXECUTOR
+from utils.executors import GLOBAL_EXECUTOR, PREFETCH_EXECUTOR
 
 
 class ShutdownManager:
@@ -355,6 +355,7 @@ class ShutdownManager:
         try:
             # Arrêter le pool de threads global pour éviter toute fuite de workers
             GLOBAL_EXECUTOR.shutdown(wait=True)
+            PREFETCH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
             # Nettoyer les références des managers de manière plus approfondie
             self._cleanup_managers(managers)
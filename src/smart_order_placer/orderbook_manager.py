@@ -2,6 +2,12 @@
 Orderbook Manager - Gestion du cache et récupération de l'orderbook.
 
 Ce module gère le cache de l'orderbook pour éviter les appels API répétés.
+
+Source prioritaire : le carnet local maintenu par le flux WebSocket
+``orderbook.50.{symbol}`` (voir ws.public.local_orderbook), lu sans aucun
+appel REST. Le REST ``get_orderbook`` ne sert plus que de repli lorsque le
+carnet local n'est pas disponible (catégorie spot, carnet pas encore
+synchronisé ou en cours de resynchronisation).
 """
 
 import time
@@ -15,18 +21,64 @@ from utils.executors import GLOBAL_EXECUTOR
 _orderbook_cache = {}
 _cache_lock = threading.Lock()
 CACHE_TTL = 2  # secondes
+ORDERBOOK_DEPTH = 10  # niveaux par côté fournis aux calculateurs (comme le REST limit=10)
 
 
 class OrderbookManager:
     """Gère le cache et la récupération de l'orderbook."""
 
-    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None):
+    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None, orderbook_source=None):
+        """
+        Args:
+            bybit_client: Client REST Bybit (repli)
+            logger: Logger pour les messages
+            orderbook_source: Fournisseur de carnets locaux (WebSocketManager)
+                exposant get_orderbook(symbol, depth) et
+                subscribe_orderbook(category, symbols)
+        """
         self.bybit_client = bybit_client
         self.logger = logger or logging.getLogger(__name__)
+        self.orderbook_source = orderbook_source
+
+    def set_orderbook_source(self, orderbook_source) -> None:
+        """Branche le fournisseur de carnets locaux (WebSocketManager)."""
+        self.orderbook_source = orderbook_source
+
+    def prepare(self, symbol: str, category: str) -> bool:
+        """
+        Demande le suivi du carnet local d'un symbole avant le placement.
+
+        Args:
+            symbol: Symbole de la paire
+            category: Catégorie (linear, inverse ; spot non supporté)
+
+        Returns:
+            True si le carnet local est (ou sera) alimenté par le WebSocket
+        """
+        if self.orderbook_source is None:
+            return False
+        try:
+            return bool(self.orderbook_source.subscribe_orderbook(category, [symbol]))
+        except Exception as e:
+            self.logger.debug(f"[CACHE] Souscription carnet local {symbol} impossible: {e}")
+            return False
+
+    def get_local_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Retourne le carnet local synchronisé d'un symbole (aucun appel REST)."""
+        if self.orderbook_source is None:
+            return None
+        try:
+            return self.orderbook_source.get_orderbook(symbol, ORDERBOOK_DEPTH)
+        except Exception:
+            return None
 
     def get_cached_orderbook(self, symbol: str, category: str) -> Optional[Dict[str, Any]]:
         """
-        Récupère le carnet d'ordres avec cache pour éviter les appels répétés.
+        Récupère le carnet d'ordres, en priorité depuis le carnet local WebSocket.
+
+        Le repli REST (avec cache) n'est utilisé que si le carnet local est
+        indisponible ; le suivi WebSocket est alors demandé pour les appels
+        suivants.
 
         Args:
             symbol: Symbole de la paire
@@ -35,6 +87,11 @@ class OrderbookManager:
         Returns:
             Dict contenant les données de l'orderbook ou None en cas d'erreur
         """
+        orderbook = self.get_local_orderbook(symbol)
+        if orderbook:
+            return orderbook
+        self.prepare(symbol, category)
+
         cache_key = f"{symbol}_{category}"
         current_time = time.time()
 
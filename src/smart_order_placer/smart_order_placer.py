@@ -14,9 +14,10 @@ ARCHITECTURE REFACTORISÉE:
 - SymbolRulesCache: Gère le cache des règles de précision
 - QuantityFormatter: Formate les quantités selon les règles Bybit
 - PriceFormatter: Formate les prix selon les règles Bybit
-- OrderbookManager: Gère le cache de l'orderbook
+- OrderbookManager: Lit le carnet local WebSocket (repli REST avec cache)
 - OrderValidator: Valide les ordres avant placement
 - OrderRetryHandler: Gère les retries et ajustements de prix
+- OrderLifecycleTracker (optionnel): États des ordres par WebSocket privée (repli REST)
 - SmartOrderPlacer: Orchestre le placement avec refresh automatique
 
 FONCTIONNALITÉS:
@@ -45,7 +46,9 @@ from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from config import get_settings
+from order_template import OrderTemplate
 from utils.executors import GLOBAL_EXECUTOR
+from warm_start_cache import get_warm_start_cache
 
 from .liquidity_classifier import LiquidityClassifier
 from .price_calculator import DynamicPriceCalculator
@@ -58,6 +61,8 @@ from .order_retry_handler import OrderRetryHandler
 
 # Paramètres de refresh
 ORDER_REFRESH_INTERVAL = 2  # secondes
+# Attente de la confirmation WS après une annulation (détecte un fill concurrent)
+CANCEL_CONFIRM_TIMEOUT = 1.0
 DEFAULT_MAX_RETRIES_PERP = 3
 DEFAULT_MAX_RETRIES_SPOT = 8
 
@@ -78,18 +83,21 @@ class OrderResult:
 class SmartOrderPlacer:
     """Orchestre le placement et le refresh des ordres maker intelligents."""
 
-    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None, maker_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None, maker_config: Optional[Dict[str, Any]] = None, orderbook_source=None):
         self.bybit_client = bybit_client
         self.logger = logger or logging.getLogger(__name__)
         
         # Initialiser les helpers
-        self.rules_cache = SymbolRulesCache(bybit_client, logger)
+        self.rules_cache = SymbolRulesCache(bybit_client, logger, warm_cache=get_warm_start_cache())
         self.quantity_formatter = QuantityFormatter(self.rules_cache, logger)
         self.price_formatter = PriceFormatter(self.rules_cache, logger)
-        self.orderbook_manager = OrderbookManager(bybit_client, logger)
+        self.orderbook_manager = OrderbookManager(bybit_client, logger, orderbook_source)
         self.order_validator = OrderValidator(logger)
         self.retry_handler = OrderRetryHandler(self.rules_cache, self.orderbook_manager, logger)
         self.price_calculator = DynamicPriceCalculator(logger)
+
+        # Suivi des ordres par WebSocket privée (REST en repli si absent)
+        self.order_tracker = None
         
         # Overrides dynamiques pour le minimum notionnel détecté par symbole
         self._symbol_min_notional_override: Dict[Tuple[str, str], float] = {}
@@ -160,13 +168,32 @@ class SmartOrderPlacer:
         if not hasattr(self, "min_order_value_usdt"):
             self.min_order_value_usdt = 10.0
 
+    def set_orderbook_source(self, orderbook_source) -> None:
+        """
+        Branche la source de carnets locaux WebSocket (aucun REST sur le chemin d'ordre).
+
+        Args:
+            orderbook_source: WebSocketManager (get_orderbook / subscribe_orderbook)
+        """
+        self.orderbook_manager.set_orderbook_source(orderbook_source)
+
+    def set_order_tracker(self, order_tracker) -> None:
+        """
+        Branche le suivi des ordres par WebSocket privée (topics order/execution).
+
+        Args:
+            order_tracker: OrderLifecycleTracker partagé
+        """
+        self.order_tracker = order_tracker
+
     def place_order_with_refresh(
         self,
         symbol: str,
         side: str,
         qty: str,
         category: str = "linear",
-        force_exact_quantity: bool = False
+        force_exact_quantity: bool = False,
+        template: Optional[OrderTemplate] = None,
     ) -> OrderResult:
         """
         Place un ordre maker avec refresh automatique si non exécuté.
@@ -185,6 +212,8 @@ class SmartOrderPlacer:
             qty: Quantité à trader (sera ajustée si < 5 USDT)
             category: "linear", "inverse", ou "spot"
             force_exact_quantity: Si True, ne réduit jamais la quantité
+            template: Gabarit pré-armé (OrderTemplate) : la première tentative
+                envoie son corps pré-sérialisé (un seul POST signé)
 
         Returns:
             OrderResult: Résultat complet avec succès, order_id, prix, etc.
@@ -244,14 +273,21 @@ class SmartOrderPlacer:
                     else:
                         self.logger.debug(attempt_msg)
 
-                    # Placer l'ordre
-                    response = self._place_order_sync(
-                        symbol=symbol,
-                        side=side,
-                        qty=qty,
-                        price=limit_price,
-                        category=category
+                    # Placer l'ordre (gabarit pré-armé à la première tentative)
+                    prepared = (
+                        self._usable_template(template, symbol, side, category, qty, limit_price)
+                        if retry == 0 else None
                     )
+                    if prepared is not None:
+                        response = self._place_prepared_sync(prepared, limit_price)
+                    else:
+                        response = self._place_order_sync(
+                            symbol=symbol,
+                            side=side,
+                            qty=qty,
+                            price=limit_price,
+                            category=category
+                        )
 
                     order_id = response.get('orderId')
                     ret_code = response.get('retCode', 0)
@@ -554,6 +590,38 @@ class SmartOrderPlacer:
 
         return qty_str
 
+    def _usable_template(
+        self,
+        template: Optional[OrderTemplate],
+        symbol: str,
+        side: str,
+        category: str,
+        qty: str,
+        price: float,
+    ) -> Optional[OrderTemplate]:
+        """
+        Gabarit pré-armé utilisable pour cet ordre au prix limite, sinon None.
+
+        Le gabarit doit correspondre au symbole, au côté et à la catégorie ;
+        sa quantité doit égaler la quantité validée (minimum notionnel).
+        """
+        if template is None or not hasattr(self.bybit_client, "place_order_prepared"):
+            return None
+        if (template.symbol, template.side, template.category) != (symbol, side, category):
+            return None
+        prepared = template.for_price(price)
+        return prepared if float(prepared.qty) == float(qty) else None
+
+    def _place_prepared_sync(self, template: OrderTemplate, price: float) -> Dict[str, Any]:
+        """Place un ordre à partir du corps pré-sérialisé du gabarit (prix inséré)."""
+        body = template.render(price)
+        self.logger.info(
+            f"[ORDER] [MAKER-OPEN] Placement pré-armé {template.symbol}: side={template.side} "
+            f"qty={template.qty} price={template.format_price(price)}"
+        )
+        future = GLOBAL_EXECUTOR.submit(self.bybit_client.place_order_prepared, body)
+        return future.result()
+
     def _place_order_sync(self, symbol: str, side: str, qty: str, price: float, category: str) -> Dict[str, Any]:
         """Place un ordre de manière synchrone."""
         # Formater le prix selon les règles de Bybit
@@ -731,17 +799,69 @@ class SmartOrderPlacer:
         side: str,
         max_retries: int
     ) -> OrderResult:
-        """Attend l'exécution de l'ordre avec refresh si nécessaire."""
+        """
+        Attend l'exécution de l'ordre avec refresh si nécessaire.
+
+        Avec un OrderLifecycleTracker authentifié, l'attente se termine dès
+        l'état terminal reçu par WebSocket ; sinon (ou sans aucun message
+        pour l'ordre) l'état est réconcilié par REST après l'intervalle.
+        """
+        try:
+            return self._wait_for_execution_tracked(
+                order_id, symbol, category, price, offset_percent, liquidity_level, retry, side, max_retries
+            )
+        finally:
+            if self.order_tracker is not None:
+                self.order_tracker.forget(order_id)
+
+    def _wait_for_execution_tracked(
+        self,
+        order_id: str,
+        symbol: str,
+        category: str,
+        price: float,
+        offset_percent: float,
+        liquidity_level: str,
+        retry: int,
+        side: str,
+        max_retries: int
+    ) -> OrderResult:
         start_wait = time.time()
+        tracker = self.order_tracker if self.order_tracker is not None and self.order_tracker.is_live() else None
 
         # Attendre l'intervalle de refresh (plus rapide pour le spot)
         refresh_interval = self.refresh_interval_perp if category != "spot" else self.refresh_interval_spot
-        time.sleep(refresh_interval)
+        state = None
+        if tracker is not None:
+            state = tracker.wait_for_terminal(order_id, refresh_interval)
+        else:
+            time.sleep(refresh_interval)
+
+        # Vérifier si l'ordre est toujours en attente (REST si aucun événement WS)
+        if state is not None:
+            pending = not state.is_terminal
+        else:
+            pending = self._is_order_still_pending(order_id, symbol, category)
+
+        # Ordre annulé/rejeté par la plateforme sans exécution (PostOnly qui croise)
+        if state is not None and state.is_terminal and not state.has_fills:
+            self.logger.debug(f"[ORDER] [MAKER-OPEN] Ordre {order_id} {state.status} sans exécution")
+            if retry < max_retries:
+                new_price = self.retry_handler.compute_join_quote_price(symbol, side, category, price)
+                return OrderResult(success=False, error_message=f"REPLACE:{new_price}")
+            return OrderResult(
+                success=False,
+                order_id=order_id,
+                price=price,
+                offset_percent=offset_percent,
+                liquidity_level=liquidity_level,
+                retry_count=retry,
+                error_message=state.status.upper()
+            )
 
-        # Vérifier si l'ordre est toujours en attente
         was_cancelled = False
 
-        if self._is_order_still_pending(order_id, symbol, category):
+        if pending:
             wait_time = time.time() - start_wait
             self.logger.debug(f"[ORDER] [MAKER-OPEN] Refresh pending après {wait_time:.1f}s")
 
@@ -757,8 +877,15 @@ class SmartOrderPlacer:
             except Exception as e:
                 self.logger.warning(f"[ORDER] ⚠️ [MAKER-OPEN] Erreur annulation {order_id}: {e}")
 
+            # L'ordre a pu être exécuté entre la fin de l'attente et l'annulation
+            if tracker is not None:
+                state = tracker.wait_for_terminal(order_id, CANCEL_CONFIRM_TIMEOUT)
+                if state is not None and state.is_filled:
+                    was_cancelled = False
+                    pending = False
+
             # Si on peut encore retry, proposer un remplacement au prix join-quote
-            if retry < max_retries:
+            if pending and retry < max_retries:
                 # Récupérer un nouveau carnet d'ordres
                 orderbook = self.orderbook_manager.get_cached_orderbook(symbol, category)
                 if orderbook:
@@ -783,7 +910,8 @@ class SmartOrderPlacer:
                 error_message="CANCELLED"
             )
 
-        if self._is_order_still_pending(order_id, symbol, category):
+        still_pending = (not state.is_terminal) if state is not None else self._is_order_still_pending(order_id, symbol, category)
+        if still_pending:
             self.logger.warning(f"[ORDER] ⚠️ [MAKER-OPEN] Ordre {order_id} toujours en attente après {execution_time:.1f}s")
             return OrderResult(
                 success=False,
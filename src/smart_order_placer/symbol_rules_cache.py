@@ -3,6 +3,10 @@ Symbol Rules Cache - Gestion du cache des règles de précision.
 
 Ce module gère le cache des règles de précision (qty_step, min_qty, min_notional, tick_size)
 pour éviter les appels API répétés.
+
+Avec un WarmStartCache, les règles chargées depuis l'API sont persistées
+(espaces de noms "tick_size" et "quantity_rules") et rechargées en une
+requête au démarrage suivant, tant que leur TTL n'est pas écoulé.
 """
 
 import logging
@@ -12,11 +16,35 @@ from typing import Dict, Any, Optional, Tuple
 class SymbolRulesCache:
     """Gère le cache des règles de précision pour les symboles."""
 
-    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None):
+    def __init__(self, bybit_client, logger: Optional[logging.Logger] = None, warm_cache=None):
         self.bybit_client = bybit_client
         self.logger = logger or logging.getLogger(__name__)
+        self.warm_cache = warm_cache
         self._symbol_precision_cache: Dict[Tuple[str, str], float] = {}
         self._symbol_qty_cache: Dict[str, Dict[str, Any]] = {}
+        if warm_cache is not None:
+            self._preload_from_warm_cache()
+
+    def _preload_from_warm_cache(self) -> None:
+        """Recharge les règles persistées encore valides (clé "symbole|catégorie")."""
+        try:
+            for key, entry in self.warm_cache.get_many("tick_size").items():
+                symbol, _, category = key.partition("|")
+                self._symbol_precision_cache[(symbol, category)] = float(entry.value)
+            for key, entry in self.warm_cache.get_many("quantity_rules").items():
+                symbol, _, category = key.partition("|")
+                self._symbol_qty_cache[f"{symbol}_{category}"] = dict(entry.value)
+            if self._symbol_precision_cache or self._symbol_qty_cache:
+                self.logger.debug(
+                    f"[CACHE] ⚡ Règles restaurées: {len(self._symbol_precision_cache)} tick size, "
+                    f"{len(self._symbol_qty_cache)} règles de quantité"
+                )
+        except Exception as e:
+            self.logger.warning(f"[CACHE] ⚠️ Erreur restauration règles persistées: {e}")
+
+    def _persist(self, namespace: str, symbol: str, category: str, value: Any) -> None:
+        if self.warm_cache is not None:
+            self.warm_cache.put(namespace, f"{symbol}|{category}", value)
 
     def get_tick_size(self, symbol: str, category: str) -> float:
         """
@@ -56,6 +84,7 @@ class SymbolRulesCache:
                 price_filter = symbol_info.get('priceFilter', {})
                 tick_size = float(price_filter.get('tickSize', '0.00001'))
                 self._symbol_precision_cache[cache_key] = tick_size
+                self._persist("tick_size", symbol, category, tick_size)
             else:
                 # Fallback pour les symboles non trouvés
                 self._symbol_precision_cache[cache_key] = 0.00001
@@ -144,6 +173,8 @@ class SymbolRulesCache:
                 'min_notional': float(min_notional),
                 'quantity_precision': quantity_precision,
             }
+            if info_list:
+                self._persist("quantity_rules", symbol, category, self._symbol_qty_cache[cache_key])
         except Exception as e:
             self.logger.warning(f"[CACHE] ⚠️ Erreur chargement règles quantité {symbol}: {e}")
             self._symbol_qty_cache[f"{symbol}_{category}"] = {
@@ -158,4 +189,5 @@ class SymbolRulesCache:
         cache_key = f"{symbol}_{category}"
         if cache_key in self._symbol_qty_cache:
             self._symbol_qty_cache[cache_key]['min_notional'] = min_notional
+            self._persist("quantity_rules", symbol, category, self._symbol_qty_cache[cache_key])
 
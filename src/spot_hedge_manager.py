@@ -11,13 +11,26 @@ Fonctionnalités :
 - Ordres limit PostOnly pour frais maker
 - Gestion des erreurs et retry logic
 - Tracking des hedges actifs
+- Pipeline de hedge : prix / disponibilité spot / règles / soldes préparés
+  avant le funding (prepare_hedge), jambe spot lancée dès le fill perp
+  (fire_hedge) en parallèle de la confirmation de la position, latences
+  par étape et fenêtre d'exposition non couverte mesurées
 """
 
 import asyncio
 import time
 import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, NamedTuple
 from collections import namedtuple
+from account_state import AccountStateCache
+from config.constants import (
+    BALANCE_UPDATE_WAIT_SECONDS,
+    HEDGE_ABORT_WAIT_SECONDS,
+    HEDGE_PLAN_MAX_AGE_SECONDS,
+)
+from enhanced_metrics import record_hedge_latency
 from logging_setup import setup_logging
 from order_monitor import OrderMonitor
 from smart_order_placer import SmartOrderPlacer
@@ -36,6 +49,25 @@ HedgeInfo = namedtuple('HedgeInfo', [
 ])
 
 
+@dataclass(frozen=True)
+class HedgePlan:
+    """
+    Données de la jambe spot préparées avant le funding.
+
+    Attributes:
+        symbol: Symbole spot
+        spot_price: Dernier prix spot
+        prepared_at: Horodatage de préparation (horloge monotone)
+    """
+
+    symbol: str
+    spot_price: float
+    prepared_at: float = field(default_factory=time.monotonic)
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() - self.prepared_at <= HEDGE_PLAN_MAX_AGE_SECONDS
+
+
 class SpotHedgeManager(SpotHedgeManagerInterface):
     """
     Gestionnaire de hedging spot automatique.
@@ -66,6 +98,10 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         self.bybit_client = bybit_client
         self.auto_trading_config = auto_trading_config
         self.spot_checker = spot_checker
+        # Client REST asynchrone optionnel (prix spot sans run_in_thread)
+        self.async_client = None
+        # Soldes du compte (remplacé par le cache partagé alimenté par la WS wallet)
+        self.account_state = AccountStateCache(bybit_client, testnet=testnet, logger=self.logger)
 
         # Configuration du hedging spot
         self.spot_hedge_config = auto_trading_config.get('spot_hedge', {})
@@ -73,6 +109,11 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
 
         # Tracking des hedges actifs
         self._active_hedges: Dict[str, HedgeInfo] = {}
+        # Pipeline : plans préparés, hedges en cours, dernières latences mesurées
+        self._hedge_plans: Dict[str, HedgePlan] = {}
+        self._hedging: set = set()
+        self._inflight: Dict[str, Future] = {}
+        self._last_latencies: Dict[str, Dict[str, float]] = {}
 
         # Thread safety
         self._lock = threading.Lock()
@@ -109,6 +150,104 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         else:
             self.logger.info("ℹ️ SpotHedgeManager initialisé (hedging désactivé)")
 
+    async def prepare_hedge(self, symbol: str) -> Optional[HedgePlan]:
+        """
+        Prépare la jambe spot d'un symbole avant le funding.
+
+        Disponibilité spot, prix, règles de quantité / tick et soldes sont
+        récupérés en parallèle ; le hedge déclenché au fill perp n'a plus
+        qu'à calculer la quantité et placer l'ordre.
+
+        Args:
+            symbol: Symbole de la watchlist (ex: "BTCUSDT")
+
+        Returns:
+            HedgePlan (None si le hedge est impossible)
+        """
+        if not self.enabled or not self.smart_placer:
+            return None
+        with self._lock:
+            plan = self._hedge_plans.get(symbol)
+        if plan is not None and plan.is_fresh():
+            return plan
+
+        available, price, *_ = await asyncio.gather(
+            self._check_spot_availability(symbol),
+            self._get_current_spot_price_async(symbol),
+            run_in_thread(self.smart_placer.rules_cache.get_quantity_rules, symbol, "spot"),
+            run_in_thread(self.smart_placer.rules_cache.get_tick_size, symbol, "spot"),
+            self._get_available_balance("USDT"),
+            return_exceptions=True,
+        )
+        if available is not True or not isinstance(price, float) or not price:
+            with self._lock:
+                self._hedge_plans.pop(symbol, None)
+            return None
+
+        plan = HedgePlan(symbol=symbol, spot_price=price)
+        with self._lock:
+            self._hedge_plans[symbol] = plan
+        self.logger.debug(f"🧰 [SPOT_HEDGE] Hedge préparé pour {symbol} (prix spot={price:.6f})")
+        return plan
+
+    def fire_hedge(
+        self,
+        symbol: str,
+        position_data: Dict[str, Any],
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Future:
+        """
+        Lance la jambe spot sans attendre (appelable depuis n'importe quel thread).
+
+        Args:
+            symbol: Symbole de la position perp
+            position_data: Données de la position perp ("filled_at" = fill perp, horloge monotone)
+            loop: Event loop qui exécute le hedge (sinon thread dédié)
+
+        Returns:
+            concurrent.futures.Future résolue à la fin du hedge
+        """
+        coro = self.on_perp_position_opened(symbol, position_data)
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(coro, loop)
+        else:
+            future = Future()
+
+            def _runner():
+                try:
+                    future.set_result(asyncio.run(coro))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            threading.Thread(target=_runner, daemon=True, name=f"spot_hedge_{symbol}").start()
+        with self._lock:
+            self._inflight[symbol] = future
+        future.add_done_callback(lambda done: self._forget_inflight(symbol, done))
+        return future
+
+    def _forget_inflight(self, symbol: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(symbol) is future:
+                del self._inflight[symbol]
+
+    def abort_hedge(self, symbol: str) -> None:
+        """
+        Annule le hedge d'une position perp non confirmée.
+
+        Attend la fin de la jambe spot en cours puis ferme le hedge placé.
+
+        Args:
+            symbol: Symbole de la position perp
+        """
+        with self._lock:
+            future = self._inflight.pop(symbol, None)
+        if future is not None:
+            try:
+                future.result(timeout=HEDGE_ABORT_WAIT_SECONDS)
+            except Exception as e:
+                self.logger.warning(f"⚠️ [SPOT_HEDGE] Jambe spot {symbol} non terminée avant annulation: {e}")
+        self.on_perp_position_closed(symbol, {"symbol": symbol, "reason": "perp_not_confirmed"})
+
     async def on_perp_position_opened(self, symbol: str, position_data: Dict[str, Any]) -> None:
         """
         Appelé quand une position perp est ouverte - place le hedge spot.
@@ -125,13 +264,18 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
             self.logger.error(f"❌ [SPOT_HEDGE] smart_placer non disponible - hedge impossible pour {symbol}")
             return
 
+        # Un seul hedge par position (fill perp du scheduler puis événement WebSocket)
+        with self._lock:
+            if symbol in self._hedging or symbol in self._active_hedges:
+                self.logger.debug(f"ℹ️ [SPOT_HEDGE] Hedge déjà en cours pour {symbol}")
+                return
+            self._hedging.add(symbol)
+
+        started_at = time.monotonic()
+        filled_at = position_data.get("filled_at") or started_at
         try:
             self.logger.info(f"🔄 [SPOT_HEDGE] Position perp ouverte détectée: {symbol}")
 
-            # Vérifier disponibilité spot
-            if not await self._check_spot_availability(symbol):
-                return
-
             # Extraire et valider les données de position perp
             perp_data = await self._extract_perp_position_data(symbol, position_data)
             if not perp_data:
@@ -141,8 +285,18 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
             spot_side = "Sell" if perp_side == "Buy" else "Buy"
             spot_symbol = symbol  # Même symbole, category différente
 
-            # Récupérer le prix actuel du marché spot
-            current_price = await self._get_current_spot_price_async(spot_symbol)
+            # Prix et disponibilité spot : plan préparé avant le funding, sinon en parallèle
+            with self._lock:
+                plan = self._hedge_plans.pop(symbol, None)
+            if plan is not None and plan.is_fresh():
+                current_price = plan.spot_price
+            else:
+                available, current_price = await asyncio.gather(
+                    self._check_spot_availability(symbol),
+                    self._get_current_spot_price_async(spot_symbol),
+                )
+                if not available:
+                    return
             if not current_price:
                 return
 
@@ -168,6 +322,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
                 return
 
             # Placer l'ordre spot
+            submitted_at = time.monotonic()
             success = await run_in_thread(
                 self._place_spot_hedge_order,
                 symbol=spot_symbol,
@@ -180,6 +335,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
             )
 
             if success:
+                self._record_latencies(symbol, filled_at, started_at, submitted_at, time.monotonic())
                 self.logger.info(f"✅ [SPOT_HEDGE] Hedge placé avec succès pour {symbol}")
                 self.logger.info("Hedge exécuté")
             else:
@@ -187,6 +343,31 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
 
         except Exception as e:
             self.logger.error(f"❌ [SPOT_HEDGE] Erreur hedge {symbol}: {e}")
+        finally:
+            with self._lock:
+                self._hedging.discard(symbol)
+
+    def _record_latencies(
+        self, symbol: str, filled_at: float, started_at: float, submitted_at: float, done_at: float
+    ) -> None:
+        """Enregistre les latences par étape et la fenêtre d'exposition non couverte."""
+        legs_ms = {
+            "dispatch": (started_at - filled_at) * 1000,
+            "prepare": (submitted_at - started_at) * 1000,
+            "spot_leg": (done_at - submitted_at) * 1000,
+        }
+        unhedged_ms = (done_at - filled_at) * 1000
+        with self._lock:
+            self._last_latencies[symbol] = {**legs_ms, "unhedged": unhedged_ms}
+        self.logger.info(
+            f"⏱️ [SPOT_HEDGE] {symbol} exposition non couverte={unhedged_ms:.0f}ms "
+            f"(dispatch={legs_ms['dispatch']:.0f}ms, préparation={legs_ms['prepare']:.0f}ms, "
+            f"jambe spot={legs_ms['spot_leg']:.0f}ms)"
+        )
+        try:
+            record_hedge_latency(symbol, legs_ms, unhedged_ms)
+        except Exception as e:
+            self.logger.debug(f"[SPOT_HEDGE] Métriques de latence ignorées: {e}")
 
     async def _check_spot_availability(self, symbol: str) -> bool:
         """
@@ -242,6 +423,45 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
 
         return (perp_side, perp_size, perp_size_float, perp_price)
 
+    def set_async_client(self, async_client) -> None:
+        """
+        Branche le client REST asynchrone (prix spot, annulations).
+
+        Args:
+            async_client: AsyncBybitClient partagé
+        """
+        self.async_client = async_client
+        self.order_monitor.set_async_client(async_client)
+
+    def set_account_state(self, account_state: AccountStateCache) -> None:
+        """
+        Branche le cache de soldes partagé (topic privé wallet).
+
+        Args:
+            account_state: AccountStateCache démarré par le bot
+        """
+        self.account_state = account_state
+
+    async def _get_available_balance(self, coin: str) -> float:
+        """Solde disponible d'un coin : mémoire si fiable, sinon REST dans un thread."""
+        available = self.account_state.get_available(coin)
+        if available is not None:
+            return available
+        return await run_in_thread(self.account_state.fetch_available, coin)
+
+    async def _fetch_spot_price_async(self, symbol: str) -> Optional[float]:
+        """Dernier prix spot via le client asynchrone (None si indisponible)."""
+        try:
+            ticker_data = await self.async_client.get_tickers(symbol=symbol, category="spot")
+            if ticker_data and ticker_data.get("list"):
+                last_price = ticker_data["list"][0].get("lastPrice")
+                if last_price:
+                    return float(last_price)
+            return None
+        except Exception as e:
+            self.logger.error(f"❌ [SPOT_HEDGE] Erreur récupération prix spot {symbol}: {e}")
+            return None
+
     async def _get_current_spot_price_async(self, symbol: str) -> Optional[float]:
         """
         Récupère le prix actuel du marché spot de manière asynchrone.
@@ -252,8 +472,11 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         Returns:
             Prix actuel ou None si erreur
         """
-        self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : _get_current_spot_price()")
-        current_price = await run_in_thread(self._get_current_spot_price, symbol)
+        if self.async_client:
+            current_price = await self._fetch_spot_price_async(symbol)
+        else:
+            self.logger.debug("[ASYNC] Bybit REST call exécuté dans un thread : _get_current_spot_price()")
+            current_price = await run_in_thread(self._get_current_spot_price, symbol)
         if not current_price:
             self.logger.error(f"❌ [SPOT_HEDGE] Impossible de récupérer le prix spot pour {symbol}")
             return None
@@ -349,7 +572,9 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         """
         if spot_side == "Sell":
             # Vérifier si on a déjà les tokens en spot
-            available_spot_balance = await run_in_thread(self._get_spot_balance, symbol)
+            base_coin = self._base_coin(symbol)
+            available_spot_balance = await self._get_available_balance(base_coin)
+            balance_version = self.account_state.version(base_coin)
             spot_size_float = float(spot_size)
             
             if available_spot_balance < spot_size_float:
@@ -382,11 +607,20 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
                 
                 self.logger.info(f"✅ [SPOT_HEDGE] Tokens spot achetés pour hedge {symbol}")
                 
-                # Attendre un court délai pour que les tokens soient disponibles
-                await asyncio.sleep(1.0)
-                
+                # Attendre la mise à jour du solde poussée par la WS wallet (au lieu d'un délai fixe)
+                updated = await run_in_thread(
+                    self.account_state.wait_for_update,
+                    base_coin,
+                    balance_version,
+                    BALANCE_UPDATE_WAIT_SECONDS,
+                )
+
                 # Vérifier à nouveau le solde après l'achat
-                new_spot_balance = await run_in_thread(self._get_spot_balance, symbol)
+                if updated:
+                    new_spot_balance = self.account_state.get_balance(base_coin).available
+                else:
+                    await run_in_thread(self.account_state.refresh)
+                    new_spot_balance = await self._get_available_balance(base_coin)
                 self.logger.info(
                     f"🔍 [SPOT_HEDGE] Solde spot après achat {symbol}: {new_spot_balance:.6f}"
                 )
@@ -417,7 +651,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
                 )
         else:
             # Pour acheter en spot (hedge d'une position perp Sell), vérifier USDT
-            available_usdt = await run_in_thread(self._get_usdt_spot_balance)
+            available_usdt = await self._get_available_balance("USDT")
             required_usdt = float(spot_size) * current_price
             
             if available_usdt < required_usdt:
@@ -874,6 +1108,11 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
             self.logger.error(f"❌ [SPOT_HEDGE] Erreur récupération prix spot {symbol}: {e}")
             return None
 
+    @staticmethod
+    def _base_coin(symbol: str) -> str:
+        """Coin de base d'un symbole spot (ex: "MMT" pour "MMTUSDT")."""
+        return symbol.replace("USDT", "").replace("USDC", "").replace("BTC", "").replace("ETH", "")
+
     def _get_spot_balance(self, symbol: str) -> float:
         """
         Récupère le solde spot disponible pour un symbole.
@@ -884,58 +1123,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         Returns:
             Solde disponible en float (0.0 si erreur ou non disponible)
         """
-        try:
-            # Extraire le coin de base (ex: "MMT" de "MMTUSDT")
-            base_coin = symbol.replace("USDT", "").replace("USDC", "").replace("BTC", "").replace("ETH", "")
-            
-            # Essayer d'abord avec SPOT, puis fallback sur UNIFIED si erreur
-            try:
-                balance_response = self.bybit_client.get_wallet_balance(account_type="SPOT")
-                # Vérifier si la réponse contient une erreur
-                ret_code = balance_response.get("retCode", 0) if balance_response else 0
-                ret_msg = balance_response.get("retMsg", "") if balance_response else ""
-                
-                if ret_code != 0 and ("only support UNIFIED" in str(ret_msg) or ret_code == 10001):
-                    raise RuntimeError(f"accountType only support UNIFIED")  # Forcer le fallback
-                    
-            except RuntimeError as e:
-                # Si erreur "only support UNIFIED", utiliser UNIFIED
-                error_msg = str(e)
-                if "only support UNIFIED" in error_msg or "retCode=10001" in error_msg or "10001" in error_msg:
-                    self.logger.debug(f"🔄 [SPOT_HEDGE] SPOT non supporté, utilisation UNIFIED pour {symbol}")
-                    balance_response = self.bybit_client.get_wallet_balance(account_type="UNIFIED")
-                else:
-                    # Autre erreur, propager
-                    raise
-            
-            if not balance_response or balance_response.get("retCode") != 0:
-                self.logger.warning(f"⚠️ [SPOT_HEDGE] Impossible de récupérer le solde pour {symbol}")
-                return 0.0
-            
-            # Extraire le solde de la coin de base
-            result = balance_response.get("result", {})
-            account_list = result.get("list", []) if result else balance_response.get("list", [])
-            if not account_list:
-                return 0.0
-            
-            account = account_list[0]
-            coins = account.get("coin", [])
-            
-            for coin in coins:
-                if coin.get("coin") == base_coin:
-                    available_balance = coin.get("availableToWithdraw", "0")
-                    wallet_balance = coin.get("walletBalance", "0")
-                    balance_str = available_balance if available_balance and float(available_balance) > 0 else wallet_balance
-                    try:
-                        return float(balance_str)
-                    except (ValueError, TypeError):
-                        return 0.0
-            
-            return 0.0
-            
-        except Exception as e:
-            self.logger.warning(f"⚠️ [SPOT_HEDGE] Erreur récupération solde spot {symbol}: {e}")
-            return 0.0
+        return self.account_state.fetch_available(self._base_coin(symbol))
 
     def _get_usdt_spot_balance(self) -> float:
         """
@@ -944,54 +1132,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
         Returns:
             Solde USDT disponible en float (0.0 si erreur)
         """
-        try:
-            # Essayer d'abord avec SPOT, puis fallback sur UNIFIED si erreur
-            try:
-                balance_response = self.bybit_client.get_wallet_balance(account_type="SPOT")
-                # Vérifier si la réponse contient une erreur
-                ret_code = balance_response.get("retCode", 0) if balance_response else 0
-                ret_msg = balance_response.get("retMsg", "") if balance_response else ""
-                
-                if ret_code != 0 and ("only support UNIFIED" in str(ret_msg) or ret_code == 10001):
-                    raise RuntimeError(f"accountType only support UNIFIED")  # Forcer le fallback
-                    
-            except RuntimeError as e:
-                # Si erreur "only support UNIFIED", utiliser UNIFIED
-                error_msg = str(e)
-                if "only support UNIFIED" in error_msg or "retCode=10001" in error_msg or "10001" in error_msg:
-                    self.logger.debug(f"🔄 [SPOT_HEDGE] SPOT non supporté, utilisation UNIFIED pour USDT")
-                    balance_response = self.bybit_client.get_wallet_balance(account_type="UNIFIED")
-                else:
-                    # Autre erreur, propager
-                    raise
-            
-            if not balance_response or balance_response.get("retCode") != 0:
-                self.logger.warning(f"⚠️ [SPOT_HEDGE] Impossible de récupérer le solde USDT")
-                return 0.0
-            
-            result = balance_response.get("result", {})
-            account_list = result.get("list", []) if result else balance_response.get("list", [])
-            if not account_list:
-                return 0.0
-            
-            account = account_list[0]
-            coins = account.get("coin", [])
-            
-            for coin in coins:
-                if coin.get("coin") == "USDT":
-                    available_balance = coin.get("availableToWithdraw", "0")
-                    wallet_balance = coin.get("walletBalance", "0")
-                    balance_str = available_balance if available_balance and float(available_balance) > 0 else wallet_balance
-                    try:
-                        return float(balance_str)
-                    except (ValueError, TypeError):
-                        return 0.0
-            
-            return 0.0
-            
-        except Exception as e:
-            self.logger.warning(f"⚠️ [SPOT_HEDGE] Erreur récupération solde USDT spot: {e}")
-            return 0.0
+        return self.account_state.fetch_available("USDT")
 
     def _buy_spot_tokens_for_hedge(
         self,
@@ -1100,6 +1241,7 @@ class SpotHedgeManager(SpotHedgeManagerInterface):
                 "enabled": self.enabled,
                 "active_hedges_count": len(self._active_hedges),
                 "active_hedges": list(self._active_hedges.keys()),
+                "last_latencies_ms": dict(self._last_latencies),
                 "config": {
                     "offset_percent": self.offset_percent * 100,
                     "timeout_minutes": self.timeout_minutes,
@@ -6,14 +6,25 @@ Cette classe gère uniquement :
 - La récupération des données de spread
 - Le traitement des données de spread
 - La gestion des erreurs spécifiques aux spreads
+
+Résolution des spreads, de la source la moins chère à la plus chère :
+1. Instantané marché du cycle (MarketSnapshot : tickers déjà récupérés
+   par le funding, sinon une seule requête paginée partagée)
+2. Bid/ask temps réel de la WebSocket publique (DataStorage)
+3. Requêtes ticker unitaires asynchrones, en concurrence bornée
 """
 
+import asyncio
+import threading
+import time
 from typing import Dict, List, Any, Optional
+
+import httpx
 from logging_setup import setup_logging
-from pagination_handler import PaginationHandler
 from error_handler import ErrorHandler
-from http_utils import get_rate_limiter
-from http_client_manager import get_http_client
+from market_snapshot import MarketSnapshot, get_market_snapshot
+from rate_limit_service import GROUP_MARKET, get_rate_limit_service
+from config.constants import LIVE_QUOTE_MAX_AGE_SECONDS, SPREAD_FALLBACK_CONCURRENCY
 
 
 class SpreadFetcher:
@@ -26,16 +37,27 @@ class SpreadFetcher:
     - Gestion des erreurs spécifiques aux spreads
     """
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, market_snapshot: Optional[MarketSnapshot] = None):
         """
         Initialise le gestionnaire de spreads.
 
         Args:
             logger: Logger pour les messages (optionnel)
+            market_snapshot: Instantané marché (instance partagée par défaut)
         """
         self.logger = logger or setup_logging()
-        self._pagination_handler = PaginationHandler(logger)
         self._error_handler = ErrorHandler(logger)
+        self._market_snapshot = market_snapshot or get_market_snapshot()
+        self._live_quote_source = None
+
+    def set_live_quote_source(self, data_storage) -> None:
+        """
+        Définit la source des bid/ask temps réel (DataStorage alimenté par la WS).
+
+        Args:
+            data_storage: Objet exposant get_realtime_data(symbol)
+        """
+        self._live_quote_source = data_storage
 
     def fetch_spread_data(
         self,
@@ -45,7 +67,7 @@ class SpreadFetcher:
         category: str = "linear",
     ) -> Dict[str, float]:
         """
-        Récupère les spreads via /v5/market/tickers paginé, puis filtre localement.
+        Récupère les spreads depuis l'instantané marché, puis complète les manquants.
 
         Args:
             base_url: URL de base de l'API Bybit
@@ -61,10 +83,13 @@ class SpreadFetcher:
                 f"📊 Récupération spreads pour {len(symbols)} symboles ({category})..."
             )
 
-            # Récupération paginée des spreads
-            found = self._fetch_spreads_paginated(base_url, symbols, timeout, category)
+            # Instantané marché du cycle (partagé avec le funding)
+            found = self._spreads_from_snapshot(base_url, symbols, timeout, category)
 
-            # Fallback unitaire pour les symboles manquants
+            # Bid/ask temps réel de la WebSocket pour les symboles manquants
+            self._fill_spreads_from_live_quotes(symbols, found)
+
+            # Dernier recours : requêtes unitaires en concurrence bornée
             self._fetch_missing_spreads(base_url, symbols, found, timeout, category)
 
             self.logger.info(f"✅ Spreads récupérés: {len(found)}/{len(symbols)} symboles")
@@ -74,11 +99,14 @@ class SpreadFetcher:
             self._error_handler.log_error(e, f"fetch_spread_data category={category}")
             raise
 
-    def _fetch_spreads_paginated(
+    def _spreads_from_snapshot(
         self, base_url: str, symbols: List[str], timeout: int, category: str
     ) -> Dict[str, float]:
         """
-        Récupère les spreads via pagination de l'API.
+        Récupère les spreads depuis les bid/ask de l'instantané marché.
+
+        La catégorie n'est récupérée (une requête paginée, partagée avec les
+        demandeurs concurrents) que si aucun composant ne l'a fait pendant le cycle.
 
         Args:
             base_url: URL de base de l'API Bybit
@@ -89,48 +117,63 @@ class SpreadFetcher:
         Returns:
             Dictionnaire {symbol: spread_pct}
         """
-        wanted = set(symbols)
-        found: Dict[str, float] = {}
-
-        # Paramètres de base pour la pagination
-        params = {"category": category, "limit": 1000}
-
         try:
-            # Récupérer toutes les données via pagination
-            all_tickers = self._pagination_handler.fetch_paginated_data(
-                base_url, "/v5/market/tickers", params, timeout
-            )
-
-            # Traiter les tickers pour extraire les spreads
-            self._process_tickers_for_spreads(all_tickers, wanted, found)
-
+            quotes = self._market_snapshot.get_quotes(base_url, category, timeout)
         except Exception as e:
-            self._error_handler.log_error(e, f"_fetch_spreads_paginated category={category}")
+            self._error_handler.log_error(e, f"_spreads_from_snapshot category={category}")
             raise
 
+        found: Dict[str, float] = {}
+        for symbol in symbols:
+            quote = quotes.get(symbol)
+            if quote is not None:
+                spread_pct = self._spread_from_quote(*quote)
+                if spread_pct is not None:
+                    found[symbol] = spread_pct
         return found
 
-    def _process_tickers_for_spreads(
-        self, tickers: List[Dict[str, Any]], wanted: set, found: Dict[str, float]
-    ):
+    def _fill_spreads_from_live_quotes(self, symbols: List[str], found: Dict[str, float]):
         """
-        Traite les tickers pour extraire les spreads.
+        Complète les spreads manquants avec les bid/ask temps réel de la WebSocket.
 
         Args:
-            tickers: Liste des tickers reçus de l'API
-            wanted: Set des symboles recherchés
-            found: Dictionnaire des spreads trouvés
+            symbols: Liste des symboles
+            found: Dictionnaire des spreads trouvés (complété en place)
         """
-        for ticker in tickers:
+        if self._live_quote_source is None:
+            return
+        now = time.time()
+        filled = 0
+        for symbol in symbols:
+            if symbol in found:
+                continue
             try:
-                symbol = ticker.get("symbol")
-                if symbol in wanted:
-                    spread_pct = self._calculate_spread_from_ticker(ticker)
-                    if spread_pct is not None:
-                        found[symbol] = spread_pct
-            except Exception as e:
-                self.logger.warning(f"⚠️ Erreur traitement ticker spread: {e}")
+                row = self._live_quote_source.get_realtime_data(symbol)
+            except Exception:
+                continue
+            if not row or now - (row.get("timestamp") or 0) > LIVE_QUOTE_MAX_AGE_SECONDS:
                 continue
+            spread_pct = self._spread_from_quote(row.get("bid1_price"), row.get("ask1_price"))
+            if spread_pct is not None:
+                found[symbol] = spread_pct
+                filled += 1
+        if filled:
+            self.logger.debug(f"📡 {filled} spread(s) complété(s) par les prix WebSocket")
+
+    def _spread_from_quote(self, bid: Any, ask: Any) -> Optional[float]:
+        """
+        Calcule le spread relatif (ask - bid) / mid.
+
+        Returns:
+            Spread en pourcentage ou None si les prix sont invalides
+        """
+        try:
+            bid, ask = float(bid), float(ask)
+        except (TypeError, ValueError):
+            return None
+        if bid <= 0 or ask <= 0:
+            return None
+        return (ask - bid) / ((ask + bid) / 2)
 
     def _calculate_spread_from_ticker(self, ticker: Dict[str, Any]) -> Optional[float]:
         """
@@ -179,7 +222,10 @@ class SpreadFetcher:
         category: str,
     ):
         """
-        Récupère les spreads manquants via des requêtes unitaires.
+        Récupère les spreads encore manquants via des requêtes unitaires asynchrones.
+
+        Les requêtes partent en parallèle (SPREAD_FALLBACK_CONCURRENCY au plus)
+        sous le rate limiter partagé.
 
         Args:
             base_url: URL de base de l'API Bybit
@@ -195,25 +241,74 @@ class SpreadFetcher:
 
         self.logger.debug(f"🔍 Récupération spreads manquants: {len(missing)} symboles")
 
-        for symbol in missing:
+        results = self._run_coroutine(
+            self._fetch_spreads_async(base_url, missing, timeout, category)
+        )
+        for symbol, spread in results.items():
+            if spread is not None:
+                found[symbol] = spread
+
+    def _run_coroutine(self, coroutine):
+        """Exécute une coroutine depuis le code synchrone (thread dédié si un loop tourne)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # Appel depuis un event loop : ne pas l'imbriquer (PERF-002)
+        outcome: Dict[str, Any] = {}
+
+        def _runner():
             try:
-                spread = self._fetch_single_spread(base_url, symbol, timeout, category)
-                if spread is not None:
-                    found[symbol] = spread
+                outcome["result"] = asyncio.run(coroutine)
             except Exception as e:
-                self.logger.debug(f"⚠️ Erreur spread unitaire pour {symbol}: {e}")
-                continue
+                outcome["error"] = e
+
+        thread = threading.Thread(target=_runner, daemon=True, name="spread_fallback")
+        thread.start()
+        thread.join()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    async def _fetch_spreads_async(
+        self, base_url: str, symbols: List[str], timeout: int, category: str
+    ) -> Dict[str, Optional[float]]:
+        """
+        Récupère les spreads de plusieurs symboles en concurrence bornée.
 
-    def _fetch_single_spread(
-        self, base_url: str, symbol: str, timeout: int, category: str
+        Args:
+            base_url: URL de base de l'API Bybit
+            symbols: Symboles à récupérer
+            timeout: Timeout HTTP
+            category: Catégorie des instruments
+
+        Returns:
+            Dict {symbol: spread_pct ou None}
+        """
+        semaphore = asyncio.Semaphore(SPREAD_FALLBACK_CONCURRENCY)
+
+        async with httpx.AsyncClient(timeout=timeout) as client:
+
+            async def _bounded(symbol: str) -> Optional[float]:
+                async with semaphore:
+                    return await self._fetch_single_spread_async(
+                        client, base_url, symbol, category
+                    )
+
+            spreads = await asyncio.gather(*(_bounded(symbol) for symbol in symbols))
+        return dict(zip(symbols, spreads))
+
+    async def _fetch_single_spread_async(
+        self, client: httpx.AsyncClient, base_url: str, symbol: str, category: str
     ) -> Optional[float]:
         """
         Récupère le spread pour un seul symbole.
 
         Args:
+            client: Client HTTP asynchrone
             base_url: URL de base de l'API Bybit
             symbol: Symbole à récupérer
-            timeout: Timeout HTTP
             category: Catégorie des instruments
 
         Returns:
@@ -223,10 +318,8 @@ class SpreadFetcher:
             url = f"{base_url}/v5/market/tickers"
             params = {"category": category, "symbol": symbol}
 
-            rate_limiter = get_rate_limiter()
-            rate_limiter.acquire()
-            client = get_http_client(timeout=timeout)
-            response = client.get(url, params=params)
+            await get_rate_limit_service().acquire_async(GROUP_MARKET)
+            response = await client.get(url, params=params)
 
             if response.status_code >= 400:
                 self._error_handler.handle_http_error(url, params, response, f"symbol={symbol}")
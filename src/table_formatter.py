@@ -9,9 +9,9 @@ Ce module contient la classe TableFormatter responsable de :
 - Formatage des valeurs (funding, volume, spread, volatilité)
 """
 
-import time
 from typing import Dict, Optional, Any, Callable
-from datetime import datetime
+
+from funding_time import format_remaining
 
 
 class TableFormatter:
@@ -299,67 +299,21 @@ class TableFormatter:
     def _get_funding_time_value(
         self, symbol: str, realtime_info: Optional[Dict], data_manager
     ) -> str:
-        """Récupère la valeur de temps de funding."""
+        """Récupère la valeur de temps de funding (formatée à l'affichage)."""
         # Priorité aux données temps réel
         if realtime_info and realtime_info.get("next_funding_time"):
-            next_funding = realtime_info["next_funding_time"]
-            return self._calculate_funding_time_remaining(next_funding)
+            return format_remaining(realtime_info["next_funding_time"])
 
         # Fallback aux données originales
         original_data = data_manager.storage.get_original_funding_data(symbol)
         if original_data:
-            return self._calculate_funding_time_remaining(original_data)
-
-        return "-"
+            return format_remaining(original_data)
 
-    def _calculate_funding_time_remaining(self, next_funding_time) -> str:
-        """
-        Calcule le temps restant avant le funding.
-
-        Args:
-            next_funding_time: Timestamp du prochain funding
+        funding_data_obj = data_manager.storage.get_funding_data_object(symbol)
+        if funding_data_obj:
+            return format_remaining(funding_data_obj.next_funding_time)
 
-        Returns:
-            Temps restant formaté ou "-"
-        """
-        try:
-            # Convertir le timestamp en secondes si nécessaire
-            if isinstance(next_funding_time, str):
-                # Format ISO ou timestamp
-                if "T" in next_funding_time:
-                    # Format ISO
-                    dt = datetime.fromisoformat(
-                        next_funding_time.replace("Z", "+00:00")
-                    )
-                    funding_ts = dt.timestamp()
-                else:
-                    # Timestamp en millisecondes
-                    funding_ts = float(next_funding_time) / 1000
-            else:
-                # Déjà un timestamp
-                funding_ts = float(next_funding_time)
-
-            # Calculer le temps restant
-            now_ts = time.time()
-            remaining_seconds = funding_ts - now_ts
-
-            if remaining_seconds <= 0:
-                return "0s"
-
-            # Formater en heures, minutes, secondes
-            hours = int(remaining_seconds // 3600)
-            minutes = int((remaining_seconds % 3600) // 60)
-            seconds = int(remaining_seconds % 60)
-
-            if hours > 0:
-                return f"{hours}h {minutes}m"
-            elif minutes > 0:
-                return f"{minutes}m {seconds}s"
-            else:
-                return f"{seconds}s"
-
-        except Exception:
-            return "-"
+        return "-"
 
     def are_all_data_available(self, funding_data: Dict, data_manager) -> bool:
         """
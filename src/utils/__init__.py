@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Utilitaires partagés du bot Bybit."""
 
-from .executors import GLOBAL_EXECUTOR
+from .executors import GLOBAL_EXECUTOR, PREFETCH_EXECUTOR
 from .async_wrappers import run_in_thread
 from .validators import (
     validate_string_param,
@@ -13,6 +13,7 @@ from .validators import (
 
 __all__ = [
     "GLOBAL_EXECUTOR",
+    "PREFETCH_EXECUTOR",
     "run_in_thread",
     "validate_string_param",
     "validate_dict_param",
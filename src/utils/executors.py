@@ -7,3 +7,7 @@ from concurrent.futures import ThreadPoolExecutor
 # ✅ Instance unique : tous les modules doivent réutiliser ce même pool
 GLOBAL_EXECUTOR = ThreadPoolExecutor(max_workers=8)
 
+# Pool réservé aux requêtes de préchargement de pages (pagination_handler).
+# Ses tâches sont des feuilles (une requête HTTP, aucune attente d'autre tâche) :
+# une tâche de GLOBAL_EXECUTOR peut donc les attendre sans risque d'interblocage.
+PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="page_prefetch")
@@ -7,6 +7,15 @@ Ce module gère le calcul et le filtrage de la volatilité :
 - Filtrage des symboles par volatilité
 - Gestion du rate limiting pour les requêtes API
 
+Les bougies sont conservées par symbole dans un KlineStore (fenêtre
+glissante, max/min en O(1)). Un symbole dont la fenêtre est alimentée en
+temps réel par le WebSocket (kline.1.{symbol}) n'entraîne aucun appel REST ;
+pour les autres, seules les bougies manquantes sont rechargées.
+
+Toutes les mesures (range, realized, parkinson, atr) sont calculées sur
+plusieurs fenêtres pour l'ensemble des symboles en une seule passe
+vectorisée (voir volatility_kernels).
+
 Cette version fusionnée élimine la duplication entre VolatilityCalculator
 et VolatilityComputer.
 """
@@ -22,6 +31,12 @@ from bybit_client import BybitPublicClient
 from async_rate_limiter import get_async_rate_limiter
 from volatility_filter import VolatilityFilter
 from instruments import category_of_symbol
+from kline_window import KlineStore, VOLATILITY_WINDOW_CANDLES
+from volatility_kernels import (
+    DEFAULT_VOLATILITY_MEASURE,
+    DEFAULT_VOLATILITY_WINDOWS,
+    parse_measure_key,
+)
 from config.timeouts import TimeoutConfig, ConcurrencyConfig
 from enhanced_metrics import monitor_task_performance
 from parallel_api_manager import get_parallel_manager, ParallelConfig, ExecutionMode
@@ -61,8 +76,11 @@ class VolatilityCalculator:
     Cette classe gère le calcul de volatilité basé sur les klines (bougies)
     et le filtrage des symboles selon leurs critères de volatilité.
 
-    La volatilité est calculée sur les 5 dernières bougies de 1 minute
-    comme : (prix_max - prix_min) / prix_median
+    Par défaut, la volatilité est calculée sur les 5 dernières bougies de
+    1 minute comme : (prix_max - prix_min) / prix_median (mesure "range_5").
+    Une autre mesure de volatility_kernels peut être retenue pour les
+    filtres (set_volatility_measure) ; toutes restent disponibles via
+    compute_volatility_measures.
     """
 
     def __init__(self, testnet: bool = True, timeout: int = 10, logger=None):
@@ -90,6 +108,55 @@ class VolatilityCalculator:
         # Gestionnaire de parallélisation optimisé
         self._parallel_manager = get_parallel_manager()
 
+        # Fenêtres des mesures (en bougies) et mesure retenue pour les filtres
+        self.volatility_windows = DEFAULT_VOLATILITY_WINDOWS
+        self.volatility_measure = DEFAULT_VOLATILITY_MEASURE
+
+        # Fenêtres de bougies par symbole (remplacé par le registre WS via set_kline_store)
+        self.kline_store = KlineStore(history=max(self.volatility_windows))
+
+    def set_kline_store(self, kline_store: KlineStore):
+        """
+        Utilise les fenêtres de bougies alimentées par le WebSocket public.
+
+        Args:
+            kline_store: Registre partagé avec les connexions WebSocket
+        """
+        kline_store.set_history(max(self.volatility_windows))
+        self.kline_store = kline_store
+
+    def set_volatility_windows(self, windows: List[int]):
+        """
+        Définit les fenêtres (en bougies de 1 minute) des mesures calculées.
+
+        Les fenêtres de 5 bougies (suivi temps réel) et de la mesure
+        retenue sont toujours incluses.
+
+        Args:
+            windows: Fenêtres souhaitées (ex: [5, 15, 60])
+        """
+        valid = {int(w) for w in windows or () if int(w) >= 2}
+        valid.add(VOLATILITY_WINDOW_CANDLES)
+        valid.add(parse_measure_key(self.volatility_measure)[1])
+        self.volatility_windows = tuple(sorted(valid))
+        self.kline_store.set_history(max(self.volatility_windows))
+
+    def set_volatility_measure(self, measure: str):
+        """
+        Choisit la mesure utilisée comme volatilité (filtres, cache, affichage).
+
+        Args:
+            measure: Clé "{mesure}_{fenêtre}" (ex: "range_5", "parkinson_15")
+
+        Raises:
+            ValueError: Si la clé ne correspond à aucune mesure connue
+        """
+        parsed = parse_measure_key(measure)
+        if parsed is None:
+            raise ValueError(f"Mesure de volatilité inconnue: {measure}")
+        self.volatility_measure = measure
+        self.set_volatility_windows(self.volatility_windows + (parsed[1],))
+
     def set_symbol_categories(self, symbol_categories: Dict[str, str]):
         """
         Définit le mapping des catégories de symboles.
@@ -99,7 +166,6 @@ class VolatilityCalculator:
         """
         self._symbol_categories = symbol_categories
 
-    @monitor_task_performance("volatility_batch_calculation", threshold=2.0)
     async def compute_volatility_batch(
         self, symbols: List[str]
     ) -> Dict[str, Optional[float]]:
@@ -110,11 +176,56 @@ class VolatilityCalculator:
             symbols: Liste des symboles
 
         Returns:
-            Dictionnaire {symbol: volatility_pct} ou None si erreur
+            Dictionnaire {symbol: volatility_pct} (mesure retenue) ou
+            None si erreur
+        """
+        measures = await self.compute_volatility_measures(symbols)
+        return {
+            symbol: (values or {}).get(self.volatility_measure)
+            for symbol, values in measures.items()
+        }
+
+    @monitor_task_performance("volatility_batch_calculation", threshold=2.0)
+    async def compute_volatility_measures(
+        self, symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Optional[float]]]]:
+        """
+        Calcule toutes les mesures de volatilité d'une liste de symboles.
+
+        Args:
+            symbols: Liste des symboles
+
+        Returns:
+            Dictionnaire {symbol: {"range_5": ..., "realized_15": ..., ...}}
+            ou None si les bougies n'ont pas pu être obtenues
         """
         if not symbols:
             return {}
 
+        # Historique temps réel (WebSocket) : aucun appel REST
+        history = max(self.volatility_windows)
+        pending = [
+            symbol for symbol in symbols
+            if not self.kline_store.is_live(symbol, count=history)
+        ]
+        failed = await self._refresh_klines(pending) if pending else set()
+
+        # Une seule passe vectorisée pour tous les symboles et toutes les fenêtres
+        measures = self.kline_store.get_measures(symbols, self.volatility_windows)
+        for symbol in failed:
+            measures[symbol] = None
+        return measures
+
+    async def _refresh_klines(self, symbols: List[str]) -> set:
+        """
+        Complète les bougies des symboles par REST (bougies manquantes seulement).
+
+        Args:
+            symbols: Symboles dont l'historique n'est pas temps réel
+
+        Returns:
+            Ensemble des symboles en échec
+        """
         # Initialiser le client si nécessaire
         if not self._client:
             try:
@@ -126,17 +237,17 @@ class VolatilityCalculator:
                     f"⚠️ Impossible d'initialiser le client pour la "
                     f"volatilité: {e}"
                 )
-                return {symbol: None for symbol in symbols}
+                return set(symbols)
 
         # Obtenir l'URL de base
         base_url = self._client.public_base_url()
 
-        # Calculer la volatilité pour tous les symboles
         try:
-            return await self._compute_batch(base_url, symbols)
+            results = await self._compute_batch(base_url, symbols)
         except Exception as e:
             self.logger.error(f"⚠️ Erreur calcul volatilité batch: {e}")
-            return {symbol: None for symbol in symbols}
+            return set(symbols)
+        return {symbol for symbol, vol_pct in results.items() if vol_pct is None}
 
     async def _compute_batch(
         self, base_url: str, symbols: List[str]
@@ -199,13 +310,15 @@ class VolatilityCalculator:
             Volatilité en pourcentage ou None si erreur
         """
         try:
-            # Récupérer les données klines
-            klines = await self._fetch_klines(session, base_url, symbol)
+            # Ne charger que les bougies manquantes depuis la dernière mise à jour
+            limit = self.kline_store.missing_candles(symbol)
+            klines = await self._fetch_klines(session, base_url, symbol, limit)
             if not klines:
                 return None
 
-            # Calculer la volatilité à partir des klines
-            return self._calculate_volatility(klines)
+            # Mettre à jour la fenêtre et en lire la volatilité (O(1))
+            self.kline_store.apply_rest(symbol, klines)
+            return self.kline_store.get_volatility(symbol)
 
         except Exception as e:
             self.logger.error(
@@ -215,7 +328,11 @@ class VolatilityCalculator:
             return None
 
     async def _fetch_klines(
-        self, session: aiohttp.ClientSession, base_url: str, symbol: str
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        symbol: str,
+        limit: int = VOLATILITY_WINDOW_CANDLES + 1,
     ) -> Optional[List]:
         """
         Récupère les klines (bougies) pour un symbole.
@@ -224,6 +341,8 @@ class VolatilityCalculator:
             session: Session HTTP asynchrone
             base_url: URL de base de l'API
             symbol: Symbole à récupérer
+            limit: Nombre de bougies (6 = 5 minutes + 1 de sécurité ;
+                moins lorsque la fenêtre locale n'a besoin que des dernières)
 
         Returns:
             Liste des klines ou None si erreur
@@ -238,7 +357,7 @@ class VolatilityCalculator:
                 "category": category,
                 "symbol": symbol,
                 "interval": "1",  # 1 minute
-                "limit": 6,  # 6 bougies pour avoir 5 minutes + 1 de sécurité
+                "limit": limit,
             }
 
             # Faire la requête HTTP asynchrone
@@ -269,7 +388,7 @@ class VolatilityCalculator:
                 klines = result.get("list", [])
 
                 # Vérifier qu'on a assez de données
-                if len(klines) < 5:
+                if len(klines) < min(limit, VOLATILITY_WINDOW_CANDLES):
                     return None
 
                 return klines
@@ -345,18 +464,18 @@ class VolatilityCalculator:
 
         Args:
             symbols_data: Liste des (symbol, funding, volume,
-                funding_time_remaining, spread_pct)
+                next_funding_time, spread_pct)
             volatility_min: Volatilité minimum ou None
             volatility_max: Volatilité maximum ou None
 
         Returns:
-            Liste des (symbol, funding, volume, funding_time_remaining,
+            Liste des (symbol, funding, volume, next_funding_time,
                 spread_pct, volatility_pct)
         """
         # Extraire les symboles
         symbols = [symbol for symbol, _, _, _, _ in symbols_data]
 
-        # Calculer les volatilités
+        # Calculer les volatilités (mesure retenue par set_volatility_measure)
         volatilities = await self.compute_volatility_batch(symbols)
 
         # Appliquer les filtres
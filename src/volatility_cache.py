@@ -6,6 +6,15 @@ Cette classe gère uniquement :
 - Le stockage temporaire avec TTL (time-to-live)
 - Les opérations CRUD sur le cache
 - Le nettoyage automatique du cache
+
+En plus de la volatilité retenue (une valeur par symbole), le cache
+conserve toutes les mesures calculées lors du même cycle (range,
+realized, parkinson, atr sur chaque fenêtre) : un filtre peut ainsi
+choisir sa mesure sans nouvel appel.
+
+Avec un WarmStartCache branché, chaque cycle est aussi écrit sur disque
+(espace de noms "volatility") et restauré au démarrage suivant tant que
+son TTL n'est pas écoulé.
 """
 
 import time
@@ -42,6 +51,12 @@ class VolatilityCache:
         # Cache de volatilité {cache_key: (timestamp, volatility_pct)}
         self.volatility_cache: Dict[str, Tuple[float, float]] = {}
 
+        # Toutes les mesures du dernier cycle {symbol: (timestamp, {mesure: valeur})}
+        self.volatility_measures: Dict[str, Tuple[float, Dict[str, Optional[float]]]] = {}
+
+        # Persistance optionnelle pour le démarrage à chaud
+        self._warm_cache = None
+
         # Nettoyage automatique
         self._last_cleanup = time.time()
         self._cleanup_interval = 60  # Nettoyer toutes les minutes
@@ -85,6 +100,82 @@ class VolatilityCache:
         if len(self.volatility_cache) > self.max_cache_size:
             self._cleanup_cache()
 
+    def set_cached_measures(
+        self, symbol: str, measures: Dict[str, Optional[float]], timestamp: Optional[float] = None
+    ):
+        """
+        Met à jour toutes les mesures de volatilité d'un symbole.
+
+        Args:
+            symbol: Symbole
+            measures: {clé de mesure: valeur} (ex: {"range_5": 0.004, ...})
+            timestamp: Timestamp des mesures (maintenant si None)
+        """
+        self.volatility_measures[symbol] = (
+            time.time() if timestamp is None else timestamp,
+            dict(measures),
+        )
+
+    def get_cached_measures(self, symbol: str) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Récupère toutes les mesures en cache pour un symbole.
+
+        Args:
+            symbol: Symbole à rechercher
+
+        Returns:
+            {clé de mesure: valeur} ou None si absent/expiré
+        """
+        cached = self.volatility_measures.get(symbol)
+        if cached and is_cache_valid(cached[0], ttl_seconds=self.ttl_seconds):
+            return cached[1]
+        return None
+
+    def get_cached_measure(self, symbol: str, measure: str) -> Optional[float]:
+        """
+        Récupère une mesure précise en cache (ex: "parkinson_15").
+
+        Args:
+            symbol: Symbole à rechercher
+            measure: Clé de la mesure
+
+        Returns:
+            Valeur de la mesure ou None si absente/expirée
+        """
+        measures = self.get_cached_measures(symbol)
+        return measures.get(measure) if measures else None
+
+    def attach_warm_cache(self, warm_cache) -> int:
+        """
+        Branche un WarmStartCache et restaure les entrées encore valides.
+
+        Les horodatages d'origine sont conservés : une volatilité restaurée
+        expire comme si le bot n'avait pas été redémarré.
+
+        Args:
+            warm_cache: Cache de démarrage à chaud
+
+        Returns:
+            Nombre de symboles restaurés
+        """
+        self._warm_cache = warm_cache
+        restored = 0
+        for symbol, entry in warm_cache.get_many("volatility").items():
+            if not is_cache_valid(entry.stored_at, ttl_seconds=self.ttl_seconds):
+                continue
+            value = entry.value or {}
+            if value.get("volatility") is not None:
+                self.volatility_cache[get_volatility_cache_key(symbol)] = (
+                    entry.stored_at,
+                    value["volatility"],
+                )
+                restored += 1
+            if value.get("measures"):
+                self.volatility_measures[symbol] = (entry.stored_at, value["measures"])
+        if restored:
+            self.logger.info(f"⚡ Volatilité restaurée depuis le cache: {restored} symboles")
+        return restored
+
     def clear_stale_cache(self, active_symbols: List[str]):
         """
         Nettoie le cache des symboles non actifs.
@@ -104,6 +195,8 @@ class VolatilityCache:
 
             for key in stale_keys:
                 self.volatility_cache.pop(key, None)
+            for symbol in [s for s in self.volatility_measures if s not in active_set]:
+                self.volatility_measures.pop(symbol, None)
 
             if stale_keys:
                 self.logger.debug(
@@ -129,6 +222,14 @@ class VolatilityCache:
 
             # Reconstruire le cache
             self.volatility_cache = dict(items_to_keep)
+            if len(self.volatility_measures) > self.max_cache_size:
+                self.volatility_measures = dict(
+                    sorted(
+                        self.volatility_measures.items(),
+                        key=lambda x: x[1][0],
+                        reverse=True,
+                    )[: self.max_cache_size]
+                )
 
             removed_count = len(sorted_items) - len(items_to_keep)
             if removed_count > 0:
@@ -140,7 +241,10 @@ class VolatilityCache:
             self.logger.warning(f"⚠️ Erreur nettoyage cache volatilité: {e}")
 
     def update_cache_with_results(
-        self, results: Dict[str, Optional[float]], timestamp: float
+        self,
+        results: Dict[str, Optional[float]],
+        timestamp: float,
+        measures: Optional[Dict[str, Optional[Dict[str, Optional[float]]]]] = None,
     ) -> Tuple[int, int]:
         """
         Met à jour le cache de volatilité avec les résultats.
@@ -148,6 +252,7 @@ class VolatilityCache:
         Args:
             results: Résultats du calcul de volatilité
             timestamp: Timestamp pour le cache
+            measures: Toutes les mesures par symbole (optionnel)
 
         Returns:
             Tuple (ok_count, fail_count)
@@ -155,6 +260,10 @@ class VolatilityCache:
         ok_count = 0
         fail_count = 0
 
+        for symbol, values in (measures or {}).items():
+            if values:
+                self.set_cached_measures(symbol, values, timestamp)
+
         for symbol, vol_pct in results.items():
             if vol_pct is not None:
                 self.set_cached_volatility(symbol, vol_pct)
@@ -162,6 +271,19 @@ class VolatilityCache:
             else:
                 fail_count += 1
 
+        if self._warm_cache is not None:
+            measures = measures or {}
+            self._warm_cache.put_many(
+                "volatility",
+                {
+                    symbol: {"volatility": vol_pct, "measures": measures.get(symbol)}
+                    for symbol, vol_pct in results.items()
+                    if vol_pct is not None
+                },
+                ttl=self.ttl_seconds,
+                stored_at=timestamp,
+            )
+
         return ok_count, fail_count
 
     def get_cache_stats(self) -> Dict[str, int]:
@@ -185,6 +307,7 @@ class VolatilityCache:
     def clear_all_cache(self):
         """Vide complètement le cache."""
         self.volatility_cache.clear()
+        self.volatility_measures.clear()
         self.logger.debug("🧹 Cache volatilité vidé complètement")
 
     def _auto_cleanup_if_needed(self):
@@ -214,6 +337,9 @@ class VolatilityCache:
             # Supprimer les entrées expirées
             for key in expired_keys:
                 self.volatility_cache.pop(key, None)
+            for symbol, (timestamp, _) in list(self.volatility_measures.items()):
+                if not is_cache_valid(timestamp, self.ttl_seconds):
+                    self.volatility_measures.pop(symbol, None)
 
             if expired_keys:
                 self.logger.debug(
@@ -38,13 +38,13 @@ class VolatilityFilter:
 
         Args:
             symbols_data: Liste des (symbol, funding, volume,
-                funding_time_remaining, spread_pct)
+                next_funding_time, spread_pct)
             volatilities: Dictionnaire {symbol: volatility_pct}
             volatility_min: Seuil minimum de volatilité ou None
             volatility_max: Seuil maximum de volatilité ou None
 
         Returns:
-            Liste filtrée des (symbol, funding, volume, funding_time_remaining,
+            Liste filtrée des (symbol, funding, volume, next_funding_time,
                 spread_pct, volatility_pct)
         """
         filtered_symbols = []
@@ -54,7 +54,7 @@ class VolatilityFilter:
             symbol,
             funding,
             volume,
-            funding_time_remaining,
+            next_funding_time,
             spread_pct,
         ) in symbols_data:
             vol_pct = volatilities.get(symbol)
@@ -72,7 +72,7 @@ class VolatilityFilter:
                     symbol,
                     funding,
                     volume,
-                    funding_time_remaining,
+                    next_funding_time,
                     spread_pct,
                     vol_pct,
                 )
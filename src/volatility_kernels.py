@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Noyaux vectorisés de volatilité sur un lot de symboles.
+
+Les bougies de tous les symboles sont empilées dans des matrices
+(symboles × bougies, de la plus ancienne à la plus récente, NaN pour une
+bougie absente) puis chaque mesure est calculée pour toutes les lignes en
+une seule passe NumPy, sur plusieurs fenêtres :
+- range     : (max(high) - min(low)) / prix_médian (mesure historique du bot)
+- realized  : écart-type des log-rendements close/close précédent
+- parkinson : sqrt(moyenne(ln(high/low)²) / (4 ln 2))
+- atr       : moyenne du true range / dernier close
+
+Les clés produites sont "{mesure}_{fenêtre}" (ex: "range_5", "realized_15").
+Sans NumPy, un calcul ligne par ligne équivalent est utilisé.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy optionnel
+    np = None
+
+# Mesures disponibles et fenêtres (en bougies de 1 minute) calculées par défaut
+VOLATILITY_MEASURES: Tuple[str, ...] = ("range", "realized", "parkinson", "atr")
+DEFAULT_VOLATILITY_WINDOWS: Tuple[int, ...] = (5, 15)
+# Mesure historique : range sur 5 bougies (filtres volatility_min / volatility_max)
+DEFAULT_VOLATILITY_MEASURE = "range_5"
+# Bougies valides minimales dans une fenêtre pour publier une mesure
+MIN_WINDOW_CANDLES = 3
+
+_PARKINSON_FACTOR = 4.0 * math.log(2.0)
+
+
+def measure_key(measure: str, window: int) -> str:
+    """Construit la clé d'une mesure ("range", 5) → "range_5"."""
+    return f"{measure}_{window}"
+
+
+def parse_measure_key(key: str) -> Optional[Tuple[str, int]]:
+    """
+    Décompose une clé de mesure.
+
+    Returns:
+        Tuple (mesure, fenêtre) ou None si la clé est invalide
+    """
+    measure, _, window = str(key).rpartition("_")
+    if measure not in VOLATILITY_MEASURES or not window.isdigit() or int(window) < 2:
+        return None
+    return measure, int(window)
+
+
+def compute_volatility_measures(
+    highs, lows, closes, windows: Iterable[int] = DEFAULT_VOLATILITY_WINDOWS
+) -> Dict[str, List[Optional[float]]]:
+    """
+    Calcule toutes les mesures de volatilité d'un lot de symboles.
+
+    Args:
+        highs: Matrice symboles × bougies des plus hauts (NaN = absente)
+        lows: Matrice des plus bas
+        closes: Matrice des clôtures
+        windows: Fenêtres (en bougies, les plus récentes) à calculer
+
+    Returns:
+        {clé de mesure: valeurs par symbole} (None si données insuffisantes)
+    """
+    windows = tuple(sorted(set(int(w) for w in windows)))
+    if np is None:
+        return _compute_python(highs, lows, closes, windows)
+    return _compute_numpy(
+        np.asarray(highs, dtype=np.float64),
+        np.asarray(lows, dtype=np.float64),
+        np.asarray(closes, dtype=np.float64),
+        windows,
+    )
+
+
+def _compute_numpy(highs, lows, closes, windows) -> Dict[str, List[Optional[float]]]:
+    if highs.ndim != 2 or highs.shape[0] == 0:
+        return {measure_key(m, w): [] for w in windows for m in VOLATILITY_MEASURES}
+
+    rows = highs.shape[0]
+    nan_column = np.full((rows, 1), np.nan)
+    prev_close = np.hstack([nan_column, closes[:, :-1]])
+    last_close = closes[:, -1]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_returns = np.log(closes / prev_close)
+        hl_squared = np.log(highs / lows) ** 2
+        # fmax ignore le NaN : sans close précédent, le true range vaut high - low
+        true_range = np.fmax(
+            highs - lows, np.fmax(np.abs(highs - prev_close), np.abs(lows - prev_close))
+        )
+        valid = ~np.isnan(highs) & ~np.isnan(lows)
+
+        results: Dict[str, List[Optional[float]]] = {}
+        for window in windows:
+            span = slice(-window, None)
+            count = valid[:, span].sum(axis=1)
+            enough = count >= min(MIN_WINDOW_CANDLES, window)
+
+            pmax = np.fmax.reduce(highs[:, span], axis=1)
+            pmin = np.fmin.reduce(lows[:, span], axis=1)
+            pmid = (pmax + pmin) / 2
+            range_vol = np.where(pmid > 0, (pmax - pmin) / pmid, np.nan)
+
+            # Rendements internes à la fenêtre (window - 1 rendements)
+            returns = log_returns[:, span][:, 1:]
+            n_returns = (~np.isnan(returns)).sum(axis=1)
+            mean = np.nansum(returns, axis=1) / n_returns
+            variance = np.nansum((returns - mean[:, None]) ** 2, axis=1) / (n_returns - 1)
+            realized = np.where(n_returns >= 2, np.sqrt(variance), np.nan)
+
+            parkinson = np.sqrt(np.nansum(hl_squared[:, span], axis=1) / count / _PARKINSON_FACTOR)
+            atr = np.nansum(true_range[:, span], axis=1) / count / last_close
+
+            for name, values in (
+                ("range", range_vol),
+                ("realized", realized),
+                ("parkinson", parkinson),
+                ("atr", atr),
+            ):
+                values = np.where(enough & np.isfinite(values), values, np.nan)
+                results[measure_key(name, window)] = [
+                    None if math.isnan(v) else float(v) for v in values.tolist()
+                ]
+    return results
+
+
+def _compute_python(highs, lows, closes, windows) -> Dict[str, List[Optional[float]]]:
+    results: Dict[str, List[Optional[float]]] = {
+        measure_key(m, w): [] for w in windows for m in VOLATILITY_MEASURES
+    }
+    for row_high, row_low, row_close in zip(highs, lows, closes):
+        for window in windows:
+            for name, value in _row_measures(row_high, row_low, row_close, window).items():
+                results[measure_key(name, window)].append(value)
+    return results
+
+
+def _row_measures(
+    highs: Sequence[float], lows: Sequence[float], closes: Sequence[float], window: int
+) -> Dict[str, Optional[float]]:
+    start = max(0, len(highs) - window)
+    empty = {name: None for name in VOLATILITY_MEASURES}
+    candles = []
+    for i in range(start, len(highs)):
+        prev = closes[i - 1] if i > 0 else math.nan
+        candles.append((highs[i], lows[i], closes[i], prev))
+    valid = [c for c in candles if not (math.isnan(c[0]) or math.isnan(c[1]))]
+    if len(valid) < min(MIN_WINDOW_CANDLES, window):
+        return empty
+
+    measures: Dict[str, Optional[float]] = dict(empty)
+    pmax = max(c[0] for c in valid)
+    pmin = min(c[1] for c in valid)
+    pmid = (pmax + pmin) / 2
+    if pmid > 0:
+        measures["range"] = (pmax - pmin) / pmid
+
+    returns = [
+        math.log(c[2] / c[3])
+        for c in candles[1:]
+        if c[2] > 0 and c[3] > 0
+    ]
+    if len(returns) >= 2:
+        mean = sum(returns) / len(returns)
+        measures["realized"] = math.sqrt(
+            sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
+        )
+
+    if all(c[1] > 0 for c in valid):
+        measures["parkinson"] = math.sqrt(
+            sum(math.log(c[0] / c[1]) ** 2 for c in valid) / len(valid) / _PARKINSON_FACTOR
+        )
+
+    last_close = closes[-1]
+    if last_close > 0:
+        ranges = []
+        for high, low, _, prev in valid:
+            true_range = high - low
+            if not math.isnan(prev):
+                true_range = max(true_range, abs(high - prev), abs(low - prev))
+            ranges.append(true_range)
+        measures["atr"] = sum(ranges) / len(ranges) / last_close
+    return measures
+
+
+def stack_candles(
+    rows: Sequence[Sequence[Tuple[float, float, float]]], length: int
+) -> Tuple[list, list, list]:
+    """
+    Empile les bougies de plusieurs symboles en matrices alignées à droite.
+
+    Args:
+        rows: Par symbole, bougies (high, low, close) de la plus ancienne à la plus récente
+        length: Nombre de colonnes (bougies les plus récentes conservées)
+
+    Returns:
+        Tuple (highs, lows, closes), complétés à gauche par des NaN
+    """
+    if np is not None:
+        highs = np.full((len(rows), length), np.nan)
+        lows = np.full((len(rows), length), np.nan)
+        closes = np.full((len(rows), length), np.nan)
+        for i, candles in enumerate(rows):
+            candles = candles[-length:]
+            if candles:
+                block = np.asarray(candles, dtype=np.float64)
+                highs[i, length - len(candles):] = block[:, 0]
+                lows[i, length - len(candles):] = block[:, 1]
+                closes[i, length - len(candles):] = block[:, 2]
+        return highs, lows, closes
+
+    highs, lows, closes = [], [], []
+    for candles in rows:
+        candles = list(candles[-length:])
+        pad = [math.nan] * (length - len(candles))
+        highs.append(pad + [c[0] for c in candles])
+        lows.append(pad + [c[1] for c in candles])
+        closes.append(pad + [c[2] for c in candles])
+    return highs, lows, closes
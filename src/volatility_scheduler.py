@@ -206,17 +206,21 @@ class VolatilityScheduler:
         if not self._running:
             return
 
-        # Calculer la volatilité pour tous les symboles
-        results = self._run_async_volatility_batch(symbols)
+        # Calculer toutes les mesures de volatilité pour tous les symboles
+        measures = self._run_async_volatility_measures(symbols)
+        measure = self.calculator.volatility_measure
+        results = {
+            symbol: (values or {}).get(measure) for symbol, values in measures.items()
+        }
 
         # Vérifier si on est toujours en cours d'exécution
         if not self._running:
             return
 
-        # Mettre à jour le cache avec les résultats
+        # Mettre à jour le cache avec les résultats (mesure retenue + toutes les mesures)
         now_ts = time.time()
         ok_count, fail_count = self.cache.update_cache_with_results(
-            results, now_ts
+            results, now_ts, measures
         )
 
         # CORRECTIF : Ne logger que si on tourne encore ET que le logging fonctionne
@@ -262,6 +266,37 @@ class VolatilityScheduler:
         Returns:
             Dictionnaire {symbol: volatility_pct}
         """
+        return self._run_in_thread_loop(
+            self.calculator.compute_volatility_batch, symbols
+        )
+
+    def _run_async_volatility_measures(
+        self, symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Optional[float]]]]:
+        """
+        Calcule toutes les mesures de volatilité sur l'event loop persistant.
+
+        Args:
+            symbols: Liste des symboles
+
+        Returns:
+            Dictionnaire {symbol: {clé de mesure: valeur}}
+        """
+        return self._run_in_thread_loop(
+            self.calculator.compute_volatility_measures, symbols
+        )
+
+    def _run_in_thread_loop(self, compute: Callable, symbols: List[str]) -> Dict:
+        """
+        Exécute un calcul asynchrone par symbole sur l'event loop du thread.
+
+        Args:
+            compute: Coroutine du calculateur (symbols -> {symbol: résultat})
+            symbols: Liste des symboles
+
+        Returns:
+            Résultats par symbole (None pour tous en cas d'erreur)
+        """
         # CORRECTIF : Vérifier si on est en train de s'arrêter
         if not self._running:
             return {symbol: None for symbol in symbols}
@@ -273,9 +308,7 @@ class VolatilityScheduler:
 
         try:
             # OPTIMISATION: Utiliser l'event loop persistant du thread
-            return self._thread_loop.run_until_complete(
-                self.calculator.compute_volatility_batch(symbols)
-            )
+            return self._thread_loop.run_until_complete(compute(symbols))
         except Exception as e:
             # CORRECTIF : Vérifier si c'est une erreur d'arrêt
             if not self._running:
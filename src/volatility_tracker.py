@@ -9,11 +9,14 @@ Cette classe coordonne les différents composants :
 """
 
 from typing import List, Tuple, Dict, Optional, Callable
+from kline_window import KlineStore
+from volatility_kernels import DEFAULT_VOLATILITY_MEASURE
 from logging_setup import setup_logging
 from interfaces.volatility_tracker_interface import VolatilityTrackerInterface
 from volatility import VolatilityCalculator
 from volatility_cache import VolatilityCache
 from volatility_scheduler import VolatilityScheduler
+from warm_start_cache import WarmStartCache
 
 
 class VolatilityTracker(VolatilityTrackerInterface):
@@ -71,6 +74,58 @@ class VolatilityTracker(VolatilityTrackerInterface):
             Callable[[], List[str]]
         ] = None
 
+        # Fenêtres de bougies temps réel (WebSocket), lues avant le cache
+        self._kline_store: Optional[KlineStore] = None
+
+    def set_kline_store(self, kline_store: KlineStore):
+        """
+        Branche les fenêtres de bougies alimentées par le WebSocket public.
+
+        Args:
+            kline_store: Registre partagé avec les connexions WebSocket
+        """
+        self._kline_store = kline_store
+        self.calculator.set_kline_store(kline_store)
+
+    def set_volatility_measure(self, measure: str, windows: Optional[List[int]] = None):
+        """
+        Choisit la mesure de volatilité retenue et les fenêtres calculées.
+
+        Args:
+            measure: Clé "{mesure}_{fenêtre}" (ex: "range_5", "realized_15")
+            windows: Fenêtres supplémentaires à calculer (optionnel)
+
+        Raises:
+            ValueError: Si la mesure est inconnue
+        """
+        self.calculator.set_volatility_measure(measure)
+        if windows:
+            self.calculator.set_volatility_windows(windows)
+
+    def get_cached_measures(self, symbol: str) -> Optional[Dict[str, Optional[float]]]:
+        """
+        Récupère toutes les mesures de volatilité du dernier cycle.
+
+        Args:
+            symbol: Symbole à rechercher
+
+        Returns:
+            {clé de mesure: valeur} ou None si absent/expiré
+        """
+        return self.cache.get_cached_measures(symbol)
+
+    def set_warm_cache(self, warm_cache: WarmStartCache) -> int:
+        """
+        Branche le cache persistant et restaure la volatilité encore valide.
+
+        Args:
+            warm_cache: Cache de démarrage à chaud
+
+        Returns:
+            Nombre de symboles restaurés
+        """
+        return self.cache.attach_warm_cache(warm_cache)
+
     def set_symbol_categories(self, symbol_categories: Dict[str, str]):
         """
         Définit le mapping des catégories de symboles.
@@ -100,7 +155,10 @@ class VolatilityTracker(VolatilityTrackerInterface):
 
     def get_cached_volatility(self, symbol: str) -> Optional[float]:
         """
-        Récupère la volatilité en cache pour un symbole.
+        Récupère la volatilité d'un symbole.
+
+        La fenêtre temps réel (WebSocket) est prioritaire ; à défaut, la
+        valeur du dernier cycle de rafraîchissement est retournée.
 
         Args:
             symbol: Symbole à rechercher
@@ -108,6 +166,14 @@ class VolatilityTracker(VolatilityTrackerInterface):
         Returns:
             Volatilité en pourcentage ou None si absent/expiré
         """
+        # La fenêtre temps réel ne fournit que la mesure historique (range_5)
+        if (
+            self._kline_store is not None
+            and self.calculator.volatility_measure == DEFAULT_VOLATILITY_MEASURE
+        ):
+            live = self._kline_store.get_live_volatility(symbol)
+            if live is not None:
+                return live
         return self.cache.get_cached_volatility(symbol)
 
     def set_cached_volatility(self, symbol: str, volatility_pct: float):
@@ -154,12 +220,12 @@ class VolatilityTracker(VolatilityTrackerInterface):
 
         Args:
             symbols_data: Liste des (symbol, funding, volume,
-                funding_time_remaining, spread_pct)
+                next_funding_time, spread_pct)
             volatility_min: Volatilité minimum ou None
             volatility_max: Volatilité maximum ou None
 
         Returns:
-            Liste des (symbol, funding, volume, funding_time_remaining,
+            Liste des (symbol, funding, volume, next_funding_time,
             spread_pct, volatility_pct)
         """
         return await self.calculator.filter_by_volatility_async(
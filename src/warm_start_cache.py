@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Cache de démarrage à chaud persistant sur disque (SQLite).
+
+À chaque démarrage, le bot rechargeait tout avant de pouvoir construire
+la watchlist : univers des instruments (pagination complète), tickers de
+funding, volatilité et règles de précision par symbole. Ce module conserve
+sur disque le dernier état connu, par espace de noms :
+- instruments     : univers perp/spot (perp_data + symboles spot)
+- tick_size       : tickSize par (catégorie, symbole)
+- quantity_rules  : règles de quantité par (catégorie, symbole)
+- funding         : dernière funding map par catégorie
+- volatility      : dernière volatilité et mesures par symbole
+
+Chaque entrée porte son horodatage et son TTL. Au démarrage, une entrée
+encore valide est servie immédiatement (lecture SQLite de quelques ms) et
+revalidée en arrière-plan ("stale-while-revalidate") ; une entrée expirée
+n'est servie qu'en secours si l'API échoue.
+
+Le schéma est versionné (SCHEMA_VERSION) : un fichier d'une autre version
+est vidé à l'ouverture. Toute erreur SQLite est journalisée et traitée
+comme un cache vide : le cache ne doit jamais empêcher le bot de démarrer.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from logging_setup import setup_logging
+from utils.executors import GLOBAL_EXECUTOR
+
+# Version du schéma (à incrémenter si le format des valeurs change)
+SCHEMA_VERSION = 1
+
+# Emplacement par défaut (surchargé par WARM_CACHE_PATH, "off" pour désactiver)
+DEFAULT_CACHE_PATH = os.path.join("cache_data", "warm_start.sqlite")
+DISABLED_VALUES = frozenset({"", "0", "off", "false", "none"})
+
+# Clés par requête "key IN (...)" (limite SQLite : 999 variables)
+_KEY_BATCH_SIZE = 500
+
+# TTL par défaut de chaque espace de noms (secondes)
+DEFAULT_TTLS: Dict[str, float] = {
+    "instruments": 6 * 3600,
+    "tick_size": 24 * 3600,
+    "quantity_rules": 24 * 3600,
+    "funding": 120,
+    "volatility": 120,
+}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    Entrée lue dans le cache.
+
+    Attributes:
+        value: Valeur désérialisée
+        stored_at: Timestamp d'écriture (time.time())
+        ttl: Durée de validité en secondes
+    """
+
+    value: Any
+    stored_at: float
+    ttl: float
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+    @property
+    def expired(self) -> bool:
+        return self.age > self.ttl
+
+
+class WarmStartCache:
+    """
+    Magasin clé/valeur persistant avec TTL par entrée.
+
+    Thread-safe : une seule connexion SQLite protégée par un verrou
+    (lectures et écritures sont courtes, journal WAL).
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttls: Optional[Mapping[str, float]] = None,
+        logger=None,
+    ):
+        """
+        Ouvre (ou crée) le fichier de cache.
+
+        Args:
+            path: Chemin du fichier SQLite (":memory:" accepté)
+            ttls: TTL par espace de noms (complète DEFAULT_TTLS)
+            logger: Logger pour les messages (optionnel)
+        """
+        self.path = path
+        self.ttls: Dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self.logger = logger or setup_logging()
+        self._lock = threading.Lock()
+        self._revalidating: set = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._open()
+
+    # ===== OUVERTURE / SCHÉMA =====
+
+    def _open(self) -> None:
+        try:
+            self._conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            # Fichier corrompu : repartir d'un cache vide
+            self.logger.warning(f"⚠️ Cache de démarrage illisible ({e}), réinitialisation")
+            self._remove_file()
+            try:
+                self._conn = self._connect()
+            except sqlite3.Error as e2:
+                self.logger.warning(f"⚠️ Cache de démarrage désactivé: {e2}")
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        try:
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != str(SCHEMA_VERSION):
+                conn.execute("DROP TABLE IF EXISTS entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " ttl REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _remove_file(self) -> None:
+        if self.path == ":memory:":
+            return
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except OSError:
+                pass
+
+    @property
+    def available(self) -> bool:
+        return self._conn is not None
+
+    def ttl_for(self, namespace: str) -> float:
+        """TTL par défaut d'un espace de noms (120 s si inconnu)."""
+        return float(self.ttls.get(namespace, 120))
+
+    # ===== ÉCRITURE =====
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        stored_at: Optional[float] = None,
+    ) -> None:
+        """
+        Enregistre une valeur (sérialisable en JSON).
+
+        Args:
+            namespace: Espace de noms
+            key: Clé dans l'espace de noms
+            value: Valeur à persister
+            ttl: Durée de validité (TTL de l'espace de noms si None)
+            stored_at: Horodatage de la valeur (maintenant si None)
+        """
+        self.put_many(namespace, {key: value}, ttl, stored_at)
+
+    def put_many(
+        self,
+        namespace: str,
+        items: Mapping[str, Any],
+        ttl: Optional[float] = None,
+        stored_at: Optional[float] = None,
+    ) -> None:
+        """
+        Enregistre plusieurs valeurs en une transaction.
+
+        Args:
+            namespace: Espace de noms
+            items: {clé: valeur}
+            ttl: Durée de validité (TTL de l'espace de noms si None)
+            stored_at: Horodatage des valeurs (maintenant si None)
+        """
+        if self._conn is None or not items:
+            return
+        ttl = self.ttl_for(namespace) if ttl is None else float(ttl)
+        stored_at = time.time() if stored_at is None else float(stored_at)
+        try:
+            rows = [
+                (namespace, str(key), json.dumps(value, separators=(",", ":")), stored_at, ttl)
+                for key, value in items.items()
+            ]
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO entries (namespace, key, payload, stored_at, ttl)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️ Écriture cache de démarrage échouée ({namespace}): {e}")
+
+    def delete(self, namespace: str, key: Optional[str] = None) -> None:
+        """Supprime une entrée, ou tout l'espace de noms si key est None."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                if key is None:
+                    self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+                else:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Suppression cache de démarrage échouée: {e}")
+
+    def purge_expired(self, grace_seconds: float = 0.0) -> int:
+        """
+        Supprime les entrées expirées depuis plus de grace_seconds.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        if self._conn is None:
+            return 0
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM entries WHERE stored_at + ttl + ? < ?",
+                    (grace_seconds, time.time()),
+                )
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Purge cache de démarrage échouée: {e}")
+            return 0
+
+    # ===== LECTURE =====
+
+    def get(
+        self, namespace: str, key: str, allow_stale: bool = False
+    ) -> Optional[CacheEntry]:
+        """
+        Lit une entrée.
+
+        Args:
+            namespace: Espace de noms
+            key: Clé recherchée
+            allow_stale: Retourner aussi une entrée expirée
+
+        Returns:
+            CacheEntry ou None si absente (ou expirée sans allow_stale)
+        """
+        return self.get_many(namespace, (key,), allow_stale).get(key)
+
+    def get_many(
+        self,
+        namespace: str,
+        keys: Optional[Iterable[str]] = None,
+        allow_stale: bool = False,
+    ) -> Dict[str, CacheEntry]:
+        """
+        Lit plusieurs entrées d'un espace de noms en une requête.
+
+        Args:
+            namespace: Espace de noms
+            keys: Clés recherchées (tout l'espace de noms si None)
+            allow_stale: Retourner aussi les entrées expirées
+
+        Returns:
+            {clé: CacheEntry}
+        """
+        if self._conn is None:
+            return {}
+        query = "SELECT key, payload, stored_at, ttl FROM entries WHERE namespace = ?"
+        params: Tuple = (namespace,)
+        if not allow_stale:
+            query += " AND stored_at + ttl >= ?"
+            params += (time.time(),)
+        # Clés demandées : recherche par clé primaire, par lots de variables SQL
+        if keys is None:
+            batches = [()]
+        else:
+            wanted = list(dict.fromkeys(keys))
+            if not wanted:
+                return {}
+            batches = [
+                tuple(wanted[i:i + _KEY_BATCH_SIZE])
+                for i in range(0, len(wanted), _KEY_BATCH_SIZE)
+            ]
+        rows = []
+        try:
+            with self._lock:
+                for batch in batches:
+                    batch_query = query
+                    if batch:
+                        batch_query += f" AND key IN ({', '.join('?' * len(batch))})"
+                    rows.extend(self._conn.execute(batch_query, params + batch).fetchall())
+        except sqlite3.Error as e:
+            self.logger.warning(f"⚠️ Lecture cache de démarrage échouée ({namespace}): {e}")
+            return {}
+
+        entries: Dict[str, CacheEntry] = {}
+        for key, payload, stored_at, ttl in rows:
+            try:
+                entries[key] = CacheEntry(json.loads(payload), stored_at, ttl)
+            except ValueError:
+                continue
+        return entries
+
+    # ===== STALE-WHILE-REVALIDATE =====
+
+    def get_or_fetch(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[], Any],
+        ttl: Optional[float] = None,
+        on_refresh: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """
+        Sert une entrée valide et la revalide en arrière-plan, sinon charge.
+
+        Args:
+            namespace: Espace de noms
+            key: Clé de l'entrée
+            fetch: Chargement depuis l'API (appelé sans argument)
+            ttl: Durée de validité (TTL de l'espace de noms si None)
+            on_refresh: Appelé avec la valeur fraîche après revalidation
+
+        Returns:
+            Valeur en cache (si valide) ou fraîchement chargée
+
+        Raises:
+            Exception: Erreur de fetch si aucune entrée, même expirée, n'existe
+        """
+        entry = self.get(namespace, key, allow_stale=True)
+        if entry is not None and not entry.expired:
+            self.logger.info(
+                f"⚡ Démarrage à chaud: {namespace} chargé depuis le cache "
+                f"(âge {entry.age:.0f}s), revalidation en arrière-plan"
+            )
+            self.revalidate(namespace, key, fetch, ttl, on_refresh)
+            return entry.value
+
+        try:
+            value = fetch()
+        except Exception as e:
+            if entry is None:
+                raise
+            self.logger.warning(
+                f"⚠️ {namespace}: API indisponible ({e}), "
+                f"données en cache périmées utilisées (âge {entry.age:.0f}s)"
+            )
+            return entry.value
+        self.put(namespace, key, value, ttl)
+        return value
+
+    def revalidate(
+        self,
+        namespace: str,
+        key: str,
+        fetch: Callable[[], Any],
+        ttl: Optional[float] = None,
+        on_refresh: Optional[Callable[[Any], None]] = None,
+    ) -> bool:
+        """
+        Recharge une entrée en arrière-plan (une seule revalidation par clé).
+
+        Returns:
+            True si une revalidation a été lancée
+        """
+        slot = (namespace, key)
+        with self._lock:
+            if slot in self._revalidating:
+                return False
+            self._revalidating.add(slot)
+
+        def _run():
+            try:
+                value = fetch()
+                self.put(namespace, key, value, ttl)
+                if on_refresh is not None:
+                    on_refresh(value)
+                self.logger.debug(f"🔄 Cache de démarrage revalidé: {namespace}/{key}")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Revalidation {namespace} échouée: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(slot)
+
+        GLOBAL_EXECUTOR.submit(_run)
+        return True
+
+    def close(self) -> None:
+        """Ferme la connexion SQLite."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Instance globale (configurée au démarrage du bot)
+_global_cache: Optional[WarmStartCache] = None
+
+
+def configure_warm_start_cache(
+    path: Optional[str] = None, logger=None
+) -> Optional[WarmStartCache]:
+    """
+    Ouvre le cache global de démarrage à chaud (idempotent).
+
+    Args:
+        path: Chemin du fichier (WARM_CACHE_PATH ou DEFAULT_CACHE_PATH si None) ;
+            "off" désactive le cache
+        logger: Logger pour les messages (optionnel)
+
+    Returns:
+        Instance globale ou None si le cache est désactivé/indisponible
+    """
+    global _global_cache
+    if _global_cache is not None:
+        return _global_cache
+    if path is None:
+        path = os.getenv("WARM_CACHE_PATH", DEFAULT_CACHE_PATH)
+    if path.strip().lower() in DISABLED_VALUES:
+        return None
+    cache = WarmStartCache(path, logger=logger)
+    if not cache.available:
+        return None
+    cache.purge_expired(grace_seconds=7 * 24 * 3600)
+    _global_cache = cache
+    return cache
+
+
+def get_warm_start_cache() -> Optional[WarmStartCache]:
+    """
+    Retourne le cache global de démarrage à chaud.
+
+    Returns:
+        Instance configurée ou None (cache non configuré ou désactivé)
+    """
+    return _global_cache
@@ -7,11 +7,13 @@ en extrayant les responsabilités de bas niveau :
 - WatchlistDataPreparer : Préparation des données
 - WatchlistFilterApplier : Application des filtres
 - WatchlistResultBuilder : Construction des résultats
+- IncrementalWatchlistRanker : Verdicts et poids conservés entre les scans
 """
 
 from .data_preparer import WatchlistDataPreparer
 from .filter_applier import WatchlistFilterApplier
 from .result_builder import WatchlistResultBuilder
+from .incremental_ranker import IncrementalWatchlistRanker
 from .weight_calculator import WeightCalculator
 
 __all__ = [
@@ -19,4 +21,5 @@ __all__ = [
     "WatchlistFilterApplier",
     "WatchlistResultBuilder",
     "WeightCalculator",
+    "IncrementalWatchlistRanker",
 ]
@@ -7,7 +7,9 @@ du WatchlistManager pour améliorer la lisibilité.
 """
 
 from typing import Dict, Tuple
+from funding_time import funding_epoch_ms
 from logging_setup import setup_logging
+from warm_start_cache import get_warm_start_cache
 
 
 class WatchlistDataPreparer:
@@ -33,6 +35,8 @@ class WatchlistDataPreparer:
         self.market_data_fetcher = market_data_fetcher
         self.logger = logger or setup_logging()
         self.original_funding_data = {}
+        # Seul le premier chargement (démarrage) peut être servi par le cache disque
+        self._warm_start_pending = True
 
     def extract_config_parameters(self, config: Dict) -> Dict:
         """
@@ -68,6 +72,10 @@ class WatchlistDataPreparer:
         """
         Récupère les données de funding selon la catégorie.
 
+        Au premier appel, une funding map persistée encore valide est
+        servie immédiatement et revalidée en arrière-plan ; les appels
+        suivants interrogent l'API et mettent à jour le cache disque.
+
         Args:
             base_url: URL de base de l'API Bybit
             categorie: Catégorie (linear, inverse, both)
@@ -75,6 +83,27 @@ class WatchlistDataPreparer:
         Returns:
             Données de funding récupérées
         """
+        warm_cache = get_warm_start_cache()
+        if warm_cache is None:
+            return self._fetch_funding_from_api(base_url, categorie)
+
+        key = f"{base_url}|{categorie}"
+        if self._warm_start_pending:
+            self._warm_start_pending = False
+            return warm_cache.get_or_fetch(
+                "funding",
+                key,
+                lambda: self._fetch_funding_from_api(base_url, categorie),
+            )
+
+        funding_map = self._fetch_funding_from_api(base_url, categorie)
+        warm_cache.put("funding", key, funding_map)
+        return funding_map
+
+    def _fetch_funding_from_api(
+        self, base_url: str, categorie: str
+    ) -> Dict[str, Dict]:
+        """Récupère la funding map depuis l'API selon la catégorie."""
         if categorie == "linear":
             return self.market_data_fetcher.fetcher.fetch_funding_map(
                 base_url, "linear", 10
@@ -130,7 +159,7 @@ class WatchlistDataPreparer:
         self.original_funding_data = {}
         for symbol, data in funding_map.items():
             try:
-                next_funding_time = data.get("next_funding_time")
+                next_funding_time = funding_epoch_ms(data.get("next_funding_time"))
                 if next_funding_time:
                     self.original_funding_data[symbol] = next_funding_time
             except Exception:
@@ -9,6 +9,8 @@ du WatchlistManager pour améliorer la lisibilité.
 from typing import List, Tuple, Dict, Optional
 from logging_setup import setup_logging
 from instruments import category_of_symbol
+from score_expression import ScoreExpressionError
+from .incremental_ranker import IncrementalWatchlistRanker
 from .weight_calculator import WeightCalculator
 
 
@@ -40,6 +42,10 @@ class WatchlistFilterApplier:
         self.symbol_categories = symbol_categories
         self.logger = logger or setup_logging()
         self.weight_calculator = WeightCalculator(logger=self.logger)
+        # Verdicts et poids conservés d'un scan à l'autre
+        self.ranker = IncrementalWatchlistRanker(
+            self.weight_calculator, logger=self.logger
+        )
 
     def apply_funding_volume_time_filters(
         self, perp_data: Dict, funding_map: Dict, config_params: Dict
@@ -47,6 +53,9 @@ class WatchlistFilterApplier:
         """
         Applique les filtres de funding, volume et temps.
 
+        Seuls les symboles dont les entrées ont changé depuis le scan
+        précédent (ou dont la fenêtre temporelle a basculé) sont réévalués.
+
         Args:
             perp_data: Données des perpétuels
             funding_map: Données de funding
@@ -55,19 +64,15 @@ class WatchlistFilterApplier:
         Returns:
             Tuple (symboles filtrés, nombre de symboles)
         """
-        filtered_symbols = self.symbol_filter.filter_by_funding(
-            perp_data,
-            funding_map,
-            config_params["funding_min"],
-            config_params["funding_max"],
-            config_params["volume_min_millions"],
-            config_params["limite"],
-            funding_time_min_minutes=config_params[
-                "funding_time_min_minutes"
-            ],
-            funding_time_max_minutes=config_params[
-                "funding_time_max_minutes"
-            ],
+        if self.ranker.configure(config_params):
+            self.logger.debug("🔄 Verdicts de watchlist réinitialisés (configuration)")
+        evaluated = self.ranker.update(
+            perp_data["linear"] + perp_data["inverse"], funding_map
+        )
+        filtered_symbols = self.ranker.head(config_params["limite"])
+        self.logger.debug(
+            f"🔍 Watchlist incrémentale: {evaluated} symboles réévalués, "
+            f"{len(filtered_symbols)} retenus"
         )
         return filtered_symbols, len(filtered_symbols)
 
@@ -91,8 +96,8 @@ class WatchlistFilterApplier:
         if spread_max is None or not filtered_symbols:
             # Pas de filtre de spread, ajouter 0.0 par défaut
             return [
-                (symbol, funding, volume, funding_time_remaining, 0.0)
-                for symbol, funding, volume, funding_time_remaining in (
+                (symbol, funding, volume, next_funding_time, 0.0)
+                for symbol, funding, volume, next_funding_time in (
                     filtered_symbols
                 )
             ]
@@ -143,8 +148,8 @@ class WatchlistFilterApplier:
             )
             # Continuer sans le filtre de spread
             return [
-                (symbol, funding, volume, funding_time_remaining, 0.0)
-                for symbol, funding, volume, funding_time_remaining in (
+                (symbol, funding, volume, next_funding_time, 0.0)
+                for symbol, funding, volume, next_funding_time in (
                     filtered_symbols
                 )
             ]
@@ -242,26 +247,21 @@ class WatchlistFilterApplier:
             return final_symbols, len(final_symbols) if final_symbols else 0
 
         try:
-            # Appliquer le système de poids complet
-            weighted_opportunities = self.weight_calculator.process_weighted_ranking(
-                final_symbols, weights_config, self.symbol_categories
-            )
-
-            # Convertir les dictionnaires en tuples pour maintenir la compatibilité
+            # Poids en cache par symbole, top N extrait sans tri complet ;
+            # weights.formula est compilée une fois et évaluée sur tout le lot
             # Format: (symbol, funding, volume, funding_time, spread, volatility, weight)
-            weighted_tuples = []
-            for opp in weighted_opportunities:
-                weighted_tuple = (
-                    opp['symbol'],
-                    opp['funding'],
-                    opp['volume'],
-                    opp['funding_time'],
-                    opp['spread'],
-                    opp['volatility'],
-                    opp['weight']
+            try:
+                weighted_tuples = self.ranker.rank(
+                    final_symbols, weights_config, self.symbol_categories
+                )
+            except ScoreExpressionError as e:
+                self.logger.warning(
+                    f"⚠️ weights.formula invalide ({e}), formule par défaut utilisée"
+                )
+                weights_config = {k: v for k, v in weights_config.items() if k != "formula"}
+                weighted_tuples = self.ranker.rank(
+                    final_symbols, weights_config, self.symbol_categories
                 )
-                weighted_tuples.append(weighted_tuple)
-
             return weighted_tuples, len(weighted_tuples)
 
         except Exception as e:
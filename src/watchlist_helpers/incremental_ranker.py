@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Classement incrémental de la watchlist.
+
+Conserve d'un scan à l'autre, par symbole, les entrées du filtre de base
+(funding, volume, heure de funding), son verdict et le poids calculé.
+Seuls les symboles dont les entrées ont changé depuis le scan précédent
+sont réévalués :
+- le verdict funding/volume/fenêtre temporelle est recalculé au changement
+  des entrées ; la fenêtre temporelle dépend de l'heure courante, ses
+  bascules (entrée / sortie de fenêtre) sont planifiées dans un tas
+- les symboles éligibles restent triés par |funding| décroissant dans une
+  liste ordonnée (bisect), d'où la sélection des `limite` premiers
+- le poids est mis en cache par symbole, recalculé seulement si funding,
+  volume, spread ou volatilité changent (sauf formule dépendant de
+  l'heure, weights.formula avec "minutes") ; le top N est extrait par heapq
+
+Le coût d'un scan suit donc le nombre de symboles modifiés et non plus la
+taille de l'univers. Un changement de configuration (bornes ou poids)
+invalide l'état correspondant.
+"""
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from funding_time import funding_epoch_ms, now_ms
+from logging_setup import setup_logging
+
+# Paramètres dont un changement invalide les verdicts mémorisés
+_BASE_PARAMS = (
+    "funding_min",
+    "funding_max",
+    "volume_min_millions",
+    "funding_time_min_minutes",
+    "funding_time_max_minutes",
+)
+
+
+class IncrementalWatchlistRanker:
+    """
+    Verdicts et poids par symbole, maintenus entre les scans.
+
+    Remplace, pour le pipeline de WatchlistFilterApplier, le filtrage
+    funding/volume/temps complet (SymbolFilter.filter_by_funding) et le
+    recalcul complet des poids (WeightCalculator.process_weighted_ranking).
+    """
+
+    def __init__(self, weight_calculator, logger=None):
+        """
+        Initialise le classement incrémental.
+
+        Args:
+            weight_calculator: Instance de WeightCalculator
+            logger: Logger pour les messages (optionnel)
+        """
+        self.weight_calculator = weight_calculator
+        self.logger = logger or setup_logging()
+        self._params: Optional[Tuple] = None
+        self._weights_config: Optional[Dict] = None
+        # {symbole: (funding, volume, next_funding_time epoch ms)}
+        self._inputs: Dict[str, Tuple[float, float, Optional[int]]] = {}
+        self._eligible: Dict[str, Tuple[float, str]] = {}
+        # Clés (-|funding|, symbole) des symboles éligibles, triées
+        self._ranked: List[Tuple[float, str]] = []
+        # Bascules de fenêtre temporelle : (epoch ms, seq, symbole, génération)
+        self._transitions: List[Tuple[int, int, str, int]] = []
+        self._generation: Dict[str, int] = {}
+        self._seq = 0
+        # {symbole: ((funding, volume, spread, volatilité), poids)}
+        self._weights: Dict[str, Tuple[Tuple, float]] = {}
+        self.last_evaluated = 0
+        self.last_rescored = 0
+
+    # ===== CONFIGURATION =====
+
+    def configure(self, config_params: Mapping[str, Any]) -> bool:
+        """
+        Applique les bornes du filtre de base ; réinitialise les verdicts
+        si elles ont changé.
+
+        Args:
+            config_params: Paramètres extraits (WatchlistDataPreparer)
+
+        Returns:
+            True si les verdicts ont été réinitialisés
+        """
+        params = tuple(config_params.get(name) for name in _BASE_PARAMS)
+        if params == self._params:
+            return False
+        self._params = params
+        self._inputs.clear()
+        self._eligible.clear()
+        self._ranked.clear()
+        self._transitions.clear()
+        return True
+
+    # ===== FILTRE DE BASE =====
+
+    def update(
+        self,
+        symbols: Iterable[str],
+        funding_map: Mapping[str, Mapping[str, Any]],
+        now: Optional[int] = None,
+    ) -> int:
+        """
+        Réévalue les symboles dont les entrées ou la fenêtre ont changé.
+
+        Args:
+            symbols: Univers des perpétuels (linear + inverse)
+            funding_map: {symbole: {funding, volume, next_funding_time}}
+            now: Heure de référence (epoch ms, défaut: maintenant)
+
+        Returns:
+            Nombre de symboles réévalués
+        """
+        if now is None:
+            now = now_ms()
+        universe = {symbol for symbol in symbols if symbol in funding_map}
+        evaluated = 0
+
+        for symbol in [s for s in self._inputs if s not in universe]:
+            self._drop(symbol)
+
+        for symbol in universe:
+            data = funding_map[symbol]
+            inputs = (
+                data["funding"],
+                data["volume"],
+                funding_epoch_ms(data.get("next_funding_time")),
+            )
+            if self._inputs.get(symbol) != inputs:
+                self._inputs[symbol] = inputs
+                self._evaluate(symbol, now)
+                evaluated += 1
+
+        # Symboles dont la fenêtre temporelle bascule depuis le dernier scan
+        while self._transitions and self._transitions[0][0] <= now:
+            _, _, symbol, generation = heapq.heappop(self._transitions)
+            if generation == self._generation.get(symbol) and symbol in self._inputs:
+                self._evaluate(symbol, now)
+                evaluated += 1
+
+        self.last_evaluated = evaluated
+        return evaluated
+
+    def _evaluate(self, symbol: str, now: int) -> None:
+        """Recalcule le verdict d'un symbole et met à jour le classement."""
+        funding, volume, funding_ms = self._inputs[symbol]
+        passes, transition = self._base_verdict(funding, volume, funding_ms, now)
+
+        generation = self._generation.get(symbol, 0) + 1
+        self._generation[symbol] = generation
+        if transition is not None:
+            self._seq += 1
+            heapq.heappush(self._transitions, (transition, self._seq, symbol, generation))
+
+        key = (-abs(funding), symbol)
+        previous = self._eligible.get(symbol)
+        if previous is not None and (not passes or previous != key):
+            self._remove_ranked(previous)
+            del self._eligible[symbol]
+        if passes and symbol not in self._eligible:
+            insort(self._ranked, key)
+            self._eligible[symbol] = key
+
+    def _base_verdict(
+        self, funding: float, volume: float, funding_ms: Optional[int], now: int
+    ) -> Tuple[bool, Optional[int]]:
+        """
+        Verdict funding/volume/fenêtre, même règle que SymbolFilter.filter_by_funding.
+
+        Returns:
+            Tuple (passe, prochaine bascule de la fenêtre en epoch ms ou None)
+        """
+        funding_min, funding_max, volume_min_millions, time_min, time_max = self._params
+        if funding_min is not None and abs(funding) < funding_min:
+            return False, None
+        if funding_max is not None and abs(funding) > funding_max:
+            return False, None
+        if volume_min_millions is not None and volume < volume_min_millions * 1_000_000:
+            return False, None
+        if time_min is None and time_max is None:
+            return True, None
+        if funding_ms is None:
+            return False, None
+
+        # Fenêtre [entrée, sortie] en heure courante ; les minutes restantes
+        # sont bornées à 0 une fois le funding passé
+        enter = funding_ms - time_max * 60_000 if time_max is not None else None
+        leave = funding_ms - time_min * 60_000 if time_min is not None and time_min > 0 else None
+        if enter is not None and now < enter:
+            return False, int(enter)
+        if leave is not None:
+            if now > leave:
+                return False, None
+            return True, int(leave) + 1
+        return True, None
+
+    def _remove_ranked(self, key: Tuple[float, str]) -> None:
+        """Retire une clé de la liste ordonnée (recherche dichotomique)."""
+        index = bisect_left(self._ranked, key)
+        if index < len(self._ranked) and self._ranked[index] == key:
+            del self._ranked[index]
+
+    def _drop(self, symbol: str) -> None:
+        """Retire un symbole sorti de l'univers."""
+        del self._inputs[symbol]
+        self._generation[symbol] = self._generation.get(symbol, 0) + 1
+        self._weights.pop(symbol, None)
+        key = self._eligible.pop(symbol, None)
+        if key is not None:
+            self._remove_ranked(key)
+
+    def head(self, limite: Optional[int]) -> List[Tuple[str, float, float, Optional[int]]]:
+        """
+        Symboles éligibles triés par |funding| décroissant.
+
+        Args:
+            limite: Nombre maximum de symboles (None = tous)
+
+        Returns:
+            Liste des (symbol, funding, volume, next_funding_time)
+        """
+        keys = self._ranked if limite is None else self._ranked[:limite]
+        result = []
+        for _, symbol in keys:
+            funding, volume, funding_ms = self._inputs[symbol]
+            result.append((symbol, funding, volume, funding_ms))
+        return result
+
+    # ===== POIDS =====
+
+    def rank(
+        self, final_symbols: List[Tuple], weights_config: Dict, symbol_categories: Dict
+    ) -> List[Tuple]:
+        """
+        Pondère et classe les symboles finaux (poids mis en cache par symbole).
+
+        Args:
+            final_symbols: Liste des (symbol, funding, volume, next_funding_time,
+                spread, volatility)
+            weights_config: Configuration des poids depuis parameters.yaml
+            symbol_categories: Mapping des catégories de symboles
+
+        Returns:
+            Top N des (symbol, funding, volume, next_funding_time, spread,
+            volatility, weight) par poids décroissant
+        """
+        if weights_config != self._weights_config:
+            self._weights_config = dict(weights_config)
+            self._weights.clear()
+        if "minutes" in self.weight_calculator.score_variables(self._weights_config):
+            # Score dépendant de l'heure (weights.formula) : pas de cache
+            self._weights.clear()
+
+        # Lignes dont les entrées ont changé : poids recalculés en un lot
+        stale = []
+        for row in final_symbols:
+            symbol, funding, volume, funding_time, spread = row[:5]
+            volatility = row[5] if len(row) > 5 else 0.0
+            cached = self._weights.get(symbol)
+            if cached is None or cached[0] != (funding, volume, spread, volatility):
+                stale.append((symbol, funding, volume, funding_time, spread, volatility))
+        if stale:
+            weights = self.weight_calculator.calculate_weights(stale, self._weights_config)
+            for row, weight in zip(stale, weights):
+                self._weights[row[0]] = (row[1:3] + row[4:6], weight)
+        self.last_rescored = len(stale)
+
+        rows = []
+        for row in final_symbols:
+            symbol, funding, volume, funding_time, spread = row[:5]
+            volatility = row[5] if len(row) > 5 else 0.0
+            weight = self._weights[symbol][1]
+            rows.append((symbol, funding, volume, funding_time, spread, volatility, weight))
+
+        top_symbols = self._weights_config.get("top_symbols", 3)
+        if top_symbols is None or top_symbols <= 0:
+            return sorted(rows, key=lambda r: r[6], reverse=True)
+        return heapq.nlargest(top_symbols, rows, key=lambda r: r[6])
+
+    def get_stats(self) -> Dict[str, int]:
+        """Statistiques : symboles suivis, éligibles, bascules en attente, dernier scan."""
+        return {
+            "tracked": len(self._inputs),
+            "eligible": len(self._ranked),
+            "pending_transitions": len(self._transitions),
+            "last_evaluated": self.last_evaluated,
+            "last_rescored": self.last_rescored,
+        }
@@ -9,6 +9,9 @@ du WatchlistManager pour améliorer la lisibilité et la maintenabilité.
 import math
 from typing import List, Tuple, Dict, Optional
 from logging_setup import setup_logging
+from filters.columnar_filter import compute_weights, np
+from funding_time import funding_epoch_ms, now_ms, remaining_minutes
+from score_expression import ScoreExpression, compile_score_expression
 
 
 class WeightCalculator:
@@ -16,7 +19,8 @@ class WeightCalculator:
     Helper pour calculer les poids et trier les opportunités.
 
     Responsabilités :
-    - Calcul du score pondéré pour chaque opportunité
+    - Calcul du score pondéré pour chaque opportunité (formule par défaut
+      ou weights.formula compilée)
     - Tri des opportunités par poids décroissant
     - Limitation au top N symboles
     - Logging du classement final
@@ -43,6 +47,10 @@ class WeightCalculator:
             float: Score pondéré calculé
         """
         try:
+            expression = self.get_score_expression(weights_config)
+            if expression is not None:
+                return expression.evaluate_row(self._score_values(opportunity))
+
             # Extraire les données de l'opportunité
             funding_rate = float(opportunity.get('funding') or 0.0)
             volume = float(opportunity.get('volume') or 0.0)
@@ -74,6 +82,100 @@ class WeightCalculator:
             self.logger.warning(f"⚠️ Erreur calcul poids pour {opportunity.get('symbol', 'inconnu')}: {e}")
             return 0.0
 
+    def calculate_weights(self, opportunities: List[Tuple], weights_config: Dict) -> List[float]:
+        """
+        Calcule les scores pondérés d'un lot d'opportunités en une passe.
+
+        Args:
+            opportunities: Tuples (symbol, funding, volume, funding_time, spread, volatility?)
+            weights_config: Configuration des poids
+
+        Returns:
+            List[float]: Scores dans l'ordre des opportunités
+
+        Raises:
+            ScoreExpressionError: Si weights.formula est invalide
+        """
+        expression = self.get_score_expression(weights_config)
+        if expression is not None:
+            now = now_ms()
+            rows = [self._score_values(self._to_dict(row, {}), now) for row in opportunities]
+            return expression.evaluate(
+                {name: [row[name] for row in rows] for name in expression.variables},
+                size=len(rows),
+            )
+        if np is None:
+            return [
+                self.calculate_weight(self._to_dict(row, {}), weights_config)
+                for row in opportunities
+            ]
+        return compute_weights(
+            [row[1] if len(row) > 1 else 0.0 for row in opportunities],
+            [row[2] if len(row) > 2 else 0.0 for row in opportunities],
+            [row[4] if len(row) > 4 else 0.0 for row in opportunities],
+            [row[5] if len(row) > 5 else 0.0 for row in opportunities],
+            weights_config,
+        ).tolist()
+
+    @staticmethod
+    def get_score_expression(weights_config: Dict) -> Optional[ScoreExpression]:
+        """
+        Formule compilée de weights.formula (None = formule par défaut).
+
+        La compilation est mise en cache par formule et coefficients.
+
+        Raises:
+            ScoreExpressionError: Si la formule est invalide
+        """
+        formula = weights_config.get('formula')
+        if not formula:
+            return None
+        return compile_score_expression(formula, weights_config)
+
+    def score_variables(self, weights_config: Dict) -> Tuple[str, ...]:
+        """Colonnes dont dépend le score ("minutes" varie à chaque scan)."""
+        expression = self.get_score_expression(weights_config)
+        if expression is None:
+            return ('funding', 'volume', 'spread', 'volatility')
+        return expression.variables
+
+    @staticmethod
+    def _score_values(opportunity: Dict, now: Optional[int] = None) -> Dict[str, float]:
+        """Variables d'une formule pour une opportunité (mêmes bornes que calculate_weight)."""
+        minutes = remaining_minutes(funding_epoch_ms(opportunity.get('funding_time')), now)
+        return {
+            'funding': float(opportunity.get('funding') or 0.0),
+            'volume': max(float(opportunity.get('volume') or 0.0), 0.0),
+            'spread': max(float(opportunity.get('spread') or 0.0), 0.0),
+            'volatility': max(float(opportunity.get('volatility') or 0.0), 0.0),
+            'minutes': minutes or 0.0,
+        }
+
+    @staticmethod
+    def _to_dict(opportunity_tuple: Tuple, symbol_categories: Dict) -> Dict:
+        """Convertit un tuple d'opportunité en dictionnaire."""
+        if len(opportunity_tuple) >= 5:
+            symbol, funding, volume, funding_time, spread = opportunity_tuple[:5]
+            volatility = opportunity_tuple[5] if len(opportunity_tuple) > 5 else 0.0
+        else:
+            # Format par défaut si données incomplètes
+            symbol = opportunity_tuple[0] if len(opportunity_tuple) > 0 else "UNKNOWN"
+            funding = opportunity_tuple[1] if len(opportunity_tuple) > 1 else 0.0
+            volume = opportunity_tuple[2] if len(opportunity_tuple) > 2 else 0.0
+            funding_time = opportunity_tuple[3] if len(opportunity_tuple) > 3 else 0
+            spread = opportunity_tuple[4] if len(opportunity_tuple) > 4 else 0.0
+            volatility = 0.0
+
+        return {
+            'symbol': symbol,
+            'funding': funding,
+            'volume': volume,
+            'funding_time': funding_time,
+            'spread': spread,
+            'volatility': volatility,
+            'category': symbol_categories.get(symbol, 'unknown')
+        }
+
     def apply_weighting_to_opportunities(
         self,
         opportunities: List[Tuple],
@@ -93,35 +195,11 @@ class WeightCalculator:
         """
         weighted_opportunities = []
 
-        for opportunity_tuple in opportunities:
-            # Convertir le tuple en dictionnaire
-            if len(opportunity_tuple) >= 5:
-                symbol, funding, volume, funding_time, spread = opportunity_tuple[:5]
-                volatility = opportunity_tuple[5] if len(opportunity_tuple) > 5 else 0.0
-            else:
-                # Format par défaut si données incomplètes
-                symbol = opportunity_tuple[0] if len(opportunity_tuple) > 0 else "UNKNOWN"
-                funding = opportunity_tuple[1] if len(opportunity_tuple) > 1 else 0.0
-                volume = opportunity_tuple[2] if len(opportunity_tuple) > 2 else 0.0
-                funding_time = opportunity_tuple[3] if len(opportunity_tuple) > 3 else 0
-                spread = opportunity_tuple[4] if len(opportunity_tuple) > 4 else 0.0
-                volatility = 0.0
-
-            # Créer le dictionnaire d'opportunité
-            opportunity_dict = {
-                'symbol': symbol,
-                'funding': funding,
-                'volume': volume,
-                'funding_time': funding_time,
-                'spread': spread,
-                'volatility': volatility,
-                'category': symbol_categories.get(symbol, 'unknown')
-            }
-
-            # Calculer le poids
-            weight = self.calculate_weight(opportunity_dict, weights_config)
+        for opportunity_tuple, weight in zip(
+            opportunities, self.calculate_weights(opportunities, weights_config)
+        ):
+            opportunity_dict = self._to_dict(opportunity_tuple, symbol_categories)
             opportunity_dict['weight'] = weight
-
             weighted_opportunities.append(opportunity_dict)
 
         return weighted_opportunities
@@ -15,12 +15,14 @@ Responsabilités principales :
 - Surveillance des candidats (symboles proches des critères)
 """
 
-from typing import List, Tuple, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, List, Tuple, Dict, Optional, TYPE_CHECKING
 from logging_setup import setup_logging
 from config import ConfigManager
 from filters.symbol_filter import SymbolFilter
+from filters.columnar_filter import ColumnarSymbolFilter
 from volatility_tracker import VolatilityTracker
 from enhanced_metrics import record_filter_result
+from market_snapshot import get_market_snapshot
 from interfaces.watchlist_manager_interface import WatchlistManagerInterface
 from interfaces.data_manager_interface import DataManagerInterface
 from watchlist_helpers import (
@@ -91,7 +93,7 @@ class WatchlistManager(WatchlistManagerInterface):
             )
         self.market_data_fetcher = market_data_fetcher
 
-        self.symbol_filter = symbol_filter or SymbolFilter(logger=self.logger)
+        self.symbol_filter = symbol_filter or ColumnarSymbolFilter(logger=self.logger)
         self.spot_checker = spot_checker  # NEW: Store spot checker
 
         # Configuration et données
@@ -116,6 +118,9 @@ class WatchlistManager(WatchlistManagerInterface):
         self.selected_symbols = []
         self.funding_data = {}
 
+        # Callback appelé après chaque construction ({symbol: nextFundingTime brut})
+        self._on_watchlist_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+
     def get_config(self) -> Dict:
         """
         Retourne la configuration actuelle.
@@ -154,6 +159,10 @@ class WatchlistManager(WatchlistManagerInterface):
         Returns:
             Tuple[linear_symbols, inverse_symbols, funding_data]
         """
+        # Nouveau cycle de scan : funding, spreads et candidats partagent
+        # un seul jeu de tickers frais par catégorie
+        get_market_snapshot().start_cycle()
+
         # Préparer la configuration et les données
         config_params, funding_map, n0 = (
             self._data_preparer.prepare_watchlist_data(
@@ -185,6 +194,7 @@ class WatchlistManager(WatchlistManagerInterface):
         # Stocker les résultats localement
         self.selected_symbols = list(funding_data.keys())
         self.funding_data = funding_data
+        self._notify_watchlist()
 
         return linear_symbols, inverse_symbols, funding_data
 
@@ -305,6 +315,34 @@ class WatchlistManager(WatchlistManagerInterface):
             symbol, ticker_data, funding_min, funding_max, volume_min_millions
         )
 
+    def set_on_watchlist_callback(self, callback: Optional[Callable[[Dict[str, Any]], None]]):
+        """
+        Définit le callback appelé après chaque construction de la watchlist.
+
+        Args:
+            callback: Fonction recevant {symbol: nextFundingTime brut} ou None
+        """
+        self._on_watchlist_callback = callback
+
+    def get_watchlist_funding_times(self) -> Dict[str, Any]:
+        """
+        Retourne les heures de funding brutes des symboles sélectionnés.
+
+        Returns:
+            Dictionnaire {symbol: nextFundingTime brut (ms ou ISO) ou None}
+        """
+        original = self._data_preparer.get_original_funding_data()
+        return {symbol: original.get(symbol) for symbol in self.selected_symbols}
+
+    def _notify_watchlist(self) -> None:
+        callback = self._on_watchlist_callback
+        if callback is None:
+            return
+        try:
+            callback(self.get_watchlist_funding_times())
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erreur callback watchlist: {e}")
+
     def get_selected_symbols(self) -> List[str]:
         """
         Retourne la liste des symboles sélectionnés.
@@ -331,24 +369,3 @@ class WatchlistManager(WatchlistManagerInterface):
             Dictionnaire des next_funding_time originaux
         """
         return self._data_preparer.get_original_funding_data()
-
-    def calculate_funding_time_remaining(self, next_funding_time) -> str:
-        """
-        Retourne "Xh Ym Zs" à partir d'un timestamp Bybit (ms) ou ISO.
-
-        Args:
-            next_funding_time: Timestamp du prochain funding
-
-        Returns:
-            str: Temps restant formaté ou "-" si invalide
-
-        Example:
-            >>> manager = WatchlistManager(...)
-            >>> manager.calculate_funding_time_remaining(1640995200000)
-            "2h 15m"
-            >>> manager.calculate_funding_time_remaining(1640995190000)
-            "45s"
-        """
-        return self.symbol_filter.calculate_funding_time_remaining(
-            next_funding_time
-        )
@@ -7,4 +7,5 @@ Ce package contient les modules spécialisés pour la gestion des connexions Web
 - strategy.py : Stratégie de répartition linear/inverse
 - handlers.py : Callbacks et métriques
 - manager.py : Façade WebSocketManager simplifiée
+- decoder.py : Décodage JSON des trames (orjson/msgspec/json, filtrage par topic)
 """
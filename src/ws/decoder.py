@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Décodage JSON des trames WebSocket.
+
+Le décodage ``json.loads`` de chaque trame est le principal coût CPU des
+threads WebSocket quand tout l'univers de tickers est suivi. Ce module
+fournit une couche de décodage interchangeable :
+- orjson ou msgspec s'ils sont installés, sinon le module json standard
+- filtrage par préfixe de topic : le début de la chaîne brute est comparé
+  aux préfixes suivis (str.startswith, sans découpage) et les trames non
+  suivies sont ignorées sans décodage ; une trame au format inattendu est
+  toujours décodée
+
+Les backends lèvent tous ValueError sur une trame invalide.
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Ordre de préférence des backends (le premier importable est retenu)
+BACKEND_PREFERENCE: Tuple[str, ...] = ("orjson", "msgspec", "json")
+
+# Le topic Bybit est la première clé des trames : '{"topic":"tickers.BTCUSDT",...'
+TOPIC_HEAD = '{"topic":"'
+
+
+def _load_backend(name: str) -> Callable[[Any], Any]:
+    """Retourne la fonction de décodage d'un backend (ImportError si absent)."""
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        decoder = msgspec.json.Decoder()
+
+        def loads(raw):
+            try:
+                return decoder.decode(raw)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Backend JSON inconnu: {name}")
+
+
+def resolve_backend(name: Optional[str] = None) -> Tuple[str, Callable[[Any], Any]]:
+    """
+    Sélectionne le backend de décodage.
+
+    Args:
+        name: Backend souhaité ("orjson", "msgspec", "json") ; le plus
+            rapide disponible si None ou non installé
+
+    Returns:
+        Tuple (nom du backend retenu, fonction loads)
+    """
+    candidates = ((name,) if name else ()) + BACKEND_PREFERENCE
+    for candidate in candidates:
+        try:
+            return candidate, _load_backend(candidate)
+        except ImportError:
+            continue
+    return "json", json.loads
+
+
+class FrameDecoder:
+    """
+    Décodeur de trames avec filtrage optionnel par préfixe de topic.
+
+    Attributes:
+        backend (str): Backend de décodage retenu
+        topic_prefixes (tuple): Préfixes de topics à décoder (tous si vide)
+        decoded (int): Trames décodées
+        skipped (int): Trames ignorées sans décodage
+    """
+
+    def __init__(self, backend: Optional[str] = None, topic_prefixes: Iterable[str] = ()):
+        """
+        Args:
+            backend: Backend souhaité (le plus rapide disponible si None)
+            topic_prefixes: Préfixes des topics suivis ; les trames portant
+                un autre topic ne sont pas décodées
+        """
+        self.backend, self._loads = resolve_backend(backend)
+        self.topic_prefixes = tuple(topic_prefixes)
+        self.decoded = 0
+        self.skipped = 0
+
+    def decode(self, raw: str) -> Optional[Dict[str, Any]]:
+        """
+        Décode une trame si son topic est suivi.
+
+        Args:
+            raw: Trame brute reçue
+
+        Returns:
+            Message décodé, ou None si le topic n'est pas suivi
+
+        Raises:
+            ValueError: Si la trame n'est pas un JSON valide
+        """
+        if (
+            self.topic_prefixes
+            and isinstance(raw, str)
+            and raw.startswith(TOPIC_HEAD)
+            and not raw.startswith(self.topic_prefixes, len(TOPIC_HEAD))
+        ):
+            self.skipped += 1
+            return None
+        payload = self._loads(raw)
+        self.decoded += 1
+        return payload
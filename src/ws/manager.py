@@ -10,13 +10,22 @@ Ce module implémente une façade simplifiée qui orchestre les modules spécial
 
 import asyncio
 import time
+from collections import OrderedDict
 from typing import List, Callable, Optional, Dict, Any, TYPE_CHECKING
 
 from logging_setup import setup_logging
 from ws_public import PublicWSClient
+from ws.public.local_orderbook import OrderbookStore
+from kline_window import KlineStore
 from interfaces.websocket_manager_interface import WebSocketManagerInterface
 from interfaces.data_manager_interface import DataManagerInterface
 
+from config.constants import (
+    WS_ORDERBOOK_MAX_SYMBOLS,
+    WS_SHARD_SPARE_WORKERS,
+    WS_SHARD_TARGET_SYMBOLS,
+)
+
 from .connection_pool import WebSocketConnectionPool
 from .strategy import WebSocketConnectionStrategy, ConnectionStrategy
 from .handlers import WebSocketHandlers
@@ -63,6 +72,8 @@ class WebSocketManager(WebSocketManagerInterface):
         self._strategy = WebSocketConnectionStrategy(self.logger)
         self._handlers = WebSocketHandlers(self.logger)
         self._executor_signature: Optional[str] = None
+        self._executor_workers = 0
+        self.max_symbols_per_connection = WS_SHARD_TARGET_SYMBOLS
 
         # Connexions WebSocket actives
         self._ws_conns: List[PublicWSClient] = []
@@ -75,6 +86,15 @@ class WebSocketManager(WebSocketManagerInterface):
         # Callbacks
         self._ticker_callback: Optional[Callable] = None
         self.on_orderbook_callback: Optional[Callable] = None
+        # Abonnés secondaires aux tickers (ex: CandidateMonitor) partageant les connexions
+        self._ticker_listeners: List[Callable[[dict], None]] = []
+
+        # Carnets d'ordres locaux partagés par toutes les connexions (lecture sans REST)
+        self.orderbook_store = OrderbookStore()
+        # Souscriptions orderbook actives {symbole: catégorie}, de la plus ancienne à la plus récente
+        self._orderbook_subscriptions: "OrderedDict[str, str]" = OrderedDict()
+        # Fenêtres de bougies 1m (kline.1.{symbol} souscrit avec chaque ticker) pour la volatilité
+        self.kline_store = KlineStore()
 
         # Configurer les handlers
         self._handlers.set_data_manager(data_manager)
@@ -100,13 +120,21 @@ class WebSocketManager(WebSocketManagerInterface):
         Met à jour le store de prix et appelle le callback externe.
 
         Args:
-            ticker_data: Données ticker reçues via WebSocket
+            ticker_data: Champs modifiés du ticker (diff émis par le
+                TickerStateEngine, funding inclus)
         """
         try:
             # Mettre à jour le store de prix via le data_manager injecté
             symbol = ticker_data.get("symbol", "")
             mark_price = ticker_data.get("markPrice")
             last_price = ticker_data.get("lastPrice")
+            if symbol and (mark_price is None) != (last_price is None):
+                # Diff partiel : l'autre prix est relu dans l'état fusionné
+                state = self.get_ticker_state(symbol) or {}
+                if mark_price is None:
+                    mark_price = state.get("markPrice")
+                else:
+                    last_price = state.get("lastPrice")
 
             if symbol and mark_price is not None and last_price is not None and self.data_manager:
                 mark_val = float(mark_price)
@@ -121,6 +149,48 @@ class WebSocketManager(WebSocketManagerInterface):
         except Exception as e:
             self.logger.warning(f"⚠️ Erreur traitement ticker WebSocket: {e}")
 
+        for listener in list(self._ticker_listeners):
+            try:
+                listener(ticker_data)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Erreur listener ticker WebSocket: {e}")
+
+    def add_ticker_listener(self, listener: Callable[[dict], None]) -> None:
+        """
+        Ajoute un abonné secondaire aux tickers des connexions principales.
+
+        Args:
+            listener: Fonction appelée avec chaque diff ticker
+
+        Raises:
+            TypeError: Si listener n'est pas une fonction
+        """
+        if not callable(listener):
+            raise TypeError("listener doit être une fonction")
+        if listener not in self._ticker_listeners:
+            self._ticker_listeners.append(listener)
+
+    def remove_ticker_listener(self, listener: Callable[[dict], None]) -> None:
+        """Retire un abonné secondaire aux tickers."""
+        if listener in self._ticker_listeners:
+            self._ticker_listeners.remove(listener)
+
+    def get_ticker_state(self, symbol: str) -> Optional[dict]:
+        """
+        Retourne l'état ticker consolidé d'un symbole (snapshot + deltas).
+
+        Args:
+            symbol: Symbole recherché
+
+        Returns:
+            Dict au format des callbacks ou None si inconnu
+        """
+        for conn in self._ws_conns:
+            state = conn.get_ticker_state(symbol)
+            if state is not None:
+                return state
+        return None
+
     def _build_executor_signature(self, strategy: ConnectionStrategy) -> str:
         """Construit une signature stable de la configuration du ThreadPoolExecutor."""
         linear_key = ",".join(sorted(set(strategy.linear_symbols)))
@@ -135,7 +205,9 @@ class WebSocketManager(WebSocketManagerInterface):
         """S'assure que l'exécuteur correspond à la stratégie demandée."""
         signature = self._build_executor_signature(strategy)
         force_recreate = self._executor_signature is not None and signature != self._executor_signature
-        workers = max(1, strategy.total_connections)
+        # Réserve de workers : de nouveaux shards peuvent démarrer sans recréer l'exécuteur
+        categories = int(strategy.needs_linear) + int(strategy.needs_inverse)
+        workers = max(1, strategy.total_connections + WS_SHARD_SPARE_WORKERS * categories)
 
         created = await self._connection_pool.ensure_executor(
             max_workers=workers,
@@ -151,6 +223,31 @@ class WebSocketManager(WebSocketManagerInterface):
             self.logger.debug("♻️ ThreadPoolExecutor réutilisé (configuration inchangée)")
 
         self._executor_signature = signature
+        self._executor_workers = workers
+
+    def _get_symbol_weights(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Estime le débit de messages attendu par symbole (turnover24h).
+
+        Utilise le turnover temps réel s'il est connu, sinon le volume 24h
+        des données de funding REST.
+        """
+        weights: Dict[str, float] = {}
+        if not self.data_manager:
+            return weights
+
+        for symbol in symbols:
+            try:
+                realtime = self.data_manager.get_realtime_data(symbol) or {}
+                turnover = realtime.get("turnover24h")
+                if turnover is None:
+                    funding_obj = self.data_manager.get_funding_data_object(symbol)
+                    turnover = funding_obj.volume_24h if funding_obj else None
+                if turnover is not None:
+                    weights[symbol] = float(turnover)
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return weights
 
     async def start_connections(self, linear_symbols: List[str], inverse_symbols: List[str],
                                on_ticker_callback: Optional[Callable] = None,
@@ -168,9 +265,9 @@ class WebSocketManager(WebSocketManagerInterface):
             self.logger.warning("⚠️ WebSocketManager déjà en cours d'exécution")
             return
 
-        # Mémoriser les symboles fournis avant de lancer la stratégie
-        self.linear_symbols = linear_symbols
-        self.inverse_symbols = inverse_symbols
+        # Mémoriser les symboles valides avant de lancer la stratégie
+        self.linear_symbols = self._strategy.validate_symbols(linear_symbols, "linear")
+        self.inverse_symbols = self._strategy.validate_symbols(inverse_symbols, "inverse")
 
         # Configurer les callbacks
         if on_ticker_callback:
@@ -178,8 +275,13 @@ class WebSocketManager(WebSocketManagerInterface):
         if on_orderbook_callback:
             self.set_orderbook_callback(on_orderbook_callback)
 
-        # Analyser la stratégie de connexion
-        strategy = self._strategy.analyze_symbols(linear_symbols, inverse_symbols)
+        # Analyser la stratégie de connexion (shards équilibrés par turnover)
+        strategy = self._strategy.analyze_symbols(
+            self.linear_symbols,
+            self.inverse_symbols,
+            weights=self._get_symbol_weights(self.linear_symbols + self.inverse_symbols),
+            max_per_connection=self.max_symbols_per_connection,
+        )
 
         if strategy.total_connections == 0:
             self.logger.warning("⚠️ Aucun symbole fourni pour les connexions WebSocket")
@@ -195,76 +297,35 @@ class WebSocketManager(WebSocketManagerInterface):
         self.logger.info(f"✅ WebSocketManager démarré ({strategy.total_connections} connexion(s))")
 
     async def _start_connections_by_strategy(self, strategy: ConnectionStrategy):
-        """Démarre les connexions selon la stratégie."""
-        if strategy.needs_linear and strategy.needs_inverse:
-            await self._start_dual_connections(strategy)
-        elif strategy.needs_linear:
-            await self._start_single_connection("linear", strategy.linear_symbols)
-        elif strategy.needs_inverse:
-            await self._start_single_connection("inverse", strategy.inverse_symbols)
-
-    async def _start_single_connection(self, category: str, symbols: List[str]):
-        """Démarre une connexion pour une catégorie."""
-        # Valider les symboles
-        valid_symbols = self._strategy.validate_symbols(symbols, category)
-        if not valid_symbols:
-            self.logger.warning(f"⚠️ Aucun symbole valide pour {category}")
-            return
+        """Démarre une connexion par shard selon la stratégie."""
+        self._ws_conns = []
+        self._ws_tasks = []
+
+        for plan in self._strategy.get_connection_plan(strategy):
+            self._start_shard_connection(plan["category"], plan["symbols"])
+
+        self._handlers.update_connection_count(len(self._ws_conns))
+        self.logger.info(
+            f"✅ Connexions démarrées (linear: {len(strategy.linear_symbols)} symboles / "
+            f"{len(strategy.linear_shards)} shard(s), inverse: {len(strategy.inverse_symbols)} "
+            f"symboles / {len(strategy.inverse_shards)} shard(s))"
+        )
 
-        # Créer la connexion
+    def _start_shard_connection(self, category: str, symbols: List[str]) -> PublicWSClient:
+        """Crée une connexion pour un shard et la lance sur l'exécuteur partagé."""
         conn = PublicWSClient(
             category=category,
-            symbols=valid_symbols,
+            symbols=list(symbols),
             testnet=self.testnet,
             logger=self.logger,
             on_ticker_callback=self._handle_ticker,
+            orderbook_store=self.orderbook_store,
+            kline_store=self.kline_store,
         )
-
-        self._ws_conns = [conn]
-
-        # Lancer dans un thread
-        task = asyncio.create_task(self._run_websocket_connection(conn))
-        self._ws_tasks = [task]
-
-        self.logger.info(f"✅ Connexion {category} démarrée ({len(valid_symbols)} symboles)")
-
-    async def _start_dual_connections(self, strategy: ConnectionStrategy):
-        """Démarre les connexions duales (linear + inverse)."""
-        # Valider les symboles
-        linear_valid = self._strategy.validate_symbols(self.linear_symbols, "linear")
-        inverse_valid = self._strategy.validate_symbols(self.inverse_symbols, "inverse")
-
-        connections = []
-        tasks = []
-
-        # Connexion linear
-        if linear_valid:
-            linear_conn = PublicWSClient(
-                category="linear",
-                symbols=linear_valid,
-                testnet=self.testnet,
-                logger=self.logger,
-                on_ticker_callback=self._handle_ticker,
-            )
-            connections.append(linear_conn)
-            tasks.append(asyncio.create_task(self._run_websocket_connection(linear_conn)))
-
-        # Connexion inverse
-        if inverse_valid:
-            inverse_conn = PublicWSClient(
-                category="inverse",
-                symbols=inverse_valid,
-                testnet=self.testnet,
-                logger=self.logger,
-                on_ticker_callback=self._handle_ticker,
-            )
-            connections.append(inverse_conn)
-            tasks.append(asyncio.create_task(self._run_websocket_connection(inverse_conn)))
-
-        self._ws_conns = connections
-        self._ws_tasks = tasks
-
-        self.logger.info(f"✅ Connexions duales démarrées (linear: {len(linear_valid)}, inverse: {len(inverse_valid)})")
+        self._ws_conns.append(conn)
+        self._ws_tasks.append(asyncio.create_task(self._run_websocket_connection(conn)))
+        self.logger.debug(f"🧩 Shard {category} #{len(self._get_connections(category))} ({len(symbols)} symboles)")
+        return conn
 
     async def _run_websocket_connection(self, conn: PublicWSClient):
         """Exécute une connexion WebSocket dans un thread."""
@@ -287,6 +348,7 @@ class WebSocketManager(WebSocketManagerInterface):
 
         # Nettoyer les handlers
         self._ticker_callback = None
+        self._ticker_listeners.clear()
         self._handlers.clear_callbacks()
 
         # Fermer toutes les connexions
@@ -315,6 +377,7 @@ class WebSocketManager(WebSocketManagerInterface):
         self._ws_tasks.clear()
         self.linear_symbols.clear()
         self.inverse_symbols.clear()
+        self._orderbook_subscriptions.clear()
 
         self.logger.info("🛑 WebSocketManager arrêté")
 
@@ -325,6 +388,7 @@ class WebSocketManager(WebSocketManagerInterface):
 
         self.running = False
         self._ticker_callback = None
+        self._ticker_listeners.clear()
         self._handlers.clear_callbacks()
 
         # Fermer les connexions
@@ -349,6 +413,7 @@ class WebSocketManager(WebSocketManagerInterface):
         self._ws_tasks.clear()
         self.linear_symbols.clear()
         self.inverse_symbols.clear()
+        self._orderbook_subscriptions.clear()
 
     # Interface WebSocketManagerInterface
     def is_running(self) -> bool:
@@ -369,9 +434,11 @@ class WebSocketManager(WebSocketManagerInterface):
     def get_connection_status(self) -> Dict[str, bool]:
         """Retourne le statut de toutes les connexions."""
         status = {}
-        for i, conn in enumerate(self._ws_conns):
-            category = "linear" if i == 0 and self.linear_symbols else "inverse"
-            status[f"{category}_connection"] = conn.is_connected()
+        for category in ("linear", "inverse"):
+            conns = self._get_connections(category)
+            for index, conn in enumerate(conns):
+                key = f"{category}_connection" if len(conns) == 1 else f"{category}_connection_{index}"
+                status[key] = conn.is_connected()
         return status
 
     def get_connection_stats(self) -> Dict[str, Any]:
@@ -391,29 +458,219 @@ class WebSocketManager(WebSocketManagerInterface):
         self.data_manager = data_manager
         self._handlers.set_data_manager(data_manager)
 
-    def add_symbols(self, category: str, symbols: List[str]) -> None:
-        """Ajoute des symboles à une connexion existante."""
+    def _get_symbol_list(self, category: str) -> List[str]:
+        """Retourne la liste (mutable) des symboles suivis pour une catégorie."""
         if category == "linear":
-            self.linear_symbols.extend(symbols)
-        elif category == "inverse":
-            self.inverse_symbols.extend(symbols)
-        else:
-            raise ValueError(f"Catégorie non supportée: {category}")
-        self.logger.info(f"✅ Symboles ajoutés à {category}: {len(symbols)} symboles")
+            return self.linear_symbols
+        if category == "inverse":
+            return self.inverse_symbols
+        raise ValueError(f"Catégorie non supportée: {category}")
+
+    def _get_connections(self, category: str) -> List[PublicWSClient]:
+        """Retourne les connexions (shards) actives d'une catégorie."""
+        return [conn for conn in self._ws_conns if conn.category == category]
+
+    def _can_spawn_shard(self) -> bool:
+        """Vérifie qu'un worker de réserve est libre pour un nouveau shard."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return self.running and len(self._ws_conns) < self._executor_workers
+
+    def _assign_to_shards(self, category: str, symbols: List[str]) -> Dict[int, List[str]]:
+        """
+        Répartit de nouveaux symboles sur les shards existants (le moins chargé d'abord).
+
+        Returns:
+            Dict {index de connexion dans _ws_conns: symboles}; index -1 pour
+            les symboles nécessitant un nouveau shard
+        """
+        conns = self._get_connections(category)
+        weights = self._get_symbol_weights(
+            symbols + [s for conn in conns for s in conn.symbols]
+        )
+        shards = [list(conn.symbols) for conn in conns]
+        loads = [
+            sum(self._strategy.symbol_weight(s, weights) for s in shard) for shard in shards
+        ]
+
+        assignment: Dict[int, List[str]] = {}
+        ordered = sorted(symbols, key=lambda s: self._strategy.symbol_weight(s, weights), reverse=True)
+        for symbol in ordered:
+            index = self._strategy.pick_shard(shards, loads, self.max_symbols_per_connection)
+            if index is None:
+                if not self._can_spawn_shard():
+                    # Pas de worker libre : débordement sur le shard le moins chargé (pas de perte)
+                    index = min(range(len(shards)), key=lambda i: loads[i])
+                    self.logger.warning(
+                        f"⚠️ Shards {category} pleins, {symbol} ajouté en débordement"
+                    )
+                else:
+                    assignment.setdefault(-1, []).append(symbol)
+                    continue
+            shards[index].append(symbol)
+            loads[index] += self._strategy.symbol_weight(symbol, weights)
+            conn_index = self._ws_conns.index(conns[index])
+            assignment.setdefault(conn_index, []).append(symbol)
+        return assignment
+
+    def add_symbols(self, category: str, symbols: List[str]) -> None:
+        """
+        Ajoute des symboles à une connexion existante.
+
+        Les symboles sont souscrits en direct sur le shard le moins chargé
+        (opération subscribe, sans reconnexion ni nouveau handshake TLS).
+        Si tous les shards sont pleins, un nouveau shard est ouvert sur un
+        worker de réserve de l'exécuteur partagé.
+        """
+        current = self._get_symbol_list(category)
+        new_symbols = [
+            s for s in dict.fromkeys(self._strategy.validate_symbols(symbols, category))
+            if s not in current
+        ]
+        if not new_symbols:
+            return
+        current.extend(new_symbols)
+
+        if not self._get_connections(category):
+            if self.running:
+                self.logger.warning(
+                    f"⚠️ Aucune connexion {category} active: {len(new_symbols)} symbole(s) "
+                    f"souscrit(s) au prochain démarrage"
+                )
+            return
+
+        for conn_index, assigned in self._assign_to_shards(category, new_symbols).items():
+            if conn_index == -1:
+                for start in range(0, len(assigned), self.max_symbols_per_connection):
+                    self._start_shard_connection(
+                        category, assigned[start:start + self.max_symbols_per_connection]
+                    )
+                self._handlers.update_connection_count(len(self._ws_conns))
+            else:
+                self._ws_conns[conn_index].subscribe(assigned)
+        self.logger.info(f"✅ Symboles ajoutés à {category}: {len(new_symbols)} symboles")
 
     def remove_symbols(self, category: str, symbols: List[str]) -> None:
-        """Retire des symboles d'une connexion existante."""
-        if category == "linear":
-            for symbol in symbols:
-                if symbol in self.linear_symbols:
-                    self.linear_symbols.remove(symbol)
-        elif category == "inverse":
-            for symbol in symbols:
-                if symbol in self.inverse_symbols:
-                    self.inverse_symbols.remove(symbol)
-        else:
-            raise ValueError(f"Catégorie non supportée: {category}")
-        self.logger.info(f"✅ Symboles retirés de {category}: {len(symbols)} symboles")
+        """
+        Retire des symboles d'une connexion existante.
+
+        Les symboles sont désouscrits en direct sur leur shard ; un shard
+        devenu vide est fermé (son worker redevient disponible).
+        """
+        current = self._get_symbol_list(category)
+        removed = [s for s in dict.fromkeys(symbols) if s in current]
+        if not removed:
+            return
+        for symbol in removed:
+            current.remove(symbol)
+
+        conns = self._get_connections(category)
+        for conn in conns:
+            owned = [s for s in removed if s in conn.symbols]
+            if owned:
+                conn.unsubscribe(owned)
+            if not conn.symbols and len(conns) > 1 and current:
+                self._close_shard(conn)
+        self.logger.info(f"✅ Symboles retirés de {category}: {len(removed)} symboles")
+
+    def _close_shard(self, conn: PublicWSClient) -> None:
+        """Ferme un shard vide et libère son worker."""
+        try:
+            conn.close()
+        except Exception as e:
+            self.logger.warning(f"⚠️ Erreur fermeture shard {conn.category}: {e}")
+        index = self._ws_conns.index(conn)
+        self._ws_conns.pop(index)
+        if index < len(self._ws_tasks):
+            self._ws_tasks.pop(index)
+        self._handlers.update_connection_count(len(self._ws_conns))
+
+        # Les carnets locaux portés par ce shard migrent vers un shard restant
+        orphans = list(getattr(conn, "orderbook_symbols", []))
+        for symbol in orphans:
+            self._orderbook_subscriptions.pop(symbol, None)
+        if orphans:
+            self.subscribe_orderbook(conn.category, orphans)
+
+    def subscribe_orderbook(self, category: str, symbols: List[str]) -> List[str]:
+        """
+        Maintient le carnet local des symboles via le flux orderbook WebSocket.
+
+        Le flux est ouvert sur le shard qui suit déjà le ticker du symbole
+        (sinon le shard portant le moins de carnets). Au-delà de
+        WS_ORDERBOOK_MAX_SYMBOLS, les carnets les plus anciens sont libérés.
+
+        Args:
+            category: Catégorie des symboles ("linear" ou "inverse")
+            symbols: Symboles dont le carnet doit être maintenu
+
+        Returns:
+            Symboles effectivement suivis (vide si aucune connexion de la
+            catégorie n'est active, ex: spot)
+        """
+        conns = self._get_connections(category) if category in ("linear", "inverse") else []
+        if not conns:
+            return []
+
+        tracked = []
+        for symbol in dict.fromkeys(s for s in symbols if s):
+            tracked.append(symbol)
+            if symbol in self._orderbook_subscriptions:
+                self._orderbook_subscriptions.move_to_end(symbol)
+                continue
+            owner = next((conn for conn in conns if symbol in conn.symbols), None)
+            if owner is None:
+                owner = min(conns, key=lambda conn: len(conn.orderbook_symbols))
+            owner.subscribe_orderbook([symbol])
+            self._orderbook_subscriptions[symbol] = category
+
+        while len(self._orderbook_subscriptions) > WS_ORDERBOOK_MAX_SYMBOLS:
+            oldest = next(iter(self._orderbook_subscriptions))
+            self.unsubscribe_orderbook([oldest])
+        return tracked
+
+    def unsubscribe_orderbook(self, symbols: List[str]) -> None:
+        """Arrête le flux orderbook des symboles et oublie leur carnet local."""
+        for symbol in symbols:
+            if self._orderbook_subscriptions.pop(symbol, None) is None:
+                continue
+            for conn in self._ws_conns:
+                if symbol in conn.orderbook_symbols:
+                    conn.unsubscribe_orderbook([symbol])
+
+    def get_orderbook(self, symbol: str, depth: Optional[int] = None) -> Optional[dict]:
+        """
+        Retourne le carnet local d'un symbole, sans appel REST.
+
+        Args:
+            symbol: Symbole recherché
+            depth: Nombre de niveaux par côté (tous si None)
+
+        Returns:
+            Dict au format REST Bybit (``b``/``a``) ou None si le carnet
+            n'est pas suivi ou pas encore synchronisé
+        """
+        return self.orderbook_store.get(symbol, depth)
+
+    def _can_update_live(self, linear_symbols: List[str], inverse_symbols: List[str]) -> bool:
+        """Vérifie que chaque catégorie demandée dispose déjà d'une connexion active."""
+        if not self.running:
+            return False
+        for category, symbols in (("linear", linear_symbols), ("inverse", inverse_symbols)):
+            if symbols and not self._get_connections(category):
+                return False
+        return True
+
+    def _apply_symbol_diff(self, linear_symbols: List[str], inverse_symbols: List[str]) -> None:
+        """Aligne les souscriptions sur les listes cibles via subscribe/unsubscribe."""
+        for category, target in (("linear", linear_symbols), ("inverse", inverse_symbols)):
+            current = self._get_symbol_list(category)
+            stale = [s for s in current if s not in target]
+            if stale:
+                self.remove_symbols(category, stale)
+            self.add_symbols(category, list(target))
 
     def set_orderbook_callback(self, callback: Callable) -> None:
         """Définit le callback pour les orderbooks."""
@@ -477,6 +734,14 @@ class WebSocketManager(WebSocketManagerInterface):
         try:
             self.logger.info(f"🔄 Basculement vers symbole unique: {symbol} ({category})")
 
+            target_linear = [symbol] if category == "linear" else []
+            target_inverse = [symbol] if category != "linear" else []
+            if self._can_update_live(target_linear, target_inverse):
+                # Connexion déjà ouverte : simple diff de souscriptions
+                self._apply_symbol_diff(target_linear, target_inverse)
+                self.logger.info(f"✅ Basculement terminé - Suivi de {symbol}")
+                return
+
             # Arrêter les connexions actuelles
             await self.stop()
 
@@ -508,6 +773,12 @@ class WebSocketManager(WebSocketManagerInterface):
         try:
             self.logger.info(f"🔄 Restauration watchlist complète: {len(linear_symbols)} linear, {len(inverse_symbols)} inverse")
 
+            if self._can_update_live(linear_symbols, inverse_symbols):
+                # Connexions déjà ouvertes : simple diff de souscriptions
+                self._apply_symbol_diff(list(linear_symbols), list(inverse_symbols))
+                self.logger.info("✅ Watchlist complète restaurée")
+                return
+
             # Arrêter les connexions actuelles
             await self.stop()
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-import json
 from typing import Callable, Optional
+from ws.decoder import FrameDecoder
 
 
 class PrivateMessageRouter:
@@ -10,11 +10,22 @@ class PrivateMessageRouter:
         self.on_topic = on_topic
         self.on_pong = on_pong
         self.logger = logger
+        self.decoder = FrameDecoder()
 
-    def route(self, raw_message: str) -> None:
-        try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError:
+    def route(self, raw_message: str, data: Optional[dict] = None) -> None:
+        """
+        Route un message privé.
+
+        Args:
+            raw_message: Trame brute reçue
+            data: Message déjà décodé par l'appelant (évite un second décodage)
+        """
+        if data is None:
+            try:
+                data = self.decoder.decode(raw_message)
+            except ValueError:
+                data = None
+        if data is None:
             try:
                 self.logger and self.logger.debug(f"Message brut reçu: {raw_message[:100]}...")
             except Exception:
@@ -5,6 +5,8 @@ Sous-package WebSocket public (Bybit v5).
 Contient des composants modulaires pour le client WebSocket public:
 - subscriptions.py: Construction des topics de souscription
 - parser_router.py: Parsing et routage des messages
+- ticker_state.py: État par symbole des tickers (fusion snapshot/delta)
+- local_orderbook.py: Carnets d'ordres locaux (snapshot/delta, contrôle de séquence)
 - transport.py: Gestion du backoff et de l'attente entre reconnexions
 - models.py: Dataclasses pour les données structurées
 """
@@ -12,6 +14,8 @@ Contient des composants modulaires pour le client WebSocket public:
 __all__ = [
     "subscriptions",
     "parser_router",
+    "ticker_state",
+    "local_orderbook",
     "transport",
     "models",
 ]
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Carnet d'ordres local maintenu par le flux ``orderbook.{depth}.{symbol}``.
+
+Bybit envoie un ``snapshot`` à la souscription puis des ``delta`` qui ne
+contiennent que les niveaux modifiés (taille "0" = niveau supprimé).
+Chaque message porte un identifiant de mise à jour ``u`` strictement
+consécutif : un trou signifie qu'un delta a été perdu et que le carnet
+local est faux. Dans ce cas le carnet est invalidé et une resouscription
+est demandée (nouveau snapshot). ``u == 1`` signale un redémarrage du
+service côté Bybit et doit être traité comme un snapshot.
+
+Les niveaux sont stockés dans un dict prix → taille accompagné d'une liste
+de prix triée (bisect), ce qui évite tout tri lors des lectures.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, List, Optional
+
+
+class LocalOrderbook:
+    """Carnet d'ordres trié d'un symbole (bids décroissants, asks croissants)."""
+
+    __slots__ = ("symbol", "_bids", "_asks", "_bid_keys", "_ask_keys", "update_id", "seq", "ts")
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._bids: Dict[float, float] = {}
+        self._asks: Dict[float, float] = {}
+        # Clés triées croissantes ; les bids sont stockés en négatif pour un tri décroissant
+        self._bid_keys: List[float] = []
+        self._ask_keys: List[float] = []
+        self.update_id = 0
+        self.seq = 0
+        self.ts = 0
+
+    def reset(self) -> None:
+        """Vide le carnet (avant application d'un snapshot)."""
+        self._bids.clear()
+        self._asks.clear()
+        self._bid_keys.clear()
+        self._ask_keys.clear()
+
+    def apply_levels(self, bids: list, asks: list) -> None:
+        """
+        Applique des niveaux [prix, taille] ; une taille nulle supprime le niveau.
+
+        Args:
+            bids: Niveaux acheteurs au format Bybit (chaînes)
+            asks: Niveaux vendeurs au format Bybit (chaînes)
+        """
+        self._apply_side(bids, self._bids, self._bid_keys, -1.0)
+        self._apply_side(asks, self._asks, self._ask_keys, 1.0)
+
+    @staticmethod
+    def _apply_side(levels: list, book: Dict[float, float], keys: List[float], sign: float) -> None:
+        for level in levels or ():
+            price = float(level[0])
+            size = float(level[1])
+            key = sign * price
+            if size == 0.0:
+                if book.pop(price, None) is not None:
+                    index = bisect_left(keys, key)
+                    if index < len(keys) and keys[index] == key:
+                        del keys[index]
+                continue
+            if price not in book:
+                insort(keys, key)
+            book[price] = size
+
+    def best_bid(self) -> Optional[float]:
+        return -self._bid_keys[0] if self._bid_keys else None
+
+    def best_ask(self) -> Optional[float]:
+        return self._ask_keys[0] if self._ask_keys else None
+
+    def to_dict(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Retourne le carnet au format REST Bybit (``b``/``a`` en [prix, taille]).
+
+        Args:
+            depth: Nombre de niveaux par côté (tous si None)
+
+        Returns:
+            Dict {"s", "b", "a", "u", "seq", "ts"} ; prix et tailles en float
+        """
+        bid_keys = self._bid_keys[:depth] if depth else self._bid_keys
+        ask_keys = self._ask_keys[:depth] if depth else self._ask_keys
+        bids = self._bids
+        asks = self._asks
+        return {
+            "s": self.symbol,
+            "b": [[-key, bids[-key]] for key in bid_keys],
+            "a": [[key, asks[key]] for key in ask_keys],
+            "u": self.update_id,
+            "seq": self.seq,
+            "ts": self.ts,
+        }
+
+    def __len__(self) -> int:
+        return len(self._bids) + len(self._asks)
+
+
+class OrderbookStore:
+    """
+    Registre thread-safe des carnets locaux, alimenté par les messages WS.
+
+    Les écritures proviennent des threads WebSocket ; les lectures (placement
+    d'ordres) depuis n'importe quel thread. Un carnet n'est lisible qu'entre
+    un snapshot et le premier trou de séquence détecté.
+    """
+
+    def __init__(self) -> None:
+        self._books: Dict[str, LocalOrderbook] = {}
+        self._valid: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self.gap_count = 0
+
+    def apply(self, payload: dict, on_gap: Optional[Callable[[str], None]] = None) -> Optional[str]:
+        """
+        Applique un message orderbook (snapshot ou delta).
+
+        Args:
+            payload: Message WebSocket décodé (topic, type, ts, data)
+            on_gap: Callback appelé avec le symbole lorsqu'un trou de
+                séquence est détecté (resouscription à déclencher par la
+                connexion qui a reçu le message)
+
+        Returns:
+            Symbole mis à jour, ou None si le message est ignoré
+            (invalide, carnet en attente de snapshot, trou de séquence)
+        """
+        data = payload.get("data") or {}
+        symbol = data.get("s")
+        if not symbol:
+            return None
+
+        try:
+            update_id = int(data.get("u") or 0)
+        except (TypeError, ValueError):
+            return None
+        is_snapshot = payload.get("type") == "snapshot" or update_id == 1
+
+        gap = False
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is None:
+                book = self._books[symbol] = LocalOrderbook(symbol)
+                self._valid[symbol] = False
+
+            if is_snapshot:
+                book.reset()
+            elif not self._valid[symbol]:
+                # Deltas reçus avant le snapshot (ou après un trou) : inutilisables
+                return None
+            elif update_id != book.update_id + 1:
+                self._valid[symbol] = False
+                self.gap_count += 1
+                gap = True
+
+            if not gap:
+                try:
+                    book.apply_levels(data.get("b"), data.get("a"))
+                except (TypeError, ValueError, IndexError):
+                    self._valid[symbol] = False
+                    gap = True
+                else:
+                    book.update_id = update_id
+                    book.seq = int(data.get("seq") or book.seq)
+                    book.ts = int(payload.get("cts") or payload.get("ts") or book.ts)
+                    self._valid[symbol] = True
+
+        if gap:
+            if on_gap:
+                on_gap(symbol)
+            return None
+        return symbol
+
+    def get(self, symbol: str, depth: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retourne le carnet local d'un symbole s'il est synchronisé.
+
+        Args:
+            symbol: Symbole recherché
+            depth: Nombre de niveaux par côté (tous si None)
+
+        Returns:
+            Dict au format REST Bybit ou None si absent / désynchronisé
+        """
+        with self._lock:
+            if not self._valid.get(symbol):
+                return None
+            return self._books[symbol].to_dict(depth)
+
+    def is_synced(self, symbol: str) -> bool:
+        """Indique si le carnet d'un symbole est lisible."""
+        return bool(self._valid.get(symbol))
+
+    def invalidate(self, symbol: str) -> None:
+        """Marque un carnet comme désynchronisé (déconnexion, resouscription)."""
+        with self._lock:
+            if symbol in self._valid:
+                self._valid[symbol] = False
+
+    def discard(self, symbol: str) -> None:
+        """Oublie le carnet d'un symbole (désabonnement)."""
+        with self._lock:
+            self._books.pop(symbol, None)
+            self._valid.pop(symbol, None)
+
+    def __len__(self) -> int:
+        return len(self._books)
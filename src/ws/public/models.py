@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -12,6 +12,8 @@ class TickerData:
     ask1_price: Optional[float] = None
     volume24h: Optional[float] = None
     turnover24h: Optional[float] = None
+    funding_rate: Optional[float] = None
+    next_funding_time: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -21,5 +23,9 @@ class OrderbookData:
     ask1_price: Optional[float]
     bid1_size: Optional[float]
     ask1_size: Optional[float]
+    bids: Tuple[Tuple[float, float], ...] = ()
+    asks: Tuple[Tuple[float, float], ...] = ()
+    update_id: Optional[int] = None
+    seq: Optional[int] = None
 
 
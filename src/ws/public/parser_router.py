@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-import json
 from typing import Callable, Optional
+from ws.decoder import FrameDecoder
 from .models import TickerData, OrderbookData
+from .ticker_state import TickerStateEngine
+from .local_orderbook import OrderbookStore
+from kline_window import KlineStore
 
 
 class PublicMessageParser:
@@ -21,6 +24,8 @@ class PublicMessageParser:
                 ask1_price=float(data.get("ask1Price")) if data.get("ask1Price") is not None else None,
                 volume24h=float(data.get("volume24h")) if data.get("volume24h") is not None else None,
                 turnover24h=float(data.get("turnover24h")) if data.get("turnover24h") is not None else None,
+                funding_rate=float(data.get("fundingRate")) if data.get("fundingRate") else None,
+                next_funding_time=int(data.get("nextFundingTime")) if data.get("nextFundingTime") else None,
             )
         except (TypeError, ValueError):
             return None
@@ -31,13 +36,19 @@ class PublicMessageParser:
         if not data:
             return None
         try:
-            # Exemple minimal pour depth=1
+            # Tous les niveaux du message (depth 1 à 500), niveau 1 en tête
+            bids = tuple((float(p), float(s)) for p, s in data.get("b") or ())
+            asks = tuple((float(p), float(s)) for p, s in data.get("a") or ())
             return OrderbookData(
                 symbol=str(data.get("s") or data.get("symbol") or ""),
-                bid1_price=float(data.get("b")[0][0]) if data.get("b") else None,
-                bid1_size=float(data.get("b")[0][1]) if data.get("b") else None,
-                ask1_price=float(data.get("a")[0][0]) if data.get("a") else None,
-                ask1_size=float(data.get("a")[0][1]) if data.get("a") else None,
+                bid1_price=bids[0][0] if bids else None,
+                bid1_size=bids[0][1] if bids else None,
+                ask1_price=asks[0][0] if asks else None,
+                ask1_size=asks[0][1] if asks else None,
+                bids=bids,
+                asks=asks,
+                update_id=int(data["u"]) if data.get("u") is not None else None,
+                seq=int(data["seq"]) if data.get("seq") is not None else None,
             )
         except (TypeError, ValueError, IndexError):
             return None
@@ -46,32 +57,51 @@ class PublicMessageParser:
 class PublicMessageRouter:
     """Routage des messages WS publics vers les callbacks applicatifs."""
 
-    def __init__(self, on_ticker: Optional[Callable[[dict], None]] = None) -> None:
+    def __init__(
+        self,
+        on_ticker: Optional[Callable[[dict], None]] = None,
+        on_ack: Optional[Callable[[dict], None]] = None,
+        orderbook_store: Optional[OrderbookStore] = None,
+        on_orderbook_gap: Optional[Callable[[str], None]] = None,
+        kline_store: Optional[KlineStore] = None,
+    ) -> None:
         self.on_ticker_raw = on_ticker
+        # Accusés de réception des opérations subscribe/unsubscribe
+        self.on_ack = on_ack
+        # État par symbole : fusion snapshot/delta et émission des seuls champs modifiés
+        self.ticker_state = TickerStateEngine()
+        # Carnets locaux (partagés entre connexions) et resouscription sur trou de séquence
+        self.orderbook_store = orderbook_store if orderbook_store is not None else OrderbookStore()
+        self.on_orderbook_gap = on_orderbook_gap
+        # Fenêtres de bougies pour la volatilité (topics kline ignorés sans registre)
+        self.kline_store = kline_store
+        # Seuls les topics routés sont décodés (publicTrade... ignorés sans décodage)
+        prefixes = ("tickers.", "orderbook.") + (("kline.",) if kline_store is not None else ())
+        self.decoder = FrameDecoder(topic_prefixes=prefixes)
 
     def route(self, raw_message: str, logger, category: str) -> None:
         try:
-            payload = json.loads(raw_message)
-        except json.JSONDecodeError as e:
+            payload = self.decoder.decode(raw_message)
+        except ValueError as e:
             try:
                 logger.warning(f"⚠️ Erreur JSON ({category}): {e}")
             except Exception:
                 pass
             return
+        if payload is None:
+            return
 
         topic: str = payload.get("topic", "")
-        if topic.startswith("tickers.") and self.on_ticker_raw:
-            ticker_obj = PublicMessageParser.parse_ticker(payload)
-            if ticker_obj:
-                # Repasse en dict (compat rétro) pour les callbacks existants
-                self.on_ticker_raw({
-                    "symbol": ticker_obj.symbol,
-                    "lastPrice": ticker_obj.last_price,
-                    "markPrice": ticker_obj.mark_price,
-                    "bid1Price": ticker_obj.bid1_price,
-                    "ask1Price": ticker_obj.ask1_price,
-                    "volume24h": ticker_obj.volume24h,
-                    "turnover24h": ticker_obj.turnover24h,
-                })
-
+        if not topic:
+            if self.on_ack and payload.get("op") in ("subscribe", "unsubscribe"):
+                self.on_ack(payload)
+            return
 
+        if topic.startswith("tickers.") and self.on_ticker_raw:
+            changes = self.ticker_state.apply(payload)
+            if changes:
+                self.on_ticker_raw(changes)
+        elif topic.startswith("orderbook."):
+            self.orderbook_store.apply(payload, self.on_orderbook_gap)
+        elif topic.startswith("kline.") and self.kline_store is not None:
+            self.kline_store.apply_ws(payload)
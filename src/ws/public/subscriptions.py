@@ -1,18 +1,52 @@
 #!/usr/bin/env python3
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class SubscriptionBuilder:
     """Construit les messages de souscription aux topics publics Bybit."""
 
     @staticmethod
-    def tickers(symbols: List[str]) -> Dict:
-        args = [f"tickers.{s}" for s in symbols if s]
-        return {"op": "subscribe", "args": args}
+    def tickers(symbols: List[str], req_id: Optional[str] = None) -> Dict:
+        return SubscriptionBuilder.subscribe(
+            SubscriptionBuilder.ticker_topics(symbols), req_id
+        )
 
     @staticmethod
-    def orderbook(symbols: List[str], depth: int = 1) -> Dict:
-        args = [f"orderbook.{depth}.{s}" for s in symbols if s]
-        return {"op": "subscribe", "args": args}
+    def unsubscribe_tickers(symbols: List[str], req_id: Optional[str] = None) -> Dict:
+        return SubscriptionBuilder.unsubscribe(
+            SubscriptionBuilder.ticker_topics(symbols), req_id
+        )
 
+    @staticmethod
+    def orderbook(symbols: List[str], depth: int = 1, req_id: Optional[str] = None) -> Dict:
+        return SubscriptionBuilder.subscribe(
+            SubscriptionBuilder.orderbook_topics(symbols, depth), req_id
+        )
+
+    @staticmethod
+    def orderbook_topics(symbols: List[str], depth: int = 1) -> List[str]:
+        return [f"orderbook.{depth}.{s}" for s in symbols if s]
+
+    @staticmethod
+    def kline_topics(symbols: List[str], interval: str = "1") -> List[str]:
+        return [f"kline.{interval}.{s}" for s in symbols if s]
+
+    @staticmethod
+    def ticker_topics(symbols: List[str]) -> List[str]:
+        return [f"tickers.{s}" for s in symbols if s]
+
+    @staticmethod
+    def subscribe(topics: List[str], req_id: Optional[str] = None) -> Dict:
+        return SubscriptionBuilder._build("subscribe", topics, req_id)
 
+    @staticmethod
+    def unsubscribe(topics: List[str], req_id: Optional[str] = None) -> Dict:
+        return SubscriptionBuilder._build("unsubscribe", topics, req_id)
+
+    @staticmethod
+    def _build(op: str, topics: List[str], req_id: Optional[str]) -> Dict:
+        message = {"op": op, "args": list(topics)}
+        # req_id est renvoyé tel quel dans l'accusé Bybit (suivi des acks)
+        if req_id:
+            message["req_id"] = req_id
+        return message
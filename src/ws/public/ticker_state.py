@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Moteur d'état des tickers publics (snapshot + delta Bybit v5).
+
+Bybit envoie un message ``snapshot`` à la souscription, puis des messages
+``delta`` qui ne contiennent que les champs modifiés. Ce module maintient un
+enregistrement pré-alloué par symbole et y fusionne les deltas en place :
+- seules les valeurs dont la chaîne brute a changé sont reconverties
+- le funding (fundingRate, nextFundingTime) est conservé
+- seul le diff est émis vers les callbacks applicatifs
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# (clé Bybit, attribut de l'enregistrement, convertisseur)
+TICKER_FIELDS: Tuple[Tuple[str, str, Callable[[Any], Any]], ...] = (
+    ("lastPrice", "last_price", float),
+    ("markPrice", "mark_price", float),
+    ("bid1Price", "bid1_price", float),
+    ("ask1Price", "ask1_price", float),
+    ("volume24h", "volume24h", float),
+    ("turnover24h", "turnover24h", float),
+    ("fundingRate", "funding_rate", float),
+    ("nextFundingTime", "next_funding_time", int),
+)
+
+
+class TickerState:
+    """Enregistrement mutable de l'état courant d'un ticker."""
+
+    __slots__ = ("symbol", "raw", "version") + tuple(attr for _, attr, _ in TICKER_FIELDS)
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        # Dernière valeur brute reçue par clé Bybit (détection de changement sans conversion)
+        self.raw: Dict[str, Any] = {}
+        self.version = 0
+        for _, attr, _ in TICKER_FIELDS:
+            setattr(self, attr, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne l'état complet au format des callbacks (clés Bybit)."""
+        result: Dict[str, Any] = {"symbol": self.symbol}
+        for key, attr, _ in TICKER_FIELDS:
+            result[key] = getattr(self, attr)
+        return result
+
+
+class TickerStateEngine:
+    """
+    Fusionne les messages ticker snapshot/delta dans un état par symbole.
+
+    Les écritures proviennent du thread WebSocket propriétaire de la
+    connexion ; le verrou ne protège que les lectures concurrentes
+    depuis d'autres threads via ``get``.
+    """
+
+    def __init__(self) -> None:
+        self._states: Dict[str, TickerState] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, payload: dict) -> Optional[Dict[str, Any]]:
+        """
+        Applique un message ticker et retourne les champs modifiés.
+
+        Args:
+            payload: Message WebSocket décodé (topic, type, data)
+
+        Returns:
+            Dict {"symbol": ..., <clé Bybit>: valeur} limité aux champs
+            modifiés (toujours émis au premier message d'un symbole),
+            ou None si rien n'a changé / message invalide
+        """
+        data = payload.get("data") or {}
+        if not data:
+            return None
+
+        symbol = data.get("symbol")
+        if not symbol:
+            topic = payload.get("topic", "")
+            symbol = topic.split(".", 1)[1] if "." in topic else ""
+        if not symbol:
+            return None
+
+        state = self._states.get(symbol)
+        is_new = state is None
+        if is_new:
+            with self._lock:
+                state = self._states.setdefault(symbol, TickerState(symbol))
+
+        is_snapshot = payload.get("type") == "snapshot"
+        changes: Dict[str, Any] = {}
+
+        with self._lock:
+            raw = state.raw
+            for key, attr, convert in TICKER_FIELDS:
+                value = data.get(key)
+                if value is None or value == "":
+                    if is_snapshot and key in raw:
+                        # Un snapshot remplace l'état : champ absent → effacé
+                        del raw[key]
+                        setattr(state, attr, None)
+                    continue
+                if raw.get(key) == value:
+                    continue
+                try:
+                    converted = convert(value)
+                except (TypeError, ValueError):
+                    continue
+                raw[key] = value
+                setattr(state, attr, converted)
+                changes[key] = converted
+
+            # Premier message d'un symbole : toujours émis pour l'annoncer
+            if not changes and not is_new:
+                return None
+            state.version += 1
+
+        changes["symbol"] = symbol
+        return changes
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne l'état complet d'un symbole.
+
+        Args:
+            symbol: Symbole recherché
+
+        Returns:
+            Dict au format des callbacks ou None si le symbole est inconnu
+        """
+        with self._lock:
+            state = self._states.get(symbol)
+            return state.to_dict() if state else None
+
+    def discard(self, symbol: str) -> None:
+        """Oublie l'état d'un symbole (désabonnement)."""
+        with self._lock:
+            self._states.pop(symbol, None)
+
+    def clear(self) -> None:
+        """Réinitialise tous les états (reconnexion : un nouveau snapshot suivra)."""
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
@@ -6,13 +6,15 @@ Ce module gère la logique de répartition des symboles entre les connexions
 linear et inverse, et détermine la stratégie de connexion optimale.
 """
 
+import math
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from typing import List, Tuple, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from logging_setup import setup_logging
+from config.constants import WS_SHARD_TARGET_SYMBOLS
 
 
 @dataclass
@@ -23,6 +25,9 @@ class ConnectionStrategy:
     total_connections: int
     linear_symbols: List[str]
     inverse_symbols: List[str]
+    # Répartition en shards (une connexion PublicWSClient par shard)
+    linear_shards: List[List[str]] = field(default_factory=list)
+    inverse_shards: List[List[str]] = field(default_factory=list)
 
 
 class WebSocketConnectionStrategy:
@@ -34,6 +39,7 @@ class WebSocketConnectionStrategy:
     - Déterminer la stratégie de connexion optimale
     - Séparer les symboles par catégorie
     - Optimiser le nombre de connexions
+    - Répartir les symboles en shards équilibrés par débit attendu
     """
 
     def __init__(self, logger=None):
@@ -45,13 +51,21 @@ class WebSocketConnectionStrategy:
         """
         self.logger = logger or setup_logging()
 
-    def analyze_symbols(self, linear_symbols: List[str], inverse_symbols: List[str]) -> ConnectionStrategy:
+    def analyze_symbols(
+        self,
+        linear_symbols: List[str],
+        inverse_symbols: List[str],
+        weights: Optional[Dict[str, float]] = None,
+        max_per_connection: int = WS_SHARD_TARGET_SYMBOLS,
+    ) -> ConnectionStrategy:
         """
         Analyse les symboles et détermine la stratégie de connexion.
 
         Args:
             linear_symbols: Symboles linear (USDT)
             inverse_symbols: Symboles inverse (USD)
+            weights: Débit attendu par symbole (turnover24h), optionnel
+            max_per_connection: Nombre de symboles par shard
 
         Returns:
             ConnectionStrategy: Stratégie optimale
@@ -59,14 +73,18 @@ class WebSocketConnectionStrategy:
         needs_linear = len(linear_symbols) > 0
         needs_inverse = len(inverse_symbols) > 0
 
-        total_connections = sum([needs_linear, needs_inverse])
+        linear_shards = self.plan_shards(linear_symbols, weights, max_per_connection)
+        inverse_shards = self.plan_shards(inverse_symbols, weights, max_per_connection)
+        total_connections = len(linear_shards) + len(inverse_shards)
 
         strategy = ConnectionStrategy(
             needs_linear=needs_linear,
             needs_inverse=needs_inverse,
             total_connections=total_connections,
             linear_symbols=linear_symbols,
-            inverse_symbols=inverse_symbols
+            inverse_symbols=inverse_symbols,
+            linear_shards=linear_shards,
+            inverse_shards=inverse_shards,
         )
 
         self.logger.info(f"📊 Stratégie connexion: {total_connections} connexion(s) "
@@ -74,9 +92,71 @@ class WebSocketConnectionStrategy:
 
         return strategy
 
+    def plan_shards(
+        self,
+        symbols: List[str],
+        weights: Optional[Dict[str, float]] = None,
+        max_per_connection: int = WS_SHARD_TARGET_SYMBOLS,
+    ) -> List[List[str]]:
+        """
+        Répartit les symboles en shards équilibrés par débit attendu.
+
+        Glouton LPT : les symboles sont triés par poids décroissant puis
+        placés dans le shard le moins chargé ayant encore de la place.
+        Aucun symbole n'est abandonné : le nombre de shards suit la taille
+        de l'univers.
+
+        Args:
+            symbols: Symboles d'une catégorie
+            weights: Poids par symbole (turnover24h), 0 si absent
+            max_per_connection: Nombre maximum de symboles par shard
+
+        Returns:
+            Liste de shards (listes de symboles)
+        """
+        unique = list(dict.fromkeys(s for s in symbols if s))
+        if not unique:
+            return []
+
+        max_per_connection = max(1, max_per_connection)
+        shard_count = math.ceil(len(unique) / max_per_connection)
+        shards: List[List[str]] = [[] for _ in range(shard_count)]
+        loads = [0.0] * shard_count
+
+        weights = weights or {}
+        ordered = sorted(unique, key=lambda s: self.symbol_weight(s, weights), reverse=True)
+        for symbol in ordered:
+            index = self.pick_shard(shards, loads, max_per_connection)
+            shards[index].append(symbol)
+            loads[index] += self.symbol_weight(symbol, weights)
+
+        return shards
+
+    @staticmethod
+    def symbol_weight(symbol: str, weights: Dict[str, float]) -> float:
+        """Poids d'un symbole (plancher à 1 pour répartir aussi le nombre de topics)."""
+        try:
+            return max(1.0, float(weights.get(symbol) or 0.0))
+        except (TypeError, ValueError):
+            return 1.0
+
+    @staticmethod
+    def pick_shard(shards: List[List[str]], loads: List[float],
+                   max_per_connection: int) -> Optional[int]:
+        """
+        Retourne l'index du shard le moins chargé ayant de la place.
+
+        Returns:
+            Index du shard, ou None si tous les shards sont pleins
+        """
+        candidates = [i for i, shard in enumerate(shards) if len(shard) < max_per_connection]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda i: (loads[i], len(shards[i])))
+
     def get_connection_plan(self, strategy: ConnectionStrategy) -> List[Dict[str, any]]:
         """
-        Génère le plan de connexion basé sur la stratégie.
+        Génère le plan de connexion basé sur la stratégie (une entrée par shard).
 
         Args:
             strategy: Stratégie de connexion
@@ -86,23 +166,21 @@ class WebSocketConnectionStrategy:
         """
         plans = []
 
-        if strategy.needs_linear:
-            plans.append({
-                "category": "linear",
-                "symbols": strategy.linear_symbols,
-                "priority": 1
-            })
-
-        if strategy.needs_inverse:
-            plans.append({
-                "category": "inverse",
-                "symbols": strategy.inverse_symbols,
-                "priority": 2
-            })
+        for category, shards, priority in (
+            ("linear", strategy.linear_shards, 1),
+            ("inverse", strategy.inverse_shards, 2),
+        ):
+            for index, shard in enumerate(shards):
+                plans.append({
+                    "category": category,
+                    "symbols": shard,
+                    "priority": priority,
+                    "shard": index,
+                })
 
         return plans
 
-    def optimize_symbols(self, symbols: List[str], max_per_connection: int = 100) -> List[str]:
+    def optimize_symbols(self, symbols: List[str], max_per_connection: int = WS_SHARD_TARGET_SYMBOLS) -> List[str]:
         """
         Optimise la liste des symboles pour une connexion.
 
@@ -113,15 +191,13 @@ class WebSocketConnectionStrategy:
         Returns:
             Liste optimisée des symboles
         """
-        if len(symbols) <= max_per_connection:
-            return symbols
-
-        # Trier par priorité (ex: volume, liquidité)
-        # Pour l'instant, on garde les premiers
-        optimized = symbols[:max_per_connection]
+        optimized = list(dict.fromkeys(s for s in symbols if s))
 
-        self.logger.warning(f"⚠️ Limitation symboles: {len(symbols)} → {len(optimized)} "
-                           f"(max {max_per_connection})")
+        # Plus de troncature : au-delà de la limite, plan_shards ouvre des connexions supplémentaires
+        if len(optimized) > max_per_connection:
+            shard_count = math.ceil(len(optimized) / max_per_connection)
+            self.logger.info(f"📊 {len(optimized)} symboles répartis sur {shard_count} connexion(s) "
+                             f"(max {max_per_connection} par connexion)")
 
         return optimized
 
@@ -178,6 +254,8 @@ class WebSocketConnectionStrategy:
             "inverse_count": len(strategy.inverse_symbols),
             "needs_linear": strategy.needs_linear,
             "needs_inverse": strategy.needs_inverse,
+            "linear_shards": [len(shard) for shard in strategy.linear_shards],
+            "inverse_shards": [len(shard) for shard in strategy.inverse_shards],
             "strategy_type": self._get_strategy_type(strategy)
         }
 
@@ -187,5 +265,7 @@ class WebSocketConnectionStrategy:
             return "none"
         elif strategy.total_connections == 1:
             return "single"
-        else:
+        elif strategy.total_connections == 2 and strategy.needs_linear and strategy.needs_inverse:
             return "dual"
+        else:
+            return "sharded"
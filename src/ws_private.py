@@ -259,7 +259,7 @@ class PrivateWSClient:
 
     def _on_message(self, ws, message):
         try:
-            data = json.loads(message)
+            data = self._router.decoder.decode(message)
 
             # Auth
             if data.get("op") == "auth":
@@ -322,9 +322,9 @@ class PrivateWSClient:
             # Déléguer le routage des messages privés (pong + topics)
             self._router.on_topic = self.on_topic
             self._router.on_pong = self.on_pong
-            self._router.route(message)
+            self._router.route(message, data)
 
-        except json.JSONDecodeError:
+        except ValueError:
             try:
                 self.logger.debug(f"Message brut reçu: {message[:100]}...")
             except Exception:
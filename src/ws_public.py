@@ -117,13 +117,18 @@ Message subscription confirmation :
 - Topics publics: https://bybit-exchange.github.io/docs/v5/ws/public/ticker
 """
 
+import itertools
 import json
+import threading
 import time
 import websocket
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional
 from enhanced_metrics import record_ws_connection, record_ws_error
 from ws.public.subscriptions import SubscriptionBuilder
 from ws.public.parser_router import PublicMessageRouter
+from ws.public.local_orderbook import OrderbookStore
+from kline_window import KlineStore
+from config.constants import WS_ORDERBOOK_DEPTH
 from ws.public.transport import BackoffTransport
 
 
@@ -180,6 +185,8 @@ class PublicWSClient:
         testnet: bool,
         logger,
         on_ticker_callback: Callable[[dict], None],
+        orderbook_store: Optional[OrderbookStore] = None,
+        kline_store: Optional[KlineStore] = None,
     ):
         """
         Initialise le client WebSocket publique.
@@ -198,6 +205,10 @@ class PublicWSClient:
                    Recommandé: logging.getLogger(__name__)
             on_ticker_callback (Callable[[dict], None]): Fonction appelée pour chaque ticker
                                                         Signature: callback(ticker_data: dict) -> None
+            orderbook_store (Optional[OrderbookStore]): Registre des carnets locaux
+                          (partagé entre connexions) ; un registre propre est créé si None
+            kline_store (Optional[KlineStore]): Fenêtres de bougies pour la volatilité ;
+                          si fourni, kline.1.{symbol} est souscrit avec chaque ticker
 
         Note:
             - Les symboles invalides seront ignorés par Bybit
@@ -219,7 +230,25 @@ class PublicWSClient:
         self.reconnect_delays = [1, 2, 5, 10, 30]  # secondes
         self.current_delay_index = 0  # Commence au premier délai (1s)
         self._transport = BackoffTransport(self.reconnect_delays)
-        self._router = PublicMessageRouter(on_ticker=self.on_ticker_callback)
+        self.orderbook_store = orderbook_store if orderbook_store is not None else OrderbookStore()
+        self._router = PublicMessageRouter(
+            on_ticker=self.on_ticker_callback,
+            on_ack=self._on_ack,
+            orderbook_store=self.orderbook_store,
+            on_orderbook_gap=self._resync_orderbook,
+            kline_store=kline_store,
+        )
+        self.kline_store = kline_store
+        # Symboles dont le carnet local est alimenté par orderbook.{depth}.{symbol}
+        self.orderbook_symbols: List[str] = []
+        self.orderbook_depth = WS_ORDERBOOK_DEPTH
+
+        # Souscriptions dynamiques sur la connexion ouverte (sans reconnexion)
+        self._connected = False
+        self._symbols_lock = threading.Lock()
+        self._req_ids = itertools.count(1)
+        # Opérations en attente d'accusé : {req_id: {"op", "topics", "sent_at"}}
+        self._pending_acks: Dict[str, Dict] = {}
 
         # Callbacks optionnels pour événements de connexion
         self.on_open_callback: Optional[Callable] = None
@@ -251,14 +280,25 @@ class PublicWSClient:
         # Après une connexion réussie, on recommence avec le délai le plus court (1s)
         # Cela permet de réagir rapidement en cas de nouvelle déconnexion
         self.current_delay_index = 0
+        self._connected = True
+
+        # Nouvelle session : les opérations en vol sont obsolètes, tout est resouscrit
+        with self._symbols_lock:
+            self._pending_acks.clear()
+            symbols = list(self.symbols)
+            orderbook_symbols = list(self.orderbook_symbols)
 
         # S'abonner aux tickers pour tous les symboles (via builder dédié)
-        if self.symbols:
-            subscribe_message = SubscriptionBuilder.tickers(self.symbols)
+        if symbols:
+            req_id = self._next_req_id("subscribe")
+            subscribe_message = SubscriptionBuilder.subscribe(
+                self._symbol_topics(symbols), req_id
+            )
             try:
+                self._track_ack(req_id, subscribe_message)
                 ws.send(json.dumps(subscribe_message))
                 self.logger.info(
-                    f"# Souscription tickers → {len(self.symbols)} symboles "
+                    f"# Souscription tickers → {len(symbols)} symboles "
                     f"({self.category})"
                 )
             except (json.JSONEncodeError, ConnectionError, OSError) as e:
@@ -275,6 +315,10 @@ class PublicWSClient:
                 f"⚠️ Aucun symbole à suivre pour {self.category}"
             )
 
+        # Carnets locaux : un snapshot complet suivra la resouscription
+        if orderbook_symbols:
+            self._send_op("subscribe", self._orderbook_topics(orderbook_symbols))
+
         # Appeler le callback externe si défini
         if self.on_open_callback:
             try:
@@ -287,6 +331,194 @@ class PublicWSClient:
         # Déléguer parsing + dispatch au routeur
         self._router.route(message, self.logger, self.category)
 
+    def is_connected(self) -> bool:
+        """Indique si la connexion est ouverte (souscriptions envoyables)."""
+        return self.running and self._connected and self.ws is not None
+
+    def subscribe(self, symbols: List[str]) -> Optional[str]:
+        """
+        Ajoute des symboles sur la connexion ouverte, sans reconnexion.
+
+        Les symboles sont mémorisés : si la connexion n'est pas ouverte,
+        ils seront souscrits au prochain _on_open.
+
+        Args:
+            symbols: Symboles à suivre
+
+        Returns:
+            req_id de l'opération envoyée (suivi d'accusé) ou None si rien
+            n'a été envoyé
+        """
+        with self._symbols_lock:
+            new_symbols = [s for s in dict.fromkeys(symbols) if s and s not in self.symbols]
+            self.symbols.extend(new_symbols)
+        if not new_symbols:
+            return None
+        return self._send_op("subscribe", self._symbol_topics(new_symbols))
+
+    def unsubscribe(self, symbols: List[str]) -> Optional[str]:
+        """
+        Retire des symboles de la connexion ouverte, sans reconnexion.
+
+        Args:
+            symbols: Symboles à ne plus suivre
+
+        Returns:
+            req_id de l'opération envoyée ou None si rien n'a été envoyé
+        """
+        with self._symbols_lock:
+            removed = [s for s in dict.fromkeys(symbols) if s in self.symbols]
+            for symbol in removed:
+                self.symbols.remove(symbol)
+        for symbol in removed:
+            self._router.ticker_state.discard(symbol)
+            if self.kline_store is not None:
+                self.kline_store.discard(symbol)
+        if not removed:
+            return None
+        return self._send_op("unsubscribe", self._symbol_topics(removed))
+
+    def _symbol_topics(self, symbols: List[str]) -> List[str]:
+        """Topics suivis pour chaque symbole (ticker, et bougies si kline_store)."""
+        topics = SubscriptionBuilder.ticker_topics(symbols)
+        if self.kline_store is not None:
+            topics += SubscriptionBuilder.kline_topics(symbols)
+        return topics
+
+    def subscribe_orderbook(self, symbols: List[str]) -> Optional[str]:
+        """
+        Alimente le carnet local des symboles via orderbook.{depth}.{symbol}.
+
+        Les symboles sont mémorisés et resouscrits à chaque reconnexion.
+
+        Args:
+            symbols: Symboles dont le carnet doit être maintenu
+
+        Returns:
+            req_id de l'opération envoyée ou None si rien n'a été envoyé
+        """
+        with self._symbols_lock:
+            new_symbols = [
+                s for s in dict.fromkeys(symbols) if s and s not in self.orderbook_symbols
+            ]
+            self.orderbook_symbols.extend(new_symbols)
+        if not new_symbols:
+            return None
+        return self._send_op("subscribe", self._orderbook_topics(new_symbols))
+
+    def unsubscribe_orderbook(self, symbols: List[str]) -> Optional[str]:
+        """
+        Arrête le flux orderbook des symboles et oublie leur carnet local.
+
+        Args:
+            symbols: Symboles à ne plus suivre
+
+        Returns:
+            req_id de l'opération envoyée ou None si rien n'a été envoyé
+        """
+        with self._symbols_lock:
+            removed = [s for s in dict.fromkeys(symbols) if s in self.orderbook_symbols]
+            for symbol in removed:
+                self.orderbook_symbols.remove(symbol)
+        for symbol in removed:
+            self.orderbook_store.discard(symbol)
+        if not removed:
+            return None
+        return self._send_op("unsubscribe", self._orderbook_topics(removed))
+
+    def get_orderbook(self, symbol: str, depth: Optional[int] = None) -> Optional[dict]:
+        """
+        Retourne le carnet local d'un symbole (aucun appel REST).
+
+        Args:
+            symbol: Symbole recherché
+            depth: Nombre de niveaux par côté (tous si None)
+
+        Returns:
+            Dict au format REST Bybit (``b``/``a``) ou None si le carnet
+            n'est pas synchronisé
+        """
+        return self.orderbook_store.get(symbol, depth)
+
+    def _orderbook_topics(self, symbols: List[str]) -> List[str]:
+        return SubscriptionBuilder.orderbook_topics(symbols, self.orderbook_depth)
+
+    def _resync_orderbook(self, symbol: str) -> None:
+        """Trou de séquence : resouscrit le topic pour obtenir un nouveau snapshot."""
+        self.logger.warning(
+            f"⚠️ Trou de séquence orderbook {symbol} ({self.category}) → resynchronisation"
+        )
+        topics = self._orderbook_topics([symbol])
+        self._send_op("unsubscribe", topics)
+        self._send_op("subscribe", topics)
+
+    def get_pending_acks(self) -> Dict[str, Dict]:
+        """Retourne les opérations subscribe/unsubscribe sans accusé."""
+        with self._symbols_lock:
+            return {req_id: dict(op) for req_id, op in self._pending_acks.items()}
+
+    def _next_req_id(self, op: str) -> str:
+        return f"{self.category}-{op}-{next(self._req_ids)}"
+
+    def _track_ack(self, req_id: str, message: dict) -> None:
+        with self._symbols_lock:
+            self._pending_acks[req_id] = {
+                "op": message["op"],
+                "topics": list(message["args"]),
+                "sent_at": time.time(),
+            }
+
+    def _send_op(self, op: str, topics: List[str]) -> Optional[str]:
+        """Envoie une opération subscribe/unsubscribe si la connexion est ouverte."""
+        if not topics or not self.is_connected():
+            return None
+
+        req_id = self._next_req_id(op)
+        build = SubscriptionBuilder.subscribe if op == "subscribe" else SubscriptionBuilder.unsubscribe
+        message = build(topics, req_id)
+        self._track_ack(req_id, message)
+        try:
+            self.ws.send(json.dumps(message))
+        except Exception as e:
+            with self._symbols_lock:
+                self._pending_acks.pop(req_id, None)
+            # Les symboles restent mémorisés : resouscrits à la reconnexion
+            self.logger.warning(f"⚠️ Erreur {op} dynamique ({self.category}): {e}")
+            return None
+
+        self.logger.debug(f"📡 {op} → {len(topics)} topic(s) ({self.category}, req_id={req_id})")
+        return req_id
+
+    def _on_ack(self, payload: dict) -> None:
+        """Traite l'accusé de réception d'une opération subscribe/unsubscribe."""
+        req_id = payload.get("req_id")
+        with self._symbols_lock:
+            pending = self._pending_acks.pop(req_id, None) if req_id else None
+
+        if payload.get("success", False):
+            return
+
+        topics = pending["topics"] if pending else []
+        self.logger.warning(
+            f"⚠️ {payload.get('op')} refusé ({self.category}): "
+            f"{payload.get('ret_msg', '')} topics={topics}"
+        )
+
+    def get_ticker_state(self, symbol: str) -> Optional[dict]:
+        """
+        Retourne l'état ticker complet d'un symbole (fusion snapshot + deltas).
+
+        Les callbacks ne reçoivent que les champs modifiés ; cette méthode
+        permet de relire l'état consolidé (dont fundingRate/nextFundingTime).
+
+        Args:
+            symbol: Symbole recherché
+
+        Returns:
+            Dict au format des callbacks ou None si aucun message reçu
+        """
+        return self._router.ticker_state.get(symbol)
+
     def _on_error(self, ws, error):
         """Callback interne appelé en cas d'erreur."""
         if self.running:
@@ -302,6 +534,10 @@ class PublicWSClient:
 
     def _on_close(self, ws, close_status_code, close_msg):
         """Callback interne appelé à la fermeture."""
+        self._connected = False
+        # Les deltas manqués pendant la coupure rendent les carnets locaux faux
+        for symbol in list(self.orderbook_symbols):
+            self.orderbook_store.invalidate(symbol)
         if self.running:
             self.logger.info(
                 f"🔌 WS fermée ({self.category}) "
@@ -343,6 +579,7 @@ class PublicWSClient:
                     self.ws.run_forever(
                         ping_interval=20, ping_timeout=15
                     )  # Timeout ping augmenté de 10s à 15s
+                    self._connected = False
 
                 except (ConnectionError, OSError, TimeoutError) as e:
                     if self.running:
@@ -424,5 +661,6 @@ class PublicWSClient:
         CORRECTIF : Utilise _cleanup() pour garantir le nettoyage.
         """
         self.running = False
+        self._connected = False
         self._cleanup()
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests du cache de soldes du compte (AccountStateCache)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import account_state
+from account_state import AccountStateCache, parse_coin_balance
+
+
+def wallet_message(coin, wallet_balance, locked="0", available=""):
+    return {"topic": "wallet", "data": [{"accountType": "UNIFIED", "coin": [{
+        "coin": coin, "walletBalance": wallet_balance, "locked": locked,
+        "availableToWithdraw": available,
+    }]}]}
+
+
+def make_client(coins):
+    client = Mock()
+    client.get_wallet_balance.return_value = {"list": [{"coin": coins}]}
+    return client
+
+
+class TestAccountStateCache:
+    """Tests de l'amorçage REST, du topic wallet et des versions."""
+
+    def test_parse_available_falls_back_to_wallet_minus_locked(self):
+        balance = parse_coin_balance({"coin": "USDT", "walletBalance": "100", "locked": "30",
+                                      "availableToWithdraw": ""})
+        assert balance.available == pytest.approx(70)
+        balance = parse_coin_balance({"coin": "USDT", "walletBalance": "100",
+                                      "availableToWithdraw": "55"})
+        assert balance.available == pytest.approx(55)
+
+    def test_refresh_falls_back_to_spot_and_remembers_type(self):
+        client = Mock()
+        client.get_wallet_balance.side_effect = [
+            RuntimeError("retCode=10001 accountType only support SPOT"),
+            {"list": [{"coin": [{"coin": "USDT", "walletBalance": "50"}]}]},
+            {"list": [{"coin": [{"coin": "USDT", "walletBalance": "40"}]}]},
+        ]
+        cache = AccountStateCache(client, logger=Mock())
+
+        assert cache.refresh()
+        assert cache.get_available("USDT") == pytest.approx(50)
+        assert cache.refresh()
+
+        account_types = [c.kwargs["account_type"] for c in client.get_wallet_balance.call_args_list]
+        assert account_types == ["UNIFIED", "SPOT", "SPOT"]
+        assert cache.get_available("USDT") == pytest.approx(40)
+
+    def test_live_balances_read_without_rest(self):
+        client = make_client([{"coin": "USDT", "walletBalance": "100"}])
+        cache = AccountStateCache(client, logger=Mock())
+        # Passage en direct : soldes rechargés par REST une fois
+        cache.set_live(True)
+
+        cache.on_topic("wallet", wallet_message("MMT", "12", locked="2"))
+
+        assert cache.fetch_available("MMT") == pytest.approx(10)
+        assert cache.fetch_available("DOGE") == 0.0
+        assert client.get_wallet_balance.call_count == 1
+
+    def test_reconnect_resyncs_before_going_live(self):
+        client = make_client([{"coin": "USDT", "walletBalance": "100"}])
+        cache = AccountStateCache(client, logger=Mock())
+        cache.set_live(True)
+        cache.set_live(False)
+        # Solde modifié pendant la coupure
+        client.get_wallet_balance.return_value = {"list": [{"coin": [
+            {"coin": "USDT", "walletBalance": "60", "locked": "0"}]}]}
+
+        cache.set_live(True)
+
+        assert cache.is_live() and cache.get_available("USDT") == pytest.approx(60)
+        assert client.get_wallet_balance.call_count == 2
+
+        cache.set_live(False)
+        client.get_wallet_balance.side_effect = RuntimeError("timeout")
+        cache.set_live(True)
+        assert not cache.is_live()
+
+    def test_stale_balances_require_refresh(self, monkeypatch):
+        client = make_client([{"coin": "USDT", "walletBalance": "100"}])
+        cache = AccountStateCache(client, logger=Mock())
+        assert cache.get_available("USDT") is None
+
+        cache.refresh()
+        monkeypatch.setattr(account_state, "ACCOUNT_STATE_MAX_AGE_SECONDS", 0)
+        time.sleep(0.01)
+        assert cache.get_available("USDT") is None
+        assert cache.fetch_available("USDT") == pytest.approx(100)
+        assert client.get_wallet_balance.call_count == 2
+
+    def test_wait_for_update_wakes_on_wallet_message(self):
+        cache = AccountStateCache(make_client([]), logger=Mock())
+        cache.refresh()
+        version = cache.version("MMT")
+
+        timer = threading.Timer(
+            0.05, cache.on_topic, args=("wallet", wallet_message("MMT", "5"))
+        )
+        timer.start()
+        start = time.monotonic()
+        assert cache.wait_for_update("MMT", version, timeout=1.0)
+        assert time.monotonic() - start < 0.5
+        assert cache.version("MMT") > version
+        assert not cache.wait_for_update("MMT", cache.version("MMT"), timeout=0.01)
+
+
+def test_hedge_balance_check_uses_cached_wallet():
+    from spot_hedge_manager import SpotHedgeManager
+
+    client = make_client([{"coin": "USDT", "walletBalance": "100"},
+                          {"coin": "MMT", "walletBalance": "20"}])
+    manager = SpotHedgeManager(
+        testnet=True,
+        logger=Mock(),
+        bybit_client=client,
+        auto_trading_config={"spot_hedge": {"enabled": True}},
+    )
+    cache = AccountStateCache(client, logger=Mock())
+    cache.refresh()
+    cache.set_live(True)
+    manager.set_account_state(cache)
+    client.get_wallet_balance.reset_mock()
+
+    spot_size = asyncio.run(
+        manager._ensure_spot_balance_for_sell("MMTUSDT", "MMTUSDT", "Sell", "10", 1.5)
+    )
+
+    assert spot_size == "10"
+    client.get_wallet_balance.assert_not_called()
+
+
+def test_wallet_routed_through_position_monitor_connection(monkeypatch):
+    import position_monitor
+    from position_book import PositionBook
+
+    monkeypatch.setattr(position_monitor, "get_settings", lambda: {"api_key": "k", "api_secret": "s"})
+    cache = AccountStateCache(make_client([{"coin": "USDT", "walletBalance": "100"}]), logger=Mock())
+    assert cache.start()
+    monitor = position_monitor.PositionMonitor(
+        logger=Mock(), position_book=PositionBook(logger=Mock()), account_state=cache
+    )
+
+    assert monitor._channels() == ["position", "order", "wallet"]
+    monitor._on_auth_success()
+    monitor._handle_position_message("wallet", wallet_message("MMT", "12"))
+
+    assert cache.is_live() and cache.get_available("MMT") == pytest.approx(12)
+    monitor._on_close(1000, "bye")
+    assert not cache.is_live()
@@ -1,9 +1,16 @@
 """Tests pour le client Bybit."""
 
+import asyncio
+import hashlib
+import hmac
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 import httpx
-from bybit_client import BybitClient, BybitPublicClient
+from bybit_client import AsyncBybitClient, BybitClient, BybitPublicClient
+from bybit_client.rate_limiter import BybitRateLimiter
+from rate_limit_service import GROUP_POSITION, RateLimitService
 
 
 class _MockResponse:
@@ -30,6 +37,21 @@ class _SeqClient:
         return item
 
 
+class _AsyncSeqClient:
+    """Client httpx.AsyncClient-like dont request() renvoie une séquence de réponses."""
+
+    def __init__(self, seq):
+        self._seq = list(seq)
+        self.requests = []
+
+    async def request(self, method, url, headers=None, content=None):
+        self.requests.append((method, url, headers, content))
+        item = self._seq.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
 class TestBybitClient:
     """Tests pour BybitClient."""
     
@@ -341,3 +363,106 @@ class TestBybitPublicClient:
         assert client.testnet is False
         assert client.timeout == 10
         assert client.public_base_url() == "https://api.bybit.com"
+
+
+class TestAsyncBybitClient:
+    """Tests pour AsyncBybitClient."""
+
+    @pytest.fixture
+    def patch_transport(self, monkeypatch):
+        sleeps = []
+
+        async def _fake_sleep(delay):
+            sleeps.append(delay)
+
+        def _install(seq):
+            seq_client = _AsyncSeqClient(seq)
+
+            async def _get_client(timeout=10):
+                return seq_client
+
+            monkeypatch.setattr("bybit_client.async_client.get_async_http_client", _get_client)
+            monkeypatch.setattr("bybit_client.async_client.record_api_call", lambda latency, success: None)
+            monkeypatch.setattr("bybit_client.async_client.asyncio.sleep", _fake_sleep)
+            return seq_client, sleeps
+
+        return _install
+
+    def _client(self, **kwargs):
+        return AsyncBybitClient(
+            testnet=True, timeout=5, api_key="k", api_secret="s", time_sync_enabled=False, **kwargs
+        )
+
+    def test_post_sends_signed_body(self, patch_transport):
+        seq_client, _ = patch_transport([
+            _MockResponse(status_code=200, json_data={"retCode": 0, "result": {"orderId": "1"}}),
+        ])
+        client = self._client()
+
+        res = asyncio.run(client.place_order("BTCUSDT", "Buy", qty="0.01", price="100"))
+
+        assert res == {"orderId": "1"}
+        method, url, headers, body = seq_client.requests[0]
+        assert method == "POST" and url.endswith("/v5/order/create")
+        payload = f"{headers['X-BAPI-TIMESTAMP']}k{headers['X-BAPI-RECV-WINDOW']}{body}"
+        expected = hmac.new(b"s", payload.encode("utf-8"), hashlib.sha256).hexdigest()
+        assert headers["X-BAPI-SIGN"] == expected
+
+    def test_rate_limit_retry_after_then_success(self, patch_transport):
+        seq_client, sleeps = patch_transport([
+            _MockResponse(status_code=429, headers={"Retry-After": "2"}),
+            _MockResponse(status_code=200, json_data={"retCode": 10016, "retMsg": "too many"}),
+            _MockResponse(status_code=200, json_data={"retCode": 0, "result": {"list": []}}),
+        ])
+        client = self._client()
+
+        res = asyncio.run(client.get_positions(settleCoin="USDT"))
+
+        assert res == {"list": []}
+        assert sleeps[0] == 2
+        assert len(seq_client.requests) == 3
+        # Signature recalculée à chaque tentative
+        assert all("X-BAPI-SIGN" in headers for _, _, headers, _ in seq_client.requests)
+
+    def test_server_errors_exhaust_retries_and_feed_circuit_breaker(self, patch_transport):
+        patch_transport([_MockResponse(status_code=503)] * 2)
+        client = self._client(max_retries=2)
+
+        with pytest.raises(RuntimeError, match="Erreur réseau/HTTP Bybit"):
+            asyncio.run(client.get_wallet_balance())
+        assert client.circuit_breaker.failure_count == 1
+
+    def test_client_error_is_not_retried(self, patch_transport):
+        seq_client, sleeps = patch_transport([_MockResponse(status_code=400, text="bad")])
+        client = self._client()
+
+        with pytest.raises(RuntimeError, match="Erreur HTTP Bybit"):
+            asyncio.run(client.cancel_order("BTCUSDT", order_id="1"))
+        assert len(seq_client.requests) == 1 and sleeps == []
+
+    def test_from_client_copies_configuration(self):
+        sync_client = Mock(
+            testnet=False, timeout=7, api_key="k", api_secret="s",
+            max_retries=3, backoff_base=0.2, recv_window_ms=5000,
+            _time_sync_enabled=True, _time_sync_interval_seconds=60, _last_time_sync=0.0, logger=None,
+        )
+        sync_client._authenticator._time_offset_ms = 120
+
+        client = AsyncBybitClient.from_client(sync_client)
+
+        assert client.base_url == "https://api.bybit.com"
+        assert client.max_retries == 3
+        assert client._authenticator._time_offset_ms == 120
+
+    def test_async_rate_limiting_waits_without_blocking(self):
+        client = self._client()
+        client._rate_limiter = BybitRateLimiter(
+            service=RateLimitService({GROUP_POSITION: (2, 0.2)}, ip_limit=None)
+        )
+
+        async def _acquire_three():
+            start = time.time()
+            await asyncio.gather(*(client._rate_limiter.acquire_async(True) for _ in range(3)))
+            return time.time() - start
+
+        assert asyncio.run(_acquire_three()) >= 0.08
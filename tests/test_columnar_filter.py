@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests du filtre de spread et des poids vectorisés (parité avec les versions ligne par ligne)."""
+
+import random
+from unittest.mock import Mock
+
+from filters import ColumnarSymbolFilter
+from filters.columnar_filter import compute_weights
+from filters.symbol_filter import SymbolFilter
+from watchlist_helpers import WeightCalculator
+from watchlist_helpers.incremental_ranker import IncrementalWatchlistRanker
+
+WEIGHTS = {"funding": 10.0, "volume": 0.5, "spread": 5.0, "volatility": 2.0, "top_symbols": 7}
+
+
+def make_rows(n=400, seed=3):
+    rng = random.Random(seed)
+    return [
+        (f"S{i}USDT", rng.uniform(-0.01, 0.01), rng.uniform(0, 5e7), None,
+         rng.uniform(0, 0.01), rng.uniform(0, 0.05))
+        for i in range(n)
+    ]
+
+
+def test_filter_by_spread_matches_symbol_filter():
+    rows = [row[:4] for row in make_rows()]
+    spreads = {row[0]: random.Random(row[0]).uniform(0, 0.01) for row in rows[::2]}
+    loop, columnar = SymbolFilter(logger=Mock()), ColumnarSymbolFilter(logger=Mock())
+
+    for spread_max in (0.004, 0.0, None):
+        assert columnar.filter_by_spread(rows, spreads, spread_max) == loop.filter_by_spread(
+            rows, spreads, spread_max
+        )
+
+
+def test_vectorized_weights_and_ranker_top_n_match_weight_calculator():
+    rows = make_rows()
+    calculator = WeightCalculator(logger=Mock())
+    expected = [calculator.calculate_weight(calculator._to_dict(row, {}), WEIGHTS) for row in rows]
+    assert calculator.calculate_weights(rows, WEIGHTS) == expected
+    assert compute_weights([0.001], [0.0], [float("nan")], [-1.0], WEIGHTS).tolist() == [0.01]
+
+    # Top N du pipeline (poids en lot) identique au tri complet des poids ligne à ligne
+    ranked = IncrementalWatchlistRanker(calculator, logger=Mock()).rank(rows, WEIGHTS, {})
+    reference = sorted(zip(rows, expected), key=lambda pair: pair[1], reverse=True)[:7]
+    assert ranked == [row + (weight,) for row, weight in reference]
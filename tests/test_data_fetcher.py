@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -6,6 +8,8 @@ import pytest
 from data_fetcher import DataFetcher
 from funding_fetcher import FundingFetcher
 from pagination_handler import PaginationHandler
+from spread_fetcher import SpreadFetcher
+from market_snapshot import MarketSnapshot
 from display_manager import DisplayManager
 from metrics_monitor import MetricsMonitor
 from callback_manager import CallbackManager
@@ -57,34 +61,36 @@ def test_data_fetcher_logs_warning_when_funding_invalid():
 
 def test_funding_fetcher_fetch_funding_map_success():
     logger = Mock()
-    with patch("funding_fetcher.PaginationHandler") as MockPagination, \
+    snapshot = MarketSnapshot(logger=Mock())
+    with patch.object(snapshot, "_pagination") as pagination, \
          patch("funding_fetcher.ErrorHandler"):
-        pagination = MockPagination.return_value
-        pagination.fetch_paginated_data.return_value = [
+        pages = [[
             {
                 "symbol": "BTCUSDT",
                 "fundingRate": "0.0002",
                 "volume24h": "1200000",
-                "nextFundingTime": "1h",
+                "nextFundingTime": "1700000000000",
             },
             {"symbol": "", "fundingRate": None},
-        ]
-        fetcher = FundingFetcher(logger=logger)
+        ]]
+        pagination.iter_pages.return_value = (page for page in pages)
+        fetcher = FundingFetcher(logger=logger, market_snapshot=snapshot)
         result = fetcher.fetch_funding_map("https://api", "linear", timeout=2)
 
     assert "BTCUSDT" in result
     assert result["BTCUSDT"]["funding"] == 0.0002
-    pagination.fetch_paginated_data.assert_called_once()
+    assert result["BTCUSDT"]["next_funding_time"] == 1700000000000
+    pagination.iter_pages.assert_called_once()
 
 
 def test_funding_fetcher_fetch_funding_map_logs_error():
     logger = Mock()
-    with patch("funding_fetcher.PaginationHandler") as MockPagination, \
+    snapshot = MarketSnapshot(logger=Mock())
+    with patch.object(snapshot, "_pagination") as pagination, \
          patch("funding_fetcher.ErrorHandler") as MockErrorHandler:
-        pagination = MockPagination.return_value
-        pagination.fetch_paginated_data.side_effect = RuntimeError("boom")
+        pagination.iter_pages.side_effect = RuntimeError("boom")
         error_handler = MockErrorHandler.return_value
-        fetcher = FundingFetcher(logger=logger)
+        fetcher = FundingFetcher(logger=logger, market_snapshot=snapshot)
 
         with pytest.raises(RuntimeError):
             fetcher.fetch_funding_map("https://api", "linear")
@@ -103,12 +109,121 @@ def test_pagination_handler_fetch_paginated_data_multiple_pages():
     assert data == [{"a": 1}, {"a": 2}]
 
 
+def test_pagination_handler_prefetches_next_page_while_consumer_works():
+    handler = PaginationHandler(logger=Mock())
+    second_requested = threading.Event()
+
+    def _request(base_url, endpoint, params, timeout, page_index, rate_limiter):
+        if page_index == 1:
+            return {"list": [{"a": 1}], "nextPageCursor": "cursor"}
+        assert params["cursor"] == "cursor"
+        second_requested.set()
+        return {"list": [{"a": 2}], "nextPageCursor": None}
+
+    with patch.object(handler, "_make_paginated_request", side_effect=_request):
+        pages = handler.iter_pages("https://api", "/endpoint", {"limit": 1}, timeout=1)
+        assert next(pages) == [{"a": 1}]
+        # La page 2 est demandée pendant que l'appelant traite la page 1
+        assert second_requested.wait(1)
+        assert list(pages) == [[{"a": 2}]]
+
+
+def test_pagination_handler_stream_categories_async_interleaves_and_raises():
+    handler = PaginationHandler(logger=Mock())
+
+    async def _request(session, base_url, endpoint, params, timeout, page_index, limiter):
+        if params["category"] == "inverse":
+            return {"list": [{"c": "inverse"}]}
+        await asyncio.sleep(0.01)
+        cursor = None if page_index == 2 else "next"
+        return {"list": [{"c": "linear", "page": page_index}], "nextPageCursor": cursor}
+
+    async def _collect(categories):
+        async for category, items in handler.stream_categories_async(
+            "https://api", "/endpoint", {"limit": 1}, categories, timeout=1
+        ):
+            received.append((category, items[0].get("page")))
+
+    received = []
+    with patch.object(handler, "_make_paginated_request_async", side_effect=_request):
+        asyncio.run(_collect(["linear", "inverse"]))
+    assert received == [("inverse", None), ("linear", 1), ("linear", 2)]
+
+    async def _failing(*args):
+        raise RuntimeError("Erreur API Bybit")
+
+    with patch.object(handler, "_make_paginated_request_async", side_effect=_failing):
+        with pytest.raises(RuntimeError):
+            asyncio.run(_collect(["linear", "inverse"]))
+
+
+def test_get_perp_symbols_streams_linear_and_inverse():
+    import instruments
+
+    pages = [
+        ("inverse", [{"symbol": "BTCUSD", "contractType": "InversePerpetual", "status": "Trading"}]),
+        ("linear", [{"symbol": "BTCUSDT", "contractType": "LinearPerpetual", "status": "Trading"}]),
+        ("linear", [{"symbol": "OLDUSDT", "contractType": "LinearPerpetual", "status": "Closed"}]),
+    ]
+    with patch.object(instruments._pagination, "stream_categories", return_value=iter(pages)) as stream:
+        perp_data = instruments.get_perp_symbols("https://api")
+
+    assert stream.call_args.args[3] == ["linear", "inverse"]
+    assert perp_data["linear"] == ["BTCUSDT"]
+    assert perp_data["inverse"] == ["BTCUSD"]
+    assert perp_data["categories"] == {"BTCUSDT": "linear", "BTCUSD": "inverse"}
+
+
+def test_spread_fetcher_cold_build_uses_single_category_request():
+    snapshot = MarketSnapshot(logger=Mock())
+    fetcher = SpreadFetcher(logger=Mock(), market_snapshot=snapshot)
+    symbols = [f"SYM{i}USDT" for i in range(200)]
+    tickers = [{"symbol": s, "bid1Price": "99.5", "ask1Price": "100.5"} for s in symbols]
+
+    with patch.object(snapshot._pagination, "iter_pages", return_value=(p for p in [tickers])) as paginated, \
+         patch.object(fetcher, "_fetch_single_spread_async", new_callable=AsyncMock) as single:
+        spreads = fetcher.fetch_spread_data("https://spread-api", symbols, category="linear")
+
+    assert len(spreads) == 200
+    assert spreads["SYM0USDT"] == pytest.approx(0.01)
+    paginated.assert_called_once()
+    single.assert_not_called()
+
+
+def test_spread_fetcher_resolves_from_snapshot_then_ws_then_bounded_fallback():
+    snapshot = MarketSnapshot(logger=Mock())
+    tickers = [{"symbol": "BTCUSDT", "bid1Price": "99", "ask1Price": "101"}]
+    with patch.object(snapshot._pagination, "iter_pages", return_value=(p for p in [tickers])):
+        snapshot.get_tickers("https://spread-api", "linear")
+    storage = Mock()
+    storage.get_realtime_data.side_effect = lambda symbol: (
+        {"bid1_price": 9.9, "ask1_price": 10.1, "timestamp": time.time()}
+        if symbol == "ETHUSDT" else None
+    )
+    fetcher = SpreadFetcher(logger=Mock(), market_snapshot=snapshot)
+    fetcher.set_live_quote_source(storage)
+
+    with patch.object(snapshot._pagination, "iter_pages") as paginated, \
+         patch.object(
+             fetcher, "_fetch_single_spread_async", new_callable=AsyncMock, return_value=0.002
+         ) as single:
+        spreads = fetcher.fetch_spread_data(
+            "https://spread-api", ["BTCUSDT", "ETHUSDT", "NEWUSDT"], category="linear"
+        )
+
+    paginated.assert_not_called()
+    assert spreads["BTCUSDT"] == pytest.approx(0.02)
+    assert spreads["ETHUSDT"] == pytest.approx(0.02)
+    assert spreads["NEWUSDT"] == 0.002
+    assert [c.args[2] for c in single.call_args_list] == ["NEWUSDT"]
+
+
 def test_display_manager_print_price_table_outputs_rows(capsys):
     funding = FundingData(
         symbol="BTCUSDT",
         funding_rate=0.0001,
         volume_24h=1_500_000,
-        next_funding_time="1h",
+        next_funding_time=1700000000000,
         spread_pct=0.001,
         volatility_pct=0.02,
     )
@@ -132,7 +247,7 @@ def test_display_manager_print_price_table_outputs_rows(capsys):
             "volume": funding.volume_24h,
             "spread_pct": funding.spread_pct,
             "volatility_pct": funding.volatility_pct,
-            "funding_time": funding.next_funding_time,
+            "funding_time": "1h 0m 0s",
         }
         formatter.format_table_row.return_value = "ROW:BTCUSDT"
 
@@ -143,6 +258,32 @@ def test_display_manager_print_price_table_outputs_rows(capsys):
     assert "ROW:BTCUSDT" in captured
 
 
+def test_display_order_cache_follows_funding_version():
+    from types import SimpleNamespace
+
+    def funding(symbol, rate):
+        return FundingData(symbol=symbol, funding_rate=rate, volume_24h=1_500_000,
+                           next_funding_time=1700000000000, spread_pct=0.001)
+
+    data_manager = DummyDataManager()
+    data_manager.get_data_snapshot = lambda: data_manager.snapshot
+    data_manager.snapshot = SimpleNamespace(
+        funding={"AUSDT": funding("AUSDT", 0.001), "BUSDT": funding("BUSDT", 0.002)},
+        funding_version=1,
+    )
+
+    with patch("display_manager.TableFormatter"), patch("builtins.print"):
+        display = DisplayManager(data_manager, logger=Mock())
+        display._print_price_table()
+        assert display._order_cache == ["BUSDT", "AUSDT"]
+
+        # Nouvelle publication : ordre recalculé même si l'objet est réutilisé
+        data_manager.snapshot.funding["AUSDT"] = funding("AUSDT", 0.003)
+        data_manager.snapshot.funding_version = 2
+        display._print_price_table()
+        assert display._order_cache == ["AUSDT", "BUSDT"]
+
+
 def test_metrics_monitor_start_stop(monkeypatch):
     monitor = MetricsMonitor(interval_minutes=1)
     monitor.logger = Mock()
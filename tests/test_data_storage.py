@@ -105,14 +105,15 @@ class TestDataStorage:
         
         storage.update_realtime_data("BTCUSDT", ticker_data)
         
+        # Stockage colonnaire float64 : valeurs restituées converties
         result = storage.realtime_data["BTCUSDT"]
-        assert result["funding_rate"] == "0.0001"
-        assert result["volume24h"] == "1000000.0"
-        assert result["bid1_price"] == "50000.0"
-        assert result["ask1_price"] == "50001.0"
-        assert result["next_funding_time"] == "1640995200000"
-        assert result["mark_price"] == "50000.5"
-        assert result["last_price"] == "50001.0"
+        assert result["funding_rate"] == 0.0001
+        assert result["volume24h"] == 1000000.0
+        assert result["bid1_price"] == 50000.0
+        assert result["ask1_price"] == 50001.0
+        assert result["next_funding_time"] == 1640995200000
+        assert result["mark_price"] == 50000.5
+        assert result["last_price"] == 50001.0
         assert "timestamp" in result
 
     def test_update_realtime_data_empty_symbol(self, storage):
@@ -190,8 +191,8 @@ class TestDataStorage:
         
         result = storage.get_realtime_data("BTCUSDT")
         
-        assert result["mark_price"] == "50000.0"
-        assert result["last_price"] == "50001.0"
+        assert result["mark_price"] == 50000.0
+        assert result["last_price"] == 50001.0
         assert "timestamp" in result
 
     def test_get_realtime_data_nonexistent(self, storage):
@@ -210,18 +211,56 @@ class TestDataStorage:
         assert "BTCUSDT" in result
         assert "ETHUSDT" in result
 
+    def test_realtime_update_writes_row_in_place(self, storage):
+        """Une mise à jour partielle conserve les autres colonnes de la ligne."""
+        storage.update_realtime_data("BTCUSDT", {"markPrice": "50000.0", "fundingRate": "0.0001"})
+        capacity = storage.realtime_data.capacity
+        storage.update_realtime_data("BTCUSDT", {"lastPrice": 50002.0})
+
+        result = storage.get_realtime_data("BTCUSDT")
+        assert result["mark_price"] == 50000.0
+        assert result["funding_rate"] == 0.0001
+        assert result["last_price"] == 50002.0
+        assert result["bid1_price"] is None
+        assert storage.realtime_data.capacity == capacity
+
+    def test_get_realtime_snapshot_columns(self, storage):
+        """Le snapshot expose toutes les colonnes, indépendamment des écritures suivantes."""
+        for i in range(100):
+            storage.update_realtime_data(f"SYM{i}USDT", {"fundingRate": i / 10000})
+
+        snapshot = storage.get_realtime_snapshot()
+        storage.update_realtime_data("SYM0USDT", {"fundingRate": 1.0})
+
+        assert len(snapshot) == 100
+        funding = snapshot.column("funding_rate")
+        assert funding[snapshot.index["SYM0USDT"]] == 0.0
+        assert funding[snapshot.index["SYM99USDT"]] == pytest.approx(0.0099)
+
+    def test_realtime_delete_keeps_index_consistent(self, storage):
+        """Supprimer une ligne déplace la dernière sans corrompre l'index."""
+        storage.update_realtime_data("AUSDT", {"markPrice": 1.0})
+        storage.update_realtime_data("BUSDT", {"markPrice": 2.0})
+        storage.update_realtime_data("CUSDT", {"markPrice": 3.0})
+
+        del storage.realtime_data["AUSDT"]
+
+        assert set(storage.realtime_data) == {"BUSDT", "CUSDT"}
+        assert storage.get_realtime_data("CUSDT")["mark_price"] == 3.0
+        assert storage.get_realtime_data("AUSDT") is None
+
     def test_update_original_funding_data(self, storage):
         """Test de mise à jour des données de funding originales."""
         storage.update_original_funding_data("BTCUSDT", "1640995200000")
         
-        assert storage.original_funding_data["BTCUSDT"] == "1640995200000"
+        assert storage.original_funding_data["BTCUSDT"] == 1640995200000
 
     def test_get_original_funding_data(self, storage):
         """Test de récupération des données de funding originales."""
         storage.update_original_funding_data("BTCUSDT", "1640995200000")
         
         result = storage.get_original_funding_data("BTCUSDT")
-        assert result == "1640995200000"
+        assert result == 1640995200000
 
     def test_get_original_funding_data_nonexistent(self, storage):
         """Test de récupération de données de funding originales inexistantes."""
@@ -236,8 +275,8 @@ class TestDataStorage:
         result = storage.get_all_original_funding_data()
         
         assert len(result) == 2
-        assert result["BTCUSDT"] == "1640995200000"
-        assert result["ETHUSDT"] == "1640995260000"
+        assert result["BTCUSDT"] == 1640995200000
+        assert result["ETHUSDT"] == 1640995260000
 
     def test_set_symbol_lists(self, storage):
         """Test de définition des listes de symboles."""
@@ -422,3 +461,52 @@ class TestDataStorage:
         
         # Vérifier qu'aucune exception n'a été levée
         assert len(storage.realtime_data) <= 500  # Max 5 threads * 100 updates
+
+    def test_snapshot_version_increments_on_publish(self, storage):
+        """Test qu'une écriture publiée incrémente la version du snapshot."""
+        from models.funding_data import FundingData
+
+        version = storage.get_snapshot_version()
+        storage.set_funding_data_object(
+            FundingData("BTCUSDT", 0.0001, 1000000.0, 1700000000000, 0.001)
+        )
+        snapshot = storage.get_snapshot(max_age=0)
+
+        assert snapshot.version > version
+        assert snapshot.funding_version >= 1
+        assert "BTCUSDT" in snapshot.funding
+
+    def test_snapshot_reused_when_unchanged(self, storage):
+        """Test qu'un lecteur récupère le même objet tant que rien ne change."""
+        storage.update_realtime_data("BTCUSDT", {"markPrice": "50000"})
+        first = storage.get_snapshot(max_age=0)
+        second = storage.get_snapshot(max_age=0)
+
+        assert first is second
+        assert storage.get_all_realtime_data() is first.realtime
+
+    def test_snapshot_refreshes_dirty_data(self, storage):
+        """Test qu'un lecteur publie les écritures en attente (intervalle non écoulé)."""
+        storage.snapshot_interval = 3600
+        storage.update_realtime_data("BTCUSDT", {"markPrice": "50000"})
+        storage.update_realtime_data("BTCUSDT", {"markPrice": "50100"})
+
+        # Le writer n'a pas republié ; le lecteur exige les dernières écritures
+        assert storage.get_snapshot().realtime["BTCUSDT"]["mark_price"] != 50100.0
+        assert storage.get_snapshot(max_age=0).realtime["BTCUSDT"]["mark_price"] == 50100.0
+
+    def test_snapshot_is_read_only(self, storage):
+        """Test que les données publiées ne sont pas modifiables par les lecteurs."""
+        from models.funding_data import FundingData
+
+        storage.set_funding_data_object(
+            FundingData("BTCUSDT", 0.0001, 1000000.0, 1700000000000, 0.001)
+        )
+        funding = storage.get_all_funding_data_objects()
+
+        with pytest.raises(TypeError):
+            funding["ETHUSDT"] = None
+        storage.set_funding_data_object(
+            FundingData("ETHUSDT", 0.0002, 1000000.0, 1700003600000, 0.001)
+        )
+        assert "ETHUSDT" not in funding
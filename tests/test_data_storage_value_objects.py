@@ -22,7 +22,7 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
             volatility_pct=0.005,
         )
@@ -47,7 +47,7 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
         )
         
@@ -61,7 +61,7 @@ class TestDataStorageWithValueObjects:
         # Vérifier la compatibilité via la propriété funding_data
         assert "BTCUSDT" in storage.funding_data
         old_format = storage.funding_data["BTCUSDT"]
-        assert old_format == (0.0001, 1000000.0, "1h 30m", 0.001, None)
+        assert old_format == (0.0001, 1000000.0, 1700000000000, 0.001, None)
     
     def test_get_all_funding_data_objects(self):
         """Test de récupération de tous les FundingData."""
@@ -71,7 +71,7 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
         )
         
@@ -79,7 +79,7 @@ class TestDataStorageWithValueObjects:
             symbol="ETHUSDT",
             funding_rate=0.0002,
             volume_24h=500000.0,
-            next_funding_time="2h 15m",
+            next_funding_time=1700003600000,
             spread_pct=0.002,
         )
         
@@ -99,7 +99,7 @@ class TestDataStorageWithValueObjects:
         storage = DataStorage()
         
         # Utiliser l'ancienne méthode qui crée maintenant un Value Object en interne
-        storage.update_funding_data("BTCUSDT", 0.0001, 1000000.0, "1h 30m", 0.001, 0.005)
+        storage.update_funding_data("BTCUSDT", 0.0001, 1000000.0, 1700000000000, 0.001, 0.005)
         
         # Récupérer en tant que Value Object
         retrieved = storage.get_funding_data_object("BTCUSDT")
@@ -114,8 +114,8 @@ class TestDataStorageWithValueObjects:
         storage = DataStorage()
         
         # Utiliser l'ancienne méthode qui crée maintenant des Value Objects en interne
-        storage.update_funding_data("BTCUSDT", 0.0001, 1000000.0, "1h 30m", 0.001, None)
-        storage.update_funding_data("ETHUSDT", 0.0002, 500000.0, "2h 15m", 0.002, None)
+        storage.update_funding_data("BTCUSDT", 0.0001, 1000000.0, 1700000000000, 0.001, None)
+        storage.update_funding_data("ETHUSDT", 0.0002, 500000.0, 1700003600000, 0.002, None)
         
         # Récupérer en tant que Value Objects
         all_funding = storage.get_all_funding_data_objects()
@@ -132,7 +132,7 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
         )
         
@@ -157,7 +157,7 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
         )
         
@@ -177,14 +177,14 @@ class TestDataStorageWithValueObjects:
             symbol="BTCUSDT",
             funding=0.0001,
             volume=1000000.0,
-            funding_time="1h 30m",
+            funding_time=1700000000000,
             spread=0.001,
             volatility=0.005,
         )
         
         # Vérifier que les données sont accessibles
         old_format = storage.get_funding_data("BTCUSDT")
-        assert old_format == (0.0001, 1000000.0, "1h 30m", 0.001, 0.005)
+        assert old_format == (0.0001, 1000000.0, 1700000000000, 0.001, 0.005)
         
         # Vérifier que les données sont convertibles en Value Object
         value_object = storage.get_funding_data_object("BTCUSDT")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Tests du planificateur d'événements de funding et de la boucle événementielle du scheduler."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+from funding_event_scheduler import FundingEventScheduler
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class TestFundingEventScheduler:
+    """Tests de l'armement, du réarmement et du déclenchement des événements."""
+
+    def test_events_fire_for_every_watched_symbol_in_order(self):
+        events = FundingEventScheduler({"prearm": 0.2, "entry": 0.1}, logger=Mock())
+        funding = now_ms() + 150
+        events.set_watchlist({"BTCUSDT": funding, "ETHUSDT": funding + 10, "SOLUSDT": None})
+        # Symbole hors watchlist ignoré
+        assert not events.on_funding_time("XRPUSDT", funding)
+
+        due = events.pop_due()
+        assert [(e.symbol, e.kind) for e in due] == [("BTCUSDT", "prearm"), ("ETHUSDT", "prearm")]
+        time.sleep(0.07)
+        due = events.pop_due()
+        assert [(e.symbol, e.kind) for e in due] == [("BTCUSDT", "entry"), ("ETHUSDT", "entry")]
+
+    def test_funding_time_change_rearms_and_drops_stale_entries(self):
+        events = FundingEventScheduler({"entry": 0.0}, logger=Mock())
+        events.set_watchlist({"BTCUSDT": now_ms() + 20})
+        # Même heure reçue par la WS : aucun réarmement
+        assert not events.on_funding_time("BTCUSDT", events.get_funding_time_ms("BTCUSDT"))
+        later = now_ms() + 60_000
+        assert events.on_funding_time("BTCUSDT", str(later))
+
+        time.sleep(0.03)
+        assert events.pop_due() == []
+        events.set_watchlist({})
+        assert events.get_stats()["armed"] == 0
+
+    def test_set_offsets_skips_elapsed_deadlines(self):
+        events = FundingEventScheduler({"prearm": 2.0, "entry": 0.1}, logger=Mock())
+        events.set_watchlist({"BTCUSDT": now_ms() + 1000})
+        assert [e.kind for e in events.pop_due()] == ["prearm"]
+
+        # Réarmement : le prearm déjà émis ne repart pas, l'entrée est conservée
+        events.set_offsets({"prearm": 2.0, "hedge_prep": 0.6, "entry": 0.1})
+        assert events.pop_due() == []
+        time.sleep(0.5)
+        assert [e.kind for e in events.pop_due()] == ["hedge_prep"]
+
+    def test_wait_next_wakes_on_threaded_update(self):
+        events = FundingEventScheduler({"entry": 0.5}, logger=Mock())
+        events.set_watchlist({"BTCUSDT": now_ms() + 3_600_000})
+
+        async def _run():
+            # Nouvelle heure de funding : entrée dans 100 ms
+            funding = now_ms() + 600
+            timer = threading.Timer(0.02, events.on_funding_time, args=("BTCUSDT", funding))
+            timer.start()
+            await events.wait_next(max_wait=2.0)  # réveillé par la mise à jour
+            await events.wait_next(max_wait=2.0)  # attend l'échéance
+            return events.pop_due()
+
+        due = asyncio.run(_run())
+        assert [e.symbol for e in due] == ["BTCUSDT"]
+        assert due[0].jitter_ms < 100
+
+
+def test_scheduler_run_events_dispatches_entry():
+    from scheduler_manager import SchedulerManager
+
+    scheduler = SchedulerManager(logger=Mock(), funding_threshold_minutes=1,
+                                 auto_trading_config={"enabled": True})
+    events = FundingEventScheduler(scheduler.event_offsets(), logger=Mock())
+    scheduler.set_funding_events(events, lambda symbol: -0.001)
+    scheduler._handle_automatic_trading = AsyncMock()
+    # Entrée 1 min avant le funding, soit dans 50 ms
+    events.set_watchlist({"BTCUSDT": now_ms() + 60_050})
+
+    async def _run():
+        task = asyncio.create_task(scheduler.run_events())
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+    asyncio.run(_run())
+
+    symbol, _, data = scheduler._handle_automatic_trading.await_args.args
+    assert symbol == "BTCUSDT" and data == {"funding_rate": -0.001}
+
+
+def test_hedge_prepared_ahead_of_entry():
+    from config.constants import HEDGE_PLAN_MAX_AGE_SECONDS
+    from scheduler_manager import SchedulerManager
+
+    scheduler = SchedulerManager(logger=Mock(), funding_threshold_minutes=1,
+                                 auto_trading_config={"enabled": True})
+    offsets = scheduler.event_offsets()
+    assert 0 < offsets["hedge_prep"] - offsets["entry"] < HEDGE_PLAN_MAX_AGE_SECONDS
+
+    scheduler.hedge_manager = Mock(prepare_hedge=AsyncMock())
+    scheduler._handle_automatic_trading = AsyncMock()
+    events = FundingEventScheduler(offsets, logger=Mock())
+    scheduler.set_funding_events(events, lambda symbol: 0.001)
+    # Préparation du hedge dans 50 ms, entrée quelques secondes plus tard
+    events.set_watchlist({"BTCUSDT": now_ms() + int(offsets["hedge_prep"] * 1000) + 50})
+
+    async def _run():
+        task = asyncio.create_task(scheduler.run_events())
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+    asyncio.run(_run())
+
+    scheduler.hedge_manager.prepare_hedge.assert_awaited_once_with("BTCUSDT")
+    scheduler._handle_automatic_trading.assert_not_awaited()
+
+
+def test_hedge_prepared_for_every_symbol_sharing_a_funding_time():
+    from scheduler_manager import SchedulerManager
+
+    scheduler = SchedulerManager(logger=Mock(), funding_threshold_minutes=1,
+                                 auto_trading_config={"enabled": True})
+    prepared = []
+
+    async def _prepare(symbol):
+        await asyncio.sleep(0.01)
+        prepared.append(symbol)
+
+    scheduler.hedge_manager = Mock(prepare_hedge=_prepare)
+
+    async def _run():
+        for symbol in ("BTCUSDT", "ETHUSDT", "BTCUSDT"):
+            scheduler._prepare_hedge(symbol)
+        await asyncio.gather(*scheduler._hedge_prep_tasks.values())
+
+    asyncio.run(_run())
+
+    assert sorted(prepared) == ["BTCUSDT", "ETHUSDT"]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Tests de la représentation numérique de l'heure de funding (epoch ms)."""
+
+from unittest.mock import Mock
+
+from filters.symbol_filter import SymbolFilter
+from funding_time import _format_seconds, format_remaining, funding_epoch_ms, now_ms, remaining_minutes
+from models.funding_data import FundingData
+
+NOW = 1_700_000_000_000
+
+
+def test_funding_epoch_ms_formats():
+    assert funding_epoch_ms("1700000000000") == 1700000000000
+    assert funding_epoch_ms(1700000000) == 1700000000000
+    assert funding_epoch_ms("2023-11-14T22:13:20Z") == 1700000000000
+    assert funding_epoch_ms("-") is None
+    assert funding_epoch_ms("1h 30m") is None
+
+
+def test_format_remaining_is_memoized_per_second():
+    _format_seconds.cache_clear()
+
+    assert format_remaining(NOW + 5_400_900, now=NOW) == "1h 30m 0s"
+    assert format_remaining(NOW + 5_400_100, now=NOW) == "1h 30m 0s"
+    assert format_remaining(str(NOW + 59_000), now=NOW) == "59s"
+    assert format_remaining(NOW - 1, now=NOW) == "0s"
+    assert format_remaining(None) == "-"
+    assert _format_seconds.cache_info().hits == 1
+
+
+def test_funding_data_derives_remaining_at_read_time():
+    funding = FundingData("BTCUSDT", 0.0001, 1e6, NOW + 90_000, 0.001)
+
+    assert funding.remaining_seconds(now_ms=NOW) == 90.0
+    assert funding.remaining_seconds(now_ms=NOW + 120_000) == 0.0
+    assert FundingData("BTCUSDT", 0.0001, 1e6, None, 0.001).remaining_seconds() is None
+
+
+def test_symbol_filter_carries_epoch_ms():
+    symbol_filter = SymbolFilter(logger=Mock())
+    funding_ms = now_ms() + 30 * 60_000
+    funding_map = {
+        "BTCUSDT": {"funding": 0.001, "volume": 5e6, "next_funding_time": str(funding_ms)},
+        "ETHUSDT": {"funding": 0.002, "volume": 5e6, "next_funding_time": now_ms() + 7_200_000},
+    }
+    perp_data = {"linear": ["BTCUSDT", "ETHUSDT"], "inverse": []}
+
+    result = symbol_filter.filter_by_funding(
+        perp_data, funding_map, None, None, None, None, funding_time_max_minutes=60
+    )
+
+    assert result == [("BTCUSDT", 0.001, 5e6, funding_ms)]
+    assert 29 < remaining_minutes(result[0][3]) <= 30
+    assert symbol_filter.check_candidate_filters("BTCUSDT", funding_map, 0.0005, None, 1, 60)
+    assert not symbol_filter.check_candidate_filters("ETHUSDT", funding_map, 0.0005, None, 1, 60)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests du classement incrémental de la watchlist (parité et coût par symbole modifié)."""
+
+import random
+from unittest.mock import Mock
+
+from filters.symbol_filter import SymbolFilter
+from watchlist_helpers import IncrementalWatchlistRanker, WeightCalculator
+
+NOW = 1_700_000_000_000
+PARAMS = {
+    "funding_min": 0.0001,
+    "funding_max": None,
+    "volume_min_millions": 1,
+    "funding_time_min_minutes": 5,
+    "funding_time_max_minutes": 120,
+}
+WEIGHTS = {"funding": 10.0, "volume": 0.5, "spread": 5.0, "volatility": 2.0, "top_symbols": 5}
+
+
+def make_funding_map(n=300, seed=7):
+    rng = random.Random(seed)
+    # |funding| distincts : l'ordre ne dépend pas du départage des égalités
+    magnitudes = rng.sample(range(1, 5000), n)
+    return {
+        f"S{i}USDT": {
+            "funding": rng.choice([-1, 1]) * magnitudes[i] / 1_000_000,
+            "volume": rng.uniform(0, 5e7),
+            "next_funding_time": NOW + rng.randint(0, 480) * 60_000,
+        }
+        for i in range(n)
+    }
+
+
+def test_matches_full_filter_and_weighting(monkeypatch):
+    funding_map = make_funding_map()
+    perp_data = {"linear": list(funding_map), "inverse": []}
+    monkeypatch.setattr("filters.symbol_filter.remaining_minutes",
+                        lambda ms: max((ms - NOW) / 60_000, 0) if ms else None)
+    ranker = IncrementalWatchlistRanker(WeightCalculator(logger=Mock()), logger=Mock())
+    ranker.configure(PARAMS)
+    ranker.update(perp_data["linear"], funding_map, now=NOW)
+
+    expected = SymbolFilter(logger=Mock()).filter_by_funding(
+        perp_data, funding_map, 0.0001, None, 1, 20,
+        funding_time_min_minutes=5, funding_time_max_minutes=120,
+    )
+    head = ranker.head(20)
+    assert [row[0] for row in head] == [row[0] for row in expected]
+
+    rows = [row + (0.001, 0.01) for row in head]
+    weighted = WeightCalculator(logger=Mock()).process_weighted_ranking(rows, WEIGHTS, {})
+    assert [r[0] for r in ranker.rank(rows, WEIGHTS, {})] == [o["symbol"] for o in weighted]
+
+
+def test_only_changed_symbols_are_reevaluated():
+    funding_map = make_funding_map()
+    ranker = IncrementalWatchlistRanker(WeightCalculator(logger=Mock()), logger=Mock())
+    ranker.configure(PARAMS)
+    assert ranker.update(list(funding_map), funding_map, now=NOW) == len(funding_map)
+
+    top = ranker.head(1)[0][0]
+    funding_map["S1USDT"] = {**funding_map["S1USDT"], "funding": 0.9, "volume": 1e8,
+                             "next_funding_time": NOW + 60 * 60_000}
+    del funding_map[top]
+
+    assert ranker.update(list(funding_map), funding_map, now=NOW) == 1
+    assert ranker.head(1)[0][0] == "S1USDT"
+    assert top not in [row[0] for row in ranker.head(None)]
+
+    rows = [row + (0.001, 0.01) for row in ranker.head(10)]
+    ranker.rank(rows, WEIGHTS, {})
+    rows[0] = rows[0][:4] + (0.002, 0.01)
+    ranker.rank(rows, WEIGHTS, {})
+    assert ranker.last_rescored == 1
+
+
+def test_time_window_transitions_without_input_change():
+    funding_map = {"BTCUSDT": {"funding": 0.001, "volume": 5e6, "next_funding_time": NOW + 130 * 60_000}}
+    ranker = IncrementalWatchlistRanker(WeightCalculator(logger=Mock()), logger=Mock())
+    ranker.configure(PARAMS)
+
+    ranker.update(["BTCUSDT"], funding_map, now=NOW)
+    assert ranker.head(None) == []
+    # Entrée dans la fenêtre (120 min avant le funding)
+    assert ranker.update(["BTCUSDT"], funding_map, now=NOW + 10 * 60_000) == 1
+    assert [row[0] for row in ranker.head(None)] == ["BTCUSDT"]
+    assert ranker.update(["BTCUSDT"], funding_map, now=NOW + 60 * 60_000) == 0
+    # Sortie de la fenêtre (moins de 5 min avant le funding)
+    ranker.update(["BTCUSDT"], funding_map, now=NOW + 126 * 60_000)
+    assert ranker.head(None) == []
+
+    assert ranker.configure({**PARAMS, "funding_time_min_minutes": None})
+    ranker.update(["BTCUSDT"], funding_map, now=NOW + 126 * 60_000)
+    assert [row[0] for row in ranker.head(None)] == ["BTCUSDT"]
@@ -21,7 +21,7 @@ def test_data_manager_funding_roundtrip(mock_logger):
         symbol="BTCUSDT",
         funding_rate=0.0001,
         volume_24h=1_000_000,
-        next_funding_time="1h",
+        next_funding_time=1700000000000,
         spread_pct=0.001,
         volatility_pct=0.05,
     )
@@ -54,15 +54,15 @@ def test_data_flow_updates_storage(mock_logger):
         symbol="BTCUSDT",
         funding_rate=0.0001,
         volume_24h=500_000,
-        next_funding_time="2h",
+        next_funding_time=1700003600000,
         spread_pct=0.002,
     )
     manager.set_funding_data_object(funding)
     manager.update_realtime_data("BTCUSDT", {"markPrice": "50000", "lastPrice": "50010"})
 
     stored = manager.get_realtime_data("BTCUSDT")
-    assert stored["mark_price"] == "50000"
-    assert stored["last_price"] == "50010"
+    assert stored["mark_price"] == 50000.0
+    assert stored["last_price"] == 50010.0
 
 
 @pytest.mark.asyncio
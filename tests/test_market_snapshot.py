@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Tests de l'instantané marché partagé par cycle de scan (MarketSnapshot)."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from funding_fetcher import FundingFetcher
+from market_snapshot import MarketSnapshot
+from spread_fetcher import SpreadFetcher
+
+BASE_URL = "https://snapshot-api"
+TICKERS = [
+    {
+        "symbol": "BTCUSDT",
+        "fundingRate": "0.0001",
+        "volume24h": "1000",
+        "nextFundingTime": "1700000000000",
+        "bid1Price": "99",
+        "ask1Price": "101",
+    }
+]
+
+
+class TestMarketSnapshot:
+    """Tests de la coalescence et du cycle de vie de l'instantané."""
+
+    def test_concurrent_requesters_share_one_fetch(self):
+        snapshot = MarketSnapshot(logger=Mock())
+        release = threading.Event()
+
+        def _slow_pages(*args, **kwargs):
+            release.wait(2)
+            yield TICKERS
+
+        results = []
+        with patch.object(snapshot._pagination, "iter_pages", side_effect=_slow_pages) as pages:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(snapshot.get_tickers(BASE_URL, "linear"))
+                )
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join(2)
+
+        assert pages.call_count == 1
+        assert results == [TICKERS] * 3
+        stats = snapshot.get_stats()
+        assert stats["fetches"] == 1
+        assert stats["coalesced"] == 2
+
+    def test_async_requesters_wait_inflight_fetch(self):
+        snapshot = MarketSnapshot(logger=Mock())
+
+        async def _pages(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            yield TICKERS
+
+        async def _run():
+            return await asyncio.gather(
+                snapshot.get_tickers_async(BASE_URL, "linear"),
+                snapshot.get_tickers_async(BASE_URL, "linear"),
+            )
+
+        with patch.object(snapshot._pagination, "iter_pages_async", side_effect=_pages) as pages:
+            results = asyncio.run(_run())
+
+        assert pages.call_count == 1
+        assert results == [TICKERS, TICKERS]
+
+    def test_failed_fetch_reaches_waiters_and_is_not_cached(self):
+        snapshot = MarketSnapshot(logger=Mock())
+        with patch.object(snapshot._pagination, "iter_pages", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                snapshot.get_tickers(BASE_URL, "linear")
+
+        with patch.object(
+            snapshot._pagination, "iter_pages", return_value=(p for p in [TICKERS])
+        ) as pages:
+            assert snapshot.get_tickers(BASE_URL, "linear") == TICKERS
+        assert pages.call_count == 1
+
+    def test_start_cycle_forces_fresh_data(self):
+        snapshot = MarketSnapshot(logger=Mock())
+        with patch.object(snapshot._pagination, "iter_pages") as pages:
+            pages.return_value = (p for p in [TICKERS])
+            assert snapshot.get_tickers(BASE_URL, "linear") == TICKERS
+            assert snapshot.get_tickers(BASE_URL, "linear") == TICKERS
+
+            snapshot.start_cycle()
+            pages.return_value = (p for p in [[]])
+            assert snapshot.get_tickers(BASE_URL, "linear") == []
+        assert pages.call_count == 2
+
+    def test_funding_and_spreads_share_cycle_request(self):
+        snapshot = MarketSnapshot(logger=Mock())
+        funding = FundingFetcher(logger=Mock(), market_snapshot=snapshot)
+        spreads = SpreadFetcher(logger=Mock(), market_snapshot=snapshot)
+
+        with patch.object(
+            snapshot._pagination, "iter_pages", return_value=(p for p in [TICKERS])
+        ) as pages:
+            funding_map = funding.fetch_funding_map(BASE_URL, "linear", timeout=2)
+            spread_map = spreads.fetch_spread_data(BASE_URL, ["BTCUSDT"], 2, "linear")
+
+        assert pages.call_count == 1
+        assert "BTCUSDT" in funding_map
+        assert spread_map["BTCUSDT"] == pytest.approx(0.02)
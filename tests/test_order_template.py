@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Tests des gabarits d'ordres pré-armés (OrderTemplate) et de leur usage par le scheduler."""
+
+import hashlib
+import hmac
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from order_template import OrderTemplate, size_quantity
+from scheduler_manager import SchedulerManager
+
+RULES = {"qty_step": 0.1, "min_qty": 0.1, "min_notional": 5.0, "quantity_precision": None}
+
+
+class TestOrderTemplate:
+    """Tests du dimensionnement et du corps pré-sérialisé."""
+
+    def test_size_quantity_covers_notional_on_step(self):
+        assert size_quantity(10, 3.0, 0.1, 0.1) == "3.4"
+        assert size_quantity(10, 1000.0, 1.0, 1.0) == "1"
+
+    def test_render_fills_price_into_compact_body(self):
+        template = OrderTemplate.build("BTCUSDT", "Buy", 3.0, 10, RULES, tick_size=0.01)
+
+        body = template.render(2.99712)
+
+        assert json.loads(body) == {
+            "category": "linear", "symbol": "BTCUSDT", "side": "Buy", "orderType": "Limit",
+            "qty": "3.4", "price": "3.00", "timeInForce": "PostOnly",
+        }
+        assert body == json.dumps(json.loads(body), separators=(',', ':'))
+
+    def test_for_price_resizes_only_below_target(self):
+        template = OrderTemplate.build("BTCUSDT", "Buy", 3.0, 10, RULES, tick_size=0.01)
+
+        assert template.for_price(3.1) is template
+        resized = template.for_price(2.5)
+        assert resized.qty == "4" and '"qty":"4"' in resized.render(2.5)
+
+
+@pytest.fixture
+def scheduler():
+    client = Mock()
+    client.is_testnet.return_value = True
+    client.is_authenticated.return_value = True
+    scheduler = SchedulerManager(
+        logger=Mock(),
+        bybit_client=client,
+        auto_trading_config={"enabled": True, "order_size_usdt": 10},
+    )
+    scheduler.smart_placer = Mock()
+    scheduler.smart_placer.rules_cache.get_quantity_rules.return_value = RULES
+    scheduler.smart_placer.rules_cache.get_tick_size.return_value = 0.01
+    scheduler.smart_placer.place_order_with_refresh.return_value = Mock(success=False, error_message="stop")
+    return scheduler
+
+
+def test_prearmed_order_skips_instrument_lookup(scheduler):
+    assert scheduler.prearm_order("BTCUSDT", 0.001, 3.0).qty == "3.4"
+    scheduler.smart_placer.rules_cache.reset_mock()
+
+    scheduler._place_automatic_order("BTCUSDT", 0.001, 3.05)
+
+    scheduler.bybit_client.get_instruments_info.assert_not_called()
+    scheduler.smart_placer.rules_cache.get_quantity_rules.assert_not_called()
+    kwargs = scheduler.smart_placer.place_order_with_refresh.call_args.kwargs
+    assert (kwargs["side"], kwargs["qty"]) == ("Buy", "3.4")
+    # Le gabarit pré-armé est transmis : premier envoi via place_order_prepared
+    assert kwargs["template"].render(3.0) == scheduler.prearm_order("BTCUSDT", 0.001, 3.0).render(3.0)
+
+
+def test_prearmed_template_not_reused_after_side_change(scheduler):
+    scheduler.prearm_order("BTCUSDT", 0.001, 3.0)
+    # Funding passé négatif : le gabarit Buy n'est pas réutilisé
+    assert scheduler._get_order_template("BTCUSDT", "Sell", 3.0).side == "Sell"
+    assert "BTCUSDT" not in scheduler._order_templates
+
+
+def test_prepared_body_is_signed_and_sent_as_is(monkeypatch):
+    from bybit_client import BybitClient
+    import bybit_client.private_client as private_client
+
+    client = BybitClient(testnet=True, timeout=5, api_key="k", api_secret="s")
+    monkeypatch.setattr(client, "_maybe_sync_time", lambda: None)
+    monkeypatch.setattr(private_client, "record_api_call", lambda latency, success: None)
+    http = Mock()
+    http.post.return_value = Mock(
+        status_code=200, headers={}, json=lambda: {"retCode": 0, "result": {"orderId": "o1"}}
+    )
+    monkeypatch.setattr(private_client, "get_http_client", lambda timeout: http)
+    body = OrderTemplate.build("BTCUSDT", "Sell", 3.0, 10, RULES, tick_size=0.01).render(3.0)
+
+    assert client.place_order_prepared(body) == {"orderId": "o1"}
+
+    kwargs = http.post.call_args.kwargs
+    headers = kwargs["headers"]
+    assert kwargs["content"] == body
+    payload = f"{headers['X-BAPI-TIMESTAMP']}k{headers['X-BAPI-RECV-WINDOW']}{body}"
+    expected = hmac.new(b"s", payload.encode(), hashlib.sha256).hexdigest()
+    assert headers["X-BAPI-SIGN"] == expected
+
+
+def test_entry_confirmed_from_position_book_without_rest(scheduler, monkeypatch):
+    import threading
+
+    import scheduler_manager
+    from position_book import PositionBook
+
+    monkeypatch.setattr(scheduler_manager, "POSITION_OPEN_CONFIRM_SECONDS", 0.05)
+    book = PositionBook(logger=Mock())
+    book.set_live(True)
+    scheduler.set_position_book(book)
+
+    assert scheduler._confirm_position_opened("BTCUSDT", "Buy") is False
+
+    message = {"topic": "position", "data": [{"symbol": "BTCUSDT", "side": "Buy", "size": "3.4"}]}
+    threading.Timer(0.01, book.on_topic, args=("position", message)).start()
+    monkeypatch.setattr(scheduler_manager, "POSITION_OPEN_CONFIRM_SECONDS", 2)
+
+    assert scheduler._confirm_position_opened("BTCUSDT", "Buy") is True
+    scheduler.bybit_client.get_positions.assert_not_called()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Tests du carnet de positions partagé (PositionBook) et de son usage par FundingCloseManager."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from position_book import PositionBook
+
+
+def position_message(symbol, size):
+    return {"topic": "position", "data": [{"symbol": symbol, "side": "Buy", "size": size}]}
+
+
+def order_message(symbol, order_id, status):
+    return {"topic": "order", "data": [{
+        "symbol": symbol, "orderId": order_id, "orderStatus": status,
+        "createdTime": str(int(time.time() * 1000)),
+    }]}
+
+
+class TestPositionBook:
+    """Tests de l'alimentation WebSocket et de la réconciliation REST."""
+
+    def test_ws_messages_update_positions_and_orders(self):
+        book = PositionBook(logger=Mock())
+        book.on_topic("position", position_message("BTCUSDT", "0.01"))
+        book.on_topic("order", order_message("ETHUSDT", "o1", "New"))
+
+        assert book.has_position("BTCUSDT")
+        assert book.has_open_order("ETHUSDT", max_age_seconds=60)
+
+        book.on_topic("position", position_message("BTCUSDT", "0"))
+        book.on_topic("order", order_message("ETHUSDT", "o1", "Filled"))
+
+        assert not book.has_position("BTCUSDT")
+        assert not book.has_open_order("ETHUSDT")
+
+    def test_reconcile_uses_one_call_per_data_type(self):
+        book = PositionBook(logger=Mock())
+        client = Mock()
+        client.get_positions.return_value = {"list": [
+            {"symbol": "BTCUSDT", "size": "0.01"},
+            {"symbol": "ETHUSDT", "size": "0"},
+        ]}
+        client.get_open_orders.return_value = {"list": [
+            {"symbol": "SOLUSDT", "orderId": "o2", "orderStatus": "New"},
+        ]}
+
+        assert book.reconcile(client)
+
+        client.get_positions.assert_called_once_with(category="linear", settleCoin="USDT", limit=200)
+        client.get_open_orders.assert_called_once_with(category="linear", settleCoin="USDT", limit=50)
+        assert set(book.get_open_positions()) == {"BTCUSDT"}
+        assert book.has_open_order("SOLUSDT")
+        assert book.seconds_since_reconcile() < 1
+
+    def test_ws_update_during_reconcile_wins(self):
+        book = PositionBook(logger=Mock())
+        client = Mock()
+
+        def _positions(**kwargs):
+            # Fermeture reçue par la WS pendant l'appel REST
+            book.on_topic("position", position_message("BTCUSDT", "0"))
+            return {"list": [{"symbol": "BTCUSDT", "size": "0.01"}]}
+
+        client.get_positions.side_effect = _positions
+        client.get_open_orders.return_value = {"list": []}
+
+        assert book.reconcile(client)
+        assert not book.has_position("BTCUSDT")
+
+    def test_reconcile_follows_page_cursor(self):
+        book = PositionBook(logger=Mock())
+        client = Mock()
+        pages = {
+            None: {"list": [{"symbol": f"S{i}USDT", "size": "1"} for i in range(200)],
+                   "nextPageCursor": "p2"},
+            "p2": {"list": [{"symbol": "LASTUSDT", "size": "1"}], "nextPageCursor": ""},
+        }
+        client.get_positions.side_effect = lambda cursor=None, **kwargs: pages[cursor]
+        client.get_open_orders.side_effect = [
+            {"list": [{"symbol": "AUSDT", "orderId": "o1", "orderStatus": "New"}], "nextPageCursor": "c2"},
+            {"list": [{"symbol": "BUSDT", "orderId": "o2", "orderStatus": "New"}]},
+        ]
+
+        assert book.reconcile(client)
+
+        assert len(book.get_open_positions()) == 201 and book.has_position("LASTUSDT")
+        assert book.has_open_order("AUSDT") and book.has_open_order("BUSDT")
+        assert client.get_open_orders.call_args.kwargs == {
+            "category": "linear", "settleCoin": "USDT", "limit": 50, "cursor": "c2",
+        }
+
+    def test_failed_reconcile_keeps_state(self):
+        book = PositionBook(logger=Mock())
+        book.on_topic("position", position_message("BTCUSDT", "1"))
+        client = Mock()
+        client.get_positions.side_effect = RuntimeError("boom")
+
+        assert not book.reconcile(client)
+        assert book.has_position("BTCUSDT")
+
+
+class TestFundingCloseManagerPositions:
+    """Tests de la vérification des positions en mémoire."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        import funding_close_manager
+
+        monkeypatch.setattr(
+            funding_close_manager, "get_settings", lambda: {"api_key": "k", "api_secret": "s"}
+        )
+        client = Mock()
+        book = PositionBook(logger=Mock())
+        book.set_live(True)
+        manager = funding_close_manager.FundingCloseManager(
+            testnet=True,
+            logger=Mock(),
+            bybit_client=client,
+            auto_trading_config={"auto_close_after_funding": True},
+            position_book=book,
+        )
+        return manager, book, client
+
+    def test_verify_position_reads_book_without_rest(self, manager):
+        manager, book, client = manager
+        book.on_topic("position", position_message("BTCUSDT", "0.01"))
+        manager.add_position_to_monitor("BTCUSDT")
+
+        assert manager._verify_position_exists("BTCUSDT")
+        client.get_positions.assert_not_called()
+        client.get_open_orders.assert_not_called()
+
+    def test_missing_position_dropped_after_grace(self, manager, monkeypatch):
+        import funding_close_manager
+
+        manager, book, client = manager
+        manager.add_position_to_monitor("ETHUSDT")
+        # Pendant le délai de confirmation la position reste surveillée
+        assert manager._verify_position_exists("ETHUSDT")
+
+        monkeypatch.setattr(funding_close_manager, "POSITION_CONFIRM_GRACE_SECONDS", 0)
+        assert not manager._verify_position_exists("ETHUSDT")
+
+        book.on_topic("order", order_message("ETHUSDT", "o1", "New"))
+        assert manager._verify_position_exists("ETHUSDT")
+
+    def test_reconcile_due_only_after_interval_when_live(self, manager):
+        manager, book, client = manager
+        assert manager._reconcile_due()
+
+        client.get_positions.return_value = {"list": []}
+        client.get_open_orders.return_value = {"list": []}
+        book.reconcile(client)
+        assert not manager._reconcile_due()
+
+        book.set_live(False)
+        assert manager._reconcile_due()
+
+        # Reconnexion : événements de la coupure rattrapés par REST
+        book.set_live(True)
+        assert manager._reconcile_due()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests du service partagé de rate limiting (RateLimitService)."""
+
+import asyncio
+import threading
+import time
+
+from rate_limit_service import (
+    GROUP_MARKET,
+    GROUP_ORDER,
+    GROUP_POSITION,
+    GROUP_WALLET,
+    RateLimitService,
+    classify_endpoint,
+)
+
+
+class TestRateLimitService:
+    """Tests des token buckets par groupe d'endpoints."""
+
+    def test_classify_endpoint(self):
+        assert classify_endpoint("https://api.bybit.com/v5/order/create", True) == GROUP_ORDER
+        assert classify_endpoint("/v5/order/cancel", True) == GROUP_ORDER
+        assert classify_endpoint("/v5/order/realtime", True) == GROUP_POSITION
+        assert classify_endpoint("/v5/position/list", True) == GROUP_POSITION
+        assert classify_endpoint("/v5/account/wallet-balance", True) == GROUP_WALLET
+        assert classify_endpoint("/v5/market/tickers?category=linear") == GROUP_MARKET
+        assert classify_endpoint("/v5/unknown", True) == GROUP_POSITION
+        assert classify_endpoint(None) == GROUP_MARKET
+
+    def test_headers_cap_tokens_until_reset(self):
+        service = RateLimitService({GROUP_ORDER: (10, 1.0)}, ip_limit=None)
+        reset_ms = int((time.time() + 0.3) * 1000)
+        assert service.update_from_headers(GROUP_ORDER, {
+            "X-Bapi-Limit": "10",
+            "X-Bapi-Limit-Status": "1",
+            "X-Bapi-Limit-Reset-Timestamp": str(reset_ms),
+        })
+
+        assert service.acquire(GROUP_ORDER, timeout=0.05)
+        # Plus aucun jeton avant le reset annoncé par le serveur
+        assert not service.acquire(GROUP_ORDER, timeout=0.1)
+
+        start = time.monotonic()
+        assert service.acquire(GROUP_ORDER, timeout=1.0)
+        assert time.monotonic() - start < 0.35
+        assert service.get_status()["groups"][GROUP_ORDER]["tokens"] >= 8
+
+    def test_order_served_before_queued_market_data(self):
+        service = RateLimitService(
+            {GROUP_MARKET: (100, 1.0), GROUP_ORDER: (100, 1.0)}, ip_limit=(1, 0.2)
+        )
+        assert service.acquire(GROUP_MARKET)
+        served = []
+
+        def _request(group):
+            service.acquire(group)
+            served.append(group)
+
+        market = threading.Thread(target=_request, args=(GROUP_MARKET,))
+        market.start()
+        time.sleep(0.02)
+        order = threading.Thread(target=_request, args=(GROUP_ORDER,))
+        order.start()
+        market.join(2)
+        order.join(2)
+
+        assert served == [GROUP_ORDER, GROUP_MARKET]
+
+    def test_async_acquire_waits_exact_refill(self):
+        service = RateLimitService({GROUP_MARKET: (2, 0.2)}, ip_limit=None)
+
+        async def _acquire_three():
+            start = time.monotonic()
+            await asyncio.gather(*(service.acquire_async(GROUP_MARKET) for _ in range(3)))
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(_acquire_three())
+        # Un jeton toutes les 0.1 s : attente ~0.1 s, sans pas de polling
+        assert 0.08 <= elapsed < 0.2
+
+    def test_consume_records_debt(self):
+        service = RateLimitService({GROUP_MARKET: (1, 1.0)}, ip_limit=None)
+        assert service.consume(GROUP_MARKET)
+        assert not service.consume(GROUP_MARKET)
+        assert service.get_status()["groups"][GROUP_MARKET]["tokens"] < 0
+        assert not service.acquire(GROUP_MARKET, timeout=0.05)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests des formules de score compilées (weights.formula)."""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from config.config_validator import ConfigValidator
+from score_expression import ScoreExpressionError, compile_score_expression
+from watchlist_helpers import WatchlistFilterApplier, WeightCalculator
+
+WEIGHTS = {"funding": 1000, "volume": 0.01, "spread": 0.1, "volatility": 0.05, "top_symbols": 5}
+DEFAULT_FORMULA = (
+    "abs(funding) * weights.funding + log(volume + 1) * weights.volume"
+    " - spread * weights.spread - volatility * weights.volatility"
+)
+
+
+def make_rows(n=200, seed=5):
+    rng = random.Random(seed)
+    return [
+        (f"S{i}USDT", rng.uniform(-0.01, 0.01), rng.uniform(0, 5e7), None,
+         rng.uniform(0, 0.01), rng.uniform(0, 0.05))
+        for i in range(n)
+    ]
+
+
+def test_default_formula_matches_builtin_weights():
+    calculator = WeightCalculator(logger=Mock())
+    rows = make_rows()
+    expected = calculator.calculate_weights(rows, WEIGHTS)
+    config = {**WEIGHTS, "formula": DEFAULT_FORMULA}
+
+    assert calculator.calculate_weights(rows, config) == expected
+    assert calculator.calculate_weight(calculator._to_dict(rows[0], {}), config) == expected[0]
+    assert calculator.get_score_expression(config) is calculator.get_score_expression(dict(config))
+
+
+def test_vectorized_and_bytecode_paths_agree(monkeypatch):
+    expression = compile_score_expression(
+        "clip(funding * 1e4, -5, 5) - sqrt(spread) / max(volatility, 0.01) + log(funding)", {}
+    )
+    columns = {
+        "funding": [0.001, -0.002, 0.0005],
+        "spread": [0.0004, 0.0, 0.01],
+        "volatility": [0.02, 0.0, 0.5],
+    }
+
+    vectorized = expression.evaluate(columns)
+    monkeypatch.setattr(expression, "_vectorized", None)
+    assert expression.evaluate(columns) == vectorized
+    # log d'un funding négatif : score non fini ramené à 0
+    assert vectorized[1] == 0.0
+
+
+@pytest.mark.parametrize("formula", [
+    "__import__('os').system('true')",
+    "funding.__class__",
+    "open_interest * 2",
+    "weights.unknown * funding",
+    "[funding]",
+    "funding if volume else spread",
+    "log(funding, 10)",
+    "abs(funding) +",
+])
+def test_rejects_formulas_outside_grammar(formula):
+    with pytest.raises(ScoreExpressionError):
+        compile_score_expression(formula, WEIGHTS)
+
+    errors = ConfigValidator()._validate_weights({"weights": {**WEIGHTS, "formula": formula}})
+    assert errors and errors[0].startswith("weights.formula invalide")
+
+
+def test_filter_applier_ranks_with_formula_and_falls_back_on_error():
+    applier = WatchlistFilterApplier(Mock(), Mock(), {}, logger=Mock())
+    rows = make_rows(50)
+    # Score = spread seul : classement par spread décroissant
+    ranked, count = applier.apply_weighting_system(rows, {"formula": "spread * 1e6", "top_symbols": 3})
+    assert count == 3
+    assert [r[0] for r in ranked] == [r[0] for r in sorted(rows, key=lambda r: r[4], reverse=True)[:3]]
+
+    ranked, _ = applier.apply_weighting_system(rows, {**WEIGHTS, "formula": "open_interest * 2"})
+    expected = WeightCalculator(logger=Mock()).process_weighted_ranking(rows, WEIGHTS, {})
+    assert [r[0] for r in ranked] == [o["symbol"] for o in expected]
+    applier.logger.warning.assert_called_once()
+
+
+def test_constant_formula_scores_every_row():
+    calculator = WeightCalculator(logger=Mock())
+    rows = make_rows(20)
+    config = {**WEIGHTS, "formula": "weights.funding * 2"}
+
+    assert calculator.calculate_weights(rows, config) == [2000.0] * len(rows)
+
+    applier = WatchlistFilterApplier(Mock(), Mock(), {}, logger=Mock())
+    ranked, count = applier.apply_weighting_system(rows, config)
+    # Poids identiques : ordre d'entrée conservé
+    assert count == 5
+    assert [r[0] for r in ranked] == [r[0] for r in rows[:5]]
+    assert all(r[6] == 2000.0 for r in ranked)
+    applier.logger.warning.assert_not_called()
@@ -126,3 +126,141 @@ def test_place_order_cycle_returns_order_info(smart_placer):
     assert result.liquidity_level is not None
 
 
+def test_prearmed_template_sends_prepared_body(smart_placer, dummy_client, executor):
+    from order_template import OrderTemplate
+
+    bodies = []
+    dummy_client.place_order_prepared = lambda body: bodies.append(body) or {
+        "retCode": 0, "retMsg": "OK", "orderId": "prepared-id"
+    }
+    rules = {"qty_step": 0.1, "min_qty": 0.1, "quantity_precision": None}
+    template = OrderTemplate.build("ENSOUSDT", "Buy", 1.5, 12.0, rules, 0.001)
+
+    result = smart_placer.place_order_with_refresh(
+        "ENSOUSDT", "Buy", template.qty, category="linear", template=template
+    )
+
+    assert result.order_id == "prepared-id"
+    assert dummy_client._placed == []
+    assert len(bodies) == 1 and f'"qty":"{template.qty}"' in bodies[0]
+    assert any(call["func"] is dummy_client.place_order_prepared for call in executor.calls)
+
+
+def test_orderbook_manager_prefers_local_book(dummy_client):
+    from src.smart_order_placer.orderbook_manager import OrderbookManager
+
+    class Source:
+        def __init__(self):
+            self.book = None
+            self.subscribed = []
+
+        def get_orderbook(self, symbol, depth=None):
+            return self.book
+
+        def subscribe_orderbook(self, category, symbols):
+            self.subscribed.extend(symbols)
+            return symbols
+
+    source = Source()
+    dummy_client.get_orderbook = lambda **kwargs: pytest.fail("REST appelé malgré le carnet local")
+    manager = OrderbookManager(dummy_client, make_logger(), source)
+    source.book = {"b": [[1.6, 100.0]], "a": [[1.7, 100.0]]}
+
+    assert manager.get_cached_orderbook("LOCALUSDT", "linear") is source.book
+    assert source.subscribed == []
+
+
+def test_orderbook_manager_falls_back_to_rest_and_subscribes(dummy_client):
+    from src.smart_order_placer.orderbook_manager import OrderbookManager
+
+    source = type("Source", (), {})()
+    source.get_orderbook = lambda symbol, depth=None: None
+    source.subscribed = []
+    source.subscribe_orderbook = lambda category, symbols: source.subscribed.extend(symbols) or symbols
+    manager = OrderbookManager(dummy_client, make_logger(), source)
+
+    orderbook = manager.get_cached_orderbook("MISSUSDT", "linear")
+
+    assert orderbook["b"][0] == ["1.600", "100"]
+    assert source.subscribed == ["MISSUSDT"]
+
+
+
+@pytest.fixture
+def live_tracker(monkeypatch):
+    import order_tracker
+
+    monkeypatch.setattr(order_tracker, "get_settings", lambda: {})
+    tracker = order_tracker.OrderLifecycleTracker(logger=make_logger())
+    tracker._live = True
+    return tracker
+
+
+def order_message(status, order_id="test-order-id", cum_exec_qty="0"):
+    return {"topic": "order", "data": [{
+        "orderId": order_id, "symbol": "ENSOUSDT", "orderStatus": status,
+        "cumExecQty": cum_exec_qty, "avgPrice": "1.6",
+    }]}
+
+
+def test_fill_seen_through_websocket_without_rest_polling(smart_placer, dummy_client, live_tracker):
+    dummy_client.get_open_orders = lambda **kwargs: pytest.fail("REST appelé malgré la WS privée")
+    # Le message WS arrive avant la réponse REST de place_order
+    live_tracker.on_topic("order", order_message("Filled", cum_exec_qty="3.2"))
+    smart_placer.set_order_tracker(live_tracker)
+
+    result = smart_placer.place_order_with_refresh("ENSOUSDT", "Buy", "0.5", category="spot")
+
+    assert result.success is True
+    assert result.order_id == "test-order-id"
+    assert len(live_tracker) == 0
+
+
+def test_postonly_cancel_from_websocket_triggers_replace(smart_placer, dummy_client, live_tracker):
+    live_tracker.on_topic("order", order_message("Cancelled"))
+    smart_placer.set_order_tracker(live_tracker)
+    smart_placer.refresh_interval_spot = 0.01
+
+    result = smart_placer.place_order_with_refresh("ENSOUSDT", "Buy", "0.5", category="spot")
+
+    # Second ordre sans événement WS : réconciliation REST (aucun ordre ouvert)
+    assert len(dummy_client._placed) == 2
+    assert result.success is True
+
+
+def test_tracker_execution_resolves_future_and_ignores_late_messages(live_tracker):
+    future = live_tracker.future("exec-order")
+    live_tracker.on_topic("execution", {"topic": "execution", "data": [{
+        "orderId": "exec-order", "symbol": "BTCUSDT", "execType": "Trade",
+        "execQty": "0.01", "execPrice": "100", "leavesQty": "0",
+    }]})
+    live_tracker.on_topic("order", order_message("New", order_id="exec-order"))
+
+    state = future.result(timeout=1)
+    assert state.is_filled and state.cum_exec_qty == pytest.approx(0.01)
+    assert live_tracker.get_state("exec-order").status == "Filled"
+    assert live_tracker.wait_for_terminal("exec-order", timeout=0).is_terminal
+
+
+def test_tracker_order_then_execution_does_not_double_count(live_tracker):
+    execution = {"topic": "execution", "data": [{
+        "orderId": "dup-order", "symbol": "BTCUSDT", "execType": "Trade", "execId": "e1",
+        "execQty": "0.4", "execPrice": "101", "leavesQty": "0.6",
+    }]}
+    # Le topic "order" (cumul absolu) arrive avant l'exécution correspondante
+    live_tracker.on_topic("order", order_message("PartiallyFilled", order_id="dup-order",
+                                                 cum_exec_qty="0.4"))
+    live_tracker.on_topic("execution", execution)
+    live_tracker.on_topic("execution", execution)
+
+    state = live_tracker.get_state("dup-order")
+    assert state.cum_exec_qty == pytest.approx(0.4)
+    assert state.avg_price == pytest.approx(1.6)
+
+    live_tracker.on_topic("execution", {"topic": "execution", "data": [{
+        "orderId": "dup-order", "symbol": "BTCUSDT", "execType": "Trade", "execId": "e2",
+        "execQty": "0.6", "execPrice": "103", "leavesQty": "0",
+    }]})
+    state = live_tracker.get_state("dup-order")
+    assert state.is_filled and state.cum_exec_qty == pytest.approx(1.0)
+    assert state.avg_price == pytest.approx(102.2)
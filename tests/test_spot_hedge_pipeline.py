@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests du pipeline de hedge spot (préparation, lancement au fill, latences)."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from spot_hedge_manager import HedgePlan, SpotHedgeManager
+
+
+@pytest.fixture
+def manager():
+    manager = SpotHedgeManager(
+        testnet=True,
+        logger=Mock(),
+        bybit_client=Mock(),
+        auto_trading_config={"spot_hedge": {"enabled": True}},
+    )
+    placed = []
+
+    def _place(symbol, side, size, price, perp_side, perp_size, perp_price):
+        time.sleep(0.05)
+        placed.append((symbol, side, size))
+        manager._track_hedge_order(symbol, "dry_run_order", side, size, price, perp_side, perp_size, perp_price)
+        return True
+
+    with patch.object(manager, "_place_spot_hedge_order", side_effect=_place), \
+         patch.object(manager, "_calculate_spot_hedge_quantity", new_callable=AsyncMock, return_value="1"), \
+         patch.object(manager, "_ensure_spot_balance_for_sell", new_callable=AsyncMock, return_value="1"), \
+         patch.object(manager, "_calculate_hedge_price", return_value=100.0), \
+         patch("spot_hedge_manager.record_hedge_latency") as record:
+        manager.placed = placed
+        manager.record = record
+        yield manager
+
+
+POSITION = {"symbol": "BTCUSDT", "side": "Buy", "size": "0.01", "price": 100.0}
+
+
+def test_prepared_plan_skips_price_and_availability_fetch(manager):
+    manager._hedge_plans["BTCUSDT"] = HedgePlan("BTCUSDT", 100.0)
+    with patch.object(manager, "_check_spot_availability", new_callable=AsyncMock) as check, \
+         patch.object(manager, "_get_current_spot_price_async", new_callable=AsyncMock) as price:
+        filled_at = time.monotonic()
+        asyncio.run(manager.on_perp_position_opened("BTCUSDT", {**POSITION, "filled_at": filled_at}))
+
+    check.assert_not_awaited()
+    price.assert_not_awaited()
+    assert manager.placed == [("BTCUSDT", "Sell", "1")]
+    latencies = manager.get_hedge_status()["last_latencies_ms"]["BTCUSDT"]
+    assert latencies["unhedged"] >= latencies["spot_leg"] >= 50
+    manager.record.assert_called_once()
+
+
+def test_fired_hedge_and_position_event_place_one_order(manager):
+    manager._hedge_plans["BTCUSDT"] = HedgePlan("BTCUSDT", 100.0)
+    future = manager.fire_hedge("BTCUSDT", {**POSITION, "filled_at": time.monotonic()})
+    time.sleep(0.01)
+    # L'événement de position (scheduler / WebSocket) arrive pendant la jambe spot
+    asyncio.run(manager.on_perp_position_opened("BTCUSDT", POSITION))
+    future.result(timeout=2)
+
+    assert len(manager.placed) == 1
+
+
+def test_abort_hedge_waits_spot_leg_then_closes(manager):
+    manager._hedge_plans["BTCUSDT"] = HedgePlan("BTCUSDT", 100.0)
+    with patch.object(manager, "_close_spot_hedge", return_value=True) as close:
+        manager.fire_hedge("BTCUSDT", POSITION)
+        manager.abort_hedge("BTCUSDT")
+
+    close.assert_called_once()
+    assert manager.get_active_hedges() == {}
+
+
+def test_prepare_hedge_gathers_spot_data(manager):
+    manager.smart_placer.rules_cache = Mock()
+    with patch.object(manager, "_check_spot_availability", new_callable=AsyncMock, return_value=True), \
+         patch.object(manager, "_get_current_spot_price_async", new_callable=AsyncMock, return_value=101.5), \
+         patch.object(manager, "_get_available_balance", new_callable=AsyncMock, return_value=50.0):
+        plan = asyncio.run(manager.prepare_hedge("BTCUSDT"))
+        again = asyncio.run(manager.prepare_hedge("BTCUSDT"))
+
+    assert plan.spot_price == 101.5 and again is plan
+    manager.smart_placer.rules_cache.get_quantity_rules.assert_called_once_with("BTCUSDT", "spot")
@@ -21,7 +21,7 @@ class TestFundingData:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
             volatility_pct=0.005,
         )
@@ -29,7 +29,7 @@ class TestFundingData:
         assert funding.symbol == "BTCUSDT"
         assert funding.funding_rate == 0.0001
         assert funding.volume_24h == 1000000.0
-        assert funding.next_funding_time == "1h 30m"
+        assert funding.next_funding_time == 1700000000000
         assert funding.spread_pct == 0.001
         assert funding.volatility_pct == 0.005
     
@@ -39,7 +39,7 @@ class TestFundingData:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
         )
         
@@ -53,7 +53,7 @@ class TestFundingData:
                 symbol="",
                 funding_rate=0.0001,
                 volume_24h=1000000.0,
-                next_funding_time="1h 30m",
+                next_funding_time=1700000000000,
                 spread_pct=0.001,
             )
     
@@ -64,7 +64,7 @@ class TestFundingData:
                 symbol="BTCUSDT",
                 funding_rate=2.0,  # Hors limites
                 volume_24h=1000000.0,
-                next_funding_time="1h 30m",
+                next_funding_time=1700000000000,
                 spread_pct=0.001,
             )
     
@@ -75,7 +75,7 @@ class TestFundingData:
                 symbol="BTCUSDT",
                 funding_rate=0.0001,
                 volume_24h=-1000.0,  # Négatif
-                next_funding_time="1h 30m",
+                next_funding_time=1700000000000,
                 spread_pct=0.001,
             )
     
@@ -86,7 +86,7 @@ class TestFundingData:
                 symbol="BTCUSDT",
                 funding_rate=0.0001,
                 volume_24h=1000000.0,
-                next_funding_time="1h 30m",
+                next_funding_time=1700000000000,
                 spread_pct=2.0,  # Hors limites
             )
     
@@ -96,7 +96,7 @@ class TestFundingData:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=5000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
             volatility_pct=0.005,
         )
@@ -111,17 +111,17 @@ class TestFundingData:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
             volatility_pct=0.005,
         )
         
         result = funding.to_tuple()
-        assert result == (0.0001, 1000000.0, "1h 30m", 0.001, 0.005)
+        assert result == (0.0001, 1000000.0, 1700000000000, 0.001, 0.005)
     
     def test_funding_data_from_tuple(self):
         """Test de création depuis un tuple."""
-        data = (0.0001, 1000000.0, "1h 30m", 0.001, 0.005)
+        data = (0.0001, 1000000.0, 1700000000000, 0.001, 0.005)
         funding = FundingData.from_tuple("BTCUSDT", data)
         
         assert funding.symbol == "BTCUSDT"
@@ -134,7 +134,7 @@ class TestFundingData:
             symbol="BTCUSDT",
             funding_rate=0.0001,
             volume_24h=1000000.0,
-            next_funding_time="1h 30m",
+            next_funding_time=1700000000000,
             spread_pct=0.001,
             volatility_pct=0.005,
         )
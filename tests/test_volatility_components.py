@@ -10,6 +10,9 @@ from unittest.mock import Mock, patch, AsyncMock
 from async_rate_limiter import AsyncRateLimiter, get_async_rate_limiter
 from volatility import VolatilityCalculator, is_cache_valid, get_volatility_cache_key
 from volatility_filter import VolatilityFilter
+from kline_window import KlineStore, KlineWindow, KLINE_INTERVAL_MS
+from volatility_cache import VolatilityCache
+import volatility_kernels
 
 
 class TestAsyncRateLimiter:
@@ -334,3 +337,142 @@ class TestUtilityFunctions:
         assert is_cache_valid(timestamp, ttl_seconds=120) is True
         assert is_cache_valid(timestamp, ttl_seconds=60) is False
 
+
+
+class TestKlineWindow:
+    """Tests pour KlineWindow / KlineStore"""
+
+    def test_window_matches_full_recalculation(self):
+        """Test que max/min incrémentaux égalent le recalcul sur les 5 dernières bougies"""
+        import random
+
+        rng = random.Random(7)
+        window = KlineWindow(size=5)
+        candles = []
+        for i in range(200):
+            start = i // 3 * KLINE_INTERVAL_MS
+            if candles and candles[-1][0] == start:
+                # Bougie en cours : high monte, low baisse
+                high = candles[-1][1] + rng.random()
+                low = candles[-1][2] - rng.random()
+                candles[-1] = [start, high, low]
+            else:
+                mid = 100 + rng.random() * 10
+                high, low = mid + rng.random(), mid - rng.random()
+                candles.append([start, high, low])
+            window.update(start, high, low)
+
+            recent = candles[-5:]
+            pmax = max(c[1] for c in recent)
+            pmin = min(c[2] for c in recent)
+            if len(recent) < 3:
+                assert window.volatility() is None
+            else:
+                assert window.volatility() == pytest.approx((pmax - pmin) / ((pmax + pmin) / 2))
+
+    def test_rest_then_ws_makes_window_live(self):
+        """Test qu'une fenêtre complétée par REST puis alimentée par WS est temps réel"""
+        store = KlineStore(history=5)
+        klines = [[str(i * KLINE_INTERVAL_MS), "0", "101", "99", "100"] for i in range(5, -1, -1)]
+        store.apply_rest("BTCUSDT", klines)
+
+        assert store.get_volatility("BTCUSDT") == pytest.approx(2 / 100)
+        assert store.get_live_volatility("BTCUSDT") is None
+
+        store.apply_ws({
+            "topic": "kline.1.BTCUSDT",
+            "data": [{"start": 5 * KLINE_INTERVAL_MS, "high": "104", "low": "99"}],
+        })
+        assert store.get_live_volatility("BTCUSDT") == pytest.approx(5 / 101.5)
+        assert store.missing_candles("BTCUSDT", now_ms=6 * KLINE_INTERVAL_MS) == 2
+
+    @pytest.mark.asyncio
+    async def test_live_window_skips_rest(self):
+        """Test qu'un symbole alimenté par WS ne déclenche aucun appel REST"""
+        calculator = VolatilityCalculator()
+        store = KlineStore()
+        calculator.set_kline_store(store)
+        for i in range(15):
+            store.apply_ws({
+                "topic": "kline.1.ETHUSDT",
+                "data": [{"start": i * KLINE_INTERVAL_MS, "high": "11", "low": "9"}],
+            })
+
+        with patch("volatility.BybitPublicClient") as mock_client_class:
+            result = await calculator.compute_volatility_batch(["ETHUSDT"])
+
+        mock_client_class.assert_not_called()
+        assert result == {"ETHUSDT": pytest.approx(0.2)}
+
+
+class TestVolatilityKernels:
+    """Tests pour les noyaux vectorisés de volatilité"""
+
+    def _rows(self):
+        import random
+
+        rng = random.Random(3)
+        rows = []
+        for length in (20, 15, 4, 2, 0):
+            candles = []
+            price = 100.0
+            for _ in range(length):
+                price *= 1 + rng.uniform(-0.01, 0.01)
+                candles.append((price * 1.002, price * 0.998, price))
+            rows.append(candles)
+        return rows
+
+    def test_numpy_matches_python_fallback(self):
+        """Test que la passe NumPy et le calcul ligne par ligne concordent"""
+        if volatility_kernels.np is None:
+            pytest.skip("NumPy non installé")
+        rows = self._rows()
+        vectorized = volatility_kernels.compute_volatility_measures(
+            *volatility_kernels.stack_candles(rows, 15), windows=(5, 15)
+        )
+        with patch.object(volatility_kernels, "np", None):
+            fallback = volatility_kernels.compute_volatility_measures(
+                *volatility_kernels.stack_candles(rows, 15), windows=(5, 15)
+            )
+
+        assert set(vectorized) == {
+            f"{m}_{w}" for m in volatility_kernels.VOLATILITY_MEASURES for w in (5, 15)
+        }
+        for key, values in vectorized.items():
+            for got, expected in zip(values, fallback[key]):
+                if expected is None:
+                    assert got is None, key
+                else:
+                    assert got == pytest.approx(expected), key
+        # Moins de 3 bougies : aucune mesure
+        assert vectorized["range_5"][3] is None
+        assert vectorized["range_5"][4] is None
+
+    def test_range_matches_legacy_formula(self):
+        """Test que range_5 reproduit (max - min) / prix médian"""
+        rows = [[(101.0, 99.0, 100.0)] * 4 + [(104.0, 98.0, 100.0)]]
+        result = volatility_kernels.compute_volatility_measures(
+            *volatility_kernels.stack_candles(rows, 5), windows=(5,)
+        )
+        assert result["range_5"][0] == pytest.approx(6 / 101)
+
+    def test_cache_keeps_all_measures(self):
+        """Test que le cache conserve toutes les mesures du cycle"""
+        cache = VolatilityCache(ttl_seconds=60, logger=Mock())
+        measures = {"BTCUSDT": {"range_5": 0.01, "parkinson_15": 0.002}, "ETHUSDT": None}
+
+        ok, fail = cache.update_cache_with_results(
+            {"BTCUSDT": 0.01, "ETHUSDT": None}, time.time(), measures
+        )
+
+        assert (ok, fail) == (1, 1)
+        assert cache.get_cached_measure("BTCUSDT", "parkinson_15") == 0.002
+        assert cache.get_cached_measures("ETHUSDT") is None
+        cache.clear_stale_cache(["ETHUSDT"])
+        assert cache.get_cached_measures("BTCUSDT") is None
+
+    def test_parse_measure_key(self):
+        """Test du décodage des clés de mesure"""
+        assert volatility_kernels.parse_measure_key("realized_15") == ("realized", 15)
+        assert volatility_kernels.parse_measure_key("range") is None
+        assert volatility_kernels.parse_measure_key("foo_5") is None
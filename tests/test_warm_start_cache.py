@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Tests du cache de démarrage à chaud (WarmStartCache)."""
+
+import sqlite3
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import warm_start_cache
+from warm_start_cache import SCHEMA_VERSION, WarmStartCache
+from smart_order_placer.symbol_rules_cache import SymbolRulesCache
+from volatility_cache import VolatilityCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "warm.sqlite")
+
+
+class TestWarmStartCache:
+    """Tests du magasin persistant."""
+
+    def test_put_get_survives_reopen(self, cache_path):
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put_many("funding", {"BTCUSDT": {"funding": 0.0001}, "ETHUSDT": {"funding": -0.0002}})
+        cache.close()
+
+        reopened = WarmStartCache(cache_path, logger=Mock())
+        entries = reopened.get_many("funding")
+        assert entries["BTCUSDT"].value == {"funding": 0.0001}
+        assert reopened.get("funding", "ETHUSDT").value == {"funding": -0.0002}
+        assert reopened.get("funding", "SOLUSDT") is None
+
+    def test_get_many_reads_only_requested_keys(self, cache_path, monkeypatch):
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put_many("rules", {f"S{i}USDT": {"qty_step": i} for i in range(1200)})
+        loads = Mock(wraps=warm_start_cache.json.loads)
+        monkeypatch.setattr(warm_start_cache.json, "loads", loads)
+
+        assert cache.get("rules", "S7USDT").value == {"qty_step": 7}
+        assert loads.call_count == 1
+        wanted = [f"S{i}USDT" for i in range(0, 1200, 2)] + ["MISSING"]
+        assert len(cache.get_many("rules", wanted)) == 600
+        assert cache.get_many("rules", []) == {}
+
+    def test_ttl_per_entry(self, cache_path):
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put("volatility", "OLD", {"volatility": 0.01}, ttl=60, stored_at=time.time() - 120)
+        cache.put("volatility", "NEW", {"volatility": 0.02}, ttl=60)
+
+        assert set(cache.get_many("volatility")) == {"NEW"}
+        stale = cache.get("volatility", "OLD", allow_stale=True)
+        assert stale is not None and stale.expired
+        assert cache.purge_expired() == 1
+
+    def test_schema_version_mismatch_resets(self, cache_path):
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put("instruments", "url", {"total": 1})
+        cache.close()
+
+        conn = sqlite3.connect(cache_path)
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'schema_version'", (str(SCHEMA_VERSION - 1),))
+        conn.commit()
+        conn.close()
+
+        assert WarmStartCache(cache_path, logger=Mock()).get("instruments", "url") is None
+
+    def test_get_or_fetch_serves_cache_and_revalidates(self, cache_path, monkeypatch):
+        # Exécuter la revalidation de manière synchrone
+        executor = Mock()
+        executor.submit.side_effect = lambda fn: fn()
+        monkeypatch.setattr(warm_start_cache, "GLOBAL_EXECUTOR", executor)
+
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put("instruments", "url", {"total": 1})
+        refreshed = []
+
+        value = cache.get_or_fetch(
+            "instruments", "url", lambda: {"total": 2}, on_refresh=refreshed.append
+        )
+
+        assert value == {"total": 1}
+        assert refreshed == [{"total": 2}]
+        assert cache.get("instruments", "url").value == {"total": 2}
+
+    def test_get_or_fetch_falls_back_to_stale_on_error(self, cache_path):
+        cache = WarmStartCache(cache_path, logger=Mock())
+        cache.put("funding", "url|both", {"BTCUSDT": {}}, ttl=1, stored_at=time.time() - 10)
+
+        def failing_fetch():
+            raise RuntimeError("API indisponible")
+
+        assert cache.get_or_fetch("funding", "url|both", failing_fetch) == {"BTCUSDT": {}}
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("funding", "absent", failing_fetch)
+
+    def test_volatility_cache_restores_from_disk(self, cache_path):
+        warm = WarmStartCache(cache_path, logger=Mock())
+        first = VolatilityCache(ttl_seconds=120, logger=Mock())
+        first.attach_warm_cache(warm)
+        first.update_cache_with_results(
+            {"BTCUSDT": 0.004, "ETHUSDT": None}, time.time(), {"BTCUSDT": {"range_5": 0.004}}
+        )
+
+        restored = VolatilityCache(ttl_seconds=120, logger=Mock())
+        assert restored.attach_warm_cache(WarmStartCache(cache_path, logger=Mock())) == 1
+        assert restored.get_cached_volatility("BTCUSDT") == 0.004
+        assert restored.get_cached_measure("BTCUSDT", "range_5") == 0.004
+        assert restored.get_cached_volatility("ETHUSDT") is None
+
+    def test_symbol_rules_preloaded_without_api_call(self, cache_path):
+        client = Mock()
+        client.get_instruments_info.return_value = {
+            "list": [{
+                "priceFilter": {"tickSize": "0.5"},
+                "lotSizeFilter": {"qtyStep": "0.01", "minOrderQty": "0.01", "minOrderValue": "5"},
+            }]
+        }
+        rules = SymbolRulesCache(client, Mock(), warm_cache=WarmStartCache(cache_path, logger=Mock()))
+        assert rules.get_tick_size("BTCUSDT", "linear") == 0.5
+        assert rules.get_quantity_rules("BTCUSDT", "linear")["qty_step"] == 0.01
+
+        cold_client = Mock()
+        warm_rules = SymbolRulesCache(
+            cold_client, Mock(), warm_cache=WarmStartCache(cache_path, logger=Mock())
+        )
+        assert warm_rules.get_tick_size("BTCUSDT", "linear") == 0.5
+        assert warm_rules.get_quantity_rules("BTCUSDT", "linear")["min_notional"] == 5.0
+        cold_client.get_instruments_info.assert_not_called()
+
+
+def test_universe_refresh_before_distribution_is_kept():
+    from bot_configurator import BotConfigurator
+
+    def universe(*symbols):
+        categories = {symbol: "linear" for symbol in symbols}
+        perp = {"linear": list(symbols), "inverse": [], "total": len(symbols), "categories": categories}
+        return {"perp_data": perp, "spot_symbols": list(symbols)}
+
+    class RacingCache:
+        """Revalidation terminée avant le retour de get_or_fetch."""
+
+        def get_or_fetch(self, namespace, key, fetch, on_refresh=None):
+            on_refresh(universe("BTCUSDT", "NEWUSDT"))
+            return universe("BTCUSDT")
+
+    configurator = BotConfigurator(testnet=True, logger=Mock())
+    perp_data, spot_symbols = configurator._load_warm_universe(RacingCache(), "url")
+
+    assert perp_data["linear"] == ["BTCUSDT", "NEWUSDT"]
+    assert spot_symbols == {"BTCUSDT", "NEWUSDT"}
@@ -49,6 +49,19 @@ def test_handle_ticker_invalid_data_is_ignored():
     data_manager.update_price_data.assert_not_called()
 
 
+def test_handle_ticker_partial_diff_uses_merged_state():
+    data_manager = Mock()
+    manager = WebSocketManager(testnet=True, data_manager=data_manager, logger=Mock())
+    conn = Mock()
+    conn.get_ticker_state.return_value = {"symbol": "BTCUSDT", "markPrice": "50000", "lastPrice": "50020"}
+    manager._ws_conns = [conn]
+
+    manager._handle_ticker({"symbol": "BTCUSDT", "lastPrice": "50030"})
+
+    symbol, mark, last, _ = data_manager.update_price_data.call_args.args
+    assert (symbol, mark, last) == ("BTCUSDT", 50000.0, 50030.0)
+
+
 @pytest.mark.asyncio
 async def test_stop_resets_state():
     manager = WebSocketManager(testnet=True, logger=Mock())
@@ -75,3 +88,100 @@ async def test_double_start_logs_warning():
 
     await manager.start_connections(["BTCUSDT"], [])
     logger.warning.assert_called_with("⚠️ WebSocketManager déjà en cours d'exécution")
+
+
+def test_add_and_remove_symbols_use_live_connection():
+    manager = WebSocketManager(testnet=True, logger=Mock())
+    manager.running = True
+    conn = Mock()
+    conn.category = "linear"
+    conn.symbols = ["BTCUSDT"]
+    manager._ws_conns = [conn]
+    manager.linear_symbols = ["BTCUSDT"]
+
+    manager.add_symbols("linear", ["BTCUSDT", "ETHUSDT"])
+    conn.subscribe.assert_called_once_with(["ETHUSDT"])
+    assert manager.linear_symbols == ["BTCUSDT", "ETHUSDT"]
+
+    manager.remove_symbols("linear", ["BTCUSDT"])
+    conn.unsubscribe.assert_called_once_with(["BTCUSDT"])
+    assert manager.linear_symbols == ["ETHUSDT"]
+
+
+def test_ticker_listener_receives_ticks():
+    manager = WebSocketManager(testnet=True, logger=Mock())
+    listener = Mock()
+    manager.add_ticker_listener(listener)
+
+    manager._handle_ticker({"symbol": "BTCUSDT", "fundingRate": 0.0001})
+    listener.assert_called_once_with({"symbol": "BTCUSDT", "fundingRate": 0.0001})
+
+    manager.remove_ticker_listener(listener)
+    manager._handle_ticker({"symbol": "BTCUSDT", "fundingRate": 0.0002})
+    listener.assert_called_once()
+
+
+def test_plan_shards_keeps_every_symbol_and_balances_turnover():
+    from ws.strategy import WebSocketConnectionStrategy
+
+    strategy = WebSocketConnectionStrategy(logger=Mock())
+    symbols = [f"S{i}USDT" for i in range(250)]
+    weights = {s: float(i) for i, s in enumerate(symbols)}
+
+    shards = strategy.plan_shards(symbols, weights, max_per_connection=100)
+
+    assert len(shards) == 3
+    assert sorted(s for shard in shards for s in shard) == sorted(symbols)
+    assert all(len(shard) <= 100 for shard in shards)
+    loads = [sum(weights[s] for s in shard) for shard in shards]
+    assert max(loads) - min(loads) <= max(weights.values())
+
+
+def test_analyze_symbols_builds_one_connection_per_shard():
+    from ws.strategy import WebSocketConnectionStrategy
+
+    strategy = WebSocketConnectionStrategy(logger=Mock())
+    linear = [f"L{i}USDT" for i in range(150)]
+    result = strategy.analyze_symbols(linear, ["BTCUSD"], max_per_connection=100)
+
+    assert result.total_connections == 3
+    plans = strategy.get_connection_plan(result)
+    assert [p["category"] for p in plans] == ["linear", "linear", "inverse"]
+
+
+def test_add_symbols_fills_least_loaded_shard():
+    manager = WebSocketManager(testnet=True, logger=Mock())
+    manager.running = True
+    manager.max_symbols_per_connection = 2
+    full, partial = Mock(), Mock()
+    full.category = partial.category = "linear"
+    full.symbols = ["AUSDT", "BUSDT"]
+    partial.symbols = ["CUSDT"]
+    manager._ws_conns = [full, partial]
+    manager.linear_symbols = ["AUSDT", "BUSDT", "CUSDT"]
+
+    manager.add_symbols("linear", ["DUSDT"])
+
+    partial.subscribe.assert_called_once_with(["DUSDT"])
+    full.subscribe.assert_not_called()
+
+
+def test_subscribe_orderbook_uses_ticker_shard_and_evicts_oldest(monkeypatch):
+    import ws.manager as ws_manager_module
+
+    monkeypatch.setattr(ws_manager_module, "WS_ORDERBOOK_MAX_SYMBOLS", 2)
+    manager = WebSocketManager(testnet=True, logger=Mock())
+    first, second = Mock(), Mock()
+    first.category = second.category = "linear"
+    first.symbols, second.symbols = ["AUSDT"], ["BUSDT"]
+    first.orderbook_symbols, second.orderbook_symbols = ["AUSDT"], []
+    manager._ws_conns = [first, second]
+
+    assert manager.subscribe_orderbook("linear", ["AUSDT", "BUSDT"]) == ["AUSDT", "BUSDT"]
+    first.subscribe_orderbook.assert_called_once_with(["AUSDT"])
+    second.subscribe_orderbook.assert_called_once_with(["BUSDT"])
+
+    manager.subscribe_orderbook("linear", ["CUSDT"])
+    first.unsubscribe_orderbook.assert_called_once_with(["AUSDT"])
+    assert list(manager._orderbook_subscriptions) == ["BUSDT", "CUSDT"]
+    assert manager.subscribe_orderbook("spot", ["AUSDT"]) == []
@@ -57,6 +57,39 @@ class TestPublicWSClient:
         client._on_close(Mock(), 1000, "bye")
         client.on_close_callback.assert_called_once()
 
+    def test_live_subscribe_tracks_ack(self):
+        import json
+        from ws_public import PublicWSClient
+
+        client = PublicWSClient("linear", ["BTCUSDT"], True, Mock(), lambda d: None)
+        client.running = True
+        client.ws = Mock()
+        with patch('ws_public.record_ws_connection'):
+            client._on_open(client.ws)
+        client.ws.send.reset_mock()
+
+        req_id = client.subscribe(["BTCUSDT", "ETHUSDT"])
+        sent = json.loads(client.ws.send.call_args[0][0])
+        assert sent["op"] == "subscribe"
+        assert sent["args"] == ["tickers.ETHUSDT"]
+        assert sent["req_id"] == req_id
+        assert req_id in client.get_pending_acks()
+
+        client._on_message(Mock(), json.dumps({"success": True, "op": "subscribe", "req_id": req_id}))
+        assert req_id not in client.get_pending_acks()
+
+        client.unsubscribe(["BTCUSDT"])
+        sent = json.loads(client.ws.send.call_args[0][0])
+        assert sent["op"] == "unsubscribe"
+        assert client.symbols == ["ETHUSDT"]
+
+    def test_subscribe_while_disconnected_defers_to_open(self):
+        from ws_public import PublicWSClient
+
+        client = PublicWSClient("linear", [], True, Mock(), lambda d: None)
+        assert client.subscribe(["BTCUSDT"]) is None
+        assert client.symbols == ["BTCUSDT"]
+
     def test_close_cleans(self):
         from ws_public import PublicWSClient
 
@@ -68,6 +101,171 @@ class TestPublicWSClient:
         assert client.on_ticker_callback is None
 
 
+class TestTickerStateEngine:
+    def test_snapshot_then_delta_emits_only_changes(self):
+        from ws.public.ticker_state import TickerStateEngine
+
+        engine = TickerStateEngine()
+        first = engine.apply({
+            "topic": "tickers.BTCUSDT",
+            "type": "snapshot",
+            "data": {
+                "symbol": "BTCUSDT",
+                "lastPrice": "50000",
+                "markPrice": "50001",
+                "fundingRate": "0.0001",
+                "nextFundingTime": "1712345678000",
+            },
+        })
+        assert first["fundingRate"] == 0.0001
+        assert first["nextFundingTime"] == 1712345678000
+
+        delta = engine.apply({
+            "topic": "tickers.BTCUSDT",
+            "type": "delta",
+            "data": {"symbol": "BTCUSDT", "lastPrice": "50010", "markPrice": "50001"},
+        })
+        assert delta == {"symbol": "BTCUSDT", "lastPrice": 50010.0}
+
+        state = engine.get("BTCUSDT")
+        assert state["fundingRate"] == 0.0001
+        assert state["markPrice"] == 50001.0
+
+    def test_unchanged_delta_is_not_emitted(self):
+        from ws.public.ticker_state import TickerStateEngine
+
+        engine = TickerStateEngine()
+        msg = {"topic": "tickers.ETHUSDT", "type": "delta", "data": {"symbol": "ETHUSDT", "lastPrice": "3000"}}
+        assert engine.apply(msg) is not None
+        assert engine.apply(msg) is None
+
+    def test_router_forwards_funding_fields(self):
+        from ws.public.parser_router import PublicMessageRouter
+
+        cb = Mock()
+        router = PublicMessageRouter(on_ticker=cb)
+        router.route(
+            '{"topic":"tickers.BTCUSDT","type":"delta",'
+            '"data":{"symbol":"BTCUSDT","fundingRate":"-0.0002"}}',
+            Mock(),
+            "linear",
+        )
+        cb.assert_called_once_with({"symbol": "BTCUSDT", "fundingRate": -0.0002})
+
+
+class TestLocalOrderbook:
+    @staticmethod
+    def _msg(kind, u, bids=(), asks=()):
+        return {
+            "topic": "orderbook.50.BTCUSDT",
+            "type": kind,
+            "ts": 1000 + u,
+            "data": {"s": "BTCUSDT", "b": [list(l) for l in bids], "a": [list(l) for l in asks], "u": u, "seq": 10 + u},
+        }
+
+    def test_snapshot_and_deltas_keep_book_sorted(self):
+        from ws.public.local_orderbook import OrderbookStore
+
+        store = OrderbookStore()
+        store.apply(self._msg("snapshot", 5, bids=[("100", "1"), ("99", "2")], asks=[("101", "1"), ("102", "3")]))
+        store.apply(self._msg("delta", 6, bids=[("100.5", "4"), ("99", "0")], asks=[("100.8", "2")]))
+
+        book = store.get("BTCUSDT")
+        assert book["b"] == [[100.5, 4.0], [100.0, 1.0]]
+        assert book["a"] == [[100.8, 2.0], [101.0, 1.0], [102.0, 3.0]]
+        assert book["u"] == 6 and book["seq"] == 16
+        assert store.get("BTCUSDT", depth=1)["a"] == [[100.8, 2.0]]
+
+    def test_sequence_gap_invalidates_and_requests_resync(self):
+        from ws.public.local_orderbook import OrderbookStore
+
+        store = OrderbookStore()
+        on_gap = Mock()
+        store.apply(self._msg("snapshot", 5, bids=[("100", "1")], asks=[("101", "1")]), on_gap)
+        assert store.apply(self._msg("delta", 8, bids=[("100", "2")]), on_gap) is None
+
+        on_gap.assert_called_once_with("BTCUSDT")
+        assert store.get("BTCUSDT") is None
+        # Les deltas suivants sont ignorés jusqu'au prochain snapshot
+        assert store.apply(self._msg("delta", 9), on_gap) is None
+        store.apply(self._msg("snapshot", 20, bids=[("100", "3")], asks=[("101", "1")]), on_gap)
+        assert store.get("BTCUSDT")["b"] == [[100.0, 3.0]]
+
+    def test_update_id_one_resets_book(self):
+        from ws.public.local_orderbook import OrderbookStore
+
+        store = OrderbookStore()
+        store.apply(self._msg("snapshot", 5, bids=[("100", "1")], asks=[("101", "1")]))
+        store.apply(self._msg("delta", 1, bids=[("90", "1")], asks=[("91", "1")]))
+
+        book = store.get("BTCUSDT")
+        assert book["b"] == [[90.0, 1.0]]
+        assert book["a"] == [[91.0, 1.0]]
+
+    def test_client_resubscribes_topic_on_gap(self):
+        from ws_public import PublicWSClient
+
+        client = PublicWSClient("linear", [], True, Mock(), lambda _: None)
+        client.running = True
+        client._connected = True
+        client.ws = Mock()
+        client.subscribe_orderbook(["BTCUSDT"])
+        client.ws.send.reset_mock()
+
+        client._on_message(None, '{"topic":"orderbook.50.BTCUSDT","type":"snapshot",'
+                                 '"data":{"s":"BTCUSDT","b":[["1","1"]],"a":[["2","1"]],"u":3}}')
+        client._on_message(None, '{"topic":"orderbook.50.BTCUSDT","type":"delta",'
+                                 '"data":{"s":"BTCUSDT","b":[],"a":[],"u":7}}')
+
+        sent = [call.args[0] for call in client.ws.send.call_args_list]
+        assert '"op": "unsubscribe"' in sent[0] and "orderbook.50.BTCUSDT" in sent[0]
+        assert '"op": "subscribe"' in sent[1] and "orderbook.50.BTCUSDT" in sent[1]
+        assert client.get_orderbook("BTCUSDT") is None
+
+    def test_parse_orderbook_reads_all_levels(self):
+        from ws.public.parser_router import PublicMessageParser
+
+        parsed = PublicMessageParser.parse_orderbook(
+            {"data": {"s": "BTCUSDT", "b": [["100", "1"], ["99", "2"]], "a": [["101", "3"]], "u": 4, "seq": 9}}
+        )
+        assert parsed.bid1_price == 100.0
+        assert parsed.bids == ((100.0, 1.0), (99.0, 2.0))
+        assert parsed.asks == ((101.0, 3.0),)
+        assert parsed.update_id == 4 and parsed.seq == 9
+
+
+class TestFrameDecoder:
+    def test_falls_back_to_stdlib_when_backend_missing(self, monkeypatch):
+        import json
+        import ws.decoder as decoder_module
+
+        def fake_load(name):
+            if name != "json":
+                raise ImportError(name)
+            return json.loads
+
+        monkeypatch.setattr(decoder_module, "_load_backend", fake_load)
+        decoder = decoder_module.FrameDecoder("orjson")
+        assert decoder.backend == "json"
+        assert decoder.decode('{"op":"pong"}') == {"op": "pong"}
+
+    def test_skips_unrouted_topics_without_decoding(self):
+        from ws.decoder import FrameDecoder
+
+        decoder = FrameDecoder(topic_prefixes=("tickers.",))
+        assert decoder.decode('{"topic":"publicTrade.BTCUSDT","data":[') is None
+        assert decoder.decode('{"topic":"tickers.BTCUSDT","data":{}}') == {"topic": "tickers.BTCUSDT", "data": {}}
+        # Accusés (sans topic en tête) toujours décodés
+        assert decoder.decode('{"success":true,"op":"subscribe"}')["op"] == "subscribe"
+        assert (decoder.decoded, decoder.skipped) == (2, 1)
+
+    def test_invalid_frame_raises_value_error(self):
+        from ws.decoder import FrameDecoder
+
+        with pytest.raises(ValueError):
+            FrameDecoder().decode("{")
+
+
 class TestPrivateWSClient:
     def test_ws_url_and_signature(self):
         from ws_private import PrivateWSClient